@@ -11,7 +11,7 @@ import base64
 import hashlib
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping, Protocol
@@ -229,7 +229,7 @@ def evaluate_proposal(
     ).hexdigest()
     return (True, body)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthoritySnapshot:
     credential_id: str
     algorithm: str
@@ -240,6 +240,16 @@ class AuthoritySnapshot:
     checkpoint_hash: str
     valid_until: str
     context_snapshot_hash: str | None = None
+    # ``valid_until`` in microseconds since the Unix epoch, parsed once here
+    # rather than on every authorization; None if it is not a valid timestamp.
+    valid_until_us: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            valid_until_us = _timestamp_micros(self.valid_until)
+        except ValueError:
+            valid_until_us = None
+        object.__setattr__(self, "valid_until_us", valid_until_us)
 
 
 def authority_binding_hash(snapshot: AuthoritySnapshot) -> str:
@@ -275,6 +285,15 @@ def _parse_timestamp(value: Any) -> datetime:
     return moment.astimezone(timezone.utc)
 
 
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp_micros(value: Any) -> int:
+    """Parse a timestamp to integer microseconds since the Unix epoch."""
+    elapsed = _parse_timestamp(value) - _UNIX_EPOCH
+    return (elapsed.days * 86400 + elapsed.seconds) * 1_000_000 + elapsed.microseconds
+
+
 class AuthorityResolver(Protocol):
     def resolve(
         self, *, credential_id: str, checkpoint_hash: str
@@ -310,6 +329,12 @@ class DecisionLedger(Protocol):
     def get_receipt(self, receipt_hash: str) -> Mapping[str, Any] | None: ...
 
 
+class NonceStore(Protocol):
+    """Shared replay ledger whose insert-if-absent is a single transaction."""
+
+    def consume(self, nonce: str) -> bool: ...
+
+
 class Secp256k1Verifier:
     """DER ECDSA/SHA-256 verifier for compressed SEC1 keys and low-S signatures."""
 
@@ -598,6 +623,7 @@ class AdmissionGatekeeper:
         verifier: SignatureVerifier,
         receipt_signer: ReceiptSigner,
         ledger: DecisionLedger,
+        nonce_store: NonceStore | None = None,
     ) -> None:
         self.gatekeeper_id = gatekeeper_id
         self.authority_resolver = authority_resolver
@@ -606,6 +632,7 @@ class AdmissionGatekeeper:
         self.verifier = verifier
         self.receipt_signer = receipt_signer
         self.ledger = ledger
+        self.nonce_store = nonce_store
 
     def evaluate(
         self, *, raw_candidate: bytes, raw_envelope: bytes, current_time: str
@@ -648,6 +675,12 @@ class AdmissionGatekeeper:
                     raise ValueError("candidate binding mismatch")
                 admitted = self._authorized(envelope, snapshot, current_time)
                 failure = None if admitted else "AUTHORIZATION_REFUSED"
+                if admitted and self.nonce_store is not None:
+                    # Consumed only once authorized, so unsigned traffic cannot
+                    # burn a credential's nonces; and before the receipt, so a
+                    # replay never yields a second admission.
+                    failure = self._consume_nonce(envelope)
+                    admitted = failure is None
         except ContextValidationError:
             failure = "CONTEXT_REFUSED"
         except Exception as error:
@@ -703,6 +736,14 @@ class AdmissionGatekeeper:
         ):
             raise ValueError("invalid envelope identifier field")
 
+    def _consume_nonce(self, envelope: Mapping[str, Any]) -> str | None:
+        key = canonical_json([envelope["credential_id"], envelope["nonce"]]).decode()
+        try:
+            fresh = self.nonce_store.consume(key)
+        except Exception:
+            return "NONCE_STORE_UNAVAILABLE"
+        return None if fresh else "NONCE_REPLAYED"
+
     def _context_authority_valid(
         self,
         envelope: Mapping[str, Any],
@@ -757,7 +798,10 @@ class AdmissionGatekeeper:
         ):
             return False
         try:
-            if _parse_timestamp(current_time) > _parse_timestamp(snapshot.valid_until):
+            valid_until = getattr(snapshot, "valid_until_us", None)
+            if valid_until is None:
+                valid_until = _timestamp_micros(snapshot.valid_until)
+            if _timestamp_micros(current_time) > valid_until:
                 return False
         except ValueError:
             return False
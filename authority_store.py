@@ -0,0 +1,432 @@
+"""Indexed authority resolution with a shared, memory-mapped revocation set.
+
+``IndexedAuthorityResolver`` is the production ``AuthorityResolver``: it
+holds every :class:`admission_gate.AuthoritySnapshot` in a hash index keyed by
+``(credential_id, checkpoint_hash)`` plus a per-epoch index used to list and
+retire whole epochs.  Snapshots pre-parse ``valid_until`` to integer
+microseconds on construction, and the fields most snapshots share --
+algorithm, checkpoint, scope policy, expiry and context -- are interned on
+load, so a million credentials cost a few hundred bytes each.  Bulk loads
+read the JSONL export written by :func:`export_jsonl`.
+
+Revocation is kept apart from the immutable snapshots in a
+:class:`RevocationSet`: an open-addressed table of 128-bit digests in a
+memory-mapped file.  Every process opening the same path sees a revocation
+as soon as ``add`` returns; lookups take no lock and touch a handful of
+cache lines.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from admission_gate import AuthoritySnapshot
+
+_HEX_64 = re.compile(r"^[0-9a-f]{64}$")
+# Fields most snapshots share with many others; interned on load.
+_SHARED_FIELDS = (
+    "algorithm",
+    "scope_policy_hash",
+    "checkpoint_hash",
+    "valid_until",
+    "context_snapshot_hash",
+)
+
+_RECORD_FIELDS = frozenset(
+    {
+        "credential_id",
+        "algorithm",
+        "public_key",
+        "authority_epoch",
+        "revoked",
+        "scope_policy_hash",
+        "checkpoint_hash",
+        "valid_until",
+        "context_snapshot_hash",
+    }
+)
+
+
+def authority_snapshot_record(snapshot: AuthoritySnapshot) -> dict[str, Any]:
+    """Return the JSON export record of *snapshot* (public key in base64)."""
+    return {
+        "credential_id": snapshot.credential_id,
+        "algorithm": snapshot.algorithm,
+        "public_key": base64.b64encode(snapshot.public_key).decode(),
+        "authority_epoch": snapshot.authority_epoch,
+        "revoked": snapshot.revoked,
+        "scope_policy_hash": snapshot.scope_policy_hash,
+        "checkpoint_hash": snapshot.checkpoint_hash,
+        "valid_until": snapshot.valid_until,
+        "context_snapshot_hash": snapshot.context_snapshot_hash,
+    }
+
+
+def authority_snapshot_from_record(record: Mapping[str, Any]) -> AuthoritySnapshot:
+    """Validate an export record and build its snapshot."""
+    if not isinstance(record, Mapping) or set(record) != _RECORD_FIELDS:
+        raise ValueError("invalid authority record field set")
+    for name in ("credential_id", "algorithm", "valid_until"):
+        if not isinstance(record[name], str) or not record[name]:
+            raise ValueError(f"{name} must be a non-empty string")
+    epoch = record["authority_epoch"]
+    if not isinstance(epoch, int) or isinstance(epoch, bool) or epoch < 0:
+        raise ValueError("authority_epoch must be a non-negative integer")
+    if not isinstance(record["revoked"], bool):
+        raise ValueError("revoked must be a boolean")
+    for name in ("scope_policy_hash", "checkpoint_hash"):
+        if not isinstance(record[name], str) or not _HEX_64.fullmatch(record[name]):
+            raise ValueError(f"{name} must be a lowercase SHA-256 hex digest")
+    context = record["context_snapshot_hash"]
+    if context is not None and (not isinstance(context, str) or not _HEX_64.fullmatch(context)):
+        raise ValueError("context_snapshot_hash must be null or a lowercase SHA-256 hex digest")
+    try:
+        public_key = base64.b64decode(record["public_key"], validate=True)
+    except (ValueError, TypeError) as error:
+        raise ValueError("public_key must be base64") from error
+    snapshot = AuthoritySnapshot(
+        record["credential_id"],
+        record["algorithm"],
+        public_key,
+        epoch,
+        record["revoked"],
+        record["scope_policy_hash"],
+        record["checkpoint_hash"],
+        record["valid_until"],
+        context,
+    )
+    if snapshot.valid_until_us is None:
+        raise ValueError("valid_until must be a timestamp with a timezone offset")
+    return snapshot
+
+
+def export_jsonl(snapshots: Iterable[AuthoritySnapshot], path: str | Path) -> int:
+    """Write one export record per line; return the number written."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as stream:
+        for snapshot in snapshots:
+            stream.write(json.dumps(authority_snapshot_record(snapshot), separators=(",", ":")))
+            stream.write("\n")
+            count += 1
+    return count
+
+
+class IndexedAuthorityResolver:
+    """``AuthorityResolver`` indexed by snapshot key and by authority epoch.
+
+    A key maps to exactly one snapshot: adding a different snapshot under a
+    key already held raises ``ValueError`` instead of silently re-pointing a
+    credential.  ``resolve`` consults *revocations* on every call, so a
+    revocation added by any process takes effect without reloading.
+    """
+
+    def __init__(
+        self,
+        snapshots: Iterable[AuthoritySnapshot] = (),
+        *,
+        revocations: "RevocationSet | None" = None,
+    ) -> None:
+        self.revocations = revocations
+        self._snapshots: dict[tuple[str, str], AuthoritySnapshot] = {}
+        self._epochs: dict[int, list[tuple[str, str]]] = {}
+        self._shared: dict[Any, Any] = {}
+        self.add_many(snapshots)
+
+    @classmethod
+    def from_jsonl(
+        cls, path: str | Path, *, revocations: "RevocationSet | None" = None
+    ) -> "IndexedAuthorityResolver":
+        resolver = cls(revocations=revocations)
+        resolver.load_jsonl(path)
+        return resolver
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def add(self, snapshot: AuthoritySnapshot) -> bool:
+        """Index *snapshot*; return False if it was already present."""
+        shared = {
+            name: self._shared.setdefault(value, value)
+            for name in _SHARED_FIELDS
+            if (value := getattr(snapshot, name)) is not None
+        }
+        if any(getattr(snapshot, name) is not value for name, value in shared.items()):
+            snapshot = replace(snapshot, **shared)
+        return self._index(snapshot)
+
+    def _index(self, snapshot: AuthoritySnapshot) -> bool:
+        key = (snapshot.credential_id, snapshot.checkpoint_hash)
+        existing = self._snapshots.get(key)
+        if existing is not None:
+            if existing != snapshot:
+                raise ValueError(f"conflicting authority snapshot for {key!r}")
+            return False
+        self._snapshots[key] = snapshot
+        self._epochs.setdefault(snapshot.authority_epoch, []).append(key)
+        return True
+
+    def add_many(self, snapshots: Iterable[AuthoritySnapshot]) -> int:
+        """Index every snapshot; return how many were new."""
+        return sum(self.add(snapshot) for snapshot in snapshots)
+
+    def load_jsonl(self, path: str | Path) -> int:
+        """Bulk-load an :func:`export_jsonl` file; return how many were new."""
+        shared = self._shared.setdefault
+        added = 0
+        with open(path, "r", encoding="utf-8") as stream:
+            for number, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if isinstance(record, dict):
+                        for name in _SHARED_FIELDS:
+                            value = record.get(name)
+                            if isinstance(value, str):
+                                record[name] = shared(value, value)
+                    added += self._index(authority_snapshot_from_record(record))
+                except ValueError as error:
+                    raise ValueError(f"{path}:{number}: {error}") from error
+        return added
+
+    def resolve(
+        self, *, credential_id: str, checkpoint_hash: str
+    ) -> AuthoritySnapshot | None:
+        snapshot = self._snapshots.get((credential_id, checkpoint_hash))
+        if (
+            snapshot is not None
+            and not snapshot.revoked
+            and self.revocations is not None
+            and self.revocations.contains(credential_id, checkpoint_hash)
+        ):
+            return replace(snapshot, revoked=True)
+        return snapshot
+
+    def epochs(self) -> list[int]:
+        return sorted(self._epochs)
+
+    def snapshots_for_epoch(self, authority_epoch: int) -> list[AuthoritySnapshot]:
+        return [self._snapshots[key] for key in self._epochs.get(authority_epoch, ())]
+
+    def retire_epochs_before(self, authority_epoch: int) -> int:
+        """Drop every snapshot of an older epoch; return how many were dropped."""
+        dropped = 0
+        for epoch in [epoch for epoch in self._epochs if epoch < authority_epoch]:
+            for key in self._epochs.pop(epoch):
+                del self._snapshots[key]
+                dropped += 1
+        return dropped
+
+
+_REVOCATION_MAGIC = b"TASREVK1"
+# magic, slot capacity (a power of two), live entries, retired flag
+_REVOCATION_HEADER = struct.Struct("<8sQQB7x")
+_COUNT = struct.Struct("<Q")
+_COUNT_OFFSET = 16
+_RETIRED_OFFSET = 24
+_SLOT = 16
+_EMPTY = bytes(_SLOT)
+_REVOCATION_PERSON = b"TAS-REVOCATION-1"
+
+
+def revocation_digest(credential_id: str, checkpoint_hash: str) -> bytes:
+    """128-bit slot digest of a snapshot key; never all zeros."""
+    credential = credential_id.encode("utf-8")
+    digest = blake2b(
+        len(credential).to_bytes(4, "little") + credential + checkpoint_hash.encode("utf-8"),
+        digest_size=_SLOT,
+        person=_REVOCATION_PERSON,
+    ).digest()
+    return digest[:-1] + bytes((digest[-1] | 1,))
+
+
+class RevocationSet:
+    """Durable set of revoked snapshot keys shared by every process opening *path*.
+
+    The file is an open-addressed hash table of 16-byte key digests behind a
+    32-byte header, kept at most half full.  Writers serialise on an
+    exclusive ``flock``.  Readers take no lock: a slot is written once, from
+    empty to its final digest, and a half-written slot matches no key, so a
+    concurrent ``contains`` sees a revocation either fully or not yet.
+
+    When the table fills up a writer builds a table twice the size in a new
+    file, renames it over *path* and sets the retired flag in the old
+    file's header; readers notice the flag and remap.  ``capacity`` only
+    applies when the file is created.  With ``sync=True`` each ``add`` is
+    ``msync``-ed before it returns.
+    """
+
+    def __init__(self, path: str | Path, capacity: int = 1 << 16, *, sync: bool = False) -> None:
+        if fcntl is None:  # pragma: no cover - non-POSIX platforms
+            raise RuntimeError("RevocationSet requires POSIX file locking (fcntl)")
+        if capacity < 2 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two of at least 2")
+        self.path = Path(path)
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._fd, self._mm, self._mask = self._open(capacity)
+
+    def _open(self, capacity: int) -> tuple[int, mmap.mmap, int]:
+        fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size == 0:
+                    os.ftruncate(fd, _REVOCATION_HEADER.size + capacity * _SLOT)
+                    os.pwrite(fd, _REVOCATION_HEADER.pack(_REVOCATION_MAGIC, capacity, 0, 0), 0)
+                magic, capacity, _, _ = _REVOCATION_HEADER.unpack(
+                    os.pread(fd, _REVOCATION_HEADER.size, 0)
+                )
+                if magic != _REVOCATION_MAGIC:
+                    raise ValueError(f"{self.path} is not a revocation set")
+                mm = mmap.mmap(fd, _REVOCATION_HEADER.size + capacity * _SLOT)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd, mm, capacity - 1
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+    def __enter__(self) -> "RevocationSet":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        self._current()
+        return _COUNT.unpack_from(self._mm, _COUNT_OFFSET)[0]
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != 2:
+            return False
+        return self.contains(*key)
+
+    def contains(self, credential_id: str, checkpoint_hash: str) -> bool:
+        mm, mask = self._current()
+        return self._probe(mm, mask, revocation_digest(credential_id, checkpoint_hash))[0]
+
+    def add(self, credential_id: str, checkpoint_hash: str) -> bool:
+        """Revoke a snapshot key; return False if it was already revoked."""
+        return self.add_many([(credential_id, checkpoint_hash)]) == 1
+
+    def add_many(self, keys: Iterable[tuple[str, str]]) -> int:
+        """Revoke many keys under one lock; return how many were new."""
+        digests = [revocation_digest(credential_id, checkpoint) for credential_id, checkpoint in keys]
+        added = 0
+        with self._exclusive():
+            for digest in digests:
+                found, offset = self._probe(self._mm, self._mask, digest)
+                if found:
+                    continue
+                count = _COUNT.unpack_from(self._mm, _COUNT_OFFSET)[0]
+                if (count + 1) * 2 > self._mask + 1:
+                    self._grow()
+                    offset = self._probe(self._mm, self._mask, digest)[1]
+                self._mm[offset : offset + _SLOT] = digest
+                _COUNT.pack_into(self._mm, _COUNT_OFFSET, count + 1)
+                added += 1
+            if added and self.sync:
+                self._mm.flush()
+        return added
+
+    def flush(self) -> None:
+        """``msync`` the mapped table to stable storage."""
+        self._mm.flush()
+
+    @staticmethod
+    def _probe(mm: mmap.mmap, mask: int, digest: bytes) -> tuple[bool, int]:
+        index = int.from_bytes(digest[:8], "little") & mask
+        while True:
+            offset = _REVOCATION_HEADER.size + index * _SLOT
+            slot = mm[offset : offset + _SLOT]
+            if slot == digest:
+                return True, offset
+            if slot == _EMPTY:
+                return False, offset
+            index = (index + 1) & mask
+
+    def _current(self) -> tuple[mmap.mmap, int]:
+        mm, mask = self._mm, self._mask
+        if mm[_RETIRED_OFFSET]:
+            with self._lock:
+                if self._mm[_RETIRED_OFFSET]:
+                    self._remap()
+                mm, mask = self._mm, self._mask
+        return mm, mask
+
+    def _remap(self) -> None:
+        # The retired mapping is left to the garbage collector rather than
+        # closed, so a thread still probing it cannot fault.
+        old_fd = self._fd
+        self._fd, self._mm, self._mask = self._open(self._mask + 1)
+        os.close(old_fd)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        with self._lock:
+            while True:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+                if not self._mm[_RETIRED_OFFSET]:
+                    break
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+                self._remap()
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _grow(self) -> None:
+        """Rehash into a table twice the size and publish it over ``path``."""
+        capacity = (self._mask + 1) * 2
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(str(temporary), os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # Locked before it becomes visible, so no other writer can
+            # slip into the new table ahead of the insert that grew it.
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            os.ftruncate(fd, _REVOCATION_HEADER.size + capacity * _SLOT)
+            mm = mmap.mmap(fd, _REVOCATION_HEADER.size + capacity * _SLOT)
+            count = _COUNT.unpack_from(self._mm, _COUNT_OFFSET)[0]
+            mm[: _REVOCATION_HEADER.size] = _REVOCATION_HEADER.pack(_REVOCATION_MAGIC, capacity, count, 0)
+            old = self._mm
+            for offset in range(_REVOCATION_HEADER.size, len(old), _SLOT):
+                digest = old[offset : offset + _SLOT]
+                if digest != _EMPTY:
+                    mm_offset = self._probe(mm, capacity - 1, digest)[1]
+                    mm[mm_offset : mm_offset + _SLOT] = digest
+            mm.flush()
+            os.replace(temporary, self.path)
+            directory_fd = os.open(self.path.parent, os.O_RDONLY)
+            try:
+                os.fsync(directory_fd)
+            finally:
+                os.close(directory_fd)
+        except BaseException:
+            os.close(fd)
+            temporary.unlink(missing_ok=True)
+            raise
+        old[_RETIRED_OFFSET] = 1
+        old.flush()
+        os.close(self._fd)
+        self._fd, self._mm, self._mask = fd, mm, capacity - 1
@@ -12,7 +12,7 @@ import hashlib
 import json
 import re
 from dataclasses import dataclass
-from typing import Any, Mapping, Protocol, Sequence
+from typing import Any, Iterable, Mapping, Protocol, Sequence
 
 CANONICALIZATION_VERSION = "TAS-CJSON-1"
 CONTEXT_SCHEMA_VERSION = "tas.context-snapshot.v1"
@@ -373,6 +373,13 @@ class ContextResolver(Protocol):
 
 
 class DefinitionResolver(Protocol):
+    """Resolves pinned definitions.
+
+    A resolver may also offer ``resolve_many(definition_ids)`` returning a
+    mapping of the IDs it holds to their bytes; ``resolve_verified_context``
+    then fetches all of a context's definitions in one call.
+    """
+
     def resolve(self, *, definition_id: str) -> bytes | None: ...
 
 
@@ -390,6 +397,13 @@ class InMemoryContextResolver:
     def resolve(self, *, context_snapshot_hash: str) -> bytes | None:
         return self._snapshots.get(context_snapshot_hash)
 
+    def resolve_many(self, context_snapshot_hashes: Iterable[str]) -> dict[str, bytes]:
+        return {
+            snapshot_hash: self._snapshots[snapshot_hash]
+            for snapshot_hash in context_snapshot_hashes
+            if snapshot_hash in self._snapshots
+        }
+
     def expected_head(self, *, namespace_id: str) -> str | None:
         return self._namespace_heads.get(namespace_id)
 
@@ -403,6 +417,13 @@ class InMemoryDefinitionResolver:
     def resolve(self, *, definition_id: str) -> bytes | None:
         return self._definitions.get(definition_id)
 
+    def resolve_many(self, definition_ids: Iterable[str]) -> dict[str, bytes]:
+        return {
+            identifier: self._definitions[identifier]
+            for identifier in definition_ids
+            if identifier in self._definitions
+        }
+
 
 def resolve_verified_context(
     *,
@@ -435,8 +456,16 @@ def resolve_verified_context(
             "context snapshot is not the active namespace head"
         )
 
+    resolve_many = getattr(definition_resolver, "resolve_many", None)
+    resolved = (
+        resolve_many(context.definition_ids) if resolve_many is not None else None
+    )
     for identifier in context.definition_ids:
-        raw_definition = definition_resolver.resolve(definition_id=identifier)
+        raw_definition = (
+            resolved.get(identifier)
+            if resolved is not None
+            else definition_resolver.resolve(definition_id=identifier)
+        )
         if raw_definition is None:
             raise ContextValidationError("pinned definition is unavailable")
         try:
@@ -0,0 +1,249 @@
+"""Durable context and definition resolvers on SQLite.
+
+``SQLiteContextResolver`` and ``SQLiteDefinitionResolver`` implement the
+``context_snapshot`` resolver protocols over one WAL-mode database file that
+any number of processes may open.  Both store the exact canonical bytes they
+were given, keyed by the raw 32-byte hash those bytes commit to; objects are
+validated once on ``put`` and never rewritten.  Opening a resolver only
+creates missing tables, so startup cost does not grow with the registry.
+
+Each namespace head carries its own version, incremented on every advance,
+and a single database-wide ``head_version`` counter is bumped in the same
+transaction.  A cache in front of the resolver can compare that counter
+against the value it last saw and discard its heads only when it moved.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from context_snapshot import (
+    CanonicalJSONError,
+    ContextSnapshot,
+    ContextValidationError,
+    definition_id_for_raw,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS context_snapshots (
+    context_snapshot_hash BLOB PRIMARY KEY,
+    namespace_id          TEXT NOT NULL,
+    parent_context_hash   BLOB,
+    raw                   BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS context_definitions (
+    definition_id BLOB PRIMARY KEY,
+    raw           BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS context_namespace_heads (
+    namespace_id          TEXT PRIMARY KEY,
+    context_snapshot_hash BLOB NOT NULL,
+    version               INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS context_head_version (
+    id    INTEGER PRIMARY KEY CHECK (id = 0),
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO context_head_version (id, value) VALUES (0, 0);
+"""
+
+# Stay under SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+_BATCH = 500
+
+
+def _key(digest: str) -> bytes | None:
+    if not isinstance(digest, str) or len(digest) != 64 or digest != digest.lower():
+        return None
+    try:
+        return bytes.fromhex(digest)
+    except ValueError:
+        return None
+
+
+class _SQLiteStore:
+    def __init__(self, path: str | Path, *, timeout: float = 30.0) -> None:
+        self._db = sqlite3.connect(
+            str(path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def _resolve(self, table: str, column: str, digest: str) -> bytes | None:
+        key = _key(digest)
+        if key is None:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT raw FROM {table} WHERE {column} = ?", (key,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def _resolve_many(self, table: str, column: str, digests: Iterable[str]) -> dict[str, bytes]:
+        keys = {key: digest for digest in digests if (key := _key(digest)) is not None}
+        found: dict[str, bytes] = {}
+        pending = list(keys)
+        with self._lock:
+            for start in range(0, len(pending), _BATCH):
+                batch = pending[start : start + _BATCH]
+                rows = self._db.execute(
+                    f"SELECT {column}, raw FROM {table}"
+                    f" WHERE {column} IN ({','.join('?' * len(batch))})",
+                    batch,
+                )
+                for key, raw in rows:
+                    found[keys[key]] = raw
+        return found
+
+
+class SQLiteContextResolver(_SQLiteStore):
+    """``ContextResolver`` over content-addressed snapshots and namespace heads."""
+
+    def put(self, raw: bytes) -> str:
+        """Store a validated snapshot; return its ``context_snapshot_hash``."""
+        return self.put_many([raw])[0]
+
+    def put_many(self, raws: Iterable[bytes]) -> list[str]:
+        """Validate and store many snapshots in one transaction."""
+        rows = []
+        for raw in raws:
+            try:
+                snapshot = ContextSnapshot.from_raw(raw)
+            except CanonicalJSONError as error:
+                raise ContextValidationError("context snapshot validation failed") from error
+            parent = snapshot.parent_context_hash
+            rows.append((
+                bytes.fromhex(snapshot.context_snapshot_hash),
+                snapshot.namespace_id,
+                None if parent is None else bytes.fromhex(parent),
+                bytes(raw),
+            ))
+        with self._lock, self._transaction():
+            self._db.executemany(
+                "INSERT OR IGNORE INTO context_snapshots VALUES (?, ?, ?, ?)", rows
+            )
+        return [row[0].hex() for row in rows]
+
+    def resolve(self, *, context_snapshot_hash: str) -> bytes | None:
+        return self._resolve("context_snapshots", "context_snapshot_hash", context_snapshot_hash)
+
+    def resolve_many(self, context_snapshot_hashes: Iterable[str]) -> dict[str, bytes]:
+        """Return the stored bytes of every known hash; unknown ones are omitted."""
+        return self._resolve_many(
+            "context_snapshots", "context_snapshot_hash", context_snapshot_hashes
+        )
+
+    def expected_head(self, *, namespace_id: str) -> str | None:
+        head = self.head(namespace_id)
+        return None if head is None else head[0]
+
+    def head(self, namespace_id: str) -> tuple[str, int] | None:
+        """Return ``(context_snapshot_hash, version)`` for *namespace_id*."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT context_snapshot_hash, version FROM context_namespace_heads"
+                " WHERE namespace_id = ?",
+                (namespace_id,),
+            ).fetchone()
+        return None if row is None else (row[0].hex(), row[1])
+
+    def head_version(self) -> int:
+        """Database-wide counter, incremented whenever any namespace head moves."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT value FROM context_head_version WHERE id = 0"
+            ).fetchone()[0]
+
+    def advance_head(self, context_snapshot_hash: str) -> int:
+        """Make a stored snapshot its namespace's head; return the new version.
+
+        The snapshot must extend the current head: its ``parent_context_hash``
+        is the current head, or ``None`` for a namespace without one.  The
+        check and the update share a write transaction, so concurrent
+        advances from any number of processes serialise and cannot fork or
+        roll back a namespace.
+        """
+        key = _key(context_snapshot_hash)
+        if key is None:
+            raise ContextValidationError("context_snapshot_hash must be a lowercase SHA-256 hex digest")
+        with self._lock, self._transaction():
+            row = self._db.execute(
+                "SELECT namespace_id, parent_context_hash FROM context_snapshots"
+                " WHERE context_snapshot_hash = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                raise ContextValidationError("context snapshot is unavailable")
+            namespace_id, parent = row
+            current = self._db.execute(
+                "SELECT context_snapshot_hash, version FROM context_namespace_heads"
+                " WHERE namespace_id = ?",
+                (namespace_id,),
+            ).fetchone()
+            if (None if current is None else current[0]) != parent:
+                raise ContextValidationError(
+                    "context snapshot does not extend the active namespace head"
+                )
+            version = 1 if current is None else current[1] + 1
+            self._db.execute(
+                "INSERT OR REPLACE INTO context_namespace_heads VALUES (?, ?, ?)",
+                (namespace_id, key, version),
+            )
+            self._db.execute(
+                "UPDATE context_head_version SET value = value + 1 WHERE id = 0"
+            )
+        return version
+
+
+class SQLiteDefinitionResolver(_SQLiteStore):
+    """``DefinitionResolver`` over definitions keyed by their DefinitionID."""
+
+    def put(self, raw: bytes) -> str:
+        """Store a validated definition record; return its DefinitionID."""
+        return self.put_many([raw])[0]
+
+    def put_many(self, raws: Iterable[bytes]) -> list[str]:
+        """Validate and store many definition records in one transaction."""
+        rows = []
+        for raw in raws:
+            try:
+                definition_id = definition_id_for_raw(raw)
+            except CanonicalJSONError as error:
+                raise ContextValidationError("definition validation failed") from error
+            rows.append((bytes.fromhex(definition_id), bytes(raw)))
+        with self._lock, self._transaction():
+            self._db.executemany(
+                "INSERT OR IGNORE INTO context_definitions VALUES (?, ?)", rows
+            )
+        return [row[0].hex() for row in rows]
+
+    def resolve(self, *, definition_id: str) -> bytes | None:
+        return self._resolve("context_definitions", "definition_id", definition_id)
+
+    def resolve_many(self, definition_ids: Iterable[str]) -> dict[str, bytes]:
+        """Return the stored bytes of every known ID; unknown ones are omitted."""
+        return self._resolve_many("context_definitions", "definition_id", definition_ids)
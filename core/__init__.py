@@ -11,6 +11,7 @@ Execution chain::
 Layers
 ------
 Gene / WakeChain         §3.4, §5.7  Evidentiary Sovereignty (dual-history chain)
+MerkleTree               tas-v1       Domain-separated Merkle batching and proofs
 AuthoritySnapshot        §3.1         Institutional Sovereignty
 DefinitionID             §3.2, §4     Semantic Sovereignty (content-addressed)
 ContextSnapshot          §3.2, §4     Semantic Sovereignty (frozen snapshot)
@@ -20,37 +21,56 @@ PhoenixRecovery          §8           Failure, recovery, reconstitution
 SovereignRuntime         PoC          Lineage-constrained forward pass
 """
 
-from .gene import TASGene, Decision
-from .wakechain import WakeChain, WakeLink, LinkKind
-from .authority.authority_snapshot import AuthoritySnapshot
-from .semantics.definition_id import DefinitionID
-from .semantics.context_snapshot import ContextSnapshot
-from .verification.universal_verifier import (
-    UniversalVerifierKernel,
-    VerificationResult,
-    SUPPORTED_CANONICALIZATION,
-)
-from .deployment_profile import (
-    DeploymentProfile,
-    SovereigntyLevel,
-    PROFILES,
-    current_profile,
-    profile_for,
-)
-from .recovery.phoenix_recovery import (
-    PhoenixRecovery,
-    RecoveryRecord,
-    RecoveryPhase,
-    RecoveryViolation,
-)
-from .runtime import (
-    AdmissionViolation,
-    AdmissibilityObject,
-    LineageDecision,
-    NullCollapse,
-    SovereignRuntime,
-)
-from .vertical_slice import CanonicalVerticalSlice, VerticalSliceOutcome
+from importlib import import_module
+
+# Public names are resolved lazily (PEP 562): ``import core`` stays cheap and
+# each layer is imported on first attribute access.  Maps name -> submodule.
+_EXPORTS = {
+    "TASGene": ".gene",
+    "Decision": ".gene",
+    "WakeChain": ".wakechain",
+    "WakeLink": ".wakechain",
+    "LinkKind": ".wakechain",
+    "MerkleTree": ".merkle",
+    "verify_many": ".merkle",
+    "verify_proof": ".merkle",
+    "AuthoritySnapshot": ".authority.authority_snapshot",
+    "DefinitionID": ".semantics.definition_id",
+    "ContextSnapshot": ".semantics.context_snapshot",
+    "UniversalVerifierKernel": ".verification.universal_verifier",
+    "VerificationResult": ".verification.universal_verifier",
+    "SUPPORTED_CANONICALIZATION": ".verification.universal_verifier",
+    "DeploymentProfile": ".deployment_profile",
+    "SovereigntyLevel": ".deployment_profile",
+    "PROFILES": ".deployment_profile",
+    "current_profile": ".deployment_profile",
+    "profile_for": ".deployment_profile",
+    "PhoenixRecovery": ".recovery.phoenix_recovery",
+    "RecoveryRecord": ".recovery.phoenix_recovery",
+    "RecoveryPhase": ".recovery.phoenix_recovery",
+    "RecoveryViolation": ".recovery.phoenix_recovery",
+    "AdmissionViolation": ".runtime",
+    "AdmissibilityObject": ".runtime",
+    "LineageDecision": ".runtime",
+    "NullCollapse": ".runtime",
+    "SovereignRuntime": ".runtime",
+    "CanonicalVerticalSlice": ".vertical_slice",
+    "VerticalSliceOutcome": ".vertical_slice",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Evidentiary layer
@@ -59,6 +79,9 @@ __all__ = [
     "WakeChain",
     "WakeLink",
     "LinkKind",
+    "MerkleTree",
+    "verify_proof",
+    "verify_many",
     # Institutional sovereignty
     "AuthoritySnapshot",
     # Semantic sovereignty
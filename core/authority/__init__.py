@@ -1,5 +1,18 @@
 """TAS institutional sovereignty layer: AuthoritySnapshot."""
 from .authority_snapshot import AuthoritySnapshot
-from .capability import CapabilityGrant, CapabilityTable
+from .capability import (
+    CapabilityGrant,
+    CapabilityStore,
+    CapabilityTable,
+    InMemoryCapabilityStore,
+)
+from .capability_store import SQLiteCapabilityStore
 
-__all__ = ["AuthoritySnapshot", "CapabilityGrant", "CapabilityTable"]
+__all__ = [
+    "AuthoritySnapshot",
+    "CapabilityGrant",
+    "CapabilityStore",
+    "CapabilityTable",
+    "InMemoryCapabilityStore",
+    "SQLiteCapabilityStore",
+]
@@ -4,21 +4,33 @@ Tokens are self-authenticating canonical payloads, but validation also requires
 the token to exist in this table.  That makes revocation and unknown-token
 rejection fail closed rather than treating possession of the master key output
 as ambient authority.
+
+Grants and revocations live in a ``CapabilityStore``.  The default
+``InMemoryCapabilityStore`` is process-local; ``SQLiteCapabilityStore`` in
+``core.authority.capability_store`` is durable and shared between processes.
 """
 
 from __future__ import annotations
 
 import base64
 import hashlib
+import heapq
 import hmac
 import json
 import math
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Protocol
+
+from tas_keyed_mac import KeyedMAC
 
 
 TOKEN_VERSION = 1
+_PAYLOAD_FIELDS = frozenset(
+    {"expires_at", "issued_at", "rights", "steward_id", "token_id", "version"}
+)
 
 
 def _canonical_bytes(payload: dict) -> bytes:
@@ -50,12 +62,79 @@ class CapabilityGrant:
     expires_at: float
 
 
+class CapabilityStore(Protocol):
+    """Persistence boundary for grants and revocations."""
+
+    def next_sequence(self) -> int:
+        """Return a sequence number never handed out before by this store."""
+        ...
+
+    def put(self, grant: CapabilityGrant) -> None: ...
+
+    def get(self, token_id: str) -> CapabilityGrant | None: ...
+
+    def revoke(self, token_id: str) -> None: ...
+
+    def is_revoked(self, token_id: str) -> bool: ...
+
+    def sweep(self, now: float) -> int:
+        """Drop grants (and their revocations) expired at ``now``; return the count."""
+        ...
+
+
+class InMemoryCapabilityStore:
+    """Process-local store with a min-heap expiry index.
+
+    ``sweep`` pops only expired heap entries, so each purge costs O(log n).
+    """
+
+    def __init__(self) -> None:
+        self._grants: dict[str, CapabilityGrant] = {}
+        self._revoked: set[str] = set()
+        self._expiry: list[tuple[float, str]] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._grants)
+
+    def next_sequence(self) -> int:
+        self._sequence += 1
+        return self._sequence
+
+    def put(self, grant: CapabilityGrant) -> None:
+        self._grants[grant.token_id] = grant
+        heapq.heappush(self._expiry, (grant.expires_at, grant.token_id))
+
+    def get(self, token_id: str) -> CapabilityGrant | None:
+        return self._grants.get(token_id)
+
+    def revoke(self, token_id: str) -> None:
+        self._revoked.add(token_id)
+
+    def is_revoked(self, token_id: str) -> bool:
+        return token_id in self._revoked
+
+    def sweep(self, now: float) -> int:
+        purged = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            _, token_id = heapq.heappop(self._expiry)
+            if self._grants.pop(token_id, None) is not None:
+                purged += 1
+            self._revoked.discard(token_id)
+        return purged
+
+
 class CapabilityTable:
     """Mint, validate, and revoke explicitly scoped HMAC capabilities.
 
     ``clock`` is injectable so expiration behavior is reproducible in tests.
     Production callers should keep the default wall clock and protect
     ``master_secret`` in an appropriate key-management boundary.
+
+    Authenticated token payloads are kept in a bounded LRU of
+    ``auth_cache_size`` entries keyed by the exact token string, so repeated
+    validation skips the HMAC and JSON work.  Registration, revocation and
+    expiry are still read from ``store`` on every call.
     """
 
     def __init__(
@@ -63,14 +142,19 @@ class CapabilityTable:
         master_secret: bytes,
         *,
         clock: Callable[[], float] = time.time,
+        store: CapabilityStore | None = None,
+        auth_cache_size: int = 4096,
     ) -> None:
         if not isinstance(master_secret, bytes) or len(master_secret) < 32:
             raise ValueError("master_secret must contain at least 32 bytes")
-        self._secret = master_secret
+        if auth_cache_size < 0:
+            raise ValueError("auth_cache_size must not be negative")
+        self._mac = KeyedMAC(master_secret)
         self._clock = clock
-        self._grants: dict[str, CapabilityGrant] = {}
-        self._revoked: set[str] = set()
-        self._sequence = 0
+        self._store = store if store is not None else InMemoryCapabilityStore()
+        self._auth_cache: OrderedDict[str, dict] = OrderedDict()
+        self._auth_cache_size = auth_cache_size
+        self._auth_lock = threading.Lock()
 
     def mint(
         self,
@@ -89,12 +173,11 @@ class CapabilityTable:
             raise ValueError("ttl_seconds must be finite and positive")
 
         issued_at = self._clock()
-        self._sequence += 1
         token_id = hashlib.sha256(
             _canonical_bytes(
                 {
                     "issued_at": issued_at,
-                    "sequence": self._sequence,
+                    "sequence": self._store.next_sequence(),
                     "steward_id": normalized_steward,
                 }
             )
@@ -108,16 +191,16 @@ class CapabilityTable:
             "version": TOKEN_VERSION,
         }
         encoded_payload = _encode(_canonical_bytes(payload))
-        signature = hmac.new(
-            self._secret, encoded_payload.encode("ascii"), hashlib.sha256
-        ).hexdigest()
+        signature = self._mac.hexdigest(encoded_payload.encode("ascii"))
         token = f"{encoded_payload}.{signature}"
-        self._grants[token_id] = CapabilityGrant(
-            token_id=token_id,
-            steward_id=normalized_steward,
-            rights=normalized_rights,
-            issued_at=issued_at,
-            expires_at=issued_at + ttl_seconds,
+        self._store.put(
+            CapabilityGrant(
+                token_id=token_id,
+                steward_id=normalized_steward,
+                rights=normalized_rights,
+                issued_at=issued_at,
+                expires_at=issued_at + ttl_seconds,
+            )
         )
         return token
 
@@ -127,9 +210,16 @@ class CapabilityTable:
         if error is not None or payload is None:
             raise ValueError(error or "TOKEN_INVALID")
         token_id = payload["token_id"]
-        if token_id not in self._grants:
+        if self._store.get(token_id) is None:
             raise ValueError("TOKEN_UNKNOWN")
-        self._revoked.add(token_id)
+        self._store.revoke(token_id)
+
+    def sweep_expired(self) -> int:
+        """Purge grants expired at the current clock; return how many were dropped.
+
+        Purged tokens subsequently validate as ``TOKEN_UNKNOWN``.
+        """
+        return self._store.sweep(self._clock())
 
     def validate_token(
         self,
@@ -143,10 +233,10 @@ class CapabilityTable:
             return False, error or "TOKEN_INVALID"
 
         token_id = payload["token_id"]
-        grant = self._grants.get(token_id)
+        grant = self._store.get(token_id)
         if grant is None:
             return False, "TOKEN_UNKNOWN"
-        if token_id in self._revoked:
+        if self._store.is_revoked(token_id):
             return False, "TOKEN_REVOKED"
         if not hmac.compare_digest(payload["steward_id"], steward_id):
             return False, "STEWARD_MISMATCH"
@@ -157,25 +247,32 @@ class CapabilityTable:
         return True, None
 
     def _authenticate(self, token: str) -> tuple[dict | None, str | None]:
+        cache = self._auth_cache
+        if isinstance(token, str):
+            with self._auth_lock:
+                cached = cache.get(token)
+                if cached is not None:
+                    cache.move_to_end(token)
+                    return cached, None
+        # Authenticate outside the lock; concurrent misses just race to insert.
+        payload, error = self._authenticate_uncached(token)
+        if payload is not None and self._auth_cache_size:
+            with self._auth_lock:
+                cache[token] = payload
+                if len(cache) > self._auth_cache_size:
+                    cache.popitem(last=False)
+        return payload, error
+
+    def _authenticate_uncached(self, token: str) -> tuple[dict | None, str | None]:
         try:
             encoded_payload, supplied_signature = token.split(".", 1)
-            expected_signature = hmac.new(
-                self._secret, encoded_payload.encode("ascii"), hashlib.sha256
-            ).hexdigest()
+            expected_signature = self._mac.hexdigest(encoded_payload.encode("ascii"))
             if not hmac.compare_digest(expected_signature, supplied_signature):
                 return None, "INVALID_SIGNATURE"
             payload = json.loads(_decode(encoded_payload))
             if not isinstance(payload, dict) or payload.get("version") != TOKEN_VERSION:
                 return None, "UNSUPPORTED_TOKEN_VERSION"
-            required = {
-                "expires_at",
-                "issued_at",
-                "rights",
-                "steward_id",
-                "token_id",
-                "version",
-            }
-            if set(payload) != required or _canonical_bytes(payload) != _decode(encoded_payload):
+            if payload.keys() != _PAYLOAD_FIELDS or _canonical_bytes(payload) != _decode(encoded_payload):
                 return None, "MALFORMED_TOKEN"
             if not isinstance(payload["token_id"], str):
                 return None, "MALFORMED_TOKEN"
@@ -0,0 +1,153 @@
+"""Durable, multi-process capability store on SQLite.
+
+Every worker opens its own ``SQLiteCapabilityStore`` on the same database
+file.  Grants are keyed by the raw 32-byte token id, an index on
+``expires_at`` is the time-ordered expiry structure used by ``sweep``, and
+revocations are a ``WITHOUT ROWID`` table of token ids, so the revocation set
+is compact and immediately visible to every process.  One instance may be
+shared between threads; a lock serialises use of its connection.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from .capability import CapabilityGrant
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS capability_grants (
+    token_id   BLOB PRIMARY KEY,
+    steward_id TEXT NOT NULL,
+    rights     TEXT NOT NULL,
+    issued_at  REAL NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS capability_grants_expiry
+    ON capability_grants (expires_at);
+CREATE TABLE IF NOT EXISTS capability_revocations (
+    token_id BLOB PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS capability_sequence (
+    id    INTEGER PRIMARY KEY CHECK (id = 0),
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO capability_sequence (id, value) VALUES (0, 0);
+"""
+
+
+class SQLiteCapabilityStore:
+    """``CapabilityStore`` shared by all processes opening the same file."""
+
+    def __init__(self, path: str | Path, *, timeout: float = 30.0) -> None:
+        self._db = sqlite3.connect(
+            str(path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "SQLiteCapabilityStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM capability_grants").fetchone()[0]
+
+    def next_sequence(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                "UPDATE capability_sequence SET value = value + 1 WHERE id = 0 RETURNING value"
+            ).fetchone()[0]
+
+    def put(self, grant: CapabilityGrant) -> None:
+        with self._lock:
+            self._insert(grant)
+
+    def put_many(self, grants: list[CapabilityGrant]) -> None:
+        """Insert many grants in one transaction (bulk provisioning)."""
+        with self._lock, self._transaction():
+            for grant in grants:
+                self._insert(grant)
+
+    def _insert(self, grant: CapabilityGrant) -> None:
+        self._db.execute(
+            "INSERT INTO capability_grants VALUES (?, ?, ?, ?, ?)",
+            (
+                bytes.fromhex(grant.token_id),
+                grant.steward_id,
+                json.dumps(sorted(grant.rights), separators=(",", ":")),
+                grant.issued_at,
+                grant.expires_at,
+            ),
+        )
+
+    def get(self, token_id: str) -> CapabilityGrant | None:
+        try:
+            key = bytes.fromhex(token_id)
+        except ValueError:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT steward_id, rights, issued_at, expires_at"
+                " FROM capability_grants WHERE token_id = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        steward_id, rights, issued_at, expires_at = row
+        return CapabilityGrant(
+            token_id=token_id,
+            steward_id=steward_id,
+            rights=frozenset(json.loads(rights)),
+            issued_at=issued_at,
+            expires_at=expires_at,
+        )
+
+    def revoke(self, token_id: str) -> None:
+        key = bytes.fromhex(token_id)
+        with self._lock:
+            self._db.execute("INSERT OR IGNORE INTO capability_revocations VALUES (?)", (key,))
+
+    def is_revoked(self, token_id: str) -> bool:
+        try:
+            key = bytes.fromhex(token_id)
+        except ValueError:
+            return False
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM capability_revocations WHERE token_id = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def sweep(self, now: float) -> int:
+        with self._lock, self._transaction():
+            self._db.execute(
+                "DELETE FROM capability_revocations WHERE token_id IN"
+                " (SELECT token_id FROM capability_grants WHERE expires_at <= ?)",
+                (now,),
+            )
+            return self._db.execute(
+                "DELETE FROM capability_grants WHERE expires_at <= ?", (now,)
+            ).rowcount
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
@@ -1,6 +1,16 @@
 # core/geometry/topology.py
 # Runs inside the Secure Monitor / TEE
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable, Mapping, Optional
+
+try:  # NumPy is optional; WindingEngine falls back to update_winding without it.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
 # Mock constants for the return values and functions that were undefined in the prompt
 FAIL_F8_TOPOLOGY_BREACH = "FAIL_F8_TOPOLOGY_BREACH"
 PASS_P7_TOPOLOGICAL_CONSISTENCY = "PASS_P7_TOPOLOGICAL_CONSISTENCY"
@@ -33,25 +43,23 @@ def update_winding(x_prev, x_curr, anchor):
     v_prev = (x_prev[0] - anchor[0], x_prev[1] - anchor[1])
     v_curr = (x_curr[0] - anchor[0], x_curr[1] - anchor[1])
 
-    q_prev = compute_quadrant(*v_prev)
-    q_curr = compute_quadrant(*v_curr)
-
     # 2D Cross Product Determinant to determine rotation direction
     # > 0 means Counter-Clockwise, < 0 means Clockwise
     cross_product = (v_prev[0] * v_curr[1]) - (v_prev[1] * v_curr[0])
 
     winding_delta = 0
 
-    # Check for boundary crossings between Quadrant 1 and Quadrant 4
-    if q_prev == 4 and q_curr == 1 and cross_product > 0:
+    # Count crossings of the positive x-axis ray from the anchor (the
+    # Quadrant 4 / Quadrant 1 boundary).  A step that enters Quadrant 1 or 2
+    # from Quadrant 3 or 4 crosses the x-axis; the sign of the cross product
+    # tells whether it passed right of the anchor (through the ray) or left.
+    # This agrees with the Quadrant 4 <-> 1 rule for adjacent steps and also
+    # catches steps that jump several quadrants at once.
+    if v_prev[1] < 0 <= v_curr[1] and cross_product > 0:
         winding_delta = 1
-    elif q_prev == 1 and q_curr == 4 and cross_product < 0:
+    elif v_curr[1] < 0 <= v_prev[1] and cross_product < 0:
         winding_delta = -1
 
-    # Note: A robust implementation will also track half-windings or
-    # enforce that the step size is strictly smaller than the distance
-    # to the anchor to prevent jumping multiple quadrants in one step.
-
     return winding_delta
 
 def verify_topology(state_history, proposed_state, active_anchors, allowed_classes):
@@ -75,4 +83,175 @@ def verify_topology(state_history, proposed_state, active_anchors, allowed_class
             return FAIL_F8_TOPOLOGY_BREACH, anchor_id, new_w
 
     return PASS_P7_TOPOLOGICAL_CONSISTENCY
-# Nonce: 13852
+
+
+@dataclass(frozen=True)
+class TrajectoryVerdict:
+    """Outcome of checking a whole trajectory with WindingEngine.
+
+    ``breach_index`` is the index into the trajectory of the first state whose
+    arrival takes a winding accumulator out of its allowed classes; ties within
+    a step go to the first anchor in engine order, as in verify_topology.
+    """
+
+    status: str
+    breach_index: Optional[int] = None
+    anchor_id: Optional[Hashable] = None
+    winding: Optional[int] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.status == PASS_P7_TOPOLOGICAL_CONSISTENCY
+
+
+class WindingEngine:
+    """Winding accumulators for many anchors, checked a trajectory at a time.
+
+    ``trajectory`` is an ``(n, 2)`` array of projected states shared by every
+    anchor, or ``(n, k, 2)`` with one projection per anchor; ``trajectory[0]``
+    is the last attested state.  Winding deltas for the whole
+    ``(n - 1) x k`` step/anchor matrix are computed with array operations in
+    chunks of ``chunk_size`` steps, stopping at the first F8 breach.  Without
+    NumPy the engine steps through update_winding with the same results.
+    """
+
+    def __init__(
+        self,
+        anchors: Mapping[Hashable, Iterable[float]],
+        allowed_classes: Mapping[Hashable, Iterable[int]],
+        accumulators: Optional[Mapping[Hashable, int]] = None,
+        *,
+        chunk_size: int = 1 << 16,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.anchor_ids = tuple(anchors)
+        self.chunk_size = chunk_size
+        coords = [tuple(anchors[anchor_id]) for anchor_id in self.anchor_ids]
+        allowed = [sorted(set(allowed_classes[anchor_id])) for anchor_id in self.anchor_ids]
+        start = [int((accumulators or {}).get(anchor_id, 0)) for anchor_id in self.anchor_ids]
+        if np is not None:
+            self._anchors = np.asarray(coords, dtype=np.float64).reshape(len(coords), 2)
+            self._allowed = [np.asarray(classes, dtype=np.int64) for classes in allowed]
+            self.accumulators = np.asarray(start, dtype=np.int64)
+        else:
+            self._anchors = coords
+            self._allowed = [frozenset(classes) for classes in allowed]
+            self.accumulators = start
+
+    def windings(self) -> dict[Hashable, int]:
+        """Return the committed winding accumulator of every anchor."""
+        return {anchor_id: int(w) for anchor_id, w in zip(self.anchor_ids, self.accumulators)}
+
+    def winding_deltas(self, trajectory: Any) -> Any:
+        """Return the ``(n - 1, k)`` matrix of per-step winding deltas."""
+        if np is None:
+            points = self._points(trajectory)
+            return [
+                [update_winding(a[j], b[j], self._anchors[j]) for j in range(len(self._anchors))]
+                for a, b in zip(points, points[1:])
+            ]
+        return self._deltas(self._points(trajectory))
+
+    def check(self, trajectory: Any) -> TrajectoryVerdict:
+        """Check *trajectory* without committing the accumulators."""
+        return self._run(trajectory)[0]
+
+    def advance(self, trajectory: Any) -> TrajectoryVerdict:
+        """Check *trajectory* and commit the accumulators if it passes."""
+        verdict, final = self._run(trajectory)
+        if final is not None:
+            self.accumulators = final
+        return verdict
+
+    # ------------------------------------------------------------------ #
+
+    def _points(self, trajectory: Any) -> Any:
+        k = len(self.anchor_ids)
+        if np is None:
+            points = []
+            for state in trajectory:
+                state = list(state)
+                if state and not isinstance(state[0], (int, float)):
+                    if len(state) != k:
+                        raise ValueError("per-anchor trajectory must have one point per anchor")
+                    points.append([tuple(p) for p in state])
+                else:
+                    points.append([tuple(state)] * k)
+            return points
+        points = np.asarray(trajectory, dtype=np.float64)
+        if points.ndim == 2 and points.shape[1] == 2:
+            return points[:, None, :]
+        if points.ndim == 3 and points.shape[1:] == (k, 2):
+            return points
+        raise ValueError("trajectory must have shape (n, 2) or (n, anchors, 2)")
+
+    def _deltas(self, points: Any) -> Any:
+        # Same arithmetic as update_winding, broadcast over steps x anchors.
+        vx = points[..., 0] - self._anchors[:, 0]
+        vy = points[..., 1] - self._anchors[:, 1]
+        x0, y0, x1, y1 = vx[:-1], vy[:-1], vx[1:], vy[1:]
+        cross = x0 * y1 - y0 * x1
+        up = (y0 < 0) & (y1 >= 0) & (cross > 0)
+        down = (y1 < 0) & (y0 >= 0) & (cross < 0)
+        return up.astype(np.int8) - down.astype(np.int8)
+
+    def _run(self, trajectory: Any) -> tuple[TrajectoryVerdict, Any]:
+        points = self._points(trajectory)
+        if np is None:
+            return self._run_python(points)
+        k = len(self.anchor_ids)
+        accumulated = self.accumulators
+        if k == 0:
+            return TrajectoryVerdict(PASS_P7_TOPOLOGICAL_CONSISTENCY), accumulated
+        for start in range(0, max(len(points) - 1, 0), self.chunk_size):
+            chunk = points[start:start + self.chunk_size + 1]
+            windings = accumulated + np.cumsum(self._deltas(chunk), axis=0, dtype=np.int64)
+            breached = ~self._admissible(windings)
+            if breached.any():
+                step, column = divmod(int(breached.argmax()), k)
+                return (
+                    TrajectoryVerdict(
+                        FAIL_F8_TOPOLOGY_BREACH,
+                        breach_index=start + step + 1,
+                        anchor_id=self.anchor_ids[column],
+                        winding=int(windings[step, column]),
+                    ),
+                    None,
+                )
+            accumulated = windings[-1]
+        return TrajectoryVerdict(PASS_P7_TOPOLOGICAL_CONSISTENCY), accumulated.copy()
+
+    def _admissible(self, windings: Any) -> Any:
+        k = len(self.anchor_ids)
+        low, high = int(windings.min()), int(windings.max())
+        span = high - low + 1
+        if span * k > 1 << 22:
+            return np.stack(
+                [np.isin(windings[:, j], self._allowed[j]) for j in range(k)], axis=1
+            )
+        # Lookup table over the winding values actually reached in this chunk.
+        table = np.zeros((k, span), dtype=bool)
+        for j, classes in enumerate(self._allowed):
+            reached = classes[(classes >= low) & (classes <= high)]
+            table[j, reached - low] = True
+        return table[np.arange(k), windings - low]
+
+    def _run_python(self, points: list) -> tuple[TrajectoryVerdict, Any]:
+        accumulated = list(self.accumulators)
+        for index in range(1, len(points)):
+            previous, current = points[index - 1], points[index]
+            for j, anchor_id in enumerate(self.anchor_ids):
+                accumulated[j] += update_winding(previous[j], current[j], self._anchors[j])
+                if accumulated[j] not in self._allowed[j]:
+                    return (
+                        TrajectoryVerdict(
+                            FAIL_F8_TOPOLOGY_BREACH,
+                            breach_index=index,
+                            anchor_id=anchor_id,
+                            winding=accumulated[j],
+                        ),
+                        None,
+                    )
+        return TrajectoryVerdict(PASS_P7_TOPOLOGICAL_CONSISTENCY), accumulated
+# Nonce: 50552
@@ -0,0 +1,219 @@
+"""Dependency-free TAS-v1 Merkle accumulator.
+
+Implements the domain-separated construction pinned by
+``conformance-tests/merkle/vectors_v1_sha256.json``:
+
+* leaf  = SHA-256(``TAS\\0v1\\0LEAF\\0`` || canonical bytes)
+* node  = SHA-256(``TAS\\0v1\\0NODE\\0`` || left || right)
+* empty = SHA-256(``TAS\\0v1\\0EMPTY\\0``)
+
+Leaves keep their input order and an odd node at the end of a level is
+promoted unchanged.  Every level is kept in memory, so appending a leaf
+rehashes only its O(log n) ancestors and proofs are read straight from the
+stored levels.
+
+Proofs use the ``[{"left": hex} | {"right": hex}, ...]`` shape written by
+earlier HCCC batches: each step names the side on which the sibling sits.
+A promoted node contributes no step.
+
+Batches written before TAS-v1 used merkletools: leaves were plain SHA-256
+digests and nodes ``SHA-256(left || right)`` with no domain headers, in the
+same tree shape and proof format.  Their roots do not verify under TAS-v1;
+check them with ``verify_legacy_proof`` instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, Iterable, Sequence
+
+LEAF_HEADER = b"TAS\x00v1\x00LEAF\x00"
+NODE_HEADER = b"TAS\x00v1\x00NODE\x00"
+EMPTY_HEADER = b"TAS\x00v1\x00EMPTY\x00"
+
+EMPTY_ROOT = hashlib.sha256(EMPTY_HEADER).digest()
+
+Proof = list[dict[str, str]]
+
+_LEAF_PREFIX = hashlib.sha256(LEAF_HEADER)
+_NODE_PREFIX = hashlib.sha256(NODE_HEADER)
+
+
+def canonical_json(value: Any) -> bytes:
+    """Return the RFC8785-style canonical bytes used for TAS-v1 leaves."""
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def leaf_hash(data: bytes) -> bytes:
+    digest = _LEAF_PREFIX.copy()
+    digest.update(data)
+    return digest.digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    digest = _NODE_PREFIX.copy()
+    digest.update(left)
+    digest.update(right)
+    return digest.digest()
+
+
+def legacy_node_hash(left: bytes, right: bytes) -> bytes:
+    """Undomained ``SHA-256(left || right)`` node of pre-TAS-v1 batches."""
+    return hashlib.sha256(left + right).digest()
+
+
+class MerkleTree:
+    """Append-only TAS-v1 Merkle tree with O(log n) append and proofs."""
+
+    def __init__(self, leaves: Iterable[bytes] = ()) -> None:
+        self._levels: list[list[bytes]] = [[]]
+        for leaf in leaves:
+            self.append_leaf_hash(leaf)
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    def append(self, data: bytes) -> int:
+        """Hash ``data`` under the LEAF domain and append it; return its index."""
+        return self.append_leaf_hash(leaf_hash(data))
+
+    def append_leaf_hash(self, digest: bytes) -> int:
+        """Append an already domain-hashed leaf and return its index."""
+        levels = self._levels
+        index = len(levels[0])
+        levels[0].append(digest)
+        position = index
+        depth = 0
+        while len(levels[depth]) > 1:
+            parent = position >> 1
+            level = levels[depth]
+            left = parent << 1
+            value = (
+                node_hash(level[left], level[left + 1])
+                if left + 1 < len(level)
+                else level[left]
+            )
+            if depth + 1 == len(levels):
+                levels.append([])
+            above = levels[depth + 1]
+            if parent < len(above):
+                above[parent] = value
+            else:
+                above.append(value)
+            position = parent
+            depth += 1
+        return index
+
+    @property
+    def root(self) -> bytes:
+        if not self._levels[0]:
+            return EMPTY_ROOT
+        return self._levels[-1][0]
+
+    def root_hex(self) -> str:
+        return self.root.hex()
+
+    def levels(self) -> list[list[str]]:
+        """Return every level as hex, leaves first (the vector ``expected_levels``)."""
+        if not self._levels[0]:
+            return []
+        return [[node.hex() for node in level] for level in self._levels]
+
+    def proof(self, index: int) -> Proof:
+        """Return the inclusion proof for leaf ``index`` in O(log n)."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"leaf index {index} out of range")
+        steps: Proof = []
+        for level in self._levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                side = "left" if sibling < index else "right"
+                steps.append({side: level[sibling].hex()})
+            index >>= 1
+        return steps
+
+    def proofs(self) -> list[Proof]:
+        """Return proofs for every leaf, reading each level once."""
+        count = len(self)
+        steps: list[Proof] = [[] for _ in range(count)]
+        for depth, level in enumerate(self._levels[:-1]):
+            hexed = [node.hex() for node in level]
+            width = len(level)
+            for index in range(count):
+                position = index >> depth
+                sibling = position ^ 1
+                if sibling < width:
+                    side = "left" if sibling < position else "right"
+                    steps[index].append({side: hexed[sibling]})
+        return steps
+
+
+def _fold(
+    digest: bytes,
+    proof: Proof,
+    memo: dict[tuple[bytes, bytes], bytes] | None,
+    combine: Callable[[bytes, bytes], bytes] = node_hash,
+) -> bytes:
+    for step in proof:
+        if len(step) != 1:
+            raise ValueError("proof step must name exactly one side")
+        ((side, sibling_hex),) = step.items()
+        sibling = bytes.fromhex(sibling_hex)
+        if side == "left":
+            pair = (sibling, digest)
+        elif side == "right":
+            pair = (digest, sibling)
+        else:
+            raise ValueError(f"unknown proof side: {side!r}")
+        if memo is None:
+            digest = combine(*pair)
+            continue
+        cached = memo.get(pair)
+        if cached is None:
+            cached = memo[pair] = combine(*pair)
+        digest = cached
+    return digest
+
+
+def verify_proof(leaf: bytes, proof: Proof, root: bytes | str) -> bool:
+    """Return whether ``proof`` links the leaf hash ``leaf`` to ``root``."""
+    expected = bytes.fromhex(root) if isinstance(root, str) else root
+    try:
+        return _fold(leaf, proof, None) == expected
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+def verify_legacy_proof(leaf: bytes, proof: Proof, root: bytes | str) -> bool:
+    """Like ``verify_proof`` for a pre-TAS-v1 (merkletools) batch.
+
+    ``leaf`` is the plain SHA-256 digest of the leaf bytes.
+    """
+    expected = bytes.fromhex(root) if isinstance(root, str) else root
+    try:
+        return _fold(leaf, proof, None, legacy_node_hash) == expected
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+def verify_many(
+    items: Sequence[tuple[bytes, Proof]], root: bytes | str, *, legacy: bool = False
+) -> list[bool]:
+    """Verify many ``(leaf_hash, proof)`` pairs against one root.
+
+    Interior nodes shared between proofs are hashed once per call.  With
+    ``legacy`` the pairs are checked as in ``verify_legacy_proof``.
+    """
+    combine = legacy_node_hash if legacy else node_hash
+    expected = bytes.fromhex(root) if isinstance(root, str) else root
+    memo: dict[tuple[bytes, bytes], bytes] = {}
+    results = []
+    for leaf, proof in items:
+        try:
+            results.append(_fold(leaf, proof, memo, combine) == expected)
+        except (AttributeError, TypeError, ValueError):
+            results.append(False)
+    return results
@@ -15,17 +15,29 @@ Special guards:
   ENERGY_INVALID  — total is NaN or non-finite (always MUTINY)
   ENERGY_NEGATIVE — total is negative (always MUTINY)
   COOLDOWN_ACTIVE — within cooldown window after a trip (MUTINY held)
+
+MutinyBank runs the same state machine for many streams at once, keyed by
+integer stream id, and reports only state transitions.  Cooldowns are
+measured on the sample timestamps rather than the wall clock.  NumPy is used
+when installed; otherwise the bank falls back to a pure-Python loop with the
+same results.
 """
 
 from __future__ import annotations
 
 import math
 import time
+from array import array
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional, Sequence
 
 from core.physics.tasw_hamiltonian import EnergyState
 
+try:  # NumPy is optional; MutinyBank falls back to pure Python without it.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
 
 @dataclass(frozen=True)
 class MutinyEvent:
@@ -159,22 +171,10 @@ class MutinyDetector:
     # ------------------------------------------------------------------ #
 
     def _nominal(self, total: float) -> MutinyEvent:
-        return MutinyEvent(
-            severity="NOMINAL",
-            trigger_code="NOMINAL",
-            energy_total=total,
-            is_mutiny=False,
-            message=f"Energy {total} within constitutional bounds",
-        )
+        return _nominal_event(total)
 
     def _friction(self, total: float) -> MutinyEvent:
-        return MutinyEvent(
-            severity="FRICTION",
-            trigger_code="HIGH_CONSTITUTIONAL_FRICTION",
-            energy_total=total,
-            is_mutiny=False,
-            message=f"Energy {total} exceeds friction threshold {self._ft}",
-        )
+        return _friction_event(total, self._ft)
 
     def _trip(self, code: str, message: str, total: float) -> MutinyEvent:
         self._state = "MUTINY"
@@ -186,3 +186,310 @@ class MutinyDetector:
             is_mutiny=True,
             message=message,
         )
+
+
+def _nominal_event(total: float) -> MutinyEvent:
+    return MutinyEvent(
+        severity="NOMINAL",
+        trigger_code="NOMINAL",
+        energy_total=total,
+        is_mutiny=False,
+        message=f"Energy {total} within constitutional bounds",
+    )
+
+
+def _friction_event(total: float, friction_threshold: float) -> MutinyEvent:
+    return MutinyEvent(
+        severity="FRICTION",
+        trigger_code="HIGH_CONSTITUTIONAL_FRICTION",
+        energy_total=total,
+        is_mutiny=False,
+        message=f"Energy {total} exceeds friction threshold {friction_threshold}",
+    )
+
+
+# ---------------------------------------------------------------------- #
+# Multi-stream bank                                                        #
+# ---------------------------------------------------------------------- #
+
+_NOMINAL, _FRICTION, _MUTINY = 0, 1, 2
+_SEVERITIES = ("NOMINAL", "FRICTION", "MUTINY")
+
+# Levels narrower than this are stepped one sample at a time; array
+# operations only pay off once a level spans enough streams.
+_VECTOR_MIN_WIDTH = 16
+
+
+@dataclass(frozen=True)
+class MutinyTransition:
+    """A change of severity on one stream, emitted by MutinyBank.process."""
+
+    stream_id: int
+    timestamp: float
+    previous: str          # severity before the sample
+    event: MutinyEvent     # event for the sample that caused the change
+
+
+class MutinyBank:
+    """Many MutinyDetector state machines held in compact per-stream arrays.
+
+    Stream ids are non-negative integers and index the arrays directly, so
+    they should be dense (e.g. agent slot numbers).  Every stream starts in
+    NOMINAL.  ``process`` applies a batch of ``(stream_id, timestamp, total)``
+    samples — each stream's samples in the order given — and returns the
+    transitions in input order.  Hysteresis and cooldown behave exactly as in
+    MutinyDetector, with ``timestamp`` standing in for ``time.monotonic()``.
+    """
+
+    def __init__(
+        self,
+        friction_threshold: float = 10.0,
+        mutiny_threshold: float = 20.0,
+        hysteresis: float = 0.0,
+        cooldown_seconds: float = 0.0,
+        *,
+        capacity: int = 0,
+    ) -> None:
+        self._ft = friction_threshold
+        self._mt = mutiny_threshold
+        self._cooldown = cooldown_seconds
+        self._mutiny_off = mutiny_threshold * (1.0 - hysteresis)
+        self._friction_off = friction_threshold * (1.0 - hysteresis)
+        if np is not None:
+            self._state = np.zeros(capacity, dtype=np.int8)
+            self._last_trip = np.zeros(capacity, dtype=np.float64)
+        else:
+            self._state = array("b", bytes(capacity))
+            self._last_trip = array("d", [0.0]) * capacity
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def state(self, stream_id: int) -> str:
+        """Return the current severity of *stream_id* (NOMINAL if unseen)."""
+        if 0 <= stream_id < len(self._state):
+            return _SEVERITIES[self._state[stream_id]]
+        return "NOMINAL"
+
+    # ------------------------------------------------------------------ #
+    # Processing                                                           #
+    # ------------------------------------------------------------------ #
+
+    def process(self, samples: Any) -> list[MutinyTransition]:
+        """Apply an ``(n, 3)`` array (or iterable) of samples.
+
+        Columns are ``stream_id``, ``timestamp`` and ``total``.
+        """
+        if np is not None:
+            samples = np.asarray(samples, dtype=np.float64)
+            if samples.size == 0:
+                return []
+            if samples.ndim != 2 or samples.shape[1] != 3:
+                raise ValueError("samples must have shape (n, 3)")
+            return self.process_columns(samples[:, 0], samples[:, 1], samples[:, 2])
+        rows = [tuple(row) for row in samples]
+        if any(len(row) != 3 for row in rows):
+            raise ValueError("samples must be (stream_id, timestamp, total) triples")
+        if not rows:
+            return []
+        ids, timestamps, totals = zip(*rows)
+        return self.process_columns(ids, timestamps, totals)
+
+    def process_columns(
+        self,
+        stream_ids: Sequence[Any],
+        timestamps: Sequence[float],
+        totals: Sequence[float],
+    ) -> list[MutinyTransition]:
+        """Apply samples given as three equal-length columns."""
+        if np is None:
+            return self._process_python(stream_ids, timestamps, totals)
+        raw_ids = np.asarray(stream_ids)
+        ids = raw_ids.astype(np.int64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        totals = np.asarray(totals, dtype=np.float64)
+        if not (ids.shape == timestamps.shape == totals.shape) or ids.ndim != 1:
+            raise ValueError("stream_ids, timestamps and totals must be 1-D and equal length")
+        if ids.size == 0:
+            return []
+        if (ids < 0).any() or (ids != raw_ids).any():
+            raise ValueError("stream ids must be non-negative integers")
+        self._reserve(int(ids.max()) + 1)
+
+        # Group samples into levels: level k holds the k-th sample of every
+        # stream that has one.  Streams are independent, so a level is
+        # stepped as a single array operation.
+        by_stream = np.argsort(ids, kind="stable")
+        sorted_ids = ids[by_stream]
+        starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+        rank = np.arange(ids.size) - np.repeat(starts, np.diff(np.r_[starts, ids.size]))
+        by_level = by_stream[np.argsort(rank, kind="stable")]
+        bounds = np.r_[0, np.cumsum(np.bincount(rank))]
+
+        changed: list[Any] = []
+        previous: list[Any] = []
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            index = by_level[lo:hi]
+            if hi - lo < _VECTOR_MIN_WIDTH:
+                for i in index.tolist():
+                    stream = int(ids[i])
+                    before = int(self._state[stream])
+                    if self._step(stream, float(timestamps[i]), float(totals[i])) != before:
+                        changed.append(np.array([i]))
+                        previous.append(np.array([before], dtype=np.int8))
+                continue
+            level_changed, level_previous = self._step_level(
+                ids[index], timestamps[index], totals[index]
+            )
+            changed.append(index[level_changed])
+            previous.append(level_previous)
+
+        if not changed:
+            return []
+        changed_index = np.concatenate(changed)
+        previous_state = np.concatenate(previous)
+        order = np.argsort(changed_index, kind="stable")
+        changed_index = changed_index[order]
+        previous_state = previous_state[order]
+        return self._transitions(
+            ids[changed_index].tolist(),
+            timestamps[changed_index].tolist(),
+            totals[changed_index].tolist(),
+            previous_state.tolist(),
+        )
+
+    def _process_python(
+        self,
+        stream_ids: Sequence[Any],
+        timestamps: Sequence[float],
+        totals: Sequence[float],
+    ) -> list[MutinyTransition]:
+        if not (len(stream_ids) == len(timestamps) == len(totals)):
+            raise ValueError("stream_ids, timestamps and totals must be equal length")
+        ids = []
+        for stream_id in stream_ids:
+            stream = int(stream_id)
+            if stream < 0 or stream != stream_id:
+                raise ValueError("stream ids must be non-negative integers")
+            ids.append(stream)
+        if not ids:
+            return []
+        self._reserve(max(ids) + 1)
+        hits: tuple[list[int], list[float], list[float], list[int]] = ([], [], [], [])
+        for stream, timestamp, total in zip(ids, timestamps, totals):
+            timestamp, total = float(timestamp), float(total)
+            before = self._state[stream]
+            if self._step(stream, timestamp, total) != before:
+                hits[0].append(stream)
+                hits[1].append(timestamp)
+                hits[2].append(total)
+                hits[3].append(before)
+        return self._transitions(*hits)
+
+    # ------------------------------------------------------------------ #
+    # State machine                                                        #
+    # ------------------------------------------------------------------ #
+
+    def _step(self, stream: int, timestamp: float, total: float) -> int:
+        """Advance one stream by one sample and return its new state."""
+        state = self._state[stream]
+        if not math.isfinite(total) or total < 0:
+            new = _MUTINY
+        elif (
+            state == _MUTINY
+            and self._cooldown > 0
+            and timestamp - self._last_trip[stream] < self._cooldown
+        ):
+            new = _MUTINY
+        elif total >= self._mt:
+            new = _MUTINY
+        elif state == _MUTINY:
+            new = _MUTINY if total >= self._mutiny_off else _FRICTION if total >= self._ft else _NOMINAL
+        elif state == _FRICTION:
+            new = _FRICTION if total >= self._ft or total >= self._friction_off else _NOMINAL
+        else:
+            new = _FRICTION if total >= self._ft else _NOMINAL
+        self._state[stream] = new
+        if new == _MUTINY:
+            self._last_trip[stream] = timestamp
+        return new
+
+    def _step_level(self, ids: Any, timestamps: Any, totals: Any) -> tuple[Any, Any]:
+        """Vectorised ``_step`` over distinct streams; returns (changed mask, old states)."""
+        state = self._state[ids]
+        last_trip = self._last_trip[ids]
+        with np.errstate(invalid="ignore"):
+            new = (totals >= self._ft).astype(np.int8)
+            new[totals >= self._mt] = _MUTINY
+            in_mutiny = state == _MUTINY
+            new[in_mutiny & (totals >= self._mutiny_off)] = _MUTINY
+            new[(state == _FRICTION) & (new == _NOMINAL) & (totals >= self._friction_off)] = _FRICTION
+            forced = ~np.isfinite(totals) | (totals < 0)
+            if self._cooldown > 0:
+                forced |= in_mutiny & (timestamps - last_trip < self._cooldown)
+        new[forced] = _MUTINY
+        tripped = new == _MUTINY
+        self._state[ids] = new
+        self._last_trip[ids] = np.where(tripped, timestamps, last_trip)
+        changed = new != state
+        return changed, state[changed]
+
+    def _transitions(
+        self,
+        ids: list[int],
+        timestamps: list[float],
+        totals: list[float],
+        previous: list[int],
+    ) -> list[MutinyTransition]:
+        transitions = []
+        # Transitions alternate per stream, so a stream's next transition
+        # starts from the state its previous one produced; the last state is
+        # the one now held in the arrays.
+        following: dict[int, int] = {}
+        for position in range(len(ids) - 1, -1, -1):
+            stream = ids[position]
+            new = following.get(stream, int(self._state[stream]))
+            following[stream] = previous[position]
+            transitions.append(
+                MutinyTransition(
+                    stream_id=stream,
+                    timestamp=timestamps[position],
+                    previous=_SEVERITIES[previous[position]],
+                    event=self._event(new, totals[position]),
+                )
+            )
+        transitions.reverse()
+        return transitions
+
+    def _event(self, state: int, total: float) -> MutinyEvent:
+        if state == _NOMINAL:
+            return _nominal_event(total)
+        if state == _FRICTION:
+            return _friction_event(total, self._ft)
+        # A transition into MUTINY is never a cooldown hold.
+        if not math.isfinite(total):
+            code, message = "ENERGY_INVALID", f"Non-finite energy: {total}"
+        elif total < 0:
+            code, message = "ENERGY_NEGATIVE", f"Negative energy: {total}"
+        else:
+            code = "HAMILTONIAN_LIMIT_EXCEEDED"
+            message = f"Energy {total} exceeds mutiny threshold {self._mt}"
+        return MutinyEvent(
+            severity="MUTINY",
+            trigger_code=code,
+            energy_total=total,
+            is_mutiny=True,
+            message=message,
+        )
+
+    def _reserve(self, size: int) -> None:
+        grow = size - len(self._state)
+        if grow <= 0:
+            return
+        grow = max(grow, len(self._state))  # amortised doubling
+        if np is not None:
+            self._state = np.concatenate([self._state, np.zeros(grow, dtype=np.int8)])
+            self._last_trip = np.concatenate([self._last_trip, np.zeros(grow)])
+        else:
+            self._state.extend(bytes(grow))
+            self._last_trip.extend([0.0] * grow)
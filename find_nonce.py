@@ -1,42 +1,153 @@
+import argparse
 import hashlib
-import sys
+import multiprocessing
 import os
+import sys
+import time
 
 TAS_HUMAN_SIG = "Russell Nordland"
 PREFIX = "1618"
 
-def find_nonce(filepath):
+# Nonces tried between checks of the shared best-so-far in parallel searches
+CHECK_INTERVAL = 4096
+
+def _base_content(filepath):
     with open(filepath, 'r') as f:
         original_content = f.read()
 
     # If there is already a nonce, we can replace it, or just append
     if "# Nonce:" in original_content:
-        base_content = original_content.split("# Nonce:")[0]
-    else:
-        # Check if it ends with newline
-        if not original_content.endswith('\n'):
-            base_content = original_content + '\n'
-        else:
-            base_content = original_content
+        return original_content.split("# Nonce:")[0]
+    # Check if it ends with newline
+    if not original_content.endswith('\n'):
+        return original_content + '\n'
+    return original_content
+
+def _write_nonce(filepath, base_content, nonce):
+    print(f"Found nonce {nonce} for {filepath}")
+    test_content = f"{base_content}# Nonce: {nonce}\n"
+    with open(filepath, 'w') as f:
+        f.write(test_content)
 
+def search_nonce(base_content, start=0, step=1, limit=None):
+    """
+    Return the first nonce >= start (stepping by step) whose stamped digest
+    starts with PREFIX, or None once the nonce exceeds limit.
+    """
     # Pre-compute the SHA-256 hash of the base content
-    base_hash = hashlib.sha256(base_content.encode())
+    return _search_from(hashlib.sha256(base_content.encode()), start, step, limit)
 
-    nonce = 0
-    while True:
+def _search_from(base_hash, start, step, limit):
+    """
+    search_nonce over an already computed hash of the base content.
+    """
+    nonce = start
+    while limit is None or nonce <= limit:
         # Use incremental updates for speed
         h = base_hash.copy()
-        nonce_str = f"# Nonce: {nonce}\n{TAS_HUMAN_SIG}"
-        h.update(nonce_str.encode())
-        digest = h.hexdigest()
-        if digest.startswith(PREFIX):
-            print(f"Found nonce {nonce} for {filepath}")
-            test_content = f"{base_content}# Nonce: {nonce}\n"
-            with open(filepath, 'w') as f:
-                f.write(test_content)
-            break
-        nonce += 1
+        h.update(f"# Nonce: {nonce}\n{TAS_HUMAN_SIG}".encode())
+        if h.hexdigest().startswith(PREFIX):
+            return nonce
+        nonce += step
+    return None
+
+def find_nonce(filepath):
+    base_content = _base_content(filepath)
+    nonce = search_nonce(base_content)
+    _write_nonce(filepath, base_content, nonce)
+    return nonce
+
+_best = None
+
+def _init_worker(best):
+    global _best
+    _best = best
+
+def _strided_search(base_content, offset, step):
+    """
+    Search nonces offset, offset + step, ... until a hit or until every
+    remaining candidate is above the best hit published by another worker.
+    """
+    base_hash = hashlib.sha256(base_content.encode())
+    start = offset
+    while True:
+        limit = min(_best.value, start + (CHECK_INTERVAL - 1) * step)
+        nonce = _search_from(base_hash, start, step, limit)
+        if nonce is not None:
+            with _best.get_lock():
+                if nonce < _best.value:
+                    _best.value = nonce
+            return nonce
+        start = limit + step
+        if start > _best.value:
+            return None
+
+def find_nonce_parallel(filepath, jobs=None):
+    """
+    Multi-process find_nonce. Worker k of N tries nonces k, k + N, ...;
+    workers stop once their next candidate exceeds the lowest hit found, so
+    the result always equals the serial search.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    base_content = _base_content(filepath)
+    best = multiprocessing.Value('q', 2**63 - 1)
+    with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(best,)) as pool:
+        hits = pool.starmap(_strided_search, [(base_content, k, jobs) for k in range(jobs)])
+    nonce = min(hit for hit in hits if hit is not None)
+    _write_nonce(filepath, base_content, nonce)
+    return nonce
+
+def find_nonces(filepaths, jobs=None):
+    """
+    Stamp many files concurrently, one serial search per worker process.
+    Returns {filepath: nonce}.
+    """
+    with multiprocessing.Pool(jobs or os.cpu_count() or 1) as pool:
+        nonces = pool.map(find_nonce, filepaths)
+    return dict(zip(filepaths, nonces))
+
+def _benchmark_worker(hashes):
+    base_hash = hashlib.sha256(b"TAS nonce benchmark\n")
+    started = time.perf_counter()
+    for nonce in range(hashes):
+        h = base_hash.copy()
+        h.update(f"# Nonce: {nonce}\n{TAS_HUMAN_SIG}".encode())
+        h.hexdigest().startswith(PREFIX)
+    return time.perf_counter() - started
+
+def benchmark(jobs=None, hashes=200_000):
+    """
+    Run the nonce inner loop on every worker at once and report throughput.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    started = time.perf_counter()
+    with multiprocessing.Pool(jobs) as pool:
+        elapsed = pool.map(_benchmark_worker, [hashes] * jobs)
+    wall = time.perf_counter() - started
+    per_core = [hashes / seconds for seconds in elapsed]
+    print(f"workers: {jobs}")
+    print(f"hashes/sec per core: {sum(per_core) / jobs:,.0f} (min {min(per_core):,.0f}, max {max(per_core):,.0f})")
+    print(f"hashes/sec total: {hashes * jobs / wall:,.0f}")
+    return per_core
 
 if __name__ == "__main__":
-    find_nonce(sys.argv[1])
-# Nonce: 149387
+    parser = argparse.ArgumentParser(description=f"Stamp files with a nonce whose SHA-256 starts with {PREFIX}.")
+    parser.add_argument("files", nargs="*", help="Files to stamp")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = all cores)")
+    parser.add_argument("--benchmark", action="store_true", help="Report hashes per second per core and exit")
+    args = parser.parse_args()
+
+    jobs = args.jobs or os.cpu_count() or 1
+    if args.benchmark:
+        benchmark(jobs)
+    elif not args.files:
+        parser.print_usage()
+        sys.exit(1)
+    elif jobs == 1:
+        for path in args.files:
+            find_nonce(path)
+    elif len(args.files) == 1:
+        find_nonce_parallel(args.files[0], jobs)
+    else:
+        find_nonces(args.files, jobs)
+# Nonce: 34566
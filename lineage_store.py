@@ -0,0 +1,196 @@
+"""Persistent SDF envelope store with range-read ancestor resolution.
+
+``SQLiteLineageStore`` implements ``sdf_evidence_envelope.LineageResolver``
+over a WAL-mode SQLite file that any number of processes may share.  At
+insert time each envelope is filed under its ancestry position: the
+``genesis_hash`` and ``sequence`` from its lineage, plus a *lane*.  A lane is
+one unbranched run of a chain.  An envelope extending the tip of its
+parent's lane joins that lane; a genesis envelope, a fork, or an envelope
+stored before its parent starts a new lane.  Rows are clustered by
+``(lane, sequence)``, so the ancestors in a lane sit next to each other even
+when thousands of chains share a genesis.  ``resolve_chain`` therefore
+returns a whole ancestor path with one range read per lane it crosses,
+usually exactly one, instead of one lookup per hop.  ``_check_lineage`` uses
+it whenever a resolver offers it.
+
+The store files envelopes by what they declare and checks only that each
+one's ``canonical_hash`` commits to its body.  Signatures, genesis trust and
+sequence continuity are still proven by ``verify_evidence`` on every read.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from sdf_evidence_envelope import (
+    SDF_ENVELOPE_DOMAIN,
+    SDFEvidenceEnvelope,
+    _domain_hash,
+    _is_hex64,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lineage_envelopes (
+    lane           BLOB NOT NULL,
+    sequence       INTEGER NOT NULL,
+    canonical_hash BLOB NOT NULL,
+    genesis_hash   BLOB NOT NULL,
+    parent_hash    BLOB,
+    envelope       BLOB NOT NULL,
+    PRIMARY KEY (lane, sequence)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS lineage_envelopes_hash
+    ON lineage_envelopes (canonical_hash);
+"""
+
+# Locate an envelope's lane and sequence, then scan that lane from the
+# envelope down through the requested depth, nearest first.
+_LANE_QUERY = """
+SELECT e.canonical_hash, e.parent_hash, e.envelope
+FROM lineage_envelopes AS e,
+     (SELECT lane, sequence FROM lineage_envelopes WHERE canonical_hash = ?) AS t
+WHERE e.lane = t.lane
+  AND e.sequence BETWEEN t.sequence - ? + 1 AND t.sequence
+ORDER BY e.sequence DESC
+"""
+
+
+def _encode(envelope: SDFEvidenceEnvelope) -> bytes:
+    return json.dumps(
+        envelope.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _decode(raw: bytes) -> SDFEvidenceEnvelope:
+    return SDFEvidenceEnvelope.from_dict(json.loads(raw))
+
+
+class SQLiteLineageStore:
+    """``LineageResolver`` with bulk ancestor reads, shared across processes."""
+
+    def __init__(self, path: str | Path, *, timeout: float = 30.0) -> None:
+        self._db = sqlite3.connect(
+            str(path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "SQLiteLineageStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM lineage_envelopes").fetchone()[0]
+
+    def put(self, envelope: SDFEvidenceEnvelope) -> bool:
+        """Store *envelope*; return False if it was already present."""
+        return self.put_many([envelope]) == 1
+
+    def put_many(self, envelopes: Iterable[SDFEvidenceEnvelope]) -> int:
+        """Store many envelopes in one transaction; return how many were new."""
+        rows = []
+        for envelope in envelopes:
+            lineage = envelope.lineage
+            if (
+                not _is_hex64(lineage.genesis_hash)
+                or not isinstance(lineage.sequence, int)
+                or isinstance(lineage.sequence, bool)
+                or lineage.sequence < 0
+                or not (lineage.parent_hash is None or _is_hex64(lineage.parent_hash))
+            ):
+                raise ValueError("envelope lineage is malformed")
+            if _domain_hash(SDF_ENVELOPE_DOMAIN, envelope.body_dict()) != envelope.canonical_hash:
+                raise ValueError("envelope canonical_hash does not match its body")
+            rows.append((
+                bytes.fromhex(lineage.genesis_hash),
+                lineage.sequence,
+                bytes.fromhex(envelope.canonical_hash),
+                None if lineage.parent_hash is None else bytes.fromhex(lineage.parent_hash),
+                _encode(envelope),
+            ))
+        added = 0
+        with self._lock, self._transaction():
+            for row in rows:
+                added += self._insert(*row)
+        return added
+
+    def _insert(
+        self, genesis: bytes, sequence: int, key: bytes, parent: bytes | None, raw: bytes
+    ) -> int:
+        db = self._db
+        if db.execute(
+            "SELECT 1 FROM lineage_envelopes WHERE canonical_hash = ?", (key,)
+        ).fetchone():
+            return 0
+        lane = key
+        if parent is not None:
+            position = db.execute(
+                "SELECT lane, sequence FROM lineage_envelopes WHERE canonical_hash = ?",
+                (parent,),
+            ).fetchone()
+            # Join the parent's lane only at its tip, so lanes never branch.
+            if position is not None and position[1] + 1 == sequence and not db.execute(
+                "SELECT 1 FROM lineage_envelopes WHERE lane = ? AND sequence = ?",
+                (position[0], sequence),
+            ).fetchone():
+                lane = position[0]
+        db.execute(
+            "INSERT INTO lineage_envelopes VALUES (?, ?, ?, ?, ?, ?)",
+            (lane, sequence, key, genesis, parent, raw),
+        )
+        return 1
+
+    def resolve(self, canonical_hash: str) -> SDFEvidenceEnvelope | None:
+        if not _is_hex64(canonical_hash):
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT envelope FROM lineage_envelopes WHERE canonical_hash = ?",
+                (bytes.fromhex(canonical_hash),),
+            ).fetchone()
+        return None if row is None else _decode(row[0])
+
+    def resolve_chain(self, canonical_hash: str, max_depth: int) -> list[SDFEvidenceEnvelope]:
+        """Return the envelope for *canonical_hash* followed by its ancestors.
+
+        At most *max_depth* envelopes come back, nearest first; the list stops
+        early at a genesis envelope or at the first ancestor not stored.
+        """
+        if not _is_hex64(canonical_hash) or max_depth < 1:
+            return []
+        chain: list[SDFEvidenceEnvelope] = []
+        key: bytes | None = bytes.fromhex(canonical_hash)
+        with self._lock:
+            while key is not None and len(chain) < max_depth:
+                rows = self._db.execute(_LANE_QUERY, (key, max_depth - len(chain))).fetchall()
+                if not rows:
+                    break
+                for row_key, parent, raw in rows:
+                    if row_key != key:
+                        return chain
+                    chain.append(_decode(raw))
+                    key = parent
+        return chain
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
@@ -0,0 +1,107 @@
+import argparse
+import hashlib
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from sdf_evidence_envelope import build_envelope
+from tas_admissibility import InMemoryNonceStore, admit_many, admit_or_refuse
+
+GENESIS = "a" * 64
+STATE = "c" * 64
+
+
+def _invariant_check(proposal, state):
+    return True
+
+
+def _apply_transition(proposal, state):
+    return hashlib.sha256(state.encode() + str(proposal["n"]).encode()).hexdigest()
+
+
+def _batch(count):
+    key = ec.generate_private_key(ec.SECP256K1())
+    batch = []
+    for n in range(count):
+        claim = {"op": "write", "n": n}
+        batch.append((claim, build_envelope(
+            evidence_id=f"evidence-{n}",
+            claim=claim,
+            issuer_authority_id="authority",
+            issuer_private_key=key,
+            context="context",
+            genesis_hash=GENESIS,
+            parent_hash=None,
+            sequence=0,
+            issued_at="2026-08-17T00:00:00Z",
+            nonce=f"nonce-{n}",
+        )))
+    return batch
+
+
+def _options(batch):
+    return dict(
+        authority_scope=frozenset({"authority"}),
+        current_context="context",
+        seen_nonces=set(),
+        invariant_check=_invariant_check,
+        apply_transition=_apply_transition,
+        trusted_authority_keys={"authority": batch[0][1].issuer.public_key_b64},
+        nonce_store=InMemoryNonceStore(),
+        trusted_genesis_hashes=frozenset({GENESIS}),
+    )
+
+
+def _serial(batch):
+    options = _options(batch)
+    outcomes, state = [], STATE
+    for proposal, envelope in batch:
+        outcome = admit_or_refuse(proposal=proposal, envelope=envelope, state_root=state, **options)
+        state = outcome.state_root_after if outcome.admitted else state
+        outcomes.append(outcome)
+    return outcomes
+
+
+def _time(label, fn, count, baseline=None):
+    started = time.perf_counter()
+    outcomes = fn()
+    elapsed = time.perf_counter() - started
+    speedup = f"  x{baseline / elapsed:5.2f}" if baseline else ""
+    print(f"{label:<40} {elapsed:7.3f}s {count / elapsed:8,.0f} items/s{speedup}")
+    return elapsed, outcomes
+
+
+def run_benchmark(count, worker_counts):
+    batch = _batch(count)
+    print(f"{count:,} proposals; {os.cpu_count()} CPUs available")
+    base, expected = _time("admit_or_refuse, serial", lambda: _serial(batch), count)
+    for workers in worker_counts:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            _, outcomes = _time(f"admit_many, {workers} threads",
+                                lambda: admit_many(batch, STATE, executor=pool, **_options(batch)), count, base)
+        assert outcomes == expected
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            _, outcomes = _time(f"admit_many, {workers} processes",
+                                lambda: admit_many(batch, STATE, executor=pool, **_options(batch)), count, base)
+        assert outcomes == expected
+    print("Receipts identical to the serial path for every configuration")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pipelined admit_many versus serial admit_or_refuse")
+    parser.add_argument("--proposals", type=int, default=2_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="pool sizes to measure (default: 1, 2, 4 up to the CPU count)")
+    args = parser.parse_args()
+    cpus = os.cpu_count() or 1
+    run_benchmark(args.proposals, args.workers or sorted({n for n in (1, 2, 4) if n <= cpus} | {cpus}))
@@ -0,0 +1,106 @@
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from admission_gate import AuthoritySnapshot, _parse_timestamp, _timestamp_micros
+from authority_store import IndexedAuthorityResolver, RevocationSet, export_jsonl
+
+EPOCH_VALIDITY = ["2030-01-01T00:00:00Z", "2031-01-01T00:00:00Z", "2032-01-01T00:00:00Z"]
+
+
+def _snapshots(count, epochs, rng):
+    # Every epoch has one checkpoint, scope policy and context, as issued.
+    for n in range(count):
+        epoch = n % epochs
+        yield AuthoritySnapshot(
+            f"credential-{n:08d}",
+            "Ed25519",
+            rng.randbytes(32),
+            epoch,
+            False,
+            f"{epoch + 1:064x}",
+            f"{epoch:064x}",
+            EPOCH_VALIDITY[epoch % len(EPOCH_VALIDITY)],
+            f"{epoch + 2:064x}",
+        )
+
+
+def _rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(label, resolve, keys):
+    samples = []
+    clock = time.perf_counter_ns
+    for credential_id, checkpoint_hash in keys:
+        started = clock()
+        resolve(credential_id=credential_id, checkpoint_hash=checkpoint_hash)
+        samples.append(clock() - started)
+    samples.sort()
+    p50 = samples[len(samples) // 2] / 1000
+    p99 = samples[len(samples) * 99 // 100] / 1000
+    mean = sum(samples) / len(samples) / 1000
+    print(f"{label:<40} mean {mean:6.2f} us  p50 {p50:6.2f} us  p99 {p99:6.2f} us")
+
+
+def run_benchmark(count, epochs, revoked, samples):
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        export = os.path.join(tmp, "authority.jsonl")
+        started = time.perf_counter()
+        export_jsonl(_snapshots(count, epochs, rng), export)
+        print(f"Exported {count:,} credentials over {epochs} epochs in {time.perf_counter() - started:.1f}s "
+              f"({os.path.getsize(export) / 2**20:.0f} MiB)")
+
+        before = _rss_mib()
+        started = time.perf_counter()
+        with RevocationSet(os.path.join(tmp, "revocations")) as revocations:
+            resolver = IndexedAuthorityResolver.from_jsonl(export, revocations=revocations)
+            print(f"Bulk-loaded in {time.perf_counter() - started:.1f}s; "
+                  f"peak RSS grew by {_rss_mib() - before:,.0f} MiB")
+
+            keys = [(f"credential-{n:08d}", f"{n % epochs:064x}") for n in range(count)]
+            hits = rng.sample(keys, samples)
+            misses = [(credential_id, "f" * 64) for credential_id, _ in hits]
+            started = time.perf_counter()
+            revocations.add_many(rng.sample(keys, revoked))
+            print(f"Revoked {revoked:,} credentials in {time.perf_counter() - started:.2f}s "
+                  f"({os.path.getsize(os.path.join(tmp, 'revocations')) / 2**20:.1f} MiB table)")
+
+            _measure("resolve hit", resolver.resolve, hits)
+            _measure("resolve miss", resolver.resolve, misses)
+            resolver.revocations = None
+            _measure("resolve hit, no revocation set", resolver.resolve, hits)
+
+    valid_until, now = EPOCH_VALIDITY[0], "2029-06-01T12:00:00Z"
+    snapshot = next(_snapshots(1, 1, rng))
+    repeat = 200_000
+    started = time.perf_counter()
+    for _ in range(repeat):
+        _parse_timestamp(now) > _parse_timestamp(valid_until)
+    parsed = (time.perf_counter() - started) / repeat
+    started = time.perf_counter()
+    for _ in range(repeat):
+        _timestamp_micros(now) > snapshot.valid_until_us
+    preparsed = (time.perf_counter() - started) / repeat
+    print(f"{'expiry check, parse both timestamps':<40} {parsed * 1e6:6.2f} us")
+    print(f"{'expiry check, pre-parsed valid_until':<40} {preparsed * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Indexed authority resolver at scale")
+    parser.add_argument("--credentials", type=int, default=1_000_000)
+    parser.add_argument("--epochs", type=int, default=16)
+    parser.add_argument("--revoked", type=int, default=10_000)
+    parser.add_argument("--samples", type=int, default=100_000)
+    args = parser.parse_args()
+    run_benchmark(args.credentials, args.epochs, args.revoked, args.samples)
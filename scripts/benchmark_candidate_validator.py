@@ -0,0 +1,69 @@
+import argparse
+import copy
+import os
+import sys
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from tas_openai_bridge.gates import tas_admissibility_gateway, validate_many
+
+VALID = {
+    "decision": "candidate",
+    "claim_type": "analysis",
+    "confidence": 0.8,
+    "requires_web_verification": False,
+    "requires_human_authorization": True,
+    "proposed_output": "candidate text",
+    "known_limitations": ["bounded context"],
+    "tas_paradata": {
+        "input_hash": "sha256:abc",
+        "model": "gpt-5.5",
+        "timestamp": "2026-05-15T00:00:00+00:00",
+        "tool_path": "openai.responses",
+        "receipt_required": True,
+    },
+}
+
+
+def _corpus(count):
+    """Mostly admissible candidates with a mix of schema and envelope refusals."""
+    refusals = [
+        {"decision": "refuse"},
+        {"claim_type": "poem"},
+        {"confidence": 1.5},
+        {"unexpected": True},
+    ]
+    corpus = []
+    for i in range(count):
+        payload = copy.deepcopy(VALID)
+        if i % 5 == 4:
+            payload.update(refusals[(i // 5) % len(refusals)])
+        corpus.append(payload)
+    return corpus
+
+
+def _measure(label, corpus, func):
+    started = time.perf_counter()
+    results = func(corpus)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<30} {elapsed / len(corpus) * 1e6:8.3f} us/candidate  {len(corpus) / elapsed:>12,.0f}/sec")
+    return results
+
+
+def run_benchmark(count):
+    corpus = _corpus(count)
+    print(f"Candidates: {count:,}")
+    compiled = _measure("compiled gateway", corpus, lambda c: [tas_admissibility_gateway(p) for p in c])
+    batched = _measure("compiled validate_many", corpus, validate_many)
+    assert compiled == batched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the TAS candidate admissibility gateway.")
+    parser.add_argument("--candidates", type=int, default=200_000, help="Number of candidates to gate")
+    args = parser.parse_args()
+    run_benchmark(args.candidates)
@@ -0,0 +1,57 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from core.authority.capability import CapabilityTable, InMemoryCapabilityStore
+from core.authority.capability_store import SQLiteCapabilityStore
+
+SECRET = b"benchmark-master-secret-0123456789"
+
+
+def _measure(label, table, tokens, samples):
+    picks = [random.choice(tokens) for _ in range(samples)]
+    started = time.perf_counter()
+    for token in picks:
+        ok, _ = table.validate_token("steward", token, "read")
+        assert ok
+    elapsed = time.perf_counter() - started
+    print(f"{label:<44} {elapsed / samples * 1e6:8.2f} us/validation  {samples / elapsed:>10,.0f}/sec")
+
+
+def run_benchmark(live_tokens, samples):
+    store = InMemoryCapabilityStore()
+    table = CapabilityTable(SECRET, store=store, auth_cache_size=0)
+    started = time.perf_counter()
+    tokens = [table.mint("steward", {"read"}, ttl_seconds=86_400) for _ in range(live_tokens)]
+    print(f"Minted {live_tokens:,} live tokens in {time.perf_counter() - started:.1f}s")
+
+    _measure("in-memory, no auth cache", table, tokens, samples)
+    cached = CapabilityTable(SECRET, store=store, auth_cache_size=samples)
+    _measure("in-memory, auth cache (cold)", cached, tokens, samples)
+    hot = tokens[:1024]
+    _measure("in-memory, auth cache (hot working set)", cached, hot, samples)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with SQLiteCapabilityStore(os.path.join(tmp, "capabilities.sqlite")) as durable:
+            started = time.perf_counter()
+            durable.put_many(list(store._grants.values()))
+            print(f"Loaded {live_tokens:,} grants into SQLite in {time.perf_counter() - started:.1f}s")
+            shared = CapabilityTable(SECRET, store=durable, auth_cache_size=samples)
+            _measure("sqlite, auth cache (cold)", shared, tokens, samples)
+            _measure("sqlite, auth cache (hot working set)", shared, hot, samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark CapabilityTable.validate_token.")
+    parser.add_argument("--tokens", type=int, default=1_000_000, help="Number of live tokens")
+    parser.add_argument("--samples", type=int, default=100_000, help="Validations per measurement")
+    args = parser.parse_args()
+    run_benchmark(args.tokens, args.samples)
@@ -0,0 +1,50 @@
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from tas_openai_bridge import HumanAPIKey, ProvenanceReceipt, ScopedAuthority, execute_many, tas_openai_execute
+from tas_openai_bridge.fake_server import FakeResponsesServer, ResponsesHTTPClient
+
+KEY = HumanAPIKey("HumanAPIKey001")
+AUTHORITY = ScopedAuthority(authority="HumanAPIKey001")
+
+
+def _report(label, prompts, elapsed, results):
+    admitted = sum(isinstance(result, ProvenanceReceipt) for result in results)
+    print(f"{label:<34} {elapsed:8.3f}s  {len(prompts) / elapsed:>10,.0f} prompts/sec  admitted {admitted}/{len(prompts)}")
+
+
+def run_benchmark(prompt_count, latency, concurrency_levels, fail_every):
+    prompts = [f"benchmark prompt {i}" for i in range(prompt_count)]
+    with FakeResponsesServer(latency=latency, fail_every=fail_every) as server:
+        client = ResponsesHTTPClient(server.url)
+        print(f"Fake Responses server at {server.url} (latency {latency * 1000:.0f} ms)")
+
+        serial = prompts[: max(1, prompt_count // 10)]
+        started = time.perf_counter()
+        results = [tas_openai_execute(KEY, AUTHORITY, prompt, client=client) for prompt in serial]
+        _report("serial tas_openai_execute", serial, time.perf_counter() - started, results)
+
+        for concurrency in concurrency_levels:
+            started = time.perf_counter()
+            results = asyncio.run(
+                execute_many(KEY, AUTHORITY, prompts, client=client, concurrency=concurrency, backoff=0.05)
+            )
+            _report(f"execute_many concurrency={concurrency}", prompts, time.perf_counter() - started, results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the TAS-OpenAI conduit against a local fake Responses server.")
+    parser.add_argument("--prompts", type=int, default=2_000, help="Prompts per execute_many run")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated model latency in seconds")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64], help="Concurrency levels")
+    parser.add_argument("--fail-every", type=int, default=0, help="Inject a 429 on every Nth request")
+    args = parser.parse_args()
+    run_benchmark(args.prompts, args.latency, args.concurrency, args.fail_every)
@@ -0,0 +1,66 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from context_snapshot import InMemoryDefinitionResolver, canonical_json, make_definition_record
+from context_store import SQLiteDefinitionResolver
+
+
+def _definitions(count):
+    return [
+        canonical_json(make_definition_record(
+            namespace_id=f"tas:bench:{n % 64}",
+            term=f"term-{n}",
+            semantic_version="1",
+            definition=f"Benchmark definition number {n}.",
+        ))
+        for n in range(count)
+    ]
+
+
+def _time(label, fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{label:<44} {elapsed * 1e3:10.3f} ms")
+    return elapsed
+
+
+def run_benchmark(count, pinned, repeat):
+    raws = _definitions(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "context.sqlite")
+        started = time.perf_counter()
+        with SQLiteDefinitionResolver(path) as store:
+            ids = store.put_many(raws)
+        print(f"Stored {count:,} definitions in {time.perf_counter() - started:.2f}s")
+
+        def open_sqlite():
+            SQLiteDefinitionResolver(path).close()
+
+        _time("startup: open SQLite resolver", open_sqlite, repeat)
+        _time("startup: build in-memory resolver", lambda: InMemoryDefinitionResolver(dict(zip(ids, raws))), 3)
+
+        sample = ids[:: max(1, count // pinned)][:pinned]
+        with SQLiteDefinitionResolver(path) as store:
+            single = _time(f"resolve x{len(sample)} one at a time",
+                           lambda: [store.resolve(definition_id=i) for i in sample], repeat)
+            bulk = _time(f"resolve_many of {len(sample)}", lambda: store.resolve_many(sample), repeat)
+    print(f"resolve_many speedup: x{single / bulk:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite context store startup and bulk resolution")
+    parser.add_argument("--definitions", type=int, default=100_000)
+    parser.add_argument("--pinned", type=int, default=64, help="Definitions pinned by one context")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    run_benchmark(args.definitions, args.pinned, args.repeat)
@@ -0,0 +1,97 @@
+import argparse
+import base64
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from admission_gate import FileDecisionLedger
+from tas_admissibility import SQLiteNonceStore
+from tas_bench.corpus import admission_gatekeeper, mint
+from tas_gate_service import GateClient, GateService, admission_methods
+
+
+def _drive(socket_path, requests, start, results):
+    # Each client is its own process so the load generator is not GIL-bound.
+    with GateClient(socket_path) as client:
+        start.wait()
+        admitted = sum(client.evaluate(c, e)["resulting_state"] == "ADMITTED" for c, e in requests)
+    results.put(admitted)
+
+
+def _run(corpus, requests, workers, clients, state_root):
+    with tempfile.TemporaryDirectory(prefix=f"gate-{workers}-", dir=state_root) as state:
+        return _run_in(corpus, requests, workers, clients, state)
+
+
+def _run_in(corpus, requests, workers, clients, state):
+    def factory():
+        return admission_methods(admission_gatekeeper(
+            corpus,
+            ledger=FileDecisionLedger(os.path.join(state, "ledger")),
+            nonce_store=SQLiteNonceStore(os.path.join(state, "nonces.sqlite")),
+        ))
+
+    socket_path = os.path.join(state, "gate.sock")
+    context = multiprocessing.get_context("fork")
+    with GateService(socket_path, factory, workers=workers):
+        start = context.Event()
+        results = context.Queue()
+        processes = [
+            context.Process(target=_drive, args=(socket_path, requests[n::clients], start, results))
+            for n in range(clients)
+        ]
+        for process in processes:
+            process.start()
+        time.sleep(0.2)  # let workers build their gates and clients connect
+        started = time.perf_counter()
+        start.set()
+        admitted = sum(results.get() for _ in processes)
+        elapsed = time.perf_counter() - started
+        for process in processes:
+            process.join()
+    if admitted != len(requests):
+        raise SystemExit(f"only {admitted} of {len(requests)} requests were admitted")
+    return elapsed
+
+
+def run_benchmark(count, worker_counts, algorithm, state_root):
+    corpus = mint("admission_gate", count, adversarial=0.0, algorithm=algorithm)
+    requests = [
+        (base64.b64decode(r["candidate"]), base64.b64decode(r["envelope"])) for r in corpus.records
+    ]
+    print(f"AdmissionGatekeeper.evaluate over a Unix socket: {count:,} {algorithm} requests, "
+          f"{os.cpu_count()} CPUs, state in {state_root}")
+    print("Every worker shares one FileDecisionLedger and one SQLiteNonceStore.")
+    baseline = None
+    for workers in worker_counts:
+        elapsed = _run(corpus, requests, workers, clients=2 * workers, state_root=state_root)
+        throughput = count / elapsed
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        print(f"{workers:>3} workers {elapsed:8.3f}s {throughput:>10,.0f} req/s"
+              f"  speedup x{speedup:5.2f}  efficiency {speedup / workers * 100 * worker_counts[0]:5.1f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gate service throughput versus worker count")
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="Worker counts to measure (default: 1, 2, 4, ... up to the CPU count)")
+    parser.add_argument("--algorithm", choices=["ed25519", "secp256k1"], default="ed25519")
+    parser.add_argument("--state-dir", default="/dev/shm" if os.path.isdir("/dev/shm") else None,
+                        help="Where ledgers and sockets live (default: /dev/shm, so fsync is not the bottleneck)")
+    args = parser.parse_args()
+    counts = args.workers
+    if counts is None:
+        counts, n = [], 1
+        while n <= (os.cpu_count() or 1):
+            counts.append(n)
+            n *= 2
+    run_benchmark(args.requests, sorted(counts), args.algorithm, args.state_dir or tempfile.gettempdir())
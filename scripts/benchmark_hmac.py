@@ -0,0 +1,70 @@
+import argparse
+import hashlib
+import hmac
+import os
+import sys
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from core.authority.capability import CapabilityTable
+from tas_keyed_mac import KeyedMAC
+from tas_logos_gatekeeper import RECEIPT_DOMAIN, HMACReceiptSigner
+from tas_phase0_microkernel import canonical_json_bytes, payload_mac, sign_payload
+
+KEY = b"benchmark-signing-key-0123456789abcdef"
+
+
+def _report(label, elapsed, count):
+    print(f"{label:<48} {elapsed:8.3f}s {count / elapsed:>12,.0f}/sec")
+
+
+def _timed(label, count, fn):
+    started = time.perf_counter()
+    fn()
+    _report(label, time.perf_counter() - started, count)
+
+
+def run_benchmark(count):
+    receipts = [
+        canonical_json_bytes({"decision": "ADMIT", "nonce": i, "policy_hash": "a" * 64, "snapshot_id": "s" * 64})
+        for i in range(count)
+    ]
+    domain = RECEIPT_DOMAIN.encode("ascii") + b"\x00"
+    print(f"Receipts: {count:,} ({len(receipts[0])} bytes each)")
+
+    _timed("receipt sign, hmac.new per call (before)", count, lambda: [
+        hmac.new(KEY, domain + r, hashlib.sha256).hexdigest() for r in receipts
+    ])
+    signer = HMACReceiptSigner("bench", KEY)
+    _timed("HMACReceiptSigner.sign", count, lambda: [signer.sign(r) for r in receipts])
+    _timed("HMACReceiptSigner.sign_many", count, lambda: signer.sign_many(receipts))
+    signatures = signer.sign_many(receipts)
+    _timed("HMACReceiptSigner.verify_many", count, lambda: signer.verify_many(receipts, signatures))
+    mac = KeyedMAC(KEY, prefix=domain)
+    _timed("KeyedMAC.sign_many (raw hex)", count, lambda: mac.sign_many(receipts))
+
+    payloads = [{"action": "open_valve", "counter": i, "one_shot": True} for i in range(count)]
+    key = KEY.decode()
+    _timed("sign_payload, hmac.new per call (before)", count, lambda: [
+        hmac.new(key.encode("utf-8"), canonical_json_bytes(p), hashlib.sha256).hexdigest() for p in payloads
+    ])
+    _timed("sign_payload, string key", count, lambda: [sign_payload(p, key) for p in payloads])
+    held = payload_mac(key)
+    _timed("sign_payload, held payload_mac", count, lambda: [sign_payload(p, held) for p in payloads])
+
+    table = CapabilityTable(KEY, auth_cache_size=0)
+    tokens = [table.mint("steward", {"read"}, ttl_seconds=3600) for _ in range(min(count, 50_000))]
+    _timed("CapabilityTable.validate_token (uncached)", len(tokens), lambda: [
+        table.validate_token("steward", t, "read") for t in tokens
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark HMAC receipt signing before and after KeyedMAC.")
+    parser.add_argument("--count", type=int, default=200_000, help="Receipts per measurement")
+    args = parser.parse_args()
+    run_benchmark(args.count)
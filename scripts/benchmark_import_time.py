@@ -0,0 +1,55 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+TARGETS = {
+    "import core": ["-c", "import core"],
+    "import tas_openai_bridge": ["-c", "import tas_openai_bridge"],
+    "from core import CanonicalVerticalSlice": ["-c", "from core import CanonicalVerticalSlice"],
+    "import tas_phase0_microkernel": ["-c", "import tas_phase0_microkernel"],
+    "tas_cli.py --help": ["tas_cli.py", "--help"],
+}
+
+
+def importtime(args):
+    """Return [(module, self_us, cumulative_us)] from one ``python -X importtime`` run."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=root_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.rstrip()[1:], int(self_us), int(cumulative)))
+    return rows
+
+
+def run_benchmark(repeat, top):
+    for label, args in TARGETS.items():
+        runs = [importtime(args) for _ in range(repeat)]
+        # Top-level imports are the unindented rows; their cumulative times sum to the total.
+        totals = [sum(c for name, _, c in rows if not name.startswith(" ")) for rows in runs]
+        print(f"{label:<44} median {statistics.median(totals) / 1000:8.1f} ms  min {min(totals) / 1000:8.1f} ms")
+        heaviest = sorted(runs[-1], key=lambda row: row[1], reverse=True)[:top]
+        for name, self_us, _ in heaviest:
+            print(f"    {self_us / 1000:7.1f} ms self  {name.strip()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure interpreter import time for TAS entry points.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per target")
+    parser.add_argument("--top", type=int, default=3, help="Heaviest modules to list per target")
+    args = parser.parse_args()
+    run_benchmark(args.repeat, args.top)
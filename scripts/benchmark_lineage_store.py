@@ -0,0 +1,102 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from lineage_store import SQLiteLineageStore
+from sdf_evidence_envelope import build_envelope, verify_evidence
+
+GENESIS = "a" * 64
+
+
+class PerHop:
+    """Hide ``resolve_chain`` so ``_check_lineage`` falls back to one call per hop."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def resolve(self, canonical_hash):
+        return self.store.resolve(canonical_hash)
+
+
+def _chains(key, count, depth):
+    chains = []
+    for c in range(count):
+        chain = []
+        for sequence in range(depth):
+            chain.append(build_envelope(
+                evidence_id=f"evidence-{c}-{sequence}",
+                claim={"op": "write", "chain": c, "n": sequence},
+                issuer_authority_id="authority",
+                issuer_private_key=key,
+                context="context",
+                genesis_hash=GENESIS,
+                parent_hash=chain[-1].canonical_hash if chain else None,
+                sequence=sequence,
+                issued_at="2026-08-17T00:00:00Z",
+                nonce=f"nonce-{c}-{sequence}",
+            ))
+        chains.append(chain)
+    return chains
+
+
+def _time(label, fn, tips, baseline=None):
+    started = time.perf_counter()
+    for tip in tips:
+        fn(tip)
+    elapsed = (time.perf_counter() - started) / len(tips)
+    speedup = f"  x{baseline / elapsed:5.2f}" if baseline else ""
+    print(f"{label:<48} {elapsed * 1e3:8.3f} ms{speedup}")
+    return elapsed
+
+
+def run_benchmark(chains, depth):
+    key = ec.generate_private_key(ec.SECP256K1())
+    started = time.perf_counter()
+    built = _chains(key, chains, depth)
+    print(f"Signed {chains} chains of depth {depth} in {time.perf_counter() - started:.1f}s")
+    options = dict(
+        authority_scope=frozenset({"authority"}),
+        current_context="context",
+        seen_nonces=set(),
+        invariant_pass=True,
+        trusted_authority_keys={"authority": built[0][0].issuer.public_key_b64},
+        trusted_genesis_hashes=frozenset({GENESIS}),
+    )
+    with tempfile.TemporaryDirectory() as tmp, SQLiteLineageStore(os.path.join(tmp, "lineage.sqlite")) as store:
+        for chain in built:
+            store.put_many(chain[:-1])
+        print(f"Stored {len(store):,} envelopes; all chains share one genesis")
+        tips = [chain[-1] for chain in built]
+        parents = [tip.lineage.parent_hash for tip in tips]
+        per_hop = PerHop(store)
+
+        def walk(parent_hash):
+            while parent_hash is not None:
+                parent_hash = store.resolve(parent_hash).lineage.parent_hash
+
+        fetch = _time(f"fetch {depth - 1} ancestors, resolve per hop", walk, parents)
+        _time(f"fetch {depth - 1} ancestors, resolve_chain", lambda h: store.resolve_chain(h, depth), parents, fetch)
+
+        def check(resolver):
+            return lambda tip: verify_evidence(tip, lineage_resolver=resolver, **options).lineage_intact
+
+        verify = _time("verify_evidence, resolve per hop", check(per_hop), tips)
+        _time("verify_evidence, resolve_chain", check(store), tips, verify)
+        print(f"Resolver calls per verification: {depth - 1} per hop, 1 with resolve_chain")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lineage resolution: per-hop resolve versus resolve_chain")
+    parser.add_argument("--chains", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=64)
+    args = parser.parse_args()
+    run_benchmark(args.chains, args.depth)
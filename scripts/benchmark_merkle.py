@@ -0,0 +1,59 @@
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from core.merkle import MerkleTree, leaf_hash, verify_many, verify_proof
+
+
+def _timed(label, count, func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<38} {elapsed:8.4f}s  {count / elapsed:>12,.0f} leaves/sec")
+    return result
+
+
+def _merkletools_path(leaves):
+    """The previous tas_hccc path: build, then get_proof and validate per cell."""
+    from merkletools import MerkleTools
+
+    mt = MerkleTools(hash_type="sha256")
+    for leaf in leaves:
+        mt.add_leaf(leaf.hex(), do_hash=False)
+    mt.make_tree()
+    root = mt.get_merkle_root()
+    proofs = [mt.get_proof(i) for i in range(len(leaves))]
+    return all(MerkleTools(hash_type="sha256").validate_proof(p, l.hex(), root) for p, l in zip(proofs, leaves))
+
+
+def run_benchmark(leaf_count):
+    leaves = [leaf_hash(hashlib.sha256(str(i).encode()).digest()) for i in range(leaf_count)]
+    print(f"Leaves: {leaf_count}")
+
+    tree = _timed("native incremental append", leaf_count, lambda: MerkleTree(leaves))
+    _timed("native proof(i) per leaf", leaf_count, lambda: [tree.proof(i) for i in range(leaf_count)])
+    proofs = _timed("native proofs() batch", leaf_count, tree.proofs)
+    root = tree.root
+    _timed("native verify_proof per leaf", leaf_count, lambda: all(verify_proof(l, p, root) for l, p in zip(leaves, proofs)))
+    _timed("native verify_many", leaf_count, lambda: all(verify_many(list(zip(leaves, proofs)), root)))
+
+    try:
+        import merkletools  # noqa: F401
+    except ImportError:
+        print("merkletools not installed; skipping the previous-path comparison")
+        return
+    _timed("merkletools build+get_proof+validate", leaf_count, lambda: _merkletools_path(leaves))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TAS-v1 Merkle proof throughput.")
+    parser.add_argument("--leaves", type=int, default=100_000, help="Number of leaves in the tree")
+    args = parser.parse_args()
+    run_benchmark(args.leaves)
@@ -0,0 +1,71 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from core.physics.tasw_hamiltonian import EnergyState
+from core.sensing import mutiny_detector
+from core.sensing.mutiny_detector import MutinyBank, MutinyDetector
+
+CONFIG = dict(friction_threshold=10.0, mutiny_threshold=20.0, hysteresis=0.1, cooldown_seconds=1.0)
+
+
+def _samples(streams, per_stream, seed=11):
+    rng = random.Random(seed)
+    energy = [rng.uniform(0.0, 12.0) for _ in range(streams)]
+    samples = []
+    for step in range(per_stream):
+        for stream in range(streams):
+            # Slow random walk, so most samples stay in their current state.
+            energy[stream] = max(0.0, energy[stream] + rng.gauss(0.0, 0.8))
+            samples.append((stream, step * 0.01, energy[stream]))
+    return samples
+
+
+def _report(label, elapsed, count, transitions):
+    print(f"{label:<32} {elapsed:8.3f}s {count / elapsed:>14,.0f} samples/sec  {transitions:>9,} transitions")
+
+
+def run_benchmark(streams, per_stream, batch):
+    samples = _samples(streams, per_stream)
+    print(f"Samples: {len(samples):,} ({streams:,} streams x {per_stream:,})")
+
+    detectors = [MutinyDetector(**CONFIG) for _ in range(streams)]
+    started = time.perf_counter()
+    for stream, _, total in samples:
+        detectors[stream].assess_state(EnergyState(total=total))
+    _report("MutinyDetector per sample", time.perf_counter() - started, len(samples), 0)
+
+    runs = [("MutinyBank (pure Python)", None)]
+    if mutiny_detector.np is not None:
+        array = mutiny_detector.np.asarray(samples, dtype=float)
+        runs.insert(0, ("MutinyBank (NumPy)", array))
+    for label, data in runs:
+        saved = mutiny_detector.np
+        if data is None:
+            mutiny_detector.np = None
+            data = samples
+        try:
+            bank = MutinyBank(**CONFIG, capacity=streams)
+            started = time.perf_counter()
+            transitions = 0
+            for offset in range(0, len(samples), batch):
+                transitions += len(bank.process(data[offset:offset + batch]))
+            _report(label, time.perf_counter() - started, len(samples), transitions)
+        finally:
+            mutiny_detector.np = saved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark MutinyBank against per-stream MutinyDetector.")
+    parser.add_argument("--streams", type=int, default=5_000, help="Number of monitored streams")
+    parser.add_argument("--per-stream", type=int, default=200, help="Samples per stream")
+    parser.add_argument("--batch", type=int, default=100_000, help="Samples per MutinyBank.process call")
+    args = parser.parse_args()
+    run_benchmark(args.streams, args.per_stream, args.batch)
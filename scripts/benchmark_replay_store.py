@@ -0,0 +1,64 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from sdf_tas_interface import InMemoryReplayStore, WindowedReplayStore
+
+
+def _contend(path, window, offset, step, count, sync):
+    """Consume this worker's interleaved counters and replay every one of them once."""
+    with WindowedReplayStore(path, window, sync=sync) as store:
+        started = time.perf_counter()
+        accepted = 0
+        for counter in range(offset, offset + count * step, step):
+            accepted += store.consume(counter)
+            # A second guard replaying the same token must be refused.
+            accepted -= store.consume(counter)
+        return accepted, time.perf_counter() - started
+
+
+def _measure_single(label, store, count):
+    started = time.perf_counter()
+    for counter in range(count):
+        store.consume(counter)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<40} {elapsed / count * 1e6:8.2f} us/consume  {count / elapsed:>12,.0f}/sec")
+
+
+def run_benchmark(processes, count, window, sync):
+    _measure_single("in-memory set+deque (1 process)", InMemoryReplayStore(window), count)
+    with tempfile.TemporaryDirectory() as tmp:
+        with WindowedReplayStore(os.path.join(tmp, "single.bin"), window, sync=sync) as store:
+            _measure_single("windowed mmap (1 process)", store, count)
+
+        for workers in sorted({n for n in (1, 2, 4) if n < processes} | {processes}):
+            path = os.path.join(tmp, f"contended-{workers}.bin")
+            WindowedReplayStore(path, window).close()
+            started = time.perf_counter()
+            with multiprocessing.Pool(workers) as pool:
+                results = pool.starmap(
+                    _contend, [(path, window, k, workers, count, sync) for k in range(workers)]
+                )
+            wall = time.perf_counter() - started
+            operations = 2 * count * workers
+            assert sum(accepted for accepted, _ in results) == count * workers
+            label = f"windowed mmap ({workers} processes contending)"
+            print(f"{label:<40} {wall / operations * 1e6:8.2f} us/op       {operations / wall:>12,.0f}/sec")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ExternalActuatorGuard replay stores.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Largest number of contending processes")
+    parser.add_argument("--counters", type=int, default=100_000, help="Counters consumed per process")
+    parser.add_argument("--window", type=int, default=1 << 20, help="Replay window in counters")
+    parser.add_argument("--sync", action="store_true", help="msync after every accepted counter")
+    args = parser.parse_args()
+    run_benchmark(args.processes, args.counters, args.window, args.sync)
@@ -0,0 +1,105 @@
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from sdf_evidence_envelope import (
+    SDF_ENVELOPE_DOMAIN,
+    SDFEvidenceEnvelope,
+    _canonical_json,
+    build_envelope,
+)
+from sdf_wire import decode, encode
+
+ECDSA = ec.ECDSA(hashes.SHA256())
+
+
+def _envelopes(count, claim_items):
+    key = ec.generate_private_key(ec.SECP256K1())
+    return [
+        build_envelope(
+            evidence_id=f"evidence-{n:08d}",
+            claim={"op": "write", "n": n, "items": [f"item-{i}" for i in range(claim_items)]},
+            issuer_authority_id="authority",
+            issuer_private_key=key,
+            context="context",
+            genesis_hash="a" * 64,
+            parent_hash=f"{n:064x}",
+            sequence=n + 1,
+            issued_at="2026-08-17T00:00:00Z",
+            nonce=f"nonce-{n:08d}",
+        )
+        for n in range(count)
+    ]
+
+
+def _time(label, fn, items, baseline=None):
+    started = time.perf_counter()
+    for item in items:
+        fn(item)
+    elapsed = (time.perf_counter() - started) / len(items)
+    speedup = f"  x{baseline / elapsed:5.2f}" if baseline else ""
+    print(f"{label:<44} {elapsed * 1e6:8.2f} us{speedup}")
+    return elapsed
+
+
+def _json_signed(raw):
+    envelope = SDFEvidenceEnvelope.from_dict(json.loads(raw))
+    body = SDF_ENVELOPE_DOMAIN + _canonical_json(envelope.body_dict())
+    return envelope, base64.b64decode(envelope.signature), body
+
+
+def _wire_signed(raw):
+    wire = decode(raw)
+    return wire, wire.signature, wire.signed_message()
+
+
+def run_benchmark(count, claim_items):
+    envelopes = _envelopes(count, claim_items)
+    json_frames = [_canonical_json(e.to_dict()) for e in envelopes]
+    wire_frames = [encode(e) for e in envelopes]
+    json_size = sum(map(len, json_frames)) / count
+    wire_size = sum(map(len, wire_frames)) / count
+    print(f"{count:,} envelopes, {claim_items} claim items each")
+    print(f"{'size, canonical JSON':<44} {json_size:8.0f} B")
+    print(f"{'size, wire frame':<44} {wire_size:8.0f} B  {wire_size / json_size:6.0%}")
+
+    base = _time("encode, to_dict + canonical JSON", lambda e: _canonical_json(e.to_dict()), envelopes)
+    _time("encode, wire frame", encode, envelopes, base)
+    base = _time("decode, json.loads + from_dict", lambda r: SDFEvidenceEnvelope.from_dict(json.loads(r)), json_frames)
+    _time("decode, wire header + lineage fields", lambda r: decode(r).parent_hash, wire_frames, base)
+    _time("decode, wire to_envelope", lambda r: decode(r).to_envelope(), wire_frames, base)
+    base = _time("signed bytes + signature, from JSON", _json_signed, json_frames)
+    _time("signed bytes + signature, from wire", _wire_signed, wire_frames, base)
+
+    public_key = ec.EllipticCurvePublicKey.from_encoded_point(
+        ec.SECP256K1(), envelopes[0].issuer.public_key_bytes()
+    )
+
+    def verify(extract):
+        def run(raw):
+            _, signature, message = extract(raw)
+            public_key.verify(bytes(signature), message, ECDSA)
+        return run
+
+    sample = max(1, count // 10)
+    base = _time("ECDSA verify, from JSON", verify(_json_signed), json_frames[:sample])
+    _time("ECDSA verify, from wire", verify(_wire_signed), wire_frames[:sample], base)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SDF envelope wire frame versus canonical JSON")
+    parser.add_argument("--envelopes", type=int, default=20_000)
+    parser.add_argument("--claim-items", type=int, default=4)
+    args = parser.parse_args()
+    run_benchmark(args.envelopes, args.claim_items)
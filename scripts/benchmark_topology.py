@@ -0,0 +1,64 @@
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from core.geometry import topology
+from core.geometry.topology import WindingEngine, update_winding
+
+
+def _trajectory(steps, seed=5):
+    # A noisy orbit around the origin, so anchors near it see many windings.
+    rng = random.Random(seed)
+    return [
+        (
+            3.0 * math.cos(i * 0.01) + rng.gauss(0.0, 0.05),
+            3.0 * math.sin(i * 0.01) + rng.gauss(0.0, 0.05),
+        )
+        for i in range(steps + 1)
+    ]
+
+
+def run_benchmark(steps, anchors, scalar_steps):
+    rng = random.Random(9)
+    anchor_map = {f"anchor-{j}": (rng.uniform(-4, 4), rng.uniform(-4, 4)) for j in range(anchors)}
+    allowed = {anchor_id: range(-100_000, 100_001) for anchor_id in anchor_map}
+    trajectory = _trajectory(steps)
+    print(f"Trajectory: {steps:,} steps x {anchors} anchors")
+
+    sample = trajectory[:scalar_steps + 1]
+    coords = list(anchor_map.values())
+    started = time.perf_counter()
+    for previous, current in zip(sample, sample[1:]):
+        for anchor in coords:
+            update_winding(previous, current, anchor)
+    elapsed = time.perf_counter() - started
+    rate = scalar_steps * anchors / elapsed
+    print(f"{'update_winding loop':<28} {elapsed:8.3f}s {rate:>14,.0f} step-anchors/sec  ({scalar_steps:,} steps)")
+
+    if topology.np is None:
+        print("NumPy not installed; skipping WindingEngine")
+        return
+    points = topology.np.asarray(trajectory)
+    engine = WindingEngine(anchor_map, allowed)
+    started = time.perf_counter()
+    verdict = engine.advance(points)
+    elapsed = time.perf_counter() - started
+    rate = steps * anchors / elapsed
+    print(f"{'WindingEngine.advance':<28} {elapsed:8.3f}s {rate:>14,.0f} step-anchors/sec  ({verdict.status})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark WindingEngine on long trajectories.")
+    parser.add_argument("--steps", type=int, default=1_000_000, help="Trajectory length")
+    parser.add_argument("--anchors", type=int, default=16, help="Number of singularity anchors")
+    parser.add_argument("--scalar-steps", type=int, default=100_000, help="Steps for the scalar baseline")
+    args = parser.parse_args()
+    run_benchmark(args.steps, args.anchors, args.scalar_steps)
@@ -0,0 +1,49 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+# Ensure the repository root is in the python path
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_path not in sys.path:
+    sys.path.insert(0, root_path)
+
+from tas_openai_bridge import TrinityEngine
+
+VOCABULARY = (
+    "map financial risk corridors explore alternative safeguards ledger lineage invariants "
+    "audit receipt refusal steward authority conduit boundary drift coherence pricing auctions "
+    "liquidity evidence anchor admissible candidate schema gateway capsule witness"
+).split()
+
+
+def _queries(count, seed=1618):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(VOCABULARY, k=rng.randint(6, 40))) for _ in range(count)]
+
+
+def _measure(label, count, func):
+    started = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {elapsed:8.3f}s  {count / elapsed:>12,.0f} queries/sec")
+    return results
+
+
+def run_benchmark(count, jobs):
+    engine = TrinityEngine()
+    queries = _queries(count)
+    print(f"Queries: {count:,}")
+    serial = _measure("execute per query", count, lambda: [engine.execute(q) for q in queries])
+    batched = _measure("execute_many (1 process)", count, lambda: engine.execute_many(queries))
+    parallel = _measure(f"execute_many ({jobs} processes)", count, lambda: engine.execute_many(queries, jobs=jobs))
+    assert serial == batched == parallel
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TrinityEngine batch execution.")
+    parser.add_argument("--queries", type=int, default=100_000, help="Number of queries")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes for the parallel run")
+    args = parser.parse_args()
+    run_benchmark(args.queries, args.jobs)
@@ -10,11 +10,15 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import io
 import json
+import re
 import subprocess
 import sys
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 
 
 KINDS = {
@@ -26,6 +30,13 @@ KINDS = {
     "experiment": ("experiment", "prototype", "bench"),
 }
 
+COMMIT_FORMAT = "%H%x00%P%x00%aI%x00%an%x00%ae%x00%B"
+# Leading marker for each commit header in the streaming ``git log`` export.
+# Numstat records always begin with ``<added>\t<deleted>\t``, so a header can
+# never be mistaken for a change record.
+COMMIT_MARKER = "\x01"
+NUMSTAT_RECORD = re.compile(r"(?:-|\d+)\t(?:-|\d+)\t")
+
 
 def git(repo: Path, *args: str, text: bool = True) -> str | bytes:
     result = subprocess.run(
@@ -67,16 +78,19 @@ def changed_files(repo: Path, sha: str, parent: str | None = None) -> list[dict[
         raw = git(repo, "diff", "--numstat", "-z", parent, sha)
     else:
         raw = git(repo, "diff-tree", "--root", "--no-commit-id", "-r", "--numstat", "-z", sha)
-    fields = raw.split("\0")
+    return parse_numstat(raw.split("\0"), sha)
+
+
+def parse_numstat(fields: list[str], sha: str) -> list[dict[str, Any]]:
     changes = []
     index = 0
     while index < len(fields) and fields[index]:
         parts = fields[index].split("\t")
         index += 1
-        if len(parts) == 3:
+        if len(parts) == 3 and parts[2]:
             added, deleted, path = parts
-        elif len(parts) == 2 and index + 1 < len(fields):  # rename/copy
-            added, deleted = parts
+        elif len(parts) == 3 and index + 1 < len(fields):  # rename/copy: "<a>\t<d>\t\0<old>\0<new>"
+            added, deleted, _ = parts
             old_path, path = fields[index : index + 2]
             index += 2
             path = f"{old_path} => {path}"
@@ -115,71 +129,291 @@ def validate_annotation(sha: str, annotation: Any, known: set[str]) -> None:
                 raise ValueError(f"annotation for {sha} references unknown {field}: {related}")
 
 
-def records(repo: Path, revision: str, annotations: dict[str, Any]) -> list[dict[str, Any]]:
+def build_record(
+    identity: list[str],
+    containing_refs: list[str],
+    changed: list[dict[str, Any]],
+    parent_deltas: list[dict[str, Any]],
+    annotation: Any,
+    remote: str,
+    shallow: bool,
+) -> dict[str, Any]:
+    commit, parents, timestamp, author, email, message = identity
+    return {
+        "schema_version": 1,
+        "commit_identity": {
+            "sha": commit,
+            "parent_shas": parents.split() if parents else [],
+            "timestamp": timestamp,
+            "author": {"name": author, "email": email},
+            "repository": remote,
+            "containing_refs": containing_refs,
+        },
+        "git_evidence": {
+            "commit_message": message,
+            "changed_files": changed,
+            "parent_deltas": parent_deltas,
+        },
+        "historical_state": (annotation or {}).get("historical_state"),
+        "architectural_lineage": (annotation or {}).get("architectural_lineage"),
+        "interpretation_evidence": (annotation or {}).get("evidence", []),
+        "corpus_warning": "shallow_repository" if shallow else None,
+    }
+
+
+def _export_plan(repo: Path, revision: str, annotations: dict[str, Any]) -> list[str]:
     shas = git(repo, "rev-list", "--reverse", "--topo-order", revision).splitlines()
     known = set(shas)
     unknown = set(annotations) - known
     if unknown:
         raise ValueError(f"annotations contain commits outside the export: {sorted(unknown)}")
+    return shas
+
+
+def records(repo: Path, revision: str, annotations: dict[str, Any]) -> list[dict[str, Any]]:
+    shas = _export_plan(repo, revision, annotations)
+    known = set(shas)
     remote = repository_name(repo)
     shallow = git(repo, "rev-parse", "--is-shallow-repository").strip() == "true"
     result = []
-    fmt = "%H%x00%P%x00%aI%x00%an%x00%ae%x00%B"
     for sha in shas:
-        identity = git(repo, "show", "-s", f"--format={fmt}", sha).rstrip("\n").split("\0", 5)
-        commit, parents, timestamp, author, email, message = identity
-        parent_shas = parents.split() if parents else []
+        identity = git(repo, "show", "-s", f"--format={COMMIT_FORMAT}", sha).rstrip("\n").split("\0", 5)
+        parent_shas = identity[1].split() if identity[1] else []
         annotation = annotations.get(sha)
         if annotation is not None:
             validate_annotation(sha, annotation, known)
         result.append(
-            {
-                "schema_version": 1,
-                "commit_identity": {
-                    "sha": commit,
-                    "parent_shas": parent_shas,
-                    "timestamp": timestamp,
-                    "author": {"name": author, "email": email},
-                    "repository": remote,
-                    "containing_refs": refs_for(repo, sha),
-                },
-                "git_evidence": {
-                    "commit_message": message,
-                    "changed_files": changed_files(repo, sha, parent_shas[0] if parent_shas else None),
-                    "parent_deltas": [
-                        {"parent_sha": parent, "changed_files": changed_files(repo, sha, parent)}
-                        for parent in parent_shas
-                    ],
-                },
-                "historical_state": (annotation or {}).get("historical_state"),
-                "architectural_lineage": (annotation or {}).get("architectural_lineage"),
-                "interpretation_evidence": (annotation or {}).get("evidence", []),
-                "corpus_warning": "shallow_repository" if shallow else None,
-            }
+            build_record(
+                identity,
+                refs_for(repo, sha),
+                changed_files(repo, sha, parent_shas[0] if parent_shas else None),
+                [
+                    {"parent_sha": parent, "changed_files": changed_files(repo, sha, parent)}
+                    for parent in parent_shas
+                ],
+                annotation,
+                remote,
+                shallow,
+            )
+        )
+    return result
+
+
+@contextmanager
+def _git_stream(repo: Path, args: list[str], revs: Iterable[str]) -> Iterator[TextIO]:
+    """Run git with ``revs`` on stdin and yield its decoded stdout stream.
+
+    stdin and stderr are spooled through temporary files so a long-running
+    export can never deadlock on a full pipe.
+    """
+    with tempfile.TemporaryFile("w+") as stdin, tempfile.TemporaryFile() as stderr:
+        stdin.writelines(f"{rev}\n" for rev in revs)
+        stdin.seek(0)
+        process = subprocess.Popen(
+            ["git", "-C", str(repo), *args], stdin=stdin, stdout=subprocess.PIPE, stderr=stderr
         )
+        try:
+            yield io.TextIOWrapper(process.stdout)
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            returncode = process.wait()
+        if returncode:
+            stderr.seek(0)
+            raise RuntimeError(f"git {' '.join(args)} failed: {stderr.read().decode().strip()}")
+
+
+def _nul_fields(stream: TextIO) -> Iterator[str]:
+    pending = ""
+    while chunk := stream.read(1 << 16):
+        pending += chunk
+        *fields, pending = pending.split("\0")
+        yield from fields
+    if pending:
+        yield pending
+
+
+def containing_refs_map(repo: Path, shas: Iterable[str]) -> dict[str, list[str]]:
+    """Return ``for-each-ref --contains`` results for every commit in ``shas``.
+
+    Each ref's peeled commit seeds a bit; one ``rev-list --topo-order`` walk
+    over all ref tips visits children before parents, so OR-ing each commit's
+    mask into its parents yields containment for the whole graph in a single
+    pass instead of one ``--contains`` query per commit.
+    """
+    wanted = set(shas)
+    refnames = sorted(line for line in git(repo, "for-each-ref", "--format=%(refname)").splitlines() if line)
+    if not refnames or not wanted:
+        return {sha: [] for sha in wanted}
+    peeled = subprocess.run(
+        ["git", "-C", str(repo), "cat-file", "--batch-check=%(objectname)"],
+        input="".join(f"{refname}^{{commit}}\n" for refname in refnames),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if peeled.returncode:
+        raise RuntimeError(f"git cat-file --batch-check failed: {peeled.stderr.strip()}")
+    masks: dict[str, int] = {}
+    for bit, line in enumerate(peeled.stdout.splitlines()):
+        if not line.endswith(" missing"):
+            masks[line] = masks.get(line, 0) | (1 << bit)
+
+    result: dict[str, list[str]] = {}
+    args = ["rev-list", "--parents", "--topo-order", "--stdin"]
+    with _git_stream(repo, args, list(masks)) as stream:
+        for line in stream:
+            commit, *parents = line.split()
+            mask = masks.pop(commit, 0)
+            for parent in parents:
+                masks[parent] = masks.get(parent, 0) | mask
+            if commit in wanted:
+                result[commit] = [refnames[bit] for bit in range(mask.bit_length()) if mask >> bit & 1]
+    for sha in wanted - result.keys():
+        result[sha] = []
     return result
 
 
+def _log_blocks(fields: Iterator[str]) -> Iterator[tuple[list[str], list[str]]]:
+    """Split ``git log -z --numstat`` output into (identity, numstat fields)."""
+    field = next(fields, None)
+    while field is not None:
+        if not field.startswith(COMMIT_MARKER):
+            raise RuntimeError(f"unexpected git log record: {field[:80]!r}")
+        identity = [field[len(COMMIT_MARKER):]]
+        for _ in range(5):
+            value = next(fields, None)
+            if value is None:
+                raise RuntimeError(f"truncated git log record for {identity[0]}")
+            identity.append(value)
+        identity[5] = identity[5].rstrip("\n")
+        stats: list[str] = []
+        field = next(fields, None)
+        if field is not None and field.startswith("\n") and NUMSTAT_RECORD.match(field, 1):
+            field = field[1:]
+            while field is not None and NUMSTAT_RECORD.match(field):
+                stats.append(field)
+                if field.count("\t") == 2 and field.endswith("\t"):  # rename/copy paths follow
+                    stats.extend(next(fields, "") for _ in range(2))
+                field = next(fields, None)
+        yield identity, stats
+
+
+def iter_records(repo: Path, revision: str, annotations: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield the same records as :func:`records` from one streamed ``git log``.
+
+    Commits are fed to ``git log --no-walk=unsorted -m`` in export order, so
+    every parent delta arrives in the same stream.  ``git log -m`` omits the
+    block for a merge parent whose diff is empty; such merges fall back to
+    per-parent ``git diff`` so the output stays identical.
+    """
+    shas = _export_plan(repo, revision, annotations)
+    known = set(shas)
+    for sha in shas:
+        annotation = annotations.get(sha)
+        if annotation is not None:
+            validate_annotation(sha, annotation, known)
+    remote = repository_name(repo)
+    shallow = git(repo, "rev-parse", "--is-shallow-repository").strip() == "true"
+    containment = containing_refs_map(repo, shas)
+
+    args = [
+        "log", "--no-walk=unsorted", "--stdin", "--root", "-m", "--numstat", "-z",
+        "--no-color", "--no-show-signature", f"--format={COMMIT_MARKER}{COMMIT_FORMAT}",
+    ]
+
+    def emit(identity: list[str], blocks: list[list[str]]) -> dict[str, Any]:
+        sha = identity[0]
+        parent_shas = identity[1].split() if identity[1] else []
+        if len(blocks) == max(len(parent_shas), 1):
+            deltas = [parse_numstat(stats, sha) for stats in blocks]
+        else:
+            deltas = [changed_files(repo, sha, parent) for parent in parent_shas or [None]]
+        return build_record(
+            identity,
+            containment[sha],
+            deltas[0],
+            [
+                {"parent_sha": parent, "changed_files": delta}
+                for parent, delta in zip(parent_shas, deltas)
+            ],
+            annotations.get(sha),
+            remote,
+            shallow,
+        )
+
+    current: list[str] | None = None
+    blocks: list[list[str]] = []
+    emitted = 0
+    with _git_stream(repo, args, shas) as stream:
+        for identity, stats in _log_blocks(_nul_fields(stream)):
+            if current is not None and identity[0] != current[0]:
+                yield emit(current, blocks)
+                emitted += 1
+                blocks = []
+            current = identity
+            blocks.append(stats)
+    if current is not None:
+        yield emit(current, blocks)
+        emitted += 1
+    if emitted != len(shas):
+        raise RuntimeError(f"git log returned {emitted} commits, expected {len(shas)}")
+
+
+def write_jsonl(exported: Iterable[dict[str, Any]], output: Path | None) -> tuple[int, str]:
+    """Write records as JSON Lines while they are produced.
+
+    Output files are written to a sibling temporary file and renamed into place
+    only once the export completes.  Returns the record count and SHA-256.
+    """
+    digest = hashlib.sha256()
+    count = 0
+    target = sys.stdout
+    if output is not None:
+        target = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=output.parent, prefix=f".{output.name}.", delete=False
+        )
+    try:
+        for item in exported:
+            line = json.dumps(item, sort_keys=True, separators=(",", ":")) + "\n"
+            target.write(line)
+            digest.update(line.encode())
+            count += 1
+    except BaseException:
+        if output is not None:
+            target.close()
+            Path(target.name).unlink(missing_ok=True)
+        raise
+    if output is not None:
+        target.close()
+        Path(target.name).replace(output)
+    return count, digest.hexdigest()
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--repo", type=Path, default=Path.cwd())
     parser.add_argument("--revision", default="--all", help="git revision set (default: --all)")
     parser.add_argument("--annotations", type=Path)
     parser.add_argument("--output", type=Path, help="write JSONL here instead of stdout")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="stream one git log pass and compute ref containment in-process (identical output)",
+    )
     args = parser.parse_args()
     try:
         annotations = load_annotations(args.annotations)
-        exported = records(args.repo, args.revision, annotations)
+        if args.fast:
+            count, digest = write_jsonl(iter_records(args.repo, args.revision, annotations), args.output)
+        else:
+            count, digest = write_jsonl(records(args.repo, args.revision, annotations), args.output)
     except (RuntimeError, ValueError, json.JSONDecodeError) as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 2
-    body = "".join(json.dumps(item, sort_keys=True, separators=(",", ":")) + "\n" for item in exported)
     if args.output:
-        args.output.write_text(body, encoding="utf-8")
-        digest = hashlib.sha256(body.encode()).hexdigest()
-        print(f"wrote {len(exported)} records to {args.output} (sha256:{digest})", file=sys.stderr)
-    else:
-        sys.stdout.write(body)
+        print(f"wrote {count} records to {args.output} (sha256:{digest})", file=sys.stderr)
     return 0
 
 
@@ -131,7 +131,13 @@ class SDFLineage:
 
 
 class LineageResolver(Protocol):
-    """External, read-only source of authenticated ancestry records."""
+    """External, read-only source of authenticated ancestry records.
+
+    A resolver may also offer ``resolve_chain(canonical_hash, max_depth)``,
+    returning that envelope followed by its ancestors (nearest first, at
+    most ``max_depth``); ``_check_lineage`` then fetches a whole ancestor
+    path in one call instead of one ``resolve`` per hop.
+    """
 
     def resolve(self, canonical_hash: str) -> "SDFEvidenceEnvelope | None": ...
 
@@ -187,6 +193,25 @@ class SDFEvidenceEnvelope:
             "canonical_hash": self.canonical_hash,
         }
 
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "SDFEvidenceEnvelope":
+        """Rebuild an envelope from :meth:`to_dict` output.
+
+        No verification is performed; pass the result to ``verify_evidence``.
+        """
+        return cls(
+            evidence_id=d["evidence_id"],
+            schema_version=d["schema_version"],
+            claim=d["claim"],
+            issuer=SDFIssuer(**d["issuer"]),
+            context=d["context"],
+            lineage=SDFLineage(**d["lineage"]),
+            issued_at=d["issued_at"],
+            nonce=d["nonce"],
+            signature=d["signature"],
+            canonical_hash=d["canonical_hash"],
+        )
+
     # ------------------------------------------------------------------
     # Body — the bytes that were signed (excludes signature itself)
     # ------------------------------------------------------------------
@@ -307,8 +332,37 @@ def verify_evidence(
         Always returns a verdict — never raises.  The verdict carries a
         deterministic ``receipt_hash`` usable as a refusal or admission receipt.
     """
+    results = _verify_state_independent(
+        envelope,
+        authority_scope=authority_scope,
+        current_context=current_context,
+        trusted_authority_keys=trusted_authority_keys,
+        trusted_credential_keys=trusted_credential_keys,
+        lineage_resolver=lineage_resolver,
+        trusted_genesis_hashes=trusted_genesis_hashes,
+    )
+    return _finish_verdict(
+        envelope, results, seen_nonces=seen_nonces, invariant_pass=invariant_pass
+    )
+
+
+def _verify_state_independent(
+    envelope: SDFEvidenceEnvelope,
+    *,
+    authority_scope: FrozenSet[str],
+    current_context: str,
+    trusted_authority_keys: Mapping[str, str] | None = None,
+    trusted_credential_keys: Mapping[str, tuple[str, str]] | None = None,
+    lineage_resolver: LineageResolver | None = None,
+    trusted_genesis_hashes: FrozenSet[str] | None = None,
+) -> dict[str, bool]:
+    """Evaluate predicates 1-4, which do not depend on nonce or system state.
+
+    Stops at the first failure; predicates after it are absent from the
+    result.  ``_finish_verdict`` completes the verdict, so batch callers can
+    run this stage ahead of time, off the ordered path.
+    """
     results: dict[str, bool] = {}
-    failed: Optional[str] = None
 
     # --- 1. Authentic -------------------------------------------------------
     results["authentic"] = _check_authentic(
@@ -317,31 +371,39 @@ def verify_evidence(
         trusted_credential_keys=trusted_credential_keys,
     )
     if not results["authentic"]:
-        failed = "authentic"
+        return results
 
     # --- 2. Lineage intact --------------------------------------------------
-    if failed is None:
-        results["lineage_intact"] = _check_lineage(
-            envelope,
-            lineage_resolver=lineage_resolver,
-            trusted_genesis_hashes=trusted_genesis_hashes,
-            trusted_authority_keys=trusted_authority_keys,
-            trusted_credential_keys=trusted_credential_keys,
-        )
-        if not results["lineage_intact"]:
-            failed = "lineage_intact"
+    results["lineage_intact"] = _check_lineage(
+        envelope,
+        lineage_resolver=lineage_resolver,
+        trusted_genesis_hashes=trusted_genesis_hashes,
+        trusted_authority_keys=trusted_authority_keys,
+        trusted_credential_keys=trusted_credential_keys,
+    )
+    if not results["lineage_intact"]:
+        return results
 
     # --- 3. Scope covered ---------------------------------------------------
-    if failed is None:
-        results["scope_covered"] = envelope.issuer.authority_id in authority_scope
-        if not results["scope_covered"]:
-            failed = "scope_covered"
+    results["scope_covered"] = envelope.issuer.authority_id in authority_scope
+    if not results["scope_covered"]:
+        return results
 
     # --- 4. Context match ---------------------------------------------------
-    if failed is None:
-        results["context_match"] = envelope.context == current_context
-        if not results["context_match"]:
-            failed = "context_match"
+    results["context_match"] = envelope.context == current_context
+    return results
+
+
+def _finish_verdict(
+    envelope: SDFEvidenceEnvelope,
+    state_independent: Mapping[str, bool],
+    *,
+    seen_nonces: Set[str],
+    invariant_pass: bool,
+) -> EvidenceVerdict:
+    """Evaluate predicates 5-6 and seal the verdict with its receipt hash."""
+    results = dict(state_independent)
+    failed: Optional[str] = next((p for p, ok in results.items() if not ok), None)
 
     # --- 5. Nonce fresh -----------------------------------------------------
     if failed is None:
@@ -494,6 +556,13 @@ def _check_lineage(
     if trusted_genesis_hashes is None:
         return False
 
+    # Prefetch the whole ancestor path when the resolver supports it; every
+    # prefetched parent is still checked below exactly as a resolved one.
+    ancestors = None
+    resolve_chain = getattr(lineage_resolver, "resolve_chain", None)
+    if resolve_chain is not None and lin.sequence > 0:
+        ancestors = iter(resolve_chain(lin.parent_hash, lin.sequence))
+
     current = envelope
     visited: set[str] = set()
     # The sequence is also a natural, attacker-independent walk bound.
@@ -512,7 +581,10 @@ def _check_lineage(
             )
         if lineage_resolver is None or not _is_hex64(lineage.parent_hash):
             return False
-        parent = lineage_resolver.resolve(lineage.parent_hash)
+        if ancestors is not None:
+            parent = next(ancestors, None)
+        else:
+            parent = lineage_resolver.resolve(lineage.parent_hash)
         if parent is None:
             return False
         if parent.canonical_hash != lineage.parent_hash:
@@ -3,13 +3,27 @@
 from __future__ import annotations
 
 from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
+import mmap
+import os
+from pathlib import Path
+import json
 import secrets
+import sqlite3
+import struct
+import threading
 import warnings
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Protocol, Tuple
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from tas_keyed_mac import KeyedMAC
 from tas_phase0_microkernel import (
     ALLOW_STATUS,
     DENY_STATUS,
@@ -17,8 +31,10 @@ from tas_phase0_microkernel import (
     Phase0Manifest,
     VerificationPolicy,
     boot_microkernel,
+    canonical_json_bytes,
     digest_payload,
     guard_accepts_token,
+    payload_mac,
     sign_payload,
     verify_action,
 )
@@ -84,14 +100,214 @@ class CursiveComputationIntent:
     snapshot_id: str
 
 
+class RegistryLedgerStore(Protocol):
+    """Append-only registry ledger indexed by record, owner and transaction."""
+
+    def __len__(self) -> int:
+        """Number of entries appended so far."""
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield every entry in append order."""
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Append *entry* and index it."""
+
+    def query_record(self, record_id: str) -> Iterator[Dict[str, Any]]:
+        """Lazily yield the entries for *record_id* in append order."""
+
+    def query_owner(self, owner_id: str) -> Iterator[Dict[str, Any]]:
+        """Lazily yield the entries notarized for *owner_id* in append order."""
+
+    def get_transaction(self, ledger_tx: str) -> Optional[Dict[str, Any]]:
+        """Return the entry written as *ledger_tx*, if any."""
+
+
+class InMemoryRegistryLedger:
+    """Process-local ledger: a list of entries plus dictionary indexes."""
+
+    def __init__(self) -> None:
+        self._entries: List[Dict[str, Any]] = []
+        self._by_record: Dict[str, List[int]] = {}
+        self._by_owner: Dict[str, List[int]] = {}
+        self._by_tx: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._entries)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self._entries[index]
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        position = len(self._entries)
+        self._entries.append(entry)
+        if "record_id" in entry:
+            self._by_record.setdefault(entry["record_id"], []).append(position)
+        if "owner_id" in entry:
+            self._by_owner.setdefault(entry["owner_id"], []).append(position)
+        if "ledger_tx" in entry:
+            self._by_tx[entry["ledger_tx"]] = position
+
+    def query_record(self, record_id: str) -> Iterator[Dict[str, Any]]:
+        # Snapshot the positions so entries appended mid-iteration are not yielded.
+        return (self._entries[i] for i in tuple(self._by_record.get(record_id, ())))
+
+    def query_owner(self, owner_id: str) -> Iterator[Dict[str, Any]]:
+        return (self._entries[i] for i in tuple(self._by_owner.get(owner_id, ())))
+
+    def get_transaction(self, ledger_tx: str) -> Optional[Dict[str, Any]]:
+        position = self._by_tx.get(ledger_tx)
+        return None if position is None else self._entries[position]
+
+
+_REGISTRY_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS registry_entries (
+    seq       INTEGER PRIMARY KEY,
+    offset    INTEGER NOT NULL,
+    length    INTEGER NOT NULL,
+    record_id TEXT,
+    owner_id  TEXT,
+    ledger_tx TEXT
+);
+CREATE INDEX IF NOT EXISTS registry_entries_record ON registry_entries (record_id);
+CREATE INDEX IF NOT EXISTS registry_entries_owner ON registry_entries (owner_id);
+CREATE INDEX IF NOT EXISTS registry_entries_tx ON registry_entries (ledger_tx);
+"""
+
+
+class FileRegistryLedger:
+    """Durable registry ledger: an append-only log plus a SQLite offset index.
+
+    ``registry.log`` holds one canonical JSON entry per line and is the
+    source of truth.  ``registry.index.sqlite`` maps each entry's sequence,
+    ``record_id``, ``owner_id`` and ``ledger_tx`` to its byte offset, so a
+    query reads only the matching lines.  On open, entries logged after the
+    last indexed offset (a crash between the log write and the index insert)
+    are indexed and a torn final line is truncated; nothing else is replayed.
+
+    The log is fsynced on every append unless ``sync=False``.  One registry
+    process should write a directory at a time; readers may share it.
+    """
+
+    LOG_NAME = "registry.log"
+    INDEX_NAME = "registry.index.sqlite"
+
+    def __init__(self, directory: str | Path, *, sync: bool = True) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._index = sqlite3.connect(
+            str(self.directory / self.INDEX_NAME), isolation_level=None, check_same_thread=False
+        )
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.executescript(_REGISTRY_INDEX_SCHEMA)
+        self._fd = os.open(self.directory / self.LOG_NAME, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            self._count, self._end = self._recover()
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._index.close()
+
+    def __enter__(self) -> "FileRegistryLedger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._read_rows("SELECT offset, length FROM registry_entries ORDER BY seq", ())
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        line = canonical_json_bytes(entry) + b"\n"
+        with self._lock:
+            os.write(self._fd, line)
+            if self.sync:
+                os.fsync(self._fd)
+            self._index_entry(self._count, self._end, len(line) - 1, entry)
+            self._count += 1
+            self._end += len(line)
+
+    def query_record(self, record_id: str) -> Iterator[Dict[str, Any]]:
+        return self._read_rows(
+            "SELECT offset, length FROM registry_entries WHERE record_id = ? ORDER BY seq", (record_id,)
+        )
+
+    def query_owner(self, owner_id: str) -> Iterator[Dict[str, Any]]:
+        return self._read_rows(
+            "SELECT offset, length FROM registry_entries WHERE owner_id = ? ORDER BY seq", (owner_id,)
+        )
+
+    def get_transaction(self, ledger_tx: str) -> Optional[Dict[str, Any]]:
+        return next(
+            self._read_rows("SELECT offset, length FROM registry_entries WHERE ledger_tx = ?", (ledger_tx,)),
+            None,
+        )
+
+    def _read_rows(self, query: str, params: Tuple[Any, ...]) -> Iterator[Dict[str, Any]]:
+        # Offsets are fetched up front; entries are only read and decoded as
+        # the caller advances.
+        rows = self._index.execute(query, params).fetchall()
+        fd = self._fd
+        return (json.loads(os.pread(fd, length, offset)) for offset, length in rows)
+
+    def _index_entry(self, seq: int, offset: int, length: int, entry: Dict[str, Any]) -> None:
+        self._index.execute(
+            "INSERT INTO registry_entries VALUES (?, ?, ?, ?, ?, ?)",
+            (seq, offset, length, entry.get("record_id"), entry.get("owner_id"), entry.get("ledger_tx")),
+        )
+
+    def _recover(self) -> Tuple[int, int]:
+        """Index the log tail past the last indexed entry and return (count, end)."""
+        row = self._index.execute(
+            "SELECT seq + 1, offset + length + 1 FROM registry_entries ORDER BY seq DESC LIMIT 1"
+        ).fetchone()
+        count, end = row if row else (0, 0)
+        size = os.fstat(self._fd).st_size
+        if size < end:
+            raise ValueError(f"{self.directory / self.LOG_NAME} is shorter than its index")
+        if size == end:
+            return count, end
+
+        tail = os.pread(self._fd, size - end, end)
+        complete = tail.rfind(b"\n") + 1
+        self._index.execute("BEGIN IMMEDIATE")
+        try:
+            offset = end
+            for line in tail[:complete].splitlines():
+                self._index_entry(count, offset, len(line), json.loads(line))
+                count += 1
+                offset += len(line) + 1
+        except BaseException:
+            self._index.execute("ROLLBACK")
+            raise
+        self._index.execute("COMMIT")
+        if complete < len(tail):
+            # A torn final line was never acknowledged to a caller.
+            os.ftruncate(self._fd, end + complete)
+        return count, end + complete
+
+
 class SDFRegistryAPI:
     """Institutional witness layer: schema gates + immutable receipt ledger."""
 
-    def __init__(self, witness_signing_key: str):
-        self._witness_signing_key = witness_signing_key
+    def __init__(self, witness_signing_key: str, ledger: RegistryLedgerStore | None = None):
+        self._witness_mac = payload_mac(witness_signing_key)
         self.identity_registry: Dict[str, Dict[str, Any]] = {}
-        self.ledger: List[Dict[str, Any]] = []
-        self._sequence = 0
+        self.ledger: RegistryLedgerStore = ledger if ledger is not None else InMemoryRegistryLedger()
+        # Every entry consumes one sequence number, so a reopened ledger resumes numbering.
+        self._sequence = len(self.ledger)
 
     def register_identity(self, identity: SovereignIdentity, metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
         self.identity_registry[identity.sovereign_id] = {
@@ -122,7 +338,7 @@ class SDFRegistryAPI:
         }
         # Optimization: Using .copy() is significantly faster than dict() for shallow dictionary copies.
         receipt = unsigned.copy()
-        receipt["witness_signature"] = sign_payload(unsigned, self._witness_signing_key)
+        receipt["witness_signature"] = sign_payload(unsigned, self._witness_mac)
         self.ledger.append(receipt)
         return receipt
 
@@ -145,13 +361,19 @@ class SDFRegistryAPI:
         }
         # Optimization: Using .copy() is significantly faster than dict() for shallow dictionary copies.
         entry = unsigned.copy()
-        entry["witness_signature"] = sign_payload(unsigned, self._witness_signing_key)
+        entry["witness_signature"] = sign_payload(unsigned, self._witness_mac)
         self.ledger.append(entry)
         return entry
 
-    def query_record(self, record_id: str) -> List[Dict[str, Any]]:
-        # Optimization: In CPython tight loops, using native `in` and `[]` access is ~1.25x faster than `.get()` because it avoids function call overhead.
-        return [entry for entry in self.ledger if "record_id" in entry and entry["record_id"] == record_id]
+    def query_record(self, record_id: str) -> Iterator[Dict[str, Any]]:
+        # Optimization: served from the ledger's record_id index instead of a full ledger scan.
+        return self.ledger.query_record(record_id)
+
+    def query_owner(self, owner_id: str) -> Iterator[Dict[str, Any]]:
+        return self.ledger.query_owner(owner_id)
+
+    def get_transaction(self, ledger_tx: str) -> Optional[Dict[str, Any]]:
+        return self.ledger.get_transaction(ledger_tx)
 
     @staticmethod
     def _require_non_empty(value: Any, message: str) -> None:
@@ -166,6 +388,16 @@ class TASAdmissibilityGateway:
         self.policy = policy
         self.verifier_signing_key = verifier_signing_key
 
+    @property
+    def verifier_signing_key(self) -> str:
+        return self._verifier_signing_key
+
+    @verifier_signing_key.setter
+    def verifier_signing_key(self, value: str) -> None:
+        # The keyed context follows the key, so it is set up once per key.
+        self._verifier_signing_key = value
+        self._verifier_mac = payload_mac(value)
+
     def boot_phase0(self, manifest: Phase0Manifest) -> Dict[str, Any]:
         receipt = boot_microkernel(manifest)
         if "anchor_hash" not in receipt:
@@ -185,7 +417,7 @@ class TASAdmissibilityGateway:
         payload["binding_hash"] = digest_payload(payload)
         # Optimization: Using .copy() is significantly faster than dict() for shallow dictionary copies.
         receipt = payload.copy()
-        receipt["signature"] = sign_payload(payload, self.verifier_signing_key)
+        receipt["signature"] = sign_payload(payload, self._verifier_mac)
         return receipt
 
     def evaluate_intent(self, intent: CursiveComputationIntent) -> Dict[str, Any]:
@@ -200,7 +432,7 @@ class TASAdmissibilityGateway:
             refusal_payload["receipt_hash"] = digest_payload(refusal_payload)
             # Optimization: Using .copy() is significantly faster than dict() for shallow dictionary copies.
             refusal = refusal_payload.copy()
-            refusal["signature"] = sign_payload(refusal_payload, self.verifier_signing_key)
+            refusal["signature"] = sign_payload(refusal_payload, self._verifier_mac)
             return refusal
 
         proposal = ActionProposal(
@@ -213,7 +445,7 @@ class TASAdmissibilityGateway:
             previous_receipt_hash=intent.previous_receipt_hash,
             snapshot_id=intent.snapshot_id,
         )
-        verification_receipt = verify_action(proposal, self.policy, self.verifier_signing_key)
+        verification_receipt = verify_action(proposal, self.policy, self._verifier_mac)
 
         payload = {
             "intent_id": intent.intent_id,
@@ -226,39 +458,241 @@ class TASAdmissibilityGateway:
         payload["gateway_receipt_hash"] = digest_payload(payload)
         # Optimization: Using .copy() is significantly faster than dict() for shallow dictionary copies.
         gateway_receipt = payload.copy()
-        gateway_receipt["signature"] = sign_payload(payload, self.verifier_signing_key)
+        gateway_receipt["signature"] = sign_payload(payload, self._verifier_mac)
         return gateway_receipt
 
 
+class ReplayCounterStore(Protocol):
+    """Consumed one-shot counters whose check-and-set is a single atomic step."""
+
+    def __contains__(self, counter: object) -> bool:
+        """Return True when *counter* can no longer be accepted."""
+
+    def consume(self, counter: Hashable) -> bool:
+        """Consume *counter*, returning False when it was already consumed."""
+
+
+class InMemoryReplayStore:
+    """Process-local replay set bounded by FIFO eviction.
+
+    Evicted counters become acceptable again; use :class:`WindowedReplayStore`
+    when counters must stay consumed across restarts and processes.
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        self._used_counters: set[Hashable] = set()
+        self._counter_order: deque[Hashable] = deque()
+        self._lock = threading.Lock()
+
+    def __contains__(self, counter: object) -> bool:
+        return counter in self._used_counters
+
+    def consume(self, counter: Hashable) -> bool:
+        with self._lock:
+            if counter in self._used_counters:
+                return False
+            self._used_counters.add(counter)
+            self._counter_order.append(counter)
+            if len(self._counter_order) > self.max_size:
+                self._used_counters.discard(self._counter_order.popleft())
+            return True
+
+
+_REPLAY_MAGIC = b"TASRPLY1"
+# magic, window size in counters, high watermark (-1 until the first consume)
+_REPLAY_HEADER = struct.Struct("<8sIxxxxq")
+_HIGH_WATERMARK = struct.Struct("<q")
+_HIGH_WATERMARK_OFFSET = 16
+# The watermark is a signed 64-bit field; larger counters cannot be recorded.
+_MAX_REPLAY_COUNTER = (1 << 63) - 1
+
+
+class WindowedReplayStore:
+    """Durable replay store shared by every process that opens the same file.
+
+    Counters are monotonic, so the store keeps the highest consumed counter
+    plus a ring bitmap of the last ``window`` counters in a memory-mapped
+    file.  A counter above the watermark advances the window, one inside it
+    is checked against its bit, and one that has fallen below the window is
+    refused outright, so eviction can never re-admit a replay.  Every
+    ``consume`` is O(1) amortized under an exclusive ``flock``; memory and
+    file size stay fixed at ``window / 8`` bytes plus a 24-byte header.
+
+    ``window`` only applies when the file is created; an existing file keeps
+    its own.  With ``sync=True`` each consume is ``msync``-ed before it
+    returns, so accepted counters also survive power loss, not just crashes.
+    """
+
+    def __init__(self, path: str | Path, window: int = 1 << 20, *, sync: bool = False) -> None:
+        if fcntl is None:  # pragma: no cover - non-POSIX platforms
+            raise RuntimeError("WindowedReplayStore requires POSIX file locking (fcntl)")
+        if window <= 0 or window % 8:
+            raise ValueError("window must be a positive multiple of 8")
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(self._fd).st_size == 0:
+                    os.ftruncate(self._fd, _REPLAY_HEADER.size + window // 8)
+                    os.pwrite(self._fd, _REPLAY_HEADER.pack(_REPLAY_MAGIC, window, -1), 0)
+                magic, self.window, _ = _REPLAY_HEADER.unpack(os.pread(self._fd, _REPLAY_HEADER.size, 0))
+                if magic != _REPLAY_MAGIC:
+                    raise ValueError(f"{path} is not a replay store")
+                self._mm = mmap.mmap(self._fd, _REPLAY_HEADER.size + self.window // 8)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+    def __enter__(self) -> "WindowedReplayStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def high_watermark(self) -> int:
+        """Highest counter consumed so far, or -1 when none has been."""
+        with self._locked(fcntl.LOCK_SH):
+            return self._high()
+
+    def __contains__(self, counter: object) -> bool:
+        if not _is_replay_counter(counter):
+            return False
+        with self._locked(fcntl.LOCK_SH):
+            high = self._high()
+            if counter > high:
+                return False
+            if counter <= high - self.window:
+                return True
+            return self._bit(counter % self.window)
+
+    def consume(self, counter: Hashable) -> bool:
+        # Only counters the watermark can record are accepted; anything else
+        # fails closed before the window is touched.
+        if not _is_replay_counter(counter):
+            return False
+        with self._locked(fcntl.LOCK_EX):
+            high = self._high()
+            if counter > high:
+                self._clear(high + 1, min(counter - high, self.window))
+                self._mm[_HIGH_WATERMARK_OFFSET:_REPLAY_HEADER.size] = _HIGH_WATERMARK.pack(counter)
+            elif counter <= high - self.window or self._bit(counter % self.window):
+                return False
+            index = counter % self.window
+            self._mm[_REPLAY_HEADER.size + (index >> 3)] |= 1 << (index & 7)
+            if self.sync:
+                self._mm.flush()
+            return True
+
+    def flush(self) -> None:
+        """``msync`` the mapped window to stable storage."""
+        self._mm.flush()
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        # flock() excludes other processes; threads sharing this descriptor
+        # need the in-process lock as well.
+        with self._lock:
+            fcntl.flock(self._fd, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _high(self) -> int:
+        return _HIGH_WATERMARK.unpack_from(self._mm, _HIGH_WATERMARK_OFFSET)[0]
+
+    def _bit(self, index: int) -> bool:
+        return bool(self._mm[_REPLAY_HEADER.size + (index >> 3)] & (1 << (index & 7)))
+
+    def _clear(self, first_counter: int, count: int) -> None:
+        """Clear the bits of *count* counters starting at *first_counter*."""
+        start = first_counter % self.window
+        end = start + count
+        if end > self.window:
+            self._clear_span(start, self.window)
+            self._clear_span(0, end - self.window)
+        else:
+            self._clear_span(start, end)
+
+    def _clear_span(self, lo: int, hi: int) -> None:
+        base = _REPLAY_HEADER.size
+        while lo < hi and lo & 7:
+            self._mm[base + (lo >> 3)] &= ~(1 << (lo & 7)) & 0xFF
+            lo += 1
+        while hi > lo and hi & 7:
+            hi -= 1
+            self._mm[base + (hi >> 3)] &= ~(1 << (hi & 7)) & 0xFF
+        if lo < hi:
+            self._mm[base + (lo >> 3):base + (hi >> 3)] = bytes((hi - lo) >> 3)
+
+
+def _is_replay_counter(counter: object) -> bool:
+    return (
+        isinstance(counter, int)
+        and not isinstance(counter, bool)
+        and 0 <= counter <= _MAX_REPLAY_COUNTER
+    )
+
+
 class ExternalActuatorGuard:
     """Independent guard that only executes with a valid one-shot token."""
 
-    def __init__(self, verifier_signing_key: str, max_replay_cache_size: int = 10000):
+    def __init__(
+        self,
+        verifier_signing_key: str,
+        max_replay_cache_size: int = 10000,
+        replay_store: ReplayCounterStore | None = None,
+    ):
         self.verifier_signing_key = verifier_signing_key
-        # Replay protection set: consumed counters are remembered so a one-shot
-        # token with an already-used counter cannot be accepted again.
-        # Lifecycle: process-local and intentionally monotonic for this prototype;
-        # it resets on process restart.
-        self._used_counters: set[int] = set()
-        self._counter_order: deque[int] = deque()
-        warnings.warn(
-            "Replay counter protection is process-local in this prototype and "
-            "must be backed by persistent storage for production.",
-            RuntimeWarning,
-            stacklevel=2,
-        )
         self.max_replay_cache_size = max_replay_cache_size
+        # Replay protection: consumed counters are remembered so a one-shot
+        # token with an already-used counter cannot be accepted again.
+        if replay_store is None:
+            # Lifecycle: process-local and bounded by FIFO eviction; it resets
+            # on process restart.
+            replay_store = InMemoryReplayStore(max_replay_cache_size)
+            warnings.warn(
+                "Replay counter protection is process-local in this prototype and "
+                "must be backed by persistent storage for production.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        self.replay_store = replay_store
+
+    @property
+    def verifier_signing_key(self) -> str:
+        return self._verifier_signing_key
+
+    @verifier_signing_key.setter
+    def verifier_signing_key(self, value: str) -> None:
+        # The keyed context follows the key, so it is set up once per key.
+        self._verifier_signing_key = value
+        self._verifier_mac = payload_mac(value)
 
     def execute(self, gateway_receipt: Dict[str, Any]) -> Dict[str, Any]:
         verification_receipt = gateway_receipt.get("verification_receipt", {})
         token = verification_receipt.get("actuation_token")
 
-        allowed = guard_accepts_token(token, self.verifier_signing_key, self._used_counters)
-        if allowed and token and token.get("counter") is not None:
-            self._counter_order.append(token["counter"])
-            if len(self._counter_order) > self.max_replay_cache_size:
-                evicted = self._counter_order.popleft()
-                self._used_counters.discard(evicted)
+        # The store lookup rejects replays before the signature check; the
+        # signature is then verified against an empty view and the store's
+        # consume() is the one atomic check-and-set, so concurrent guards
+        # sharing a store cannot both accept the same counter.
+        allowed = (
+            isinstance(token, dict)
+            and token.get("counter") not in self.replay_store
+            and guard_accepts_token(token, self._verifier_mac, set())
+            and self.replay_store.consume(token["counter"])
+        )
         status = "EXECUTED" if allowed else "REFUSED"
 
         # Optimization: Using EAFP pattern (try...except KeyError) is measurably faster (~1.3x speedup) than .get() for dictionary access by avoiding method call overhead.
@@ -290,7 +724,7 @@ class ExternalActuatorGuard:
         trace_payload["trace_hash"] = digest_payload(trace_payload)
         # Optimization: Using .copy() is significantly faster than dict() for shallow dictionary copies.
         trace = trace_payload.copy()
-        trace["signature"] = sign_payload(trace_payload, self.verifier_signing_key)
+        trace["signature"] = sign_payload(trace_payload, self._verifier_mac)
         return trace
 
 
@@ -400,7 +834,7 @@ class CitizenPortal:
         }
 
     def view_timeline(self, record_id: str) -> List[Dict[str, Any]]:
-        return self.registry.query_record(record_id)
+        return list(self.registry.query_record(record_id))
 
 
 class PublicVerifier:
@@ -410,8 +844,29 @@ class PublicVerifier:
         self.witness_signing_key = witness_signing_key
         self.verifier_signing_key = verifier_signing_key
 
+    @property
+    def verifier_signing_key(self) -> str:
+        return self._verifier_signing_key
+
+    @verifier_signing_key.setter
+    def verifier_signing_key(self, value: str) -> None:
+        # The keyed context follows the key, so it is set up once per key.
+        self._verifier_signing_key = value
+        self._verifier_mac = payload_mac(value)
+
+    @property
+    def witness_signing_key(self) -> str:
+        return self._witness_signing_key
+
+    @witness_signing_key.setter
+    def witness_signing_key(self, value: str) -> None:
+        self._witness_signing_key = value
+        self._witness_mac = payload_mac(value)
+
     @staticmethod
-    def _verify_signature(signed_payload: Dict[str, Any], signature_field: str, signing_key: str) -> bool:
+    def _verify_signature(
+        signed_payload: Dict[str, Any], signature_field: str, signing_key: str | KeyedMAC
+    ) -> bool:
         # Optimization: Using .copy() is significantly faster than dict() for shallow dictionary copies.
         payload = signed_payload.copy()
         signature = payload.pop(signature_field, None)
@@ -459,22 +914,22 @@ class PublicVerifier:
         except (KeyError, TypeError):
             return False
 
-        if not self._verify_signature(record_receipt, "witness_signature", self.witness_signing_key):
+        if not self._verify_signature(record_receipt, "witness_signature", self._witness_mac):
             return False
-        if not self._verify_signature(binding_receipt, "signature", self.verifier_signing_key):
+        if not self._verify_signature(binding_receipt, "signature", self._verifier_mac):
             return False
 
-        if not self._verify_signature(gateway_receipt, "signature", self.verifier_signing_key):
+        if not self._verify_signature(gateway_receipt, "signature", self._verifier_mac):
             return False
         verification_receipt = gateway_receipt.get("verification_receipt")
         if verification_receipt and not self._verify_signature(
-            verification_receipt, "signature", self.verifier_signing_key
+            verification_receipt, "signature", self._verifier_mac
         ):
             return False
 
-        if not self._verify_signature(execution_trace, "signature", self.verifier_signing_key):
+        if not self._verify_signature(execution_trace, "signature", self._verifier_mac):
             return False
-        if not self._verify_signature(execution_ledger_receipt, "witness_signature", self.witness_signing_key):
+        if not self._verify_signature(execution_ledger_receipt, "witness_signature", self._witness_mac):
             return False
 
         return True
@@ -0,0 +1,290 @@
+"""Compact binary wire encoding for ``SDFEvidenceEnvelope``.
+
+``to_dict`` plus JSON remains the canonical, signed form.  This module adds a
+versioned transport frame so hops that only forward, index or verify an
+envelope can skip JSON parsing and base64 decoding altogether.
+
+Frame layout, version 1 (all integers big-endian)::
+
+    magic "SDFW" | version u8 | flags u8 | schema_version u16 | sequence u64
+    canonical_hash 32 | genesis_hash 32 | parent_hash 32 (zero when absent)
+    public_key_len u8 | signature_len u8
+    evidence_id, context, issued_at, nonce, authority_id, credential_ref
+        lengths, u16 each | claim_len u32
+    public_key | signature | the six UTF-8 strings | claim
+
+The claim section holds the claim's canonical JSON bytes exactly as they
+appear in the signed body.  ``decode`` reads only the fixed header; every
+field is sliced lazily out of the caller's buffer as a ``memoryview``.
+
+The signature covers ``SDF_ENVELOPE_DOMAIN`` plus the canonical JSON of the
+body, so those bytes cannot sit contiguously in a binary frame without
+storing the body twice.  ``WireEnvelope.signed_message`` instead splices the
+claim section and the header fields into the fixed, key-sorted body
+template.  No dicts are built and the claim is never re-encoded.  The
+result is byte-identical to what ``build_envelope`` signed, and its SHA-256
+is the envelope's ``canonical_hash``.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import struct
+from json.encoder import encode_basestring
+from typing import Any
+
+from sdf_evidence_envelope import (
+    SDF_ENVELOPE_DOMAIN,
+    SDFEvidenceEnvelope,
+    SDFIssuer,
+    SDFLineage,
+    _canonical_json,
+)
+
+WIRE_MAGIC = b"SDFW"
+WIRE_VERSION = 1
+
+_HEADER = struct.Struct(">4sBBHQ32s32s32sBB6HI")
+_FLAG_PARENT = 0x01
+_NO_PARENT = bytes(32)
+
+
+def _json_str(view: memoryview) -> bytes:
+    return encode_basestring(str(view, "utf-8")).encode("utf-8")
+
+
+def _hash_raw(value: Any) -> bytes:
+    try:
+        raw = bytes.fromhex(value)
+    except (TypeError, ValueError):
+        raw = b""
+    # Round-tripping through hex() rejects uppercase and embedded whitespace.
+    if len(raw) != 32 or raw.hex() != value:
+        raise ValueError("envelope hashes must be lowercase 64-character hex")
+    return raw
+
+
+def _b64_raw(value: str, label: str) -> bytes:
+    try:
+        raw = base64.b64decode(value, validate=True)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{label} is not canonical base64") from exc
+    # Only canonical base64 survives the trip through raw bytes unchanged.
+    if base64.b64encode(raw).decode("ascii") != value:
+        raise ValueError(f"{label} is not canonical base64")
+    return raw
+
+
+def encode(envelope: SDFEvidenceEnvelope) -> bytes:
+    """Return the version-1 wire frame for *envelope*.
+
+    Raises ``ValueError`` for an envelope the frame cannot carry losslessly:
+    non-hex hashes, non-canonical base64, or fields beyond their width.
+    """
+    lineage = envelope.lineage
+    canonical_hash = _hash_raw(envelope.canonical_hash)
+    genesis_hash = _hash_raw(lineage.genesis_hash)
+    parent_hash = _NO_PARENT if lineage.parent_hash is None else _hash_raw(lineage.parent_hash)
+    for label, number, limit in (
+        ("sequence", lineage.sequence, 1 << 64),
+        ("schema_version", envelope.schema_version, 1 << 16),
+    ):
+        if not isinstance(number, int) or isinstance(number, bool) or not 0 <= number < limit:
+            raise ValueError(f"{label} does not fit the wire frame")
+    public_key = _b64_raw(envelope.issuer.public_key_b64, "public_key_b64")
+    signature = _b64_raw(envelope.signature, "signature")
+    if len(public_key) > 0xFF or len(signature) > 0xFF:
+        raise ValueError("public key or signature does not fit the wire frame")
+    strings = []
+    for value in (
+        envelope.evidence_id,
+        envelope.context,
+        envelope.issued_at,
+        envelope.nonce,
+        envelope.issuer.authority_id,
+        envelope.issuer.credential_ref,
+    ):
+        if not isinstance(value, str):
+            raise ValueError("envelope string fields must be str")
+        raw = value.encode("utf-8")
+        if len(raw) > 0xFFFF:
+            raise ValueError("string field does not fit the wire frame")
+        strings.append(raw)
+    claim = _canonical_json(envelope.claim)
+    if len(claim) > 0xFFFFFFFF:
+        raise ValueError("claim does not fit the wire frame")
+    header = _HEADER.pack(
+        WIRE_MAGIC,
+        WIRE_VERSION,
+        _FLAG_PARENT if lineage.parent_hash is not None else 0,
+        envelope.schema_version,
+        lineage.sequence,
+        canonical_hash,
+        genesis_hash,
+        parent_hash,
+        len(public_key),
+        len(signature),
+        *(len(raw) for raw in strings),
+        len(claim),
+    )
+    return b"".join((header, public_key, signature, *strings, claim))
+
+
+def decode(buffer: Any) -> "WireEnvelope":
+    """Validate the frame header in *buffer* and return a lazy view over it."""
+    return WireEnvelope(buffer)
+
+
+class WireEnvelope:
+    """Zero-copy view of one wire frame.
+
+    Hash, key and signature accessors return slices of the original buffer;
+    strings are decoded on access.  The buffer must stay alive and unchanged
+    while the view is in use.
+    """
+
+    __slots__ = ("_view", "_header", "_spans", "_signed")
+
+    def __init__(self, buffer: Any) -> None:
+        view = memoryview(buffer).cast("B")
+        if len(view) < _HEADER.size:
+            raise ValueError("wire frame is truncated")
+        header = _HEADER.unpack_from(view)
+        if header[0] != WIRE_MAGIC:
+            raise ValueError("not an SDF wire frame")
+        if header[1] != WIRE_VERSION:
+            raise ValueError(f"unsupported SDF wire version {header[1]}")
+        if header[2] & ~_FLAG_PARENT or (not header[2] and header[7] != _NO_PARENT):
+            raise ValueError("wire frame flags are malformed")
+        spans = []
+        offset = _HEADER.size
+        for length in header[8:]:
+            spans.append((offset, offset + length))
+            offset += length
+        if offset != len(view):
+            raise ValueError("wire frame length does not match its header")
+        self._view = view
+        self._header = header
+        self._spans = spans
+        self._signed: bytes | None = None
+
+    def _field(self, index: int) -> memoryview:
+        start, end = self._spans[index]
+        return self._view[start:end]
+
+    def _str(self, index: int) -> str:
+        return str(self._field(index), "utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._view)
+
+    @property
+    def schema_version(self) -> int:
+        return self._header[3]
+
+    @property
+    def sequence(self) -> int:
+        return self._header[4]
+
+    @property
+    def canonical_hash(self) -> str:
+        return self._header[5].hex()
+
+    @property
+    def genesis_hash(self) -> str:
+        return self._header[6].hex()
+
+    @property
+    def parent_hash(self) -> str | None:
+        return self._header[7].hex() if self._header[2] & _FLAG_PARENT else None
+
+    @property
+    def public_key(self) -> memoryview:
+        return self._field(0)
+
+    @property
+    def signature(self) -> memoryview:
+        return self._field(1)
+
+    @property
+    def evidence_id(self) -> str:
+        return self._str(2)
+
+    @property
+    def context(self) -> str:
+        return self._str(3)
+
+    @property
+    def issued_at(self) -> str:
+        return self._str(4)
+
+    @property
+    def nonce(self) -> str:
+        return self._str(5)
+
+    @property
+    def authority_id(self) -> str:
+        return self._str(6)
+
+    @property
+    def credential_ref(self) -> str:
+        return self._str(7)
+
+    @property
+    def claim_json(self) -> memoryview:
+        """The claim's canonical JSON bytes, as signed."""
+        return self._field(8)
+
+    @property
+    def claim(self) -> Any:
+        return json.loads(str(self.claim_json, "utf-8"))
+
+    def signed_message(self) -> bytes:
+        """Return exactly the bytes the issuer signed (domain prefix included)."""
+        if self._signed is None:
+            parent = self.parent_hash
+            self._signed = b"".join((
+                SDF_ENVELOPE_DOMAIN,
+                b'{"claim":', self.claim_json,
+                b',"context":', _json_str(self._field(3)),
+                b',"evidence_id":', _json_str(self._field(2)),
+                b',"issued_at":', _json_str(self._field(4)),
+                b',"issuer":{"authority_id":', _json_str(self._field(6)),
+                b',"credential_ref":', _json_str(self._field(7)),
+                b',"public_key_b64":"', base64.b64encode(self.public_key),
+                b'"},"lineage":{"genesis_hash":"', self.genesis_hash.encode("ascii"),
+                b'","parent_hash":', b"null" if parent is None else b'"%s"' % parent.encode("ascii"),
+                b',"sequence":%d},"nonce":' % self.sequence, _json_str(self._field(5)),
+                b',"schema_version":%d}' % self.schema_version,
+            ))
+        return self._signed
+
+    def hash_matches(self) -> bool:
+        """True iff ``canonical_hash`` commits to the framed body."""
+        return hashlib.sha256(self.signed_message()).digest() == self._header[5]
+
+    def to_envelope(self) -> SDFEvidenceEnvelope:
+        """Materialise the full ``SDFEvidenceEnvelope``; no verification."""
+        return SDFEvidenceEnvelope(
+            evidence_id=self.evidence_id,
+            schema_version=self.schema_version,
+            claim=self.claim,
+            issuer=SDFIssuer(
+                authority_id=self.authority_id,
+                public_key_b64=base64.b64encode(self.public_key).decode("ascii"),
+                credential_ref=self.credential_ref,
+            ),
+            context=self.context,
+            lineage=SDFLineage(
+                genesis_hash=self.genesis_hash,
+                parent_hash=self.parent_hash,
+                sequence=self.sequence,
+            ),
+            issued_at=self.issued_at,
+            nonce=self.nonce,
+            signature=base64.b64encode(self.signature).decode("ascii"),
+            canonical_hash=self.canonical_hash,
+        )
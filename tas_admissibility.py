@@ -38,8 +38,10 @@ import json
 import math
 import sqlite3
 import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, FrozenSet, Mapping, Optional, Protocol, Set
+from functools import partial
+from typing import Any, Callable, FrozenSet, Iterable, Mapping, Optional, Protocol, Set
 
 from sdf_evidence_envelope import (
     EvidenceVerdict,
@@ -48,7 +50,8 @@ from sdf_evidence_envelope import (
     SDF_VERDICT_DOMAIN,
     _canonical_json,
     _domain_hash,
-    verify_evidence,
+    _finish_verdict,
+    _verify_state_independent,
 )
 
 # ---------------------------------------------------------------------------
@@ -58,6 +61,9 @@ from sdf_evidence_envelope import (
 TAS_ADMISSION_DOMAIN = b"TAS-ADMISSION-V1\x00"
 TAS_REFUSAL_DOMAIN = b"TAS-REFUSAL-V1\x00"
 
+# Envelopes per pool task in ``admit_many``; amortises the task hand-off.
+_VERIFY_CHUNK = 32
+
 
 class AtomicNonceStore(Protocol):
     """Replay ledger whose insert-if-absent operation is one transaction."""
@@ -252,6 +258,136 @@ def admit_or_refuse(
     AdmissionReceipt  — if ΔS ≠ 0 (transition was admitted).
     RefusalReceipt    — if ΔS = 0  (transition was refused).
     """
+    return _admit_or_refuse(
+        proposal,
+        envelope,
+        state_root,
+        None,
+        authority_scope=authority_scope,
+        current_context=current_context,
+        seen_nonces=seen_nonces,
+        invariant_check=invariant_check,
+        apply_transition=apply_transition,
+        trusted_authority_keys=trusted_authority_keys,
+        trusted_credential_keys=trusted_credential_keys,
+        nonce_store=nonce_store,
+        lineage_resolver=lineage_resolver,
+        trusted_genesis_hashes=trusted_genesis_hashes,
+    )
+
+
+def admit_many(
+    proposals_with_envelopes: Iterable[tuple[Any, SDFEvidenceEnvelope]],
+    initial_state_root: str,
+    *,
+    authority_scope: FrozenSet[str],
+    current_context: str,
+    seen_nonces: Set[str],
+    invariant_check: Callable[[Any, str], bool],
+    apply_transition: Callable[[Any, str], str],
+    trusted_authority_keys: Mapping[str, str],
+    trusted_credential_keys: Mapping[str, tuple[str, str]] | None = None,
+    nonce_store: AtomicNonceStore | None = None,
+    lineage_resolver: LineageResolver | None = None,
+    trusted_genesis_hashes: FrozenSet[str] | None = None,
+    executor: Executor | None = None,
+) -> list[AdmissionOutcome]:
+    """Evaluate an ordered stream of ``(proposal, envelope)`` pairs.
+
+    Equivalent to calling :func:`admit_or_refuse` on each pair in turn,
+    feeding every admission's ``state_root_after`` into the next call, and
+    returns the same receipts.  Authenticity, lineage, scope and context do
+    not depend on the evolving state, so they are verified for the whole
+    batch on *executor* (a thread pool by default) while the ordered path
+    runs ``invariant_check``, nonce consumption and ``apply_transition``
+    one item at a time.  ``lineage_resolver`` must not change during the
+    batch; it is consulted ahead of the items that might otherwise extend
+    it.  An envelope whose early verification raised is verified again on
+    the ordered path, so it behaves exactly as in :func:`admit_or_refuse`
+    and its neighbours are unaffected.
+    """
+    items = list(proposals_with_envelopes)
+    verify = partial(
+        _verify_chunk,
+        authority_scope=authority_scope,
+        current_context=current_context,
+        trusted_authority_keys=trusted_authority_keys,
+        trusted_credential_keys=trusted_credential_keys,
+        lineage_resolver=lineage_resolver,
+        trusted_genesis_hashes=trusted_genesis_hashes,
+    )
+    pool = executor or ThreadPoolExecutor()
+    try:
+        chunks = [
+            items[start:start + _VERIFY_CHUNK]
+            for start in range(0, len(items), _VERIFY_CHUNK)
+        ]
+        futures = [
+            pool.submit(verify, [envelope for _, envelope in chunk]) for chunk in chunks
+        ]
+        outcomes: list[AdmissionOutcome] = []
+        state_root = initial_state_root
+        for chunk, future in zip(chunks, futures):
+            try:
+                verified = future.result()
+            except Exception:
+                # None defers verification to the ordered path, item by item.
+                verified = [None] * len(chunk)
+            for (proposal, envelope), state_independent in zip(chunk, verified):
+                outcome = _admit_or_refuse(
+                    proposal,
+                    envelope,
+                    state_root,
+                    state_independent,
+                    authority_scope=authority_scope,
+                    current_context=current_context,
+                    seen_nonces=seen_nonces,
+                    invariant_check=invariant_check,
+                    apply_transition=apply_transition,
+                    trusted_authority_keys=trusted_authority_keys,
+                    trusted_credential_keys=trusted_credential_keys,
+                    nonce_store=nonce_store,
+                    lineage_resolver=lineage_resolver,
+                    trusted_genesis_hashes=trusted_genesis_hashes,
+                )
+                if outcome.admitted:
+                    state_root = outcome.state_root_after
+                outcomes.append(outcome)
+        return outcomes
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _verify_chunk(
+    envelopes: list[SDFEvidenceEnvelope], **options: Any
+) -> list[dict[str, bool] | None]:
+    verified: list[dict[str, bool] | None] = []
+    for envelope in envelopes:
+        try:
+            verified.append(_verify_state_independent(envelope, **options))
+        except Exception:
+            verified.append(None)
+    return verified
+
+
+def _admit_or_refuse(
+    proposal: Any,
+    envelope: SDFEvidenceEnvelope,
+    state_root: str,
+    state_independent: Mapping[str, bool] | None,
+    *,
+    authority_scope: FrozenSet[str],
+    current_context: str,
+    seen_nonces: Set[str],
+    invariant_check: Callable[[Any, str], bool],
+    apply_transition: Callable[[Any, str], str],
+    trusted_authority_keys: Mapping[str, str],
+    trusted_credential_keys: Mapping[str, tuple[str, str]] | None,
+    nonce_store: AtomicNonceStore | None,
+    lineage_resolver: LineageResolver | None,
+    trusted_genesis_hashes: FrozenSet[str] | None,
+) -> AdmissionOutcome:
     normalized_proposal = _json_value(proposal)
     normalized_claim = _json_value(envelope.claim)
     proposal_hash = _domain_hash(
@@ -263,16 +399,18 @@ def admit_or_refuse(
     # independent; neither can influence the other's inputs.
     inv = invariant_check(normalized_proposal, state_root)
 
-    verdict = verify_evidence(
-        envelope,
-        authority_scope=authority_scope,
-        current_context=current_context,
-        seen_nonces=seen_nonces,
-        invariant_pass=inv,
-        trusted_authority_keys=trusted_authority_keys,
-        trusted_credential_keys=trusted_credential_keys,
-        lineage_resolver=lineage_resolver,
-        trusted_genesis_hashes=trusted_genesis_hashes,
+    if state_independent is None:
+        state_independent = _verify_state_independent(
+            envelope,
+            authority_scope=authority_scope,
+            current_context=current_context,
+            trusted_authority_keys=trusted_authority_keys,
+            trusted_credential_keys=trusted_credential_keys,
+            lineage_resolver=lineage_resolver,
+            trusted_genesis_hashes=trusted_genesis_hashes,
+        )
+    verdict = _finish_verdict(
+        envelope, state_independent, seen_nonces=seen_nonces, invariant_pass=inv
     )
 
     if verdict.admissible and not claim_matches_proposal:
@@ -307,16 +445,8 @@ def admit_or_refuse(
         # should always inject a durable AtomicNonceStore.
         store = nonce_store or InMemoryNonceStore(seen_nonces)
         if not store.consume(envelope.nonce):
-            verdict = verify_evidence(
-                envelope,
-                authority_scope=authority_scope,
-                current_context=current_context,
-                seen_nonces={envelope.nonce},
-                invariant_pass=inv,
-                trusted_authority_keys=trusted_authority_keys,
-                trusted_credential_keys=trusted_credential_keys,
-                lineage_resolver=lineage_resolver,
-                trusted_genesis_hashes=trusted_genesis_hashes,
+            verdict = _finish_verdict(
+                envelope, state_independent, seen_nonces={envelope.nonce}, invariant_pass=inv
             )
         else:
             new_state_root = apply_transition(normalized_proposal, state_root)
@@ -0,0 +1,37 @@
+"""Offline, CPU-only benchmark suite for TAS gates, verifiers and ledgers.
+
+Run ``python -m tas_bench run`` to measure every registered case,
+``python -m tas_bench run --compare`` to check the results against the
+committed baseline in ``tas_bench/baselines/``, and ``python -m tas_bench
+compare OLD NEW`` to compare two saved reports.  See :mod:`tas_bench.harness`
+for how cases are defined and timed.
+
+For end-to-end load, ``python -m tas_bench mint`` pre-signs a corpus of valid
+and adversarial requests (:mod:`tas_bench.corpus`) and ``python -m tas_bench
+load`` drives it through a fresh gate, closed- or open-loop, reporting a
+latency histogram per outcome code (:mod:`tas_bench.loadgen`).
+"""
+
+from .harness import (
+    CASES,
+    BenchmarkCase,
+    BenchmarkResult,
+    Comparison,
+    benchmark,
+    compare,
+    run_case,
+    run_suite,
+    select,
+)
+
+__all__ = [
+    "CASES",
+    "BenchmarkCase",
+    "BenchmarkResult",
+    "Comparison",
+    "benchmark",
+    "compare",
+    "run_case",
+    "run_suite",
+    "select",
+]
@@ -0,0 +1,179 @@
+"""Command line for the TAS benchmark suite."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+
+# Allow ``python tas_bench`` as well as ``python -m tas_bench`` from a checkout.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from tas_bench import suites  # noqa: E402,F401  (registers the cases)
+from tas_bench.harness import compare, run_suite, select  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "baseline.json"
+
+
+def _print_result(result) -> None:
+    print(
+        f"{result.name:<36} p50 {result.p50_us:10.1f}us  p95 {result.p95_us:10.1f}us"
+        f"  p99 {result.p99_us:10.1f}us  {result.ops_per_sec:>12,.0f} ops/s",
+        flush=True,
+    )
+
+
+def _print_comparisons(comparisons, metric: str) -> int:
+    regressions = 0
+    for item in comparisons:
+        if item.status in ("missing", "new"):
+            print(f"{item.name:<36} {item.status}")
+            continue
+        marker = {"regression": "REGRESSION", "improvement": "improved", "ok": "ok"}[item.status]
+        print(f"{item.name:<36} {metric} {item.baseline:10.1f} -> {item.current:10.1f}  x{item.ratio:5.2f}  {marker}")
+        regressions += item.status == "regression"
+    return regressions
+
+
+def _load(path) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _cmd_list(args) -> int:
+    for case in select(args.cases):
+        print(f"{case.name:<36} {case.description}")
+    return 0
+
+
+def _cmd_run(args) -> int:
+    cases = select(args.cases)
+    if not cases:
+        print("No benchmark cases match.", file=sys.stderr)
+        return 2
+    report = run_suite(
+        cases, warmup=args.warmup, repeat=args.repeat, number=args.number, progress=_print_result
+    )
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Report written to {args.output}")
+    if args.compare is None:
+        return 0
+    print()
+    baseline = _load(args.compare)
+    if args.cases:
+        # Only the selected cases were run; do not report the rest as missing.
+        baseline = {**baseline, "results": {k: v for k, v in baseline["results"].items() if k in report["results"]}}
+    comparisons = compare(baseline, report, threshold=args.threshold, metric=args.metric)
+    return 1 if _print_comparisons(comparisons, args.metric) else 0
+
+
+def _cmd_compare(args) -> int:
+    comparisons = compare(_load(args.baseline), _load(args.current), threshold=args.threshold, metric=args.metric)
+    return 1 if _print_comparisons(comparisons, args.metric) else 0
+
+
+def _cmd_mint(args) -> int:
+    from tas_bench.corpus import mint
+
+    corpus = mint(
+        args.target, args.count, seed=args.seed, adversarial=args.adversarial,
+        algorithm=args.algorithm, max_chain_depth=args.max_chain_depth,
+    )
+    corpus.save(args.output)
+    kinds = ", ".join(f"{kind}={n}" for kind, n in sorted(corpus.kinds().items()))
+    print(f"Minted {len(corpus)} {args.target} requests to {args.output} ({kinds})")
+    return 0
+
+
+def _cmd_load(args) -> int:
+    from tas_bench.corpus import Corpus, build_target
+    from tas_bench.loadgen import run_closed_loop, run_open_loop
+
+    corpus = Corpus.load(args.corpus)
+    target = build_target(corpus)
+    if args.rate is None:
+        workers = 1 if args.workers is None else args.workers
+        result = run_closed_loop(target, workers=workers, limit=args.limit)
+        mode = f"closed loop, {result.workers} workers"
+    else:
+        workers = 8 if args.workers is None else args.workers
+        result = run_open_loop(target, rate=args.rate, workers=workers, limit=args.limit)
+        mode = f"open loop at {args.rate:,.0f}/s, {result.workers} workers"
+    print(f"{corpus.target}: {result.requests} requests in {result.elapsed_s:.2f}s ({mode})")
+    print(f"throughput {result.throughput:,.0f} req/s")
+    for code, histogram in [("all", result.total()), *sorted(result.histograms.items())]:
+        stats = histogram.to_dict()
+        print(
+            f"{code:<36} n={stats['count']:<8} p50 {stats['p50_us']:10.1f}us  p95 {stats['p95_us']:10.1f}us"
+            f"  p99 {stats['p99_us']:10.1f}us  max {stats['max_us']:10.1f}us"
+        )
+    for (expected, observed), count in sorted(result.mismatches.items()):
+        print(f"unexpected outcome: expected {expected}, observed {observed} x{count}")
+    if args.output:
+        report = {"corpus": str(args.corpus), "target": corpus.target, **result.to_dict()}
+        Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Report written to {args.output}")
+    return 0
+
+
+def _add_threshold_options(parser) -> None:
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown before a case is flagged")
+    parser.add_argument("--metric", default="p50_us", choices=["p50_us", "p95_us", "p99_us", "mean_us"], help="Latency metric to compare")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tas_bench", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List benchmark cases")
+    list_parser.add_argument("cases", nargs="*", help="Glob patterns selecting cases")
+    list_parser.set_defaults(func=_cmd_list)
+
+    run_parser = subparsers.add_parser("run", help="Run benchmark cases")
+    run_parser.add_argument("cases", nargs="*", help="Glob patterns selecting cases (default: all)")
+    run_parser.add_argument("--warmup", type=int, default=50, help="Untimed operations per case")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed rounds per case")
+    run_parser.add_argument("--number", type=int, default=200, help="Operations per timed round")
+    run_parser.add_argument("--output", help="Write the JSON report to this path")
+    run_parser.add_argument(
+        "--compare", nargs="?", const=str(DEFAULT_BASELINE), default=None,
+        help="Compare against a baseline report (default: the committed baseline)",
+    )
+    _add_threshold_options(run_parser)
+    run_parser.set_defaults(func=_cmd_run)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two saved reports")
+    compare_parser.add_argument("baseline", help="Baseline report")
+    compare_parser.add_argument("current", help="Current report")
+    _add_threshold_options(compare_parser)
+    compare_parser.set_defaults(func=_cmd_compare)
+
+    mint_parser = subparsers.add_parser("mint", help="Mint a load corpus of valid and adversarial requests")
+    mint_parser.add_argument("target", choices=["admission_gate", "sdf"], help="Gate the corpus is minted for")
+    mint_parser.add_argument("--output", "-o", required=True, help="Corpus file (JSON Lines) to write")
+    mint_parser.add_argument("--count", "-n", type=int, default=10_000, help="Number of requests")
+    mint_parser.add_argument("--seed", type=int, default=0, help="Seed for keys and request mix")
+    mint_parser.add_argument("--adversarial", type=float, default=0.25, help="Fraction of adversarial requests")
+    mint_parser.add_argument("--algorithm", choices=["ed25519", "secp256k1"], default="ed25519", help="Authority signature algorithm (admission_gate)")
+    mint_parser.add_argument("--max-chain-depth", type=int, default=8, help="Longest lineage chain (sdf)")
+    mint_parser.set_defaults(func=_cmd_mint)
+
+    load_parser = subparsers.add_parser("load", help="Drive a saved corpus through its gate")
+    load_parser.add_argument("corpus", help="Corpus file written by 'mint'")
+    load_parser.add_argument("--workers", "-w", type=int, default=None, help="Worker threads (default: 1 closed-loop, 8 open-loop)")
+    load_parser.add_argument("--rate", type=float, default=None, help="Open loop: release this many requests per second")
+    load_parser.add_argument("--limit", type=int, default=None, help="Submit at most this many requests")
+    load_parser.add_argument("--output", help="Write the JSON load report to this path")
+    load_parser.set_defaults(func=_cmd_load)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,448 @@
+"""Pre-minted load corpora of valid and adversarial admission inputs.
+
+A corpus is a JSON Lines file.  The first line is a header naming the target
+gate and carrying the public material needed to rebuild it (authority
+snapshot, context and definitions, or trusted SDF keys and genesis); every
+further line is one request with its ``kind`` -- ``"valid"``, ``"chain"`` or
+an adversarial mutation -- the outcome code it is expected to produce, and
+its serialized inputs.  Signing happens once, at mint time, so a saved corpus
+replays byte-identical traffic on every run.
+
+Two targets are supported:
+
+``admission_gate``
+    :meth:`admission_gate.AdmissionGatekeeper.evaluate`.  The external
+    authority signs with :class:`~admission_gate.LocalEd25519Signer` or
+    :class:`~admission_gate.LocalSecp256k1Signer`.  Outcome codes are
+    ``"ADMITTED"`` or the receipt's (or cutoff's) ``failure_code``.
+
+``sdf``
+    :func:`tas_admissibility.admit_or_refuse` over envelopes from
+    :func:`sdf_evidence_envelope.build_envelope`.  Valid envelopes form
+    genesis-rooted chains served by a lineage resolver; outcome codes are
+    ``"ADMITTED"`` or the verdict's ``failed_predicate``.  ``replay``
+    requests repeat an earlier admissible envelope; with several workers a
+    replay can overtake its original, in which case the pair's outcomes swap
+    and are reported as mismatches.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+import random
+from typing import Any, Callable, Mapping
+
+from . import fixtures
+
+CORPUS_VERSION = 1
+ADMITTED = "ADMITTED"
+
+# kind -> the outcome code a request of that kind is expected to produce.
+ADMISSION_GATE_KINDS: dict[str, str] = {
+    "valid": ADMITTED,
+    "bad_signature": "AUTHORIZATION_REFUSED",
+    "foreign_key": "AUTHORIZATION_REFUSED",
+    "stale_epoch": "AUTHORIZATION_REFUSED",
+    "unknown_credential": "CONTEXT_AUTHORITY_MISMATCH",
+    "unknown_context": "CONTEXT_REFUSED",
+    "orphan_parent": "LINEAGE_UNAVAILABLE",
+    "candidate_mismatch": "INVALID_INPUT:ValueError",
+    "malformed_envelope": "INVALID_INPUT:CanonicalJSONError",
+}
+
+SDF_KINDS: dict[str, str] = {
+    "valid": ADMITTED,
+    "chain": ADMITTED,
+    "tampered_claim": "authentic",
+    "untrusted_key": "authentic",
+    "orphan": "lineage_intact",
+    "untrusted_genesis": "lineage_intact",
+    "out_of_scope": "scope_covered",
+    "wrong_context": "context_match",
+    "replay": "nonce_fresh",
+    "invariant_violation": "invariant_pass",
+    "claim_mismatch": "claim_matches_proposal",
+}
+
+TARGETS: dict[str, Mapping[str, str]] = {
+    "admission_gate": ADMISSION_GATE_KINDS,
+    "sdf": SDF_KINDS,
+}
+
+ALGORITHMS = ("ed25519", "secp256k1")
+
+_VALID_KINDS = frozenset({"valid", "chain"})
+_OBSERVER = "observer"
+
+
+@dataclass
+class Corpus:
+    """A header plus an ordered list of request records."""
+
+    header: dict[str, Any]
+    records: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def target(self) -> str:
+        return self.header["target"]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def kinds(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for record in self.records:
+            counts[record["kind"]] = counts.get(record["kind"], 0) + 1
+        return counts
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            for line in (self.header, *self.records):
+                handle.write(json.dumps(line, sort_keys=True, separators=(",", ":")))
+                handle.write("\n")
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "Corpus":
+        with open(path, encoding="utf-8") as handle:
+            header = json.loads(handle.readline())
+            if header.get("corpus_version") != CORPUS_VERSION:
+                raise ValueError(f"unsupported corpus version: {header.get('corpus_version')!r}")
+            if header.get("target") not in TARGETS:
+                raise ValueError(f"unknown corpus target: {header.get('target')!r}")
+            return cls(header, [json.loads(line) for line in handle if line.strip()])
+
+
+@dataclass
+class Target:
+    """A freshly built gate and the corpus requests decoded for it.
+
+    ``submit(request)`` runs one request through the gate and returns its
+    outcome code.  Gate state (ledgers, nonce stores) starts empty, so a
+    corpus can be driven through a new target any number of times.
+    """
+
+    submit: Callable[[Any], str]
+    requests: list[Any]
+    expected: list[str]
+
+
+def mint(
+    target: str,
+    count: int,
+    *,
+    seed: int = 0,
+    adversarial: float = 0.25,
+    algorithm: str = "ed25519",
+    max_chain_depth: int = 8,
+) -> Corpus:
+    """Mint *count* requests for *target*.
+
+    A fraction *adversarial* of the requests is spread evenly over the
+    target's adversarial kinds; the rest are admissible.  For ``sdf``,
+    admissible envelopes extend existing chains up to *max_chain_depth*
+    before a new genesis is started.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"unknown target: {target!r}")
+    if count < 0:
+        raise ValueError("count must not be negative")
+    if not 0.0 <= adversarial <= 1.0:
+        raise ValueError("adversarial must be between 0 and 1")
+    rng = random.Random(seed)
+    if target == "admission_gate":
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm: {algorithm!r}")
+        return _mint_admission_gate(count, rng, seed, adversarial, algorithm)
+    return _mint_sdf(count, rng, seed, adversarial, max_chain_depth)
+
+
+def build_target(corpus: Corpus) -> Target:
+    """Build a fresh gate for *corpus* and decode its requests."""
+    if corpus.target == "admission_gate":
+        return _admission_gate_target(corpus)
+    return _sdf_target(corpus)
+
+
+def _choose_kind(rng: random.Random, kinds: Mapping[str, str], adversarial: float) -> str:
+    if rng.random() >= adversarial:
+        return "valid"
+    return rng.choice([kind for kind in kinds if kind not in _VALID_KINDS])
+
+
+def _random_hex(rng: random.Random) -> str:
+    return f"{rng.getrandbits(256):064x}"
+
+
+# ---------------------------------------------------------------------- #
+# admission_gate                                                           #
+# ---------------------------------------------------------------------- #
+
+def _authority_signer(algorithm: str, seed: int):
+    from admission_gate import LocalEd25519Signer, LocalSecp256k1Signer
+
+    if algorithm == "ed25519":
+        return LocalEd25519Signer(fixtures.ed25519_key(seed))
+    return LocalSecp256k1Signer(fixtures.secp256k1_key(seed))
+
+
+def _mint_admission_gate(
+    count: int, rng: random.Random, seed: int, adversarial: float, algorithm: str
+) -> Corpus:
+    from admission_gate import canonical_json
+    from authority_store import authority_snapshot_record
+
+    authority = _authority_signer(algorithm, seed * 2 + 101)
+    foreign = _authority_signer(algorithm, seed * 2 + 102)
+    snapshot, context, definition = fixtures.admission_material(authority)
+    header = {
+        "corpus_version": CORPUS_VERSION,
+        "target": "admission_gate",
+        "seed": seed,
+        "algorithm": authority.algorithm,
+        "evaluated_at": fixtures.EVALUATED_AT,
+        "authority": authority_snapshot_record(snapshot),
+        "context": context.mapping,
+        "definitions": [definition],
+    }
+
+    records = []
+    for index in range(count):
+        kind = _choose_kind(rng, ADMISSION_GATE_KINDS, adversarial)
+        proposal = {**fixtures.candidate(index), "operation": rng.choice(("READ", "WRITE", "APPEND"))}
+        body = fixtures.admission_body(authority, context, index, proposal)
+        signer = authority
+        if kind == "foreign_key":
+            signer = foreign
+        elif kind == "stale_epoch":
+            body["authority_epoch"] -= 1
+        elif kind == "unknown_credential":
+            body["credential_id"] = f"credential-{rng.getrandbits(32):08x}"
+        elif kind == "unknown_context":
+            body["context_snapshot_hash"] = _random_hex(rng)
+        elif kind == "orphan_parent":
+            body["parent_receipt_hash"] = _random_hex(rng)
+        raw_candidate = canonical_json(proposal)
+        raw_envelope = fixtures.sign_admission_body(signer, body)
+        if kind == "bad_signature":
+            envelope = json.loads(raw_envelope)
+            signature = bytearray(base64.b64decode(envelope["signature"]))
+            signature[-1] ^= 0x01
+            envelope["signature"] = base64.b64encode(bytes(signature)).decode()
+            raw_envelope = canonical_json(envelope)
+        elif kind == "candidate_mismatch":
+            raw_candidate = canonical_json({**proposal, "resource": "registry/records/override"})
+        elif kind == "malformed_envelope":
+            raw_envelope = raw_envelope[: rng.randrange(1, len(raw_envelope))]
+        records.append(
+            {
+                "kind": kind,
+                "expect": ADMISSION_GATE_KINDS[kind],
+                "candidate": base64.b64encode(raw_candidate).decode(),
+                "envelope": base64.b64encode(raw_envelope).decode(),
+            }
+        )
+    return Corpus(header, records)
+
+
+def admission_gatekeeper(corpus: Corpus, *, ledger=None, nonce_store=None):
+    """Build the ``AdmissionGatekeeper`` an ``admission_gate`` corpus targets.
+
+    By default decisions go to an in-memory ledger and nonces are not
+    tracked; pass durable backends to share them between processes.
+    """
+    from authority_store import authority_snapshot_from_record
+    from context_snapshot import ContextSnapshot
+
+    if corpus.target != "admission_gate":
+        raise ValueError(f"not an admission_gate corpus: {corpus.target!r}")
+    header = corpus.header
+    return fixtures.build_admission_gatekeeper(
+        authority_snapshot_from_record(header["authority"]),
+        ContextSnapshot.from_mapping(header["context"]),
+        header["definitions"],
+        ledger=ledger,
+        nonce_store=nonce_store,
+    )
+
+
+def _admission_gate_target(corpus: Corpus) -> Target:
+    gatekeeper = admission_gatekeeper(corpus)
+    evaluated_at = corpus.header["evaluated_at"]
+
+    def submit(request: tuple[bytes, bytes]) -> str:
+        raw_candidate, raw_envelope = request
+        result = gatekeeper.evaluate(
+            raw_candidate=raw_candidate, raw_envelope=raw_envelope, current_time=evaluated_at
+        )
+        if result["resulting_state"] == ADMITTED:
+            return ADMITTED
+        failure = result.get("failure_code") or result.get("receipt", {}).get("failure_code")
+        return failure or result["resulting_state"]
+
+    requests = [
+        (base64.b64decode(record["candidate"]), base64.b64decode(record["envelope"]))
+        for record in corpus.records
+    ]
+    return Target(submit, requests, [record["expect"] for record in corpus.records])
+
+
+# ---------------------------------------------------------------------- #
+# sdf / tas_admissibility                                                  #
+# ---------------------------------------------------------------------- #
+
+def _public_key_b64(private_key) -> str:
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+    return base64.b64encode(
+        private_key.public_key().public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)
+    ).decode()
+
+
+def _mint_sdf(count: int, rng: random.Random, seed: int, adversarial: float, max_depth: int) -> Corpus:
+    from sdf_evidence_envelope import build_envelope
+
+    key = fixtures.secp256k1_key(seed * 3 + 201)
+    observer_key = fixtures.secp256k1_key(seed * 3 + 202)
+    untrusted_key = fixtures.secp256k1_key(seed * 3 + 203)
+    genesis = fixtures.digest(f"sdf-genesis-{seed}", 0)
+    header = {
+        "corpus_version": CORPUS_VERSION,
+        "target": "sdf",
+        "seed": seed,
+        "authority_scope": [fixtures.SDF_AUTHORITY],
+        "context": fixtures.SDF_CONTEXT,
+        "state_root": fixtures.STATE_ROOT,
+        "trusted_authority_keys": {
+            fixtures.SDF_AUTHORITY: _public_key_b64(key),
+            _OBSERVER: _public_key_b64(observer_key),
+        },
+        "trusted_genesis_hashes": [genesis],
+    }
+
+    # Tails of chains that may still be extended: (envelope, depth).
+    open_chains: list[tuple[Any, int]] = []
+    admitted: list[dict[str, Any]] = []
+    records = []
+    for index in range(count):
+        kind = _choose_kind(rng, SDF_KINDS, adversarial)
+        if kind == "replay" and not admitted:
+            kind = "valid"
+        if kind == "valid" and open_chains and rng.random() < 0.5:
+            kind = "chain"
+        if kind == "replay":
+            original = rng.choice(admitted)
+            records.append({**original, "kind": kind, "expect": SDF_KINDS[kind], "publish": False})
+            continue
+
+        claim = fixtures.candidate(index)
+        if kind == "invariant_violation":
+            claim = {**claim, "operation": "DELETE"}
+        options = {
+            "evidence_id": f"evidence-{seed}-{index}",
+            "claim": claim,
+            "issuer_authority_id": fixtures.SDF_AUTHORITY,
+            "issuer_private_key": key,
+            "context": fixtures.SDF_CONTEXT,
+            "genesis_hash": genesis,
+            "parent_hash": None,
+            "sequence": 0,
+            "issued_at": fixtures.ISSUED_AT,
+            "nonce": f"nonce-{seed}-{index}",
+        }
+        depth = 0
+        if kind == "chain":
+            slot = rng.randrange(len(open_chains))
+            parent, depth = open_chains[slot]
+            options.update(parent_hash=parent.canonical_hash, sequence=parent.lineage.sequence + 1)
+        elif kind == "untrusted_key":
+            options["issuer_private_key"] = untrusted_key
+        elif kind == "orphan":
+            options.update(parent_hash=_random_hex(rng), sequence=rng.randrange(1, max_depth + 1))
+        elif kind == "untrusted_genesis":
+            options["genesis_hash"] = _random_hex(rng)
+        elif kind == "out_of_scope":
+            options.update(issuer_authority_id=_OBSERVER, issuer_private_key=observer_key)
+        elif kind == "wrong_context":
+            options["context"] = f"{fixtures.SDF_CONTEXT}:stale"
+        envelope = build_envelope(**options)
+
+        if kind in _VALID_KINDS:
+            if kind == "chain":
+                open_chains.pop(slot)
+            if depth + 1 < max_depth:
+                open_chains.append((envelope, depth + 1))
+
+        serialized = envelope.to_dict()
+        proposal = claim
+        if kind == "tampered_claim":
+            serialized["claim"] = proposal = {**claim, "resource": "registry/records/override"}
+        elif kind == "claim_mismatch":
+            proposal = {**claim, "resource": "registry/records/override"}
+        record = {
+            "kind": kind,
+            "expect": SDF_KINDS[kind],
+            "proposal": proposal,
+            "envelope": serialized,
+            "publish": kind in _VALID_KINDS,
+        }
+        if kind in _VALID_KINDS:
+            admitted.append(record)
+        records.append(record)
+    return Corpus(header, records)
+
+
+class _LineageStore:
+    """Read-only ``LineageResolver`` over the corpus's published envelopes."""
+
+    def __init__(self, envelopes) -> None:
+        self._envelopes = {envelope.canonical_hash: envelope for envelope in envelopes}
+
+    def resolve(self, canonical_hash: str):
+        return self._envelopes.get(canonical_hash)
+
+
+def _invariant_check(proposal: Any, state_root: str) -> bool:
+    return proposal.get("operation") != "DELETE"
+
+
+def _apply_transition(proposal: Any, state_root: str) -> str:
+    encoded = json.dumps(proposal, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(state_root.encode() + encoded).hexdigest()
+
+
+def _sdf_target(corpus: Corpus) -> Target:
+    from sdf_evidence_envelope import SDFEvidenceEnvelope
+    from tas_admissibility import AdmissionReceipt, InMemoryNonceStore, admit_or_refuse
+
+    header = corpus.header
+    envelopes = [SDFEvidenceEnvelope.from_dict(record["envelope"]) for record in corpus.records]
+    resolver = _LineageStore(
+        envelope for envelope, record in zip(envelopes, corpus.records) if record.get("publish")
+    )
+    store = InMemoryNonceStore()
+    options = {
+        "state_root": header["state_root"],
+        "authority_scope": frozenset(header["authority_scope"]),
+        "current_context": header["context"],
+        # The store's own set doubles as seen_nonces, so replays are caught
+        # by nonce_fresh whichever worker consumed the original.
+        "seen_nonces": store.nonces,
+        "invariant_check": _invariant_check,
+        "apply_transition": _apply_transition,
+        "trusted_authority_keys": dict(header["trusted_authority_keys"]),
+        "nonce_store": store,
+        "lineage_resolver": resolver,
+        "trusted_genesis_hashes": frozenset(header["trusted_genesis_hashes"]),
+    }
+
+    def submit(request: tuple[Any, Any]) -> str:
+        proposal, envelope = request
+        outcome = admit_or_refuse(proposal=proposal, envelope=envelope, **options)
+        return ADMITTED if isinstance(outcome, AdmissionReceipt) else outcome.failed_predicate
+
+    requests = [(record["proposal"], envelope) for record, envelope in zip(corpus.records, envelopes)]
+    return Target(submit, requests, [record["expect"] for record in corpus.records])
@@ -0,0 +1,305 @@
+"""Deterministic fixture generators for the benchmark suite.
+
+Keys are derived from fixed scalars and every input is built from its index,
+so two runs of the suite sign, hash and append byte-identical material.
+Nothing here touches the network.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import replace
+import hashlib
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+GENESIS_HASH = "a" * 64
+STATE_ROOT = "c" * 64
+EVALUATED_AT = "2029-01-01T00:00:00Z"
+ISSUED_AT = "2026-08-17T00:00:00Z"
+
+
+def secp256k1_key(seed: int) -> ec.EllipticCurvePrivateKey:
+    """Deterministic secp256k1 private key for *seed* (fixtures only)."""
+    scalar = int.from_bytes(hashlib.sha256(f"tas-bench-key-{seed}".encode()).digest(), "big")
+    return ec.derive_private_key(scalar % (2**255) + 1, ec.SECP256K1())
+
+
+def ed25519_key(seed: int) -> Ed25519PrivateKey:
+    """Deterministic Ed25519 private key for *seed* (fixtures only)."""
+    return Ed25519PrivateKey.from_private_bytes(
+        hashlib.sha256(f"tas-bench-ed25519-{seed}".encode()).digest()
+    )
+
+
+def digest(label: str, index: int) -> str:
+    return hashlib.sha256(f"{label}:{index}".encode()).hexdigest()
+
+
+def candidate(index: int) -> dict[str, Any]:
+    """A realistic proposal: a scoped write with a small structured payload."""
+    return {
+        "operation": "WRITE",
+        "resource": f"registry/records/{index % 997}",
+        "parameters": {
+            "record_id": f"record-{index:08d}",
+            "fields": {"status": "ACTIVE", "revision": index % 13, "tags": ["sdf", "tas", "bench"]},
+            "content_hash": digest("content", index),
+        },
+    }
+
+
+def receipt(index: int) -> dict[str, Any]:
+    """A provenance-receipt-shaped document for ledgers and canonicalization."""
+    return {
+        "receipt_type": "TAS_PROVENANCE_RECEIPT",
+        "schema_version": "1.0",
+        "receipt_id": f"receipt-{index:08d}",
+        "human_authority": "HumanAPIKey:steward",
+        "conduit": "openai.responses",
+        "action": "candidate_generation",
+        "input_hash": digest("input", index),
+        "output_hash": digest("output", index),
+        "model": "gpt-4.1-mini",
+        "gate": "TAS_ADMISSIBILITY_GATEWAY",
+        "admissible": True,
+        "timestamp": ISSUED_AT,
+        "paradata": {"invariants": ["P0", "P1", "P2"], "sequence": index, "candidate": candidate(index)},
+    }
+
+
+# ---------------------------------------------------------------------- #
+# admission_gate.AdmissionGatekeeper                                       #
+# ---------------------------------------------------------------------- #
+
+CREDENTIAL_ID = "credential-1"
+CHECKPOINT_HASH = "a" * 64
+AUTHORITY_EPOCH = 7
+
+
+def admission_material(authority):
+    """Return ``(snapshot, context, definition)`` mutually bound to *authority*."""
+    from admission_gate import AuthoritySnapshot, authority_binding_hash
+    from context_snapshot import ContextSnapshot, definition_id_for_mapping, make_definition_record
+
+    snapshot = AuthoritySnapshot(
+        CREDENTIAL_ID, authority.algorithm, authority.public_key, AUTHORITY_EPOCH, False,
+        "c" * 64, CHECKPOINT_HASH, "2030-01-01T00:00:00Z",
+    )
+    definition = make_definition_record(
+        namespace_id="tas:core",
+        term="requested_operation",
+        semantic_version="1",
+        definition="The scoped operation requested by external authority.",
+    )
+    context = ContextSnapshot.build(
+        namespace_id="tas:core",
+        context_sequence=0,
+        definition_ids=[definition_id_for_mapping(definition)],
+        invariant_set_id="b" * 64,
+        authority_binding_hash=authority_binding_hash(snapshot),
+        parent_context_hash=None,
+        effective_epoch=AUTHORITY_EPOCH,
+    )
+    return replace(snapshot, context_snapshot_hash=context.context_snapshot_hash), context, definition
+
+
+def build_admission_gatekeeper(
+    snapshot, context, definitions, *, receipt_signer=None, ledger=None, nonce_store=None
+):
+    """Wire an ``AdmissionGatekeeper`` over in-memory resolvers.
+
+    The ledger defaults to an in-memory one; pass a durable *ledger* and
+    *nonce_store* to share decisions and replay protection between gates.
+    """
+    from admission_gate import (
+        AdmissionGatekeeper,
+        Ed25519Verifier,
+        InMemoryDecisionLedger,
+        LocalSecp256k1Signer,
+        Secp256k1Verifier,
+        canonical_json,
+    )
+    from authority_store import IndexedAuthorityResolver
+    from context_snapshot import InMemoryContextResolver, InMemoryDefinitionResolver, definition_id_for_mapping
+
+    verifier = Ed25519Verifier() if snapshot.algorithm == Ed25519Verifier.algorithm else Secp256k1Verifier()
+    return AdmissionGatekeeper(
+        gatekeeper_id="bench-gate",
+        authority_resolver=IndexedAuthorityResolver([snapshot]),
+        context_resolver=InMemoryContextResolver(
+            {context.context_snapshot_hash: canonical_json(context.mapping)},
+            {context.namespace_id: context.context_snapshot_hash},
+        ),
+        definition_resolver=InMemoryDefinitionResolver(
+            {definition_id_for_mapping(d): canonical_json(d) for d in definitions}
+        ),
+        verifier=verifier,
+        receipt_signer=receipt_signer or LocalSecp256k1Signer(secp256k1_key(2)),
+        ledger=InMemoryDecisionLedger() if ledger is None else ledger,
+        nonce_store=nonce_store,
+    )
+
+
+def admission_gatekeeper():
+    """Return ``(gatekeeper, authority_signer, context)`` wired as in production."""
+    from admission_gate import LocalSecp256k1Signer
+
+    authority = LocalSecp256k1Signer(secp256k1_key(1))
+    snapshot, context, definition = admission_material(authority)
+    return build_admission_gatekeeper(snapshot, context, [definition]), authority, context
+
+
+def admission_body(authority, context, index: int, proposal) -> dict[str, Any]:
+    """The unsigned authorization envelope body for *proposal*."""
+    from admission_gate import CANONICALIZATION_VERSION, canonical_hash
+
+    return {
+        "schema_version": 2,
+        "canonicalization_version": CANONICALIZATION_VERSION,
+        "domain_separator": "TAS_AUTHORITY_GATE_V1",
+        "credential_id": CREDENTIAL_ID,
+        "authority_checkpoint_hash": CHECKPOINT_HASH,
+        "authority_epoch": AUTHORITY_EPOCH,
+        "context_snapshot_hash": context.context_snapshot_hash,
+        "signature_algorithm": authority.algorithm,
+        "requested_operation": proposal["operation"],
+        "candidate_hash": canonical_hash(proposal),
+        "parent_receipt_hash": None,
+        "nonce": f"nonce-{index}",
+    }
+
+
+def sign_admission_body(signer, body: dict[str, Any]) -> bytes:
+    """Return the canonical envelope bytes for *body* signed by *signer*."""
+    from admission_gate import AUTHORIZATION_DOMAIN, canonical_json
+
+    signature = base64.b64encode(signer.sign(AUTHORIZATION_DOMAIN + canonical_json(body))).decode()
+    return canonical_json({**body, "signature": signature})
+
+
+def admission_request(authority, context, index: int) -> tuple[bytes, bytes]:
+    """Return ``(raw_candidate, raw_envelope)`` for a signed, unique request."""
+    from admission_gate import canonical_json
+
+    proposal = {**candidate(index), "operation": "READ"}
+    body = admission_body(authority, context, index, proposal)
+    return canonical_json(proposal), sign_admission_body(authority, body)
+
+
+# ---------------------------------------------------------------------- #
+# sdf_evidence_envelope / tas_admissibility                                #
+# ---------------------------------------------------------------------- #
+
+SDF_AUTHORITY = "authority"
+SDF_CONTEXT = "context"
+
+
+def sdf_envelopes(count: int, key: ec.EllipticCurvePrivateKey | None = None) -> list:
+    """Genesis-rooted, signed envelopes whose claims are realistic proposals."""
+    from sdf_evidence_envelope import build_envelope
+
+    key = key or secp256k1_key(3)
+    return [
+        build_envelope(
+            evidence_id=f"evidence-{index}",
+            claim=candidate(index),
+            issuer_authority_id=SDF_AUTHORITY,
+            issuer_private_key=key,
+            context=SDF_CONTEXT,
+            genesis_hash=GENESIS_HASH,
+            parent_hash=None,
+            sequence=0,
+            issued_at=ISSUED_AT,
+            nonce=f"nonce-{index}",
+        )
+        for index in range(count)
+    ]
+
+
+# ---------------------------------------------------------------------- #
+# tas_logos_gatekeeper                                                     #
+# ---------------------------------------------------------------------- #
+
+def logos_gatekeeper():
+    """Return ``(gatekeeper, lineage_resolver)`` with HMAC signing and a fixed clock."""
+    from datetime import datetime, timezone
+
+    from tas_logos_gatekeeper import HMACLineageResolver, HMACReceiptSigner, TASLogosGatekeeper
+
+    resolver = HMACLineageResolver({"steward_01": b"L" * 32})
+    gatekeeper = TASLogosGatekeeper(
+        receipt_signer=HMACReceiptSigner("bench-gatekeeper", b"R" * 32),
+        lineage_verifier=resolver.verify,
+        clock=lambda: datetime(2026, 7, 16, 12, 0, 0, tzinfo=timezone.utc),
+    )
+    return gatekeeper, resolver
+
+
+def logos_payload(gatekeeper, resolver, index: int) -> bytes:
+    import json
+
+    payload = {
+        "credential_id": "steward_01",
+        "operation": "MUTATE_STATE",
+        "state_delta": {"param_x": index, "param_y": index % 7, "label": f"delta-{index}"},
+        "lineage": {"parent_hash": "0" * 64, "history": []},
+    }
+    authorization_hash = gatekeeper.compute_authorization_hash(payload)
+    payload["lineage"]["signature"] = resolver.sign(payload, authorization_hash)
+    return json.dumps(payload).encode()
+
+
+# ---------------------------------------------------------------------- #
+# core                                                                     #
+# ---------------------------------------------------------------------- #
+
+def core_authority_and_context():
+    from core.authority.authority_snapshot import AuthoritySnapshot
+    from core.semantics.context_snapshot import ContextSnapshot
+
+    authority = AuthoritySnapshot.create(
+        principal="steward",
+        credential_reference="key:bench-001",
+        permitted_scope=["codex.run", "shadow-scan", "registry.write"],
+        effective_epoch="2026-01-01T00:00:00Z",
+        jurisdiction="TAS",
+        revocation_condition="Written notice",
+        expiry_epoch="2027-01-01T00:00:00Z",
+    )
+    context = ContextSnapshot.create(
+        namespace="TAS-SDF",
+        epoch="2026-01-01T00:00:00Z",
+        definition_ids=[],
+        invariant_set=["PRIME_INVARIANT"],
+        authority_binding=authority.snapshot_id,
+    )
+    return authority, context
+
+
+def uvk_candidate(index: int) -> dict[str, Any]:
+    return {
+        "origin": f"agent-{index % 64}",
+        "operation": "registry.write",
+        "namespace": "TAS-SDF",
+        "payload": candidate(index),
+    }
+
+
+def genes(count: int) -> list:
+    from core.gene import TASGene
+
+    return [
+        TASGene.admit(
+            origin=f"agent-{index % 64}",
+            context="TAS-SDF",
+            authority="HumanAPIKey:steward",
+            operation="registry.write",
+            parent=None,
+            invariants=("P0", "P1"),
+            receipt={"receipt_id": f"receipt-{index:08d}", "admissible": True},
+        )
+        for index in range(count)
+    ]
@@ -0,0 +1,186 @@
+"""Benchmark registry, runner, statistics and baseline comparison.
+
+A case is a factory ``setup(count, stack) -> op``: it builds fixtures for
+``count`` operations (registering any cleanup on the ``ExitStack``) and
+returns ``op(i)``, which performs operation ``i``.  Each operation index is
+used once, so cases that consume nonces or append to ledgers never replay an
+input.  The runner executes ``warmup`` untimed operations, then ``repeat``
+rounds of ``number`` individually timed operations, and reports latency
+percentiles over every timed operation plus throughput over the timed
+rounds.
+"""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+import fnmatch
+import math
+import platform
+import sys
+import time
+from typing import Any, Callable, Iterable, Mapping
+
+REPORT_VERSION = 1
+
+Setup = Callable[[int, ExitStack], Callable[[int], Any]]
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    setup: Setup
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    operations: int
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    mean_us: float
+    ops_per_sec: float
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    status: str  # "ok" | "regression" | "improvement" | "missing" | "new"
+    baseline: float | None = None
+    current: float | None = None
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline
+
+
+CASES: dict[str, BenchmarkCase] = {}
+
+
+def benchmark(name: str, description: str = "") -> Callable[[Setup], Setup]:
+    """Register *setup* as the benchmark case *name*."""
+
+    def register(setup: Setup) -> Setup:
+        if name in CASES:
+            raise ValueError(f"duplicate benchmark case: {name}")
+        CASES[name] = BenchmarkCase(name, setup, description)
+        return setup
+
+    return register
+
+
+def select(patterns: Iterable[str] = ()) -> list[BenchmarkCase]:
+    """Return registered cases matching any glob in *patterns* (all if empty)."""
+    patterns = list(patterns)
+    return [
+        case
+        for name, case in sorted(CASES.items())
+        if not patterns or any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+def percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of already-sorted samples."""
+    if not sorted_samples:
+        raise ValueError("no samples")
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def run_case(case: BenchmarkCase, *, warmup: int, repeat: int, number: int) -> BenchmarkResult:
+    if repeat < 1 or number < 1 or warmup < 0:
+        raise ValueError("repeat and number must be positive and warmup non-negative")
+    clock = time.perf_counter_ns
+    with ExitStack() as stack:
+        op = case.setup(warmup + repeat * number, stack)
+        for index in range(warmup):
+            op(index)
+        samples: list[int] = []
+        index = warmup
+        for _ in range(repeat):
+            for _ in range(number):
+                started = clock()
+                op(index)
+                samples.append(clock() - started)
+                index += 1
+    samples.sort()
+    total = sum(samples)
+    return BenchmarkResult(
+        name=case.name,
+        operations=len(samples),
+        p50_us=percentile(samples, 0.50) / 1e3,
+        p95_us=percentile(samples, 0.95) / 1e3,
+        p99_us=percentile(samples, 0.99) / 1e3,
+        mean_us=total / len(samples) / 1e3,
+        ops_per_sec=len(samples) / (total / 1e9) if total else math.inf,
+    )
+
+
+def run_suite(
+    cases: Iterable[BenchmarkCase],
+    *,
+    warmup: int = 50,
+    repeat: int = 5,
+    number: int = 200,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> dict[str, Any]:
+    """Run *cases* and return a JSON-serialisable report."""
+    results = {}
+    for case in cases:
+        result = run_case(case, warmup=warmup, repeat=repeat, number=number)
+        results[case.name] = asdict(result)
+        if progress is not None:
+            progress(result)
+    return {
+        "report_version": REPORT_VERSION,
+        "environment": environment(),
+        "settings": {"warmup": warmup, "repeat": repeat, "number": number},
+        "results": results,
+    }
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def compare(
+    baseline: Mapping[str, Any],
+    current: Mapping[str, Any],
+    *,
+    threshold: float = 0.25,
+    metric: str = "p50_us",
+) -> list[Comparison]:
+    """Compare two reports on a latency *metric*.
+
+    A case regresses when ``current > baseline * (1 + threshold)`` and
+    improves when ``current < baseline / (1 + threshold)``.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must not be negative")
+    old, new = baseline["results"], current["results"]
+    comparisons = []
+    for name in sorted(set(old) | set(new)):
+        if name not in new:
+            comparisons.append(Comparison(name, "missing", baseline=old[name][metric]))
+            continue
+        if name not in old:
+            comparisons.append(Comparison(name, "new", current=new[name][metric]))
+            continue
+        before, after = old[name][metric], new[name][metric]
+        if after > before * (1 + threshold):
+            status = "regression"
+        elif after * (1 + threshold) < before:
+            status = "improvement"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(name, status, baseline=before, current=after))
+    return comparisons
@@ -0,0 +1,249 @@
+"""Drive a corpus through a gate in closed- or open-loop mode.
+
+Closed loop: ``workers`` threads each submit the next request as soon as
+their previous one completes, which measures peak throughput at that
+concurrency.
+
+Open loop: requests are released on a fixed schedule of ``rate`` per second,
+whatever the gate's state, and handed to ``workers`` threads.  Latency is
+measured from each request's *scheduled* start, so time spent queued behind
+a saturated gate is counted rather than silently omitted.
+
+Latencies are recorded in one :class:`LatencyHistogram` per outcome code
+(``"ADMITTED"`` or a refusal code), so the cost of each refusal path is
+visible separately from the admit path.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import itertools
+import math
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+from .corpus import Target
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with a fixed relative resolution.
+
+    Each octave of nanoseconds is split into ``SUB_BUCKETS`` buckets, so a
+    reported percentile is at most about 9% above the true sample.  Memory
+    is bounded by the latency range, not the number of samples, and
+    histograms from separate workers merge exactly.
+    """
+
+    SUB_BUCKETS = 8
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, latency_ns: int) -> None:
+        index = math.floor(math.log2(max(latency_ns, 1)) * self.SUB_BUCKETS)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if not self.count or latency_ns < self.min_ns:
+            self.min_ns = latency_ns
+        if latency_ns > self.max_ns:
+            self.max_ns = latency_ns
+        self.count += 1
+        self.total_ns += latency_ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        if other.count and (not self.count or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    def _upper_ns(self, index: int) -> float:
+        return 2 ** ((index + 1) / self.SUB_BUCKETS)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound, in nanoseconds, of the bucket holding the percentile."""
+        if not self.count:
+            raise ValueError("empty histogram")
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self._upper_ns(index), self.max_ns)
+        return float(self.max_ns)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+            "min_us": self.min_ns / 1e3,
+            "p50_us": self.percentile(0.50) / 1e3 if self.count else 0.0,
+            "p95_us": self.percentile(0.95) / 1e3 if self.count else 0.0,
+            "p99_us": self.percentile(0.99) / 1e3 if self.count else 0.0,
+            "max_us": self.max_ns / 1e3,
+            # [bucket upper bound in microseconds, sample count], ascending.
+            "buckets": [
+                [round(self._upper_ns(index) / 1e3, 3), self.buckets[index]] for index in sorted(self.buckets)
+            ],
+        }
+
+
+@dataclass
+class LoadResult:
+    mode: str
+    workers: int
+    rate: float | None
+    requests: int
+    elapsed_s: float
+    histograms: dict[str, LatencyHistogram]
+    # (expected, observed) -> count, for requests whose outcome was not the
+    # one recorded in the corpus.
+    mismatches: dict[tuple[str, str], int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed_s if self.elapsed_s else math.inf
+
+    def total(self) -> LatencyHistogram:
+        merged = LatencyHistogram()
+        for histogram in self.histograms.values():
+            merged.merge(histogram)
+        return merged
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "rate": self.rate,
+            "requests": self.requests,
+            "elapsed_s": self.elapsed_s,
+            "throughput": self.throughput,
+            "latency": self.total().to_dict(),
+            "codes": {code: self.histograms[code].to_dict() for code in sorted(self.histograms)},
+            "mismatches": [
+                {"expected": expected, "observed": observed, "count": count}
+                for (expected, observed), count in sorted(self.mismatches.items())
+            ],
+        }
+
+
+class _Recorder:
+    """Per-worker histograms and mismatch counts, merged after the run."""
+
+    def __init__(self, target: Target) -> None:
+        self._target = target
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.mismatches: dict[tuple[str, str], int] = {}
+
+    def submit(self, index: int, started_ns: int) -> None:
+        try:
+            code = self._target.submit(self._target.requests[index])
+        except Exception as error:  # a gate that raises is itself a finding
+            code = f"EXCEPTION:{type(error).__name__}"
+        latency = time.perf_counter_ns() - started_ns
+        histogram = self.histograms.get(code)
+        if histogram is None:
+            histogram = self.histograms[code] = LatencyHistogram()
+        histogram.record(latency)
+        expected = self._target.expected[index]
+        if code != expected:
+            key = (expected, code)
+            self.mismatches[key] = self.mismatches.get(key, 0) + 1
+
+
+def _drive(
+    mode: str,
+    target: Target,
+    workers: int,
+    rate: float | None,
+    count: int,
+    body: Callable[[_Recorder], None],
+    feed: Callable[[], None] | None = None,
+) -> LoadResult:
+    """Run *body* on *workers* threads (and *feed* on this one), then merge."""
+    recorders = [_Recorder(target) for _ in range(workers)]
+    threads = [
+        threading.Thread(target=body, args=(recorder,), name=f"tas-load-{n}", daemon=True)
+        for n, recorder in enumerate(recorders)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    if feed is not None:
+        feed()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    histograms: dict[str, LatencyHistogram] = {}
+    mismatches: dict[tuple[str, str], int] = {}
+    for recorder in recorders:
+        for code, histogram in recorder.histograms.items():
+            histograms.setdefault(code, LatencyHistogram()).merge(histogram)
+        for key, n in recorder.mismatches.items():
+            mismatches[key] = mismatches.get(key, 0) + n
+    return LoadResult(mode, workers, rate, count, elapsed, histograms, mismatches)
+
+
+def _request_count(target: Target, limit: int | None) -> int:
+    if limit is not None and limit < 0:
+        raise ValueError("limit must not be negative")
+    return len(target.requests) if limit is None else min(limit, len(target.requests))
+
+
+def run_closed_loop(target: Target, *, workers: int = 1, limit: int | None = None) -> LoadResult:
+    """Submit requests back to back from *workers* threads."""
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    count = _request_count(target, limit)
+    # next() on itertools.count is atomic under the GIL.
+    indices = itertools.count()
+
+    def body(recorder: _Recorder) -> None:
+        clock = time.perf_counter_ns
+        for index in indices:
+            if index >= count:
+                return
+            recorder.submit(index, clock())
+
+    return _drive("closed", target, workers, None, count, body)
+
+
+def run_open_loop(
+    target: Target, *, rate: float, workers: int = 8, limit: int | None = None
+) -> LoadResult:
+    """Release requests at *rate* per second to a pool of *workers* threads."""
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    count = _request_count(target, limit)
+    pending: queue.SimpleQueue[tuple[int, int] | None] = queue.SimpleQueue()
+
+    def body(recorder: _Recorder) -> None:
+        while (item := pending.get()) is not None:
+            index, scheduled_ns = item
+            recorder.submit(index, scheduled_ns)
+
+    def feed() -> None:
+        interval_ns = 1e9 / rate
+        origin = time.perf_counter_ns()
+        for index in range(count):
+            scheduled = origin + int(index * interval_ns)
+            delay = scheduled - time.perf_counter_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            # Behind schedule the request is released at once, still stamped
+            # with its scheduled time.
+            pending.put((index, scheduled))
+        for _ in range(workers):
+            pending.put(None)
+
+    return _drive("open", target, workers, rate, count, body, feed)
@@ -0,0 +1,192 @@
+"""The registered benchmark cases: gates, verifiers, ledgers and canonicalization."""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+import tempfile
+
+from . import fixtures
+from .harness import benchmark
+
+
+# ---------------------------------------------------------------------- #
+# Canonicalization                                                         #
+# ---------------------------------------------------------------------- #
+
+@benchmark("canonical.context_snapshot", "context_snapshot.canonical_json of a receipt")
+def _canonical_context_snapshot(count: int, stack: ExitStack):
+    from context_snapshot import canonical_json
+
+    documents = [fixtures.receipt(i) for i in range(count)]
+    return lambda i: canonical_json(documents[i])
+
+
+@benchmark("canonical.logos", "tas_logos_gatekeeper._serialize_canonical of a receipt")
+def _canonical_logos(count: int, stack: ExitStack):
+    from tas_logos_gatekeeper import _serialize_canonical
+
+    documents = [fixtures.receipt(i) for i in range(count)]
+    return lambda i: _serialize_canonical(documents[i])
+
+
+@benchmark("canonical.bridge_hash", "tas_openai_bridge.receipts.canonical_hash of a receipt")
+def _canonical_bridge_hash(count: int, stack: ExitStack):
+    from tas_openai_bridge.receipts import canonical_hash
+
+    documents = [fixtures.receipt(i) for i in range(count)]
+    return lambda i: canonical_hash(documents[i])
+
+
+# ---------------------------------------------------------------------- #
+# Gates and verifiers                                                      #
+# ---------------------------------------------------------------------- #
+
+@benchmark("sdf.verify_evidence", "verify_evidence on a fresh genesis-rooted envelope")
+def _sdf_verify_evidence(count: int, stack: ExitStack):
+    from sdf_evidence_envelope import verify_evidence
+
+    envelopes = fixtures.sdf_envelopes(count)
+    trusted = {fixtures.SDF_AUTHORITY: envelopes[0].issuer.public_key_b64}
+    scope = frozenset({fixtures.SDF_AUTHORITY})
+    genesis = frozenset({fixtures.GENESIS_HASH})
+    seen: set[str] = set()
+
+    def op(i):
+        verdict = verify_evidence(
+            envelopes[i],
+            authority_scope=scope,
+            current_context=fixtures.SDF_CONTEXT,
+            seen_nonces=seen,
+            invariant_pass=True,
+            trusted_authority_keys=trusted,
+            trusted_genesis_hashes=genesis,
+        )
+        assert verdict.admissible
+        return verdict
+
+    return op
+
+
+@benchmark("tas_admissibility.admit_or_refuse", "admit_or_refuse with nonce commit and transition")
+def _admit_or_refuse(count: int, stack: ExitStack):
+    from tas_admissibility import AdmissionReceipt, InMemoryNonceStore, admit_or_refuse
+
+    envelopes = fixtures.sdf_envelopes(count)
+    trusted = {fixtures.SDF_AUTHORITY: envelopes[0].issuer.public_key_b64}
+    scope = frozenset({fixtures.SDF_AUTHORITY})
+    genesis = frozenset({fixtures.GENESIS_HASH})
+    store = InMemoryNonceStore()
+    next_root = "d" * 64
+
+    def op(i):
+        outcome = admit_or_refuse(
+            proposal=envelopes[i].claim,
+            envelope=envelopes[i],
+            state_root=fixtures.STATE_ROOT,
+            authority_scope=scope,
+            current_context=fixtures.SDF_CONTEXT,
+            seen_nonces=set(),
+            invariant_check=lambda proposal, state: True,
+            apply_transition=lambda proposal, state: next_root,
+            trusted_authority_keys=trusted,
+            nonce_store=store,
+            trusted_genesis_hashes=genesis,
+        )
+        assert isinstance(outcome, AdmissionReceipt)
+        return outcome
+
+    return op
+
+
+@benchmark("admission_gate.evaluate", "AdmissionGatekeeper.evaluate of a signed request")
+def _admission_gate_evaluate(count: int, stack: ExitStack):
+    gatekeeper, authority, context = fixtures.admission_gatekeeper()
+    requests = [fixtures.admission_request(authority, context, i) for i in range(count)]
+
+    def op(i):
+        raw_candidate, raw_envelope = requests[i]
+        result = gatekeeper.evaluate(
+            raw_candidate=raw_candidate, raw_envelope=raw_envelope, current_time=fixtures.EVALUATED_AT
+        )
+        assert result["resulting_state"] == "ADMITTED"
+        return result
+
+    return op
+
+
+@benchmark("logos.process_payload", "TASLogosGatekeeper.process_payload of a signed payload")
+def _logos_process_payload(count: int, stack: ExitStack):
+    gatekeeper, resolver = fixtures.logos_gatekeeper()
+    payloads = [fixtures.logos_payload(gatekeeper, resolver, i) for i in range(count)]
+
+    def op(i):
+        result = gatekeeper.process_payload(payloads[i])
+        assert result["state"] == "ADMITTED"
+        return result
+
+    return op
+
+
+@benchmark("core.uvk_verify", "UniversalVerifierKernel.verify (nine checks)")
+def _uvk_verify(count: int, stack: ExitStack):
+    from core.verification.universal_verifier import UniversalVerifierKernel
+
+    authority, context = fixtures.core_authority_and_context()
+    kernel = UniversalVerifierKernel()
+    candidates = [fixtures.uvk_candidate(i) for i in range(count)]
+
+    def op(i):
+        result = kernel.verify(candidates[i], authority, context, "2026-07-18T12:00:00Z")
+        assert result.admitted
+        return result
+
+    return op
+
+
+# ---------------------------------------------------------------------- #
+# Ledgers and chains                                                       #
+# ---------------------------------------------------------------------- #
+
+@benchmark("core.wakechain_append", "WakeChain.append of an admitted gene")
+def _wakechain_append(count: int, stack: ExitStack):
+    from core.wakechain import WakeChain
+
+    genes = fixtures.genes(count)
+    chain = WakeChain.start(author="bench")
+    return lambda i: chain.append(genes[i])
+
+
+@benchmark("ledger.immutable_truth_append", "ImmutableTruthLedger.append (in memory)")
+def _immutable_truth_append(count: int, stack: ExitStack):
+    from tas_openai_bridge.ledger import ImmutableTruthLedger
+
+    receipts = [fixtures.receipt(i) for i in range(count)]
+    ledger = ImmutableTruthLedger()
+    return lambda i: ledger.append(receipts[i])
+
+
+@benchmark("ledger.segmented_truth_append", "SegmentedTruthLedger.append (sync=False)")
+def _segmented_truth_append(count: int, stack: ExitStack):
+    from tas_openai_bridge.ledger import SegmentedTruthLedger
+
+    receipts = [fixtures.receipt(i) for i in range(count)]
+    directory = stack.enter_context(tempfile.TemporaryDirectory())
+    ledger = stack.enter_context(SegmentedTruthLedger(directory, sync=False))
+    return lambda i: ledger.append(receipts[i])
+
+
+@benchmark("ledger.registry_append", "SDFRegistryAPI.append_execution_record on FileRegistryLedger (sync=False)")
+def _registry_append(count: int, stack: ExitStack):
+    from sdf_tas_interface import FileRegistryLedger, SDFRegistryAPI
+
+    directory = stack.enter_context(tempfile.TemporaryDirectory())
+    ledger = stack.enter_context(FileRegistryLedger(directory, sync=False))
+    registry = SDFRegistryAPI("bench-witness-key", ledger=ledger)
+    traces = [fixtures.digest("trace", i) for i in range(count)]
+
+    def op(i):
+        return registry.append_execution_record(
+            f"record-{i % 997:06d}", traces[i], fixtures.digest("receipt", i), "EXECUTED"
+        )
+
+    return op
@@ -11,27 +11,20 @@ _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, _SCRIPT_DIR)
 sys.path.insert(1, os.path.join(_SCRIPT_DIR, 'tas_pythonetics/src'))
 
-from tas_tools.tas_shadow_scan import scan_repository, print_report
-from tas_tools.tas_sequencer import sequence_artifact, calculate_sha256, TAS_HUMAN_SIG, TAS_META_EXT
-from core.authority import AuthoritySnapshot
-from core.runtime import SovereignRuntime
-from core.semantics import ContextSnapshot
-from core.vertical_slice import CanonicalVerticalSlice
-from core.wakechain import WakeChain
-
-# Try to import tas_pythonetics modules, handle if not present (though we just added path)
-try:
-    from tas_pythonetics.sentient_lock import verify_kinematic_identity, PhoenixError
-except ImportError:
-    verify_kinematic_identity = None
-    PhoenixError = None
+# Subcommand dependencies are imported inside their handlers so that --help
+# and short-lived invocations only pay for argparse.  These mirror
+# tas_tools.tas_sequencer.TAS_HUMAN_SIG / TAS_META_EXT for argument defaults.
+TAS_HUMAN_SIG = "Russell Nordland"
+TAS_META_EXT = ".tasmeta.json"
 
 class TASHelpFormatter(argparse.ArgumentDefaultsHelpFormatter, argparse.RawDescriptionHelpFormatter):
     pass
 
 def _handle_shadow_scan(args):
+    from tas_tools.tas_shadow_scan import scan_repository, print_report
+
     print(f"Scanning: {args.path} ...")
-    report = scan_repository(args.path)
+    report = scan_repository(args.path, incremental=args.incremental, jobs=args.jobs, cache_path=args.cache)
     print_report(report)
     if report["noise"]:
         sys.exit(1)
@@ -44,9 +37,26 @@ def _setup_shadow_scan_parser(subparsers):
         formatter_class=TASHelpFormatter,
     )
     scan_parser.add_argument("path", nargs="?", default=".", help="Directory path to scan")
+    scan_parser.add_argument("--incremental", action="store_true", help="Reuse cached form IDs for files whose inode, size and mtime are unchanged")
+    scan_parser.add_argument("--jobs", type=int, default=1, help="Number of threads used to hash changed files")
+    scan_parser.add_argument("--cache", default=None, help="Scan cache path for --incremental; None uses <path>/.tas_scan_cache.json")
     scan_parser.set_defaults(func=_handle_shadow_scan)
 
 def _handle_sequence(args):
+    from tas_tools.tas_sequencer import sequence_artifact, sequence_tree
+
+    if args.recursive:
+        print(f"Sequencing tree: {args.file} ...")
+        manifest = sequence_tree(args.file, args.seed, args.genome, jobs=args.jobs, manifest_path=args.manifest)
+        print(f"Sequencing complete for {len(manifest['artifacts'])} artifacts")
+        for error in manifest["errors"]:
+            print(f"  ! {error['path']} - {error['error']}")
+        if args.manifest:
+            print(f"Manifest: {args.manifest}")
+        if manifest["errors"]:
+            sys.exit(1)
+        return
+
     print(f"Sequencing: {args.file} ...")
     success = sequence_artifact(args.file, args.seed, args.genome)
     if not success:
@@ -59,13 +69,19 @@ def _setup_sequence_parser(subparsers):
         description="Run the sequencing ceremony for a file and emit the matching .tasmeta.json sidecar.",
         formatter_class=TASHelpFormatter,
     )
-    seq_parser.add_argument("file", help="File to sequence")
+    seq_parser.add_argument("file", help="File to sequence (a directory with --recursive)")
     seq_parser.add_argument("--seed", default=TAS_HUMAN_SIG, help="Human Seed ID used in the metadata")
     seq_parser.add_argument("--genome", default="TAS_GENOME_V1", help="Genome ID recorded in the metadata")
+    seq_parser.add_argument("--recursive", action="store_true", help="Sequence every artifact under the given directory")
+    seq_parser.add_argument("--jobs", type=int, default=1, help="Number of threads used to hash files with --recursive")
+    seq_parser.add_argument("--manifest", default=None, help="Write the --recursive summary manifest to this path")
     seq_parser.set_defaults(func=_handle_sequence)
 
 
 def _load_sidecar_metadata(target_file):
+    from tas_pythonetics.sentient_lock import PhoenixError
+    from tas_tools.tas_sequencer import calculate_sha256
+
     meta_path = target_file + TAS_META_EXT
     if not os.path.exists(meta_path):
         raise PhoenixError(f"Missing TAS sidecar anchor: {meta_path}")
@@ -91,7 +107,11 @@ def _load_sidecar_metadata(target_file):
     return meta_path, metadata
 
 def _handle_verify_identity(args):
-    if verify_kinematic_identity is None:
+    # tas_sequencer first: its logging configuration takes precedence.
+    import tas_tools.tas_sequencer  # noqa: F401
+    try:
+        from tas_pythonetics.sentient_lock import verify_kinematic_identity, PhoenixError
+    except ImportError:
         print("Error: tas_pythonetics module not found or failed to load.")
         sys.exit(1)
 
@@ -134,6 +154,12 @@ def _setup_verify_identity_parser(subparsers):
 
 
 def _handle_vertical_slice(args):
+    from core.authority import AuthoritySnapshot
+    from core.runtime import SovereignRuntime
+    from core.semantics import ContextSnapshot
+    from core.vertical_slice import CanonicalVerticalSlice
+    from core.wakechain import WakeChain
+
     timestamp = args.timestamp
     authority = AuthoritySnapshot.create(
         principal=args.principal,
@@ -222,4 +248,4 @@ def main():
 
 if __name__ == "__main__":
     main()
-# Nonce: 60659
+# Nonce: 35410
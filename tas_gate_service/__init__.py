@@ -0,0 +1,32 @@
+"""Local, pre-forked gate service for TAS gatekeepers.
+
+Embedding applications construct an ``AdmissionGatekeeper`` or
+``TASLogosGatekeeper`` in-process, which caps each gate at one core.  This
+package serves a gatekeeper from a pool of worker processes on a Unix domain
+socket instead, with the ledger and nonce store shared through durable
+backends:
+
+    service = GateService("/run/tas/gate.sock", factory, workers=8)
+    service.serve_forever()
+
+    with GateClient("/run/tas/gate.sock") as client:
+        decision = client.evaluate(raw_candidate, raw_envelope)
+
+``python -m tas_gate_service --factory module:callable`` runs the service
+from the command line.
+"""
+
+from .client import GateClient
+from .handlers import admission_methods, logos_methods
+from .protocol import FrameError, GateServiceError, RemoteError
+from .server import GateService
+
+__all__ = [
+    "FrameError",
+    "GateClient",
+    "GateService",
+    "GateServiceError",
+    "RemoteError",
+    "admission_methods",
+    "logos_methods",
+]
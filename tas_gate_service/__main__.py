@@ -0,0 +1,66 @@
+"""Run a gate service: ``python -m tas_gate_service --factory module:callable``.
+
+The factory is imported by the master before workers are forked and called
+in every worker as ``factory(**options)``, where options come from repeated
+``--set key=value`` arguments.  It must return a method table, typically
+from :func:`tas_gate_service.admission_methods` or
+:func:`tas_gate_service.logos_methods`.  Send ``SIGHUP`` to the master for a
+graceful reload and ``SIGTERM`` to stop it.
+"""
+
+from __future__ import annotations
+
+import argparse
+from functools import partial
+import importlib
+import os
+import sys
+
+# Allow running from a checkout without installation.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from tas_gate_service.server import GateService  # noqa: E402
+
+
+def _load_factory(spec: str):
+    module_name, _, attribute = spec.partition(":")
+    if not module_name or not attribute:
+        raise argparse.ArgumentTypeError(f"factory must look like module:callable, not {spec!r}")
+    target = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+    return target
+
+
+def _option(text: str) -> tuple[str, str]:
+    key, separator, value = text.partition("=")
+    if not separator or not key:
+        raise argparse.ArgumentTypeError(f"expected key=value, not {text!r}")
+    return key, value
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tas_gate_service", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", required=True, help="Unix domain socket path to serve on")
+    parser.add_argument("--factory", required=True, type=_load_factory, help="module:callable returning a method table")
+    parser.add_argument("--set", dest="options", action="append", type=_option, default=[], metavar="KEY=VALUE", help="Keyword argument for the factory (repeatable)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--frame-timeout", type=float, default=10.0, help="Seconds allowed to receive one request frame")
+    args = parser.parse_args(argv)
+
+    service = GateService(
+        args.socket,
+        partial(args.factory, **dict(args.options)),
+        workers=args.workers,
+        frame_timeout=args.frame_timeout,
+    )
+    print(f"tas_gate_service: serving on {args.socket} with {service.workers} workers (pid {os.getpid()})", flush=True)
+    service.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
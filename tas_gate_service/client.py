@@ -0,0 +1,111 @@
+"""Thin blocking client for :class:`~tas_gate_service.server.GateService`."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+from typing import Any
+
+from .protocol import (
+    MAX_FRAME_BYTES,
+    STATUS_OK,
+    FrameError,
+    GateServiceError,
+    RemoteError,
+    encode_frame,
+    read_frame,
+)
+
+
+class GateClient:
+    """One persistent connection to a gate service.
+
+    A connection the service closed between requests -- an idle timeout or
+    a worker retiring during a graceful reload -- is detected when sending
+    fails; it is reopened and the request resent once, since a request that
+    was never fully sent cannot have been evaluated.  Once a request has been
+    sent, a connection that closes without a reply raises
+    :class:`GateServiceError`: the worker may have evaluated it (consumed the
+    nonce, written the receipt) before dying, so resending could report a
+    replay for a request that was in fact admitted.  Not thread-safe; give
+    each thread its own client.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | os.PathLike[str],
+        *,
+        timeout: float | None = 30.0,
+        max_frame_bytes: int = MAX_FRAME_BYTES,
+    ) -> None:
+        self.socket_path = os.fspath(socket_path)
+        self.timeout = timeout
+        self.max_frame_bytes = max_frame_bytes
+        self._sock: socket.socket | None = None
+
+    def _connection(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+        return self._sock
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "GateClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def call(self, method: str, *args: bytes) -> Any:
+        """Invoke *method* with byte arguments and return its decoded result."""
+        frame = encode_frame([method.encode(), *args])
+        for attempt in range(2):
+            sock = self._connection()
+            try:
+                sock.sendall(frame)
+                break
+            except (BrokenPipeError, ConnectionResetError):
+                # The request never fully left; resending cannot duplicate it.
+                self.close()
+                if attempt:
+                    raise
+            except OSError:
+                self.close()
+                raise
+        try:
+            reply = read_frame(sock, self.max_frame_bytes)
+        except (OSError, FrameError):
+            self.close()
+            raise
+        if reply is None:
+            self.close()
+            raise GateServiceError(
+                "gate service closed the connection after receiving the request; "
+                "it may have been evaluated"
+            )
+        if len(reply) != 2:
+            self.close()
+            raise FrameError(f"expected a 2-part reply, got {len(reply)} parts")
+        status, payload = reply
+        if status != STATUS_OK:
+            raise RemoteError(payload.decode("utf-8", "replace"))
+        return json.loads(payload)
+
+    def evaluate(self, raw_candidate: bytes, raw_envelope: bytes) -> dict[str, Any]:
+        """Remote :meth:`admission_gate.AdmissionGatekeeper.evaluate`."""
+        return self.call("evaluate", raw_candidate, raw_envelope)
+
+    def process_payload(self, raw_payload: bytes) -> dict[str, Any]:
+        """Remote :meth:`tas_logos_gatekeeper.TASLogosGatekeeper.process_payload`."""
+        return self.call("process_payload", raw_payload)
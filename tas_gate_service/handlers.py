@@ -0,0 +1,46 @@
+"""Method tables exposing the in-process gatekeepers over the service.
+
+A method table maps a method name to a callable taking the request's byte
+arguments and returning a JSON-serialisable result.  Tables are built by a
+factory in each worker after fork, so every worker owns its own gatekeeper,
+resolver and database connections while sharing the durable ledger and nonce
+store underneath them.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Mapping
+
+Methods = Mapping[str, Callable[..., Any]]
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def admission_methods(gatekeeper, *, clock: Callable[[], str] = utc_now) -> Methods:
+    """Serve :meth:`admission_gate.AdmissionGatekeeper.evaluate`.
+
+    ``evaluate(raw_candidate, raw_envelope)``: evaluation time comes from the
+    service's *clock*, never from the caller.  Configure the gatekeeper with
+    a shared :class:`admission_gate.FileDecisionLedger` and
+    :class:`tas_admissibility.SQLiteNonceStore` so that every worker appends
+    to one ledger and consumes from one nonce set.
+    """
+
+    def evaluate(raw_candidate: bytes, raw_envelope: bytes) -> dict[str, Any]:
+        return gatekeeper.evaluate(
+            raw_candidate=raw_candidate, raw_envelope=raw_envelope, current_time=clock()
+        )
+
+    return {"evaluate": evaluate}
+
+
+def logos_methods(gatekeeper) -> Methods:
+    """Serve :meth:`tas_logos_gatekeeper.TASLogosGatekeeper.process_payload`."""
+
+    def process_payload(raw_payload: bytes) -> dict[str, Any]:
+        return gatekeeper.process_payload(raw_payload)
+
+    return {"process_payload": process_payload}
@@ -0,0 +1,114 @@
+"""Length-prefixed framing shared by the gate service and its client.
+
+A frame is a header ``(body_length: u32, part_count: u16)`` followed by
+``part_count`` parts, each ``(length: u32, bytes)``, all big-endian.  A
+request's parts are the method name followed by its byte arguments; a
+response's parts are a status (``b"ok"`` or ``b"error"``) and a payload
+(canonical JSON of the result, or an error message).  Every length is
+checked against the declared body, so a truncated or padded frame is
+rejected rather than re-synchronised.
+"""
+
+from __future__ import annotations
+
+import socket
+import struct
+from typing import Sequence
+
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+MAX_PARTS = 64
+
+_HEADER = struct.Struct("!IH")
+_PART = struct.Struct("!I")
+
+STATUS_OK = b"ok"
+STATUS_ERROR = b"error"
+
+
+class GateServiceError(Exception):
+    """Base class for gate service transport and remote errors."""
+
+
+class FrameError(GateServiceError):
+    """A frame was malformed, oversized or truncated."""
+
+
+class RemoteError(GateServiceError):
+    """The service answered with an error status."""
+
+
+def encode_frame(parts: Sequence[bytes]) -> bytes:
+    if len(parts) > MAX_PARTS:
+        raise FrameError(f"frame has {len(parts)} parts; at most {MAX_PARTS} allowed")
+    body = bytearray()
+    for part in parts:
+        body += _PART.pack(len(part))
+        body += part
+    if len(body) > MAX_FRAME_BYTES:
+        raise FrameError(f"frame body of {len(body)} bytes exceeds {MAX_FRAME_BYTES}")
+    return _HEADER.pack(len(body), len(parts)) + bytes(body)
+
+
+def decode_body(body: bytes, count: int) -> list[bytes]:
+    view = memoryview(body)
+    parts: list[bytes] = []
+    offset = 0
+    for _ in range(count):
+        if offset + _PART.size > len(view):
+            raise FrameError("truncated part header")
+        (length,) = _PART.unpack_from(view, offset)
+        offset += _PART.size
+        if offset + length > len(view):
+            raise FrameError("part overruns frame body")
+        parts.append(bytes(view[offset : offset + length]))
+        offset += length
+    if offset != len(view):
+        raise FrameError("trailing bytes after last part")
+    return parts
+
+
+def split_frame(
+    buffer: bytes | bytearray, max_bytes: int = MAX_FRAME_BYTES
+) -> tuple[list[bytes], int] | None:
+    """Decode the first frame in *buffer*, or return None if it is incomplete.
+
+    Returns the parts and the number of bytes the frame occupied, so a
+    non-blocking reader can consume it and keep any bytes that follow.
+    """
+    if len(buffer) < _HEADER.size:
+        return None
+    length, count = _HEADER.unpack_from(buffer)
+    if length > max_bytes:
+        raise FrameError(f"frame body of {length} bytes exceeds {max_bytes}")
+    if count > MAX_PARTS:
+        raise FrameError(f"frame has {count} parts; at most {MAX_PARTS} allowed")
+    end = _HEADER.size + length
+    if len(buffer) < end:
+        return None
+    return decode_body(bytes(buffer[_HEADER.size:end]), count), end
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise FrameError(f"connection closed after {received} of {size} bytes")
+        received += count
+    return bytes(buffer)
+
+
+def read_frame(sock: socket.socket, max_bytes: int = MAX_FRAME_BYTES) -> list[bytes] | None:
+    """Read one frame; return None if the peer closed cleanly between frames."""
+    first = sock.recv(_HEADER.size)
+    if not first:
+        return None
+    header = first if len(first) == _HEADER.size else first + _recv_exactly(sock, _HEADER.size - len(first))
+    length, count = _HEADER.unpack(header)
+    if length > max_bytes:
+        raise FrameError(f"frame body of {length} bytes exceeds {max_bytes}")
+    if count > MAX_PARTS:
+        raise FrameError(f"frame has {count} parts; at most {MAX_PARTS} allowed")
+    return decode_body(_recv_exactly(sock, length), count)
@@ -0,0 +1,434 @@
+"""Pre-forked gate service on a Unix domain socket.
+
+The master process binds the socket, forks ``workers`` processes and then
+only supervises: it respawns workers that die, replaces the whole pool on
+``SIGHUP`` and shuts down on ``SIGTERM``/``SIGINT``.  Workers share the
+listening socket, so the kernel spreads connections across them.  Each
+worker builds its own method table by calling ``factory()`` after fork and
+serves any number of persistent connections, one length-prefixed request at
+a time per connection.  Workers never block on a single connection: bytes are
+buffered as they arrive and a request is evaluated only once its whole frame
+is in, so a slow or stalled client delays no one else.  A frame that stays
+incomplete for ``frame_timeout`` seconds closes its connection.
+
+Gate state that must be shared -- the decision ledger and the nonce store --
+lives in durable, multi-process-safe backends opened by the factory
+(:class:`admission_gate.FileDecisionLedger`,
+:class:`tas_admissibility.SQLiteNonceStore`), so admissions scale across
+cores without a shared in-memory structure.
+
+Graceful reload: on ``SIGHUP`` the master starts a new generation of workers
+(which call ``factory()`` afresh, picking up rotated keys, resolver contents
+or configuration) and sends ``SIGTERM`` to the old generation.  An old
+worker stops accepting, answers every request it has already received and
+exits.  :class:`~tas_gate_service.client.GateClient` reconnects when its
+next request finds the connection closed; a request cut off after it was
+sent is reported, never resent.  Modules imported by the
+master are not re-imported; code changes need a restart.
+"""
+
+from __future__ import annotations
+
+import errno
+import json
+import os
+import select
+import selectors
+import signal
+import socket
+import stat
+import sys
+import time
+import traceback
+from typing import Callable
+
+from .handlers import Methods
+from .protocol import (
+    MAX_FRAME_BYTES,
+    STATUS_ERROR,
+    STATUS_OK,
+    FrameError,
+    GateServiceError,
+    encode_frame,
+    split_frame,
+)
+
+# A worker that exits sooner than this after being forked is respawned only
+# after the same delay, so a failing factory cannot spin the master.
+_MIN_UPTIME = 1.0
+
+_RECV_BYTES = 65536
+
+
+def _drain(fd: int) -> None:
+    try:
+        while os.read(fd, 4096):
+            pass
+    except BlockingIOError:
+        pass
+
+
+def _wakeup_pipe() -> tuple[int, int]:
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    return read_fd, write_fd
+
+
+def _signal_process(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
+
+
+def _reap() -> list[int]:
+    reaped = []
+    while True:
+        try:
+            pid, _status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return reaped
+        if pid == 0:
+            return reaped
+        reaped.append(pid)
+
+
+class GateService:
+    """A pool of pre-forked workers serving a method table on *socket_path*.
+
+    ``factory`` is called in each worker after fork and returns the method
+    table (see :mod:`tas_gate_service.handlers`).  Call :meth:`serve_forever`
+    to run the master in the current process, or :meth:`start` to fork it
+    into the background and control it with :meth:`reload` and :meth:`stop`.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | os.PathLike[str],
+        factory: Callable[[], Methods],
+        *,
+        workers: int | None = None,
+        backlog: int = 128,
+        frame_timeout: float = 10.0,
+        shutdown_timeout: float = 10.0,
+        max_frame_bytes: int = MAX_FRAME_BYTES,
+    ) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.socket_path = os.fspath(socket_path)
+        self.factory = factory
+        self.workers = workers
+        self.backlog = backlog
+        self.frame_timeout = frame_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.max_frame_bytes = max_frame_bytes
+        self.pid: int | None = None
+
+    # ------------------------------------------------------------------ #
+    # Background control                                                   #
+    # ------------------------------------------------------------------ #
+
+    def start(self, timeout: float = 10.0) -> int:
+        """Fork the master into the background; return once it accepts."""
+        if self.pid is not None:
+            raise GateServiceError("service already started")
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                self.serve_forever()
+                code = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(code)
+        self.pid = pid
+        deadline = time.monotonic() + timeout
+        while True:
+            if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                self.pid = None
+                raise GateServiceError("gate service exited during startup")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                return pid
+            except OSError:
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise GateServiceError(f"gate service did not bind {self.socket_path}")
+                time.sleep(0.01)
+            finally:
+                probe.close()
+
+    def reload(self) -> None:
+        """Ask a started master to replace its workers gracefully."""
+        if self.pid is None:
+            raise GateServiceError("service not started")
+        os.kill(self.pid, signal.SIGHUP)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Shut a started master down, waiting up to *timeout* seconds."""
+        if self.pid is None:
+            return
+        pid, self.pid = self.pid, None
+        _signal_process(pid, signal.SIGTERM)
+        deadline = time.monotonic() + (self.shutdown_timeout + 5.0 if timeout is None else timeout)
+        while os.waitpid(pid, os.WNOHANG)[0] == 0:
+            if time.monotonic() > deadline:
+                _signal_process(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                break
+            time.sleep(0.01)
+
+    def __enter__(self) -> "GateService":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------ #
+    # Master                                                               #
+    # ------------------------------------------------------------------ #
+
+    def _bind(self) -> socket.socket:
+        try:
+            if stat.S_ISSOCK(os.stat(self.socket_path).st_mode):
+                probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    probe.connect(self.socket_path)
+                except OSError:
+                    os.unlink(self.socket_path)  # stale socket from a dead service
+                else:
+                    raise OSError(errno.EADDRINUSE, "gate service already running", self.socket_path)
+                finally:
+                    probe.close()
+        except FileNotFoundError:
+            pass
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        listener.listen(self.backlog)
+        # Every worker polls the shared socket; losers of an accept race
+        # must see EAGAIN rather than block.
+        listener.setblocking(False)
+        return listener
+
+    def serve_forever(self) -> None:
+        """Run the master until ``SIGTERM`` or ``SIGINT``."""
+        listener = self._bind()
+        bound = os.stat(self.socket_path).st_ino
+        wake_r, wake_w = _wakeup_pipe()
+        pending: set[str] = set()
+
+        def on_signal(signum, _frame) -> None:
+            pending.add("reload" if signum == signal.SIGHUP else "stop")
+
+        saved = {
+            signum: signal.signal(signum, on_signal)
+            for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
+        }
+        # A Python-level handler makes SIGCHLD wake the loop via the pipe.
+        saved[signal.SIGCHLD] = signal.signal(signal.SIGCHLD, lambda *_: None)
+        saved_wakeup = signal.set_wakeup_fd(wake_w)
+        current: dict[int, float] = {}  # pid -> fork time
+        retiring: set[int] = set()
+        try:
+            for _ in range(self.workers):
+                self._spawn(listener, current, (wake_r, wake_w))
+            while "stop" not in pending:
+                select.select([wake_r], [], [], 1.0)
+                _drain(wake_r)
+                if "reload" in pending:
+                    pending.discard("reload")
+                    old = list(current)
+                    retiring.update(old)
+                    current.clear()
+                    for _ in range(self.workers):
+                        self._spawn(listener, current, (wake_r, wake_w))
+                    for pid in old:
+                        _signal_process(pid, signal.SIGTERM)
+                for pid in _reap():
+                    if pid in retiring:
+                        retiring.discard(pid)
+                        continue
+                    forked = current.pop(pid, None)
+                    if forked is None or "stop" in pending:
+                        continue
+                    if time.monotonic() - forked < _MIN_UPTIME:
+                        print(f"tas_gate_service: worker {pid} exited early; respawning", file=sys.stderr)
+                        time.sleep(_MIN_UPTIME)
+                    self._spawn(listener, current, (wake_r, wake_w))
+        finally:
+            self._shutdown(set(current) | retiring)
+            listener.close()
+            try:
+                if os.stat(self.socket_path).st_ino == bound:
+                    os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+            signal.set_wakeup_fd(saved_wakeup)
+            for signum, handler in saved.items():
+                signal.signal(signum, handler)
+            os.close(wake_r)
+            os.close(wake_w)
+
+    def _shutdown(self, children: set[int]) -> None:
+        for pid in children:
+            _signal_process(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.shutdown_timeout
+        while children and time.monotonic() < deadline:
+            children.difference_update(_reap())
+            time.sleep(0.01)
+        for pid in children:
+            _signal_process(pid, signal.SIGKILL)
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+    def _spawn(self, listener: socket.socket, current: dict[int, float], pipe: tuple[int, int]) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                signal.set_wakeup_fd(-1)
+                for fd in pipe:
+                    os.close(fd)
+                code = self._worker(listener)
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(code)
+        current[pid] = time.monotonic()
+
+    # ------------------------------------------------------------------ #
+    # Worker                                                               #
+    # ------------------------------------------------------------------ #
+
+    def _worker(self, listener: socket.socket) -> int:
+        stopping = False
+
+        def on_term(_signum, _frame) -> None:
+            nonlocal stopping
+            stopping = True
+
+        signal.signal(signal.SIGTERM, on_term)
+        # The master coordinates shutdown and reload for the whole group.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        wake_r, wake_w = _wakeup_pipe()
+        signal.set_wakeup_fd(wake_w)
+
+        methods = self.factory()
+        selector = selectors.DefaultSelector()
+        selector.register(listener, selectors.EVENT_READ)
+        selector.register(wake_r, selectors.EVENT_READ)
+        # connection -> bytes received but not yet framed
+        buffers: dict[socket.socket, bytearray] = {}
+        # connection -> monotonic time by which its partial frame must complete
+        deadlines: dict[socket.socket, float] = {}
+
+        def close(connection: socket.socket) -> None:
+            selector.unregister(connection)
+            buffers.pop(connection, None)
+            deadlines.pop(connection, None)
+            connection.close()
+
+        def receive(connection: socket.socket) -> None:
+            if not self._receive(connection, buffers[connection], deadlines, methods):
+                close(connection)
+
+        try:
+            while not stopping:
+                timeout = None
+                if deadlines:
+                    timeout = max(0.0, min(deadlines.values()) - time.monotonic())
+                for key, _ in selector.select(timeout):
+                    if key.fileobj is listener:
+                        try:
+                            connection, _ = listener.accept()
+                        except (BlockingIOError, InterruptedError):
+                            continue
+                        # Reads only follow readiness; the timeout bounds replies.
+                        connection.settimeout(self.frame_timeout)
+                        selector.register(connection, selectors.EVENT_READ)
+                        buffers[connection] = bytearray()
+                    elif key.fileobj == wake_r:
+                        _drain(wake_r)
+                    else:
+                        receive(key.fileobj)
+                now = time.monotonic()
+                for connection in [c for c, due in deadlines.items() if due <= now]:
+                    close(connection)
+            # Stop accepting, answer what has already arrived, then close.
+            selector.unregister(listener)
+            selector.unregister(wake_r)
+            while buffers:
+                ready = selector.select(timeout=0)
+                if not ready:
+                    break
+                for key, _ in ready:
+                    receive(key.fileobj)
+        finally:
+            for connection in list(buffers):
+                close(connection)
+            selector.close()
+        return 0
+
+    def _receive(
+        self,
+        connection: socket.socket,
+        buffer: bytearray,
+        deadlines: dict[socket.socket, float],
+        methods: Methods,
+    ) -> bool:
+        """Read what is ready, answer every complete frame; False to close."""
+        try:
+            data = connection.recv(_RECV_BYTES)
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            return False
+        if not data:
+            return False
+        buffer += data
+        answered = False
+        while True:
+            try:
+                frame = split_frame(buffer, self.max_frame_bytes)
+            except FrameError:
+                return False
+            if frame is None:
+                break
+            parts, size = frame
+            del buffer[:size]
+            answered = True
+            if not self._answer(connection, parts, methods):
+                return False
+        if answered:
+            deadlines.pop(connection, None)
+        if buffer:
+            deadlines.setdefault(connection, time.monotonic() + self.frame_timeout)
+        return True
+
+    def _answer(self, connection: socket.socket, parts: list[bytes], methods: Methods) -> bool:
+        """Evaluate one request and send its reply; False when sending failed."""
+        name = parts[0].decode("utf-8", "replace") if parts else ""
+        method = methods.get(name)
+        if method is None:
+            reply = [STATUS_ERROR, f"unknown method: {name!r}".encode()]
+        else:
+            try:
+                result = method(*parts[1:])
+                reply = [STATUS_OK, json.dumps(result, sort_keys=True, separators=(",", ":")).encode()]
+            except Exception as error:
+                reply = [STATUS_ERROR, f"{type(error).__name__}: {error}".encode()]
+        try:
+            connection.sendall(encode_frame(reply))
+        except (FrameError, OSError):
+            return False
+        return True
@@ -10,6 +10,14 @@ from pathlib import Path
 from typing import List, Optional
 import zlib
 
+from core.merkle import (
+    MerkleTree,
+    leaf_hash,
+    verify_legacy_proof,
+    verify_many,
+    verify_proof,
+)
+
 
 def _deterministic_json(data: dict) -> str:
     """Return a compact JSON representation with sorted keys."""
@@ -144,54 +152,66 @@ class CursiveCoherenceEngine:
 
 
 class MerkleBatch:
-    """Accumulates cells into Merkle trees and persists batches."""
+    """Accumulates cells into TAS-v1 Merkle trees and persists batches."""
 
     def __init__(self, batch_size: int = 10, out_dir: str = "hccc_roots"):
-        from merkletools import (
-            MerkleTools,
-        )  # Imported lazily to avoid dependency if unused
-
         self.batch_size = batch_size
         self.out_dir = Path(out_dir)
         self.out_dir.mkdir(parents=True, exist_ok=True)
         self.cells: List[Cell] = []
-        self.mt = MerkleTools(hash_type="sha256")
+        self.tree = MerkleTree()
 
     def add_cell(self, cell: Cell) -> None:
         self.cells.append(cell)
-        idx = len(self.cells)  # index reserved for proof lookup
-        self.mt.add_leaf(cell.sha256(), do_hash=False)
+        self.tree.append(cell._blob_for_sig())
         if len(self.cells) >= self.batch_size:
             self._commit()
 
-    def _commit(self) -> None:
-        self.mt.make_tree()
-        root = self.mt.get_merkle_root()
+    def _commit(self) -> Path:
+        root = self.tree.root_hex()
         filepath = self.out_dir / f"{root}.jsonl"
         with filepath.open("w", encoding="utf-8") as f:
-            for i, c in enumerate(self.cells):
-                proof = self.mt.get_proof(i)
+            for c, proof in zip(self.cells, self.tree.proofs()):
                 f.write(json.dumps(asdict(c) | {"proof": proof}) + "\n")
         # Reset for next batch
         self.cells.clear()
-        from merkletools import MerkleTools
-
-        self.mt = MerkleTools(hash_type="sha256")
+        self.tree = MerkleTree()
+        return filepath
 
 
-def verify_cell(cell_json: str, merkle_root: str) -> bool:
-    """Verify a cell's inclusion in a Merkle tree."""
-    from merkletools import MerkleTools
-
-    cell = json.loads(cell_json)
+def _cell_leaf(cell: dict, legacy: bool = False) -> bytes:
     core = {
         k: v
         for k, v in cell.items()
         if k not in {"sig_ed", "sig_pq", "pk_ed", "pk_pq", "proof"}
     }
-    leaf = hashlib.sha256(_deterministic_json(core).encode()).hexdigest()
-    mt = MerkleTools(hash_type="sha256")
-    return mt.validate_proof(cell.get("proof", []), leaf, merkle_root)
+    blob = _deterministic_json(core).encode()
+    return hashlib.sha256(blob).digest() if legacy else leaf_hash(blob)
+
+
+def verify_cell(cell_json: str, merkle_root: str, legacy: bool = False) -> bool:
+    """Verify a cell's inclusion in a Merkle tree.
+
+    Batches written before the TAS-v1 tree (by merkletools) keep their old
+    roots; pass ``legacy=True`` to verify cells from those files.
+    """
+    cell = json.loads(cell_json)
+    proof = cell.get("proof", [])
+    if legacy:
+        return verify_legacy_proof(_cell_leaf(cell, legacy=True), proof, merkle_root)
+    return verify_proof(_cell_leaf(cell), proof, merkle_root)
+
+
+def verify_cells(
+    cell_jsons: List[str], merkle_root: str, legacy: bool = False
+) -> List[bool]:
+    """Verify many cells from one batch, hashing shared proof nodes once."""
+    cells = [json.loads(cell_json) for cell_json in cell_jsons]
+    return verify_many(
+        [(_cell_leaf(cell, legacy), cell.get("proof", [])) for cell in cells],
+        merkle_root,
+        legacy=legacy,
+    )
 
 
 if __name__ == "__main__":
@@ -221,4 +241,4 @@ if __name__ == "__main__":
     if batch.cells:
         batch._commit()
     print(f"Batches written to {batch.out_dir}")
-# Nonce: 169229
+# Nonce: 52327
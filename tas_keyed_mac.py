@@ -0,0 +1,102 @@
+"""Precomputed-key HMAC contexts shared by the TAS receipt and token paths.
+
+``hmac.new(key, msg, sha256)`` re-derives the keyed inner and outer pad
+states on every call.  :class:`KeyedMAC` absorbs them once per key (RFC 2104:
+``H((K ^ opad) || H((K ^ ipad) || m))``) and copies the two hash states per
+message, so signing cost is just the message and one extra block.  An
+optional ``prefix`` — a domain-separation tag, say — is absorbed into the
+inner state as well.  Message parts are fed to the copied state one by one,
+so callers never concatenate buffers to sign them.
+
+Digests are byte-for-byte identical to ``hmac.new(key, prefix + msg,
+digestmod)``.  Contexts hold key material, so they belong to the object
+that owns the key rather than to a module-level cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+from typing import Any, Callable, Iterable, Sequence
+
+_IPAD = bytes(x ^ 0x36 for x in range(256))
+_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+
+class KeyedMAC:
+    """HMAC signer/verifier for one key, with the pad states precomputed."""
+
+    __slots__ = ("_inner", "_outer", "digest_size")
+
+    def __init__(
+        self,
+        key: bytes,
+        *,
+        prefix: bytes = b"",
+        digestmod: Callable[[], Any] = hashlib.sha256,
+    ) -> None:
+        if not isinstance(key, (bytes, bytearray)):
+            raise TypeError("HMAC keys must be bytes")
+        inner = digestmod()
+        block_size = inner.block_size
+        if len(key) > block_size:
+            key = digestmod(key).digest()
+        key = bytes(key).ljust(block_size, b"\0")
+        inner.update(key.translate(_IPAD))
+        inner.update(prefix)
+        outer = digestmod()
+        outer.update(key.translate(_OPAD))
+        self._inner = inner
+        self._outer = outer
+        self.digest_size = inner.digest_size
+
+    def digest(self, *parts: bytes) -> bytes:
+        """Return the MAC of the concatenation of *parts*."""
+        inner = self._inner.copy()
+        for part in parts:
+            inner.update(part)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def hexdigest(self, *parts: bytes) -> str:
+        """Return the MAC of the concatenation of *parts* as lowercase hex."""
+        inner = self._inner.copy()
+        for part in parts:
+            inner.update(part)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+
+    def verify(self, signature: str, *parts: bytes) -> bool:
+        """Constant-time check of a hex *signature* over *parts*."""
+        return _matches(self.hexdigest(*parts), signature)
+
+    def sign_many(self, messages: Iterable[bytes]) -> list[str]:
+        """Return hex MACs for *messages*, in order."""
+        inner_state, outer_state = self._inner, self._outer
+        signatures = []
+        for message in messages:
+            inner = inner_state.copy()
+            inner.update(message)
+            outer = outer_state.copy()
+            outer.update(inner.digest())
+            signatures.append(outer.hexdigest())
+        return signatures
+
+    def verify_many(self, messages: Sequence[bytes], signatures: Sequence[str]) -> list[bool]:
+        """Constant-time check of each hex signature against its message."""
+        if len(messages) != len(signatures):
+            raise ValueError("messages and signatures must have the same length")
+        return [
+            _matches(expected, signature)
+            for expected, signature in zip(self.sign_many(messages), signatures)
+        ]
+
+
+def _matches(expected: str, supplied: Any) -> bool:
+    # Malformed signatures (non-str, non-ASCII) fail closed instead of raising.
+    if not isinstance(supplied, str) or not supplied.isascii():
+        return False
+    return hmac.compare_digest(expected, supplied)
+
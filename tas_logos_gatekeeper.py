@@ -1,7 +1,6 @@
 import copy
 import decimal
 import hashlib
-import hmac
 import json
 import math
 import re
@@ -10,6 +9,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from tas_keyed_mac import KeyedMAC
+
 
 CANONICALIZATION_VERSION = "TAS-CJSON-1"
 RULE_SET_VERSION = "TAS-LOGOS-GATE-1"
@@ -255,16 +256,14 @@ class HMACReceiptSigner:
         if not isinstance(key, bytes) or len(key) < 32:
             raise ValueError("HMAC signing keys must contain at least 32 bytes")
         self.key_id = key_id
-        self._key = key
+        # The receipt domain tag is absorbed into the precomputed key state.
+        self._mac = KeyedMAC(key, prefix=RECEIPT_DOMAIN.encode("ascii") + b"\x00")
 
     def sign(self, receipt_bytes: bytes) -> Dict[str, str]:
-        domain_bound = RECEIPT_DOMAIN.encode("ascii") + b"\x00" + receipt_bytes
-        value = hmac.new(self._key, domain_bound, hashlib.sha256).hexdigest()
-        return {
-            "algorithm": self.algorithm,
-            "key_id": self.key_id,
-            "value": value,
-        }
+        return self._signature(self._mac.hexdigest(receipt_bytes))
+
+    def sign_many(self, receipts: Sequence[bytes]) -> List[Dict[str, str]]:
+        return [self._signature(value) for value in self._mac.sign_many(receipts)]
 
     def verify(self, receipt_bytes: bytes, signature: Mapping[str, str]) -> bool:
         if (
@@ -272,9 +271,29 @@ class HMACReceiptSigner:
             or signature.get("key_id") != self.key_id
         ):
             return False
-        domain_bound = RECEIPT_DOMAIN.encode("ascii") + b"\x00" + receipt_bytes
-        expected = hmac.new(self._key, domain_bound, hashlib.sha256).hexdigest()
-        return hmac.compare_digest(expected, signature.get("value", ""))
+        return self._mac.verify(signature.get("value", ""), receipt_bytes)
+
+    def verify_many(
+        self, receipts: Sequence[bytes], signatures: Sequence[Mapping[str, str]]
+    ) -> List[bool]:
+        if len(receipts) != len(signatures):
+            raise ValueError("receipts and signatures must have the same length")
+        matches = self._mac.verify_many(
+            receipts, [signature.get("value", "") for signature in signatures]
+        )
+        return [
+            matched
+            and signature.get("algorithm") == self.algorithm
+            and signature.get("key_id") == self.key_id
+            for matched, signature in zip(matches, signatures)
+        ]
+
+    def _signature(self, value: str) -> Dict[str, str]:
+        return {
+            "algorithm": self.algorithm,
+            "key_id": self.key_id,
+            "value": value,
+        }
 
 
 class HMACLineageResolver:
@@ -293,7 +312,9 @@ class HMACLineageResolver:
         for credential_id, key in credential_keys.items():
             if not credential_id or not isinstance(key, bytes) or len(key) < 32:
                 raise ValueError("Each credential must have an id and a 32-byte key")
-        self._credential_keys = dict(credential_keys)
+        self._credential_macs = {
+            credential_id: KeyedMAC(key) for credential_id, key in credential_keys.items()
+        }
 
     @staticmethod
     def build_envelope(
@@ -311,20 +332,19 @@ class HMACLineageResolver:
 
     def sign(self, payload: Mapping[str, Any], authorization_hash: str) -> str:
         credential_id = payload.get("credential_id")
-        key = self._credential_keys.get(credential_id)
-        if key is None:
+        mac = self._credential_macs.get(credential_id)
+        if mac is None:
             raise GatekeeperError("UNKNOWN_CREDENTIAL", "Credential is not registered.")
         envelope = self.build_envelope(payload, authorization_hash)
         envelope_bytes = _serialize_canonical(envelope)
-        value = hmac.new(key, envelope_bytes, hashlib.sha256).hexdigest()
-        return f"hmac-sha256:{value}"
+        return f"hmac-sha256:{mac.hexdigest(envelope_bytes)}"
 
     def verify(
         self, payload: Mapping[str, Any], authorization_hash: str
     ) -> Tuple[bool, str]:
         credential_id = payload.get("credential_id")
-        key = self._credential_keys.get(credential_id)
-        if key is None:
+        mac = self._credential_macs.get(credential_id)
+        if mac is None:
             return False, "UNKNOWN_CREDENTIAL"
 
         lineage = payload.get("lineage")
@@ -337,9 +357,7 @@ class HMACLineageResolver:
 
         envelope = self.build_envelope(payload, authorization_hash)
         envelope_bytes = _serialize_canonical(envelope)
-        expected = hmac.new(key, envelope_bytes, hashlib.sha256).hexdigest()
-        actual = supplied.split(":", 1)[1]
-        if not hmac.compare_digest(expected, actual):
+        if not mac.verify(supplied.split(":", 1)[1], envelope_bytes):
             return False, "SIGNATURE_MISMATCH"
         return True, "SIGNATURE_VALID"
 
@@ -610,4 +628,4 @@ class TASLogosGatekeeper:
             "authorization_hash": authorization_hash,
             **finalized,
         }
-# Nonce: 31442
+# Nonce: 160552
@@ -4,23 +4,46 @@ The bridge treats OpenAI as a scoped execution conduit. TAS remains the
 admissibility and provenance authority.
 """
 
-from .polymath import AlgorithmicPolymath
-from .bridge import tas_openai_execute
-from .gates import GateResult, tas_admissibility_gateway
-from .receipts import ProvenanceReceipt
-from .refusal import RefusalArtifact
-from .schemas import TAS_CANDIDATE_RESPONSE_SCHEMA, CandidateResponse
-from .authority import HumanAPIKey, ScopedAuthority
-from .trinity import (
-    ArchetypeAnalysis,
-    OctopusArchetype,
-    RaccoonArchetype,
-    SafetyEnvelope,
-    SemanticRouter,
-    SingularityEvent,
-    TrinityEngine,
-    TrinityResult,
-)
+from importlib import import_module
+
+# Public names are resolved lazily (PEP 562) so importing one submodule,
+# e.g. ``tas_openai_bridge.receipts``, does not load the whole bridge.
+_EXPORTS = {
+    "AlgorithmicPolymath": ".polymath",
+    "tas_openai_execute": ".bridge",
+    "execute_many": ".conduit",
+    "GateResult": ".gates",
+    "tas_admissibility_gateway": ".gates",
+    "validate_many": ".gates",
+    "ProvenanceReceipt": ".receipts",
+    "RefusalArtifact": ".refusal",
+    "TAS_CANDIDATE_RESPONSE_SCHEMA": ".schemas",
+    "CandidateResponse": ".schemas",
+    "HumanAPIKey": ".authority",
+    "ScopedAuthority": ".authority",
+    "ArchetypeAnalysis": ".trinity",
+    "OctopusArchetype": ".trinity",
+    "RaccoonArchetype": ".trinity",
+    "SafetyEnvelope": ".trinity",
+    "SemanticRouter": ".trinity",
+    "SingularityEvent": ".trinity",
+    "TrinityEngine": ".trinity",
+    "TrinityResult": ".trinity",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "AlgorithmicPolymath",
@@ -39,7 +62,9 @@ __all__ = [
     "TrinityEngine",
     "TrinityResult",
     "ArchetypeAnalysis",
+    "execute_many",
     "tas_admissibility_gateway",
     "tas_openai_execute",
+    "validate_many",
 ]
-# Nonce: 120693
+# Nonce: 13408
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import copy
 from datetime import datetime, timezone
 import hashlib
 import importlib.util
 import json
+import os
+import threading
 from typing import Any
 
 from .authority import HumanAPIKey, ScopedAuthority
+from .cache import ConduitResponseCache
 from .gates import tas_admissibility_gateway
 from .receipts import ProvenanceReceipt
 from .refusal import RefusalArtifact
@@ -53,16 +57,155 @@ def _candidate_from_response(response: Any) -> dict[str, Any] | RefusalArtifact:
     return payload
 
 
+_client_lock = threading.Lock()
+_pooled_client: tuple[int, Any] | None = None
+
+
 def _default_client() -> Any | RefusalArtifact:
-    if importlib.util.find_spec("openai") is None:
-        return RefusalArtifact(
-            reason="OpenAI SDK is not installed",
-            details={"stage": "openai.client"},
-        )
+    """Return this process's pooled OpenAI client, creating it on first use.
+
+    The SDK client is thread-safe and keeps an HTTP connection pool, so every
+    call in a process shares one.  A forked child builds its own rather than
+    inheriting the parent's sockets.
+    """
+    global _pooled_client
+    pooled = _pooled_client
+    if pooled is not None and pooled[0] == os.getpid():
+        return pooled[1]
+    with _client_lock:
+        if _pooled_client is not None and _pooled_client[0] == os.getpid():
+            return _pooled_client[1]
+        if importlib.util.find_spec("openai") is None:
+            return RefusalArtifact(
+                reason="OpenAI SDK is not installed",
+                details={"stage": "openai.client"},
+            )
+
+        from openai import OpenAI
+
+        _pooled_client = (os.getpid(), OpenAI())
+        return _pooled_client[1]
+
+
+def _authorization_refusal(
+    human_api_key: HumanAPIKey | None, scoped_authority: ScopedAuthority | None
+) -> RefusalArtifact | None:
+    if human_api_key is None or scoped_authority is None:
+        return RefusalArtifact(reason="Missing authority anchor")
+
+    if not human_api_key.validate():
+        return RefusalArtifact(reason="Invalid HumanAPI Key")
+
+    if not scoped_authority.allows(OPENAI_RESPONSES_ACTION):
+        return RefusalArtifact(reason="Scope does not authorize OpenAI execution")
+    return None
+
+
+def _conduit_request(prompt: str, model: str) -> tuple[str, dict[str, Any]]:
+    """Return the prompt hash and the ``responses.create`` keyword arguments."""
+    prompt_hash = _hash_prompt(prompt)
+    conduit_prompt = json.dumps(
+        {
+            "prompt": prompt,
+            "tas_paradata_requirements": {
+                "input_hash": prompt_hash,
+                "model": model,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "tool_path": "openai.responses",
+                "receipt_required": True,
+            },
+        },
+        sort_keys=True,
+    )
+    return prompt_hash, {
+        "model": model,
+        "input": conduit_prompt,
+        "text": {"format": _schema_format()},
+    }
 
-    from openai import OpenAI
 
-    return OpenAI()
+def _conduit_failure(exc: BaseException, **details: Any) -> RefusalArtifact:
+    return RefusalArtifact(
+        reason="OpenAI conduit execution failed",
+        details={"stage": "openai.responses.create", "error": str(exc), **details},
+    )
+
+
+def _admit_response(
+    response: Any,
+    prompt_hash: str,
+    model: str,
+    human_api_key: HumanAPIKey,
+    scoped_authority: ScopedAuthority,
+    cache: ConduitResponseCache | None = None,
+) -> ProvenanceReceipt | RefusalArtifact:
+    """Gate a conduit response and emit its receipt or refusal."""
+    candidate = _candidate_from_response(response)
+    if isinstance(candidate, RefusalArtifact):
+        return candidate
+
+    # Gating fills in tas_paradata; the cache keeps what the model returned.
+    returned = copy.deepcopy(candidate) if cache is not None else None
+    result = _admit_candidate(
+        candidate,
+        response,
+        prompt_hash,
+        model,
+        human_api_key,
+        scoped_authority,
+        cache_hit=False if cache is not None else None,
+    )
+    if cache is not None and isinstance(result, ProvenanceReceipt):
+        # Only admitted candidates are cached; a refusal is re-asked next time.
+        cache.put(prompt_hash, model, returned)
+    return result
+
+
+def _admit_candidate(
+    candidate: dict[str, Any],
+    response: Any,
+    prompt_hash: str,
+    model: str,
+    human_api_key: HumanAPIKey,
+    scoped_authority: ScopedAuthority,
+    *,
+    cache_hit: bool | None = None,
+) -> ProvenanceReceipt | RefusalArtifact:
+    """Run the TAS gate on a structured candidate, fresh or cached."""
+    candidate.setdefault("tas_paradata", {})["input_hash"] = prompt_hash
+    candidate["tas_paradata"].setdefault("model", model)
+    candidate["tas_paradata"].setdefault("tool_path", "openai.responses")
+    candidate["tas_paradata"].setdefault("receipt_required", True)
+
+    gate_result = tas_admissibility_gateway(candidate)
+    if not gate_result.admissible:
+        return RefusalArtifact.from_gate_result(gate_result)
+
+    return ProvenanceReceipt.from_response(
+        response=response,
+        human_api_key=human_api_key,
+        scoped_authority=scoped_authority,
+        gate_result=gate_result,
+        cache_hit=cache_hit,
+    )
+
+
+def _cached_admission(
+    cache: ConduitResponseCache | None,
+    prompt_hash: str,
+    model: str,
+    human_api_key: HumanAPIKey,
+    scoped_authority: ScopedAuthority,
+) -> ProvenanceReceipt | RefusalArtifact | None:
+    """Admit a cached candidate, or return None on a miss."""
+    if cache is None:
+        return None
+    candidate = cache.get(prompt_hash, model)
+    if candidate is None:
+        return None
+    return _admit_candidate(
+        candidate, None, prompt_hash, model, human_api_key, scoped_authority, cache_hit=True
+    )
 
 
 def tas_openai_execute(
@@ -72,76 +215,41 @@ def tas_openai_execute(
     *,
     client: Any | None = None,
     model: str = DEFAULT_MODEL,
+    cache: ConduitResponseCache | None = None,
 ) -> ProvenanceReceipt | RefusalArtifact:
     """Run Prompt → Structured Candidate → TAS Gate → Receipt or Refusal.
 
     The function fails closed: missing authority, invalid scope, malformed model
     output, OpenAI execution errors, and TAS gate failures all emit a
     RefusalArtifact instead of allowing raw crashes or silent acceptance.
+
+    With a ``cache``, a previously admitted candidate for the same prompt,
+    model and schema skips the OpenAI call but is still gated and receipted;
+    the receipt's ``cache_hit`` records which path produced it.
     """
     try:
-        if human_api_key is None or scoped_authority is None:
-            return RefusalArtifact(reason="Missing authority anchor")
-
-        if not human_api_key.validate():
-            return RefusalArtifact(reason="Invalid HumanAPI Key")
+        refusal = _authorization_refusal(human_api_key, scoped_authority)
+        if refusal is not None:
+            return refusal
 
-        if not scoped_authority.allows(OPENAI_RESPONSES_ACTION):
-            return RefusalArtifact(reason="Scope does not authorize OpenAI execution")
+        prompt_hash, request = _conduit_request(prompt, model)
+        cached = _cached_admission(cache, prompt_hash, model, human_api_key, scoped_authority)
+        if cached is not None:
+            return cached
 
         execution_client = client if client is not None else _default_client()
         if isinstance(execution_client, RefusalArtifact):
             return execution_client
 
-        prompt_hash = _hash_prompt(prompt)
-        conduit_prompt = json.dumps(
-            {
-                "prompt": prompt,
-                "tas_paradata_requirements": {
-                    "input_hash": prompt_hash,
-                    "model": model,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "tool_path": "openai.responses",
-                    "receipt_required": True,
-                },
-            },
-            sort_keys=True,
-        )
-
         try:
-            response = execution_client.responses.create(
-                model=model,
-                input=conduit_prompt,
-                text={"format": _schema_format()},
-            )
+            response = execution_client.responses.create(**request)
         except Exception as exc:
-            return RefusalArtifact(
-                reason="OpenAI conduit execution failed",
-                details={"stage": "openai.responses.create", "error": str(exc)},
-            )
+            return _conduit_failure(exc)
 
-        candidate = _candidate_from_response(response)
-        if isinstance(candidate, RefusalArtifact):
-            return candidate
-
-        candidate.setdefault("tas_paradata", {})["input_hash"] = prompt_hash
-        candidate["tas_paradata"].setdefault("model", model)
-        candidate["tas_paradata"].setdefault("tool_path", "openai.responses")
-        candidate["tas_paradata"].setdefault("receipt_required", True)
-
-        gate_result = tas_admissibility_gateway(candidate)
-        if not gate_result.admissible:
-            return RefusalArtifact.from_gate_result(gate_result)
-
-        return ProvenanceReceipt.from_response(
-            response=response,
-            human_api_key=human_api_key,
-            scoped_authority=scoped_authority,
-            gate_result=gate_result,
-        )
+        return _admit_response(response, prompt_hash, model, human_api_key, scoped_authority, cache)
     except Exception as exc:
         return RefusalArtifact(
             reason="Unhandled runtime exception in TAS bridge",
             details={"error": str(exc)},
         )
-# Nonce: 14663
+# Nonce: 15985
@@ -0,0 +1,169 @@
+"""Opt-in, on-disk cache of structured conduit candidates.
+
+The cache stores what the model returned — the parsed candidate object — and
+never a receipt; the bridge only stores candidates the gate admitted.  A hit
+skips only the OpenAI call: the candidate still goes through
+``tas_admissibility_gateway`` and a fresh receipt or refusal is issued, with
+the receipt's ``cache_hit`` recording whether the candidate came from the
+cache.
+
+Entries are keyed by ``(input_hash, model, schema version)``; the schema
+version is a digest of ``TAS_CANDIDATE_RESPONSE_SCHEMA``, so changing the
+schema invalidates every cached candidate.  Candidate bytes live in a
+content-addressed object store (identical candidates share one object) and a
+SQLite index holds the keys with their store and last-use times for TTL and
+LRU eviction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+
+from .receipts import canonical_hash
+from .schemas import TAS_CANDIDATE_RESPONSE_SCHEMA
+
+SCHEMA_VERSION = canonical_hash(TAS_CANDIDATE_RESPONSE_SCHEMA)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conduit_cache (
+    cache_key  TEXT PRIMARY KEY,
+    object_id  TEXT NOT NULL,
+    stored_at  REAL NOT NULL,
+    last_used  REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS conduit_cache_lru ON conduit_cache (last_used);
+CREATE INDEX IF NOT EXISTS conduit_cache_ttl ON conduit_cache (stored_at);
+CREATE INDEX IF NOT EXISTS conduit_cache_object ON conduit_cache (object_id);
+"""
+
+
+def cache_key(input_hash: str, model: str, schema_version: str = SCHEMA_VERSION) -> str:
+    """Return the cache key for a prompt hash, model and candidate schema."""
+    return canonical_hash(
+        {"input_hash": input_hash, "model": model, "schema_version": schema_version}
+    )
+
+
+class ConduitResponseCache:
+    """Content-addressed candidate cache with LRU and TTL eviction.
+
+    ``max_entries`` bounds the number of keys; the least recently used are
+    evicted first.  Entries older than ``ttl_seconds`` (measured from when
+    they were stored) are treated as misses and removed.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 7 * 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = Path(directory)
+        self.objects = self.directory / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.directory / "index.sqlite"), isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ConduitResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM conduit_cache").fetchone()[0]
+
+    def get(self, input_hash: str, model: str) -> dict[str, Any] | None:
+        """Return a fresh copy of the cached candidate, or None on a miss."""
+        key = cache_key(input_hash, model)
+        now = self._clock()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT object_id, stored_at FROM conduit_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            object_id, stored_at = row
+            if now - stored_at > self.ttl_seconds:
+                self._delete([(key, object_id)])
+                return None
+            try:
+                data = self._object_path(object_id).read_bytes()
+            except FileNotFoundError:
+                self._delete([(key, object_id)])
+                return None
+            if hashlib.sha256(data).hexdigest() != object_id:
+                # A corrupted object is a miss, never a candidate.
+                self._delete([(key, object_id)])
+                return None
+            self._db.execute(
+                "UPDATE conduit_cache SET last_used = ? WHERE cache_key = ?", (now, key)
+            )
+        return json.loads(data)
+
+    def put(self, input_hash: str, model: str, candidate: dict[str, Any]) -> str:
+        """Store *candidate* and return its object id."""
+        data = json.dumps(candidate, sort_keys=True, separators=(",", ":")).encode()
+        object_id = hashlib.sha256(data).hexdigest()
+        path = self._object_path(object_id)
+        now = self._clock()
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                temporary = path.with_name(f".{object_id}.{os.getpid()}.tmp")
+                temporary.write_bytes(data)
+                os.replace(temporary, path)
+            self._db.execute(
+                "INSERT OR REPLACE INTO conduit_cache VALUES (?, ?, ?, ?)",
+                (cache_key(input_hash, model), object_id, now, now),
+            )
+            self._evict(now)
+        return object_id
+
+    def _evict(self, now: float) -> None:
+        expired = self._db.execute(
+            "SELECT cache_key, object_id FROM conduit_cache WHERE stored_at < ?",
+            (now - self.ttl_seconds,),
+        ).fetchall()
+        excess = len(self) - len(expired) - self.max_entries
+        if excess > 0:
+            expired += self._db.execute(
+                "SELECT cache_key, object_id FROM conduit_cache WHERE stored_at >= ?"
+                " ORDER BY last_used LIMIT ?",
+                (now - self.ttl_seconds, excess),
+            ).fetchall()
+        if expired:
+            self._delete(expired)
+
+    def _delete(self, rows: list[tuple[str, str]]) -> None:
+        self._db.executemany("DELETE FROM conduit_cache WHERE cache_key = ?", [(key,) for key, _ in rows])
+        for object_id in {object_id for _, object_id in rows}:
+            still_used = self._db.execute(
+                "SELECT 1 FROM conduit_cache WHERE object_id = ? LIMIT 1", (object_id,)
+            ).fetchone()
+            if still_used is None:
+                self._object_path(object_id).unlink(missing_ok=True)
+
+    def _object_path(self, object_id: str) -> Path:
+        return self.objects / object_id[:2] / f"{object_id[2:]}.json"
@@ -0,0 +1,179 @@
+"""Concurrent conduit execution for bulk TAS-OpenAI bridge traffic.
+
+``execute_many`` runs the same Prompt → Structured Candidate → TAS Gate →
+Receipt or Refusal path as :func:`tas_openai_execute` for many prompts at
+once.  Requests share one pooled client, run at most ``concurrency`` at a
+time, are bounded by the SDK's own per-request timeout, and transient
+conduit errors are retried with jittered exponential backoff.  Results come back in prompt order
+and every failure is a :class:`RefusalArtifact`, never an exception.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+import copy
+from functools import partial
+import inspect
+import random
+from typing import Any, Iterable
+
+from .authority import HumanAPIKey, ScopedAuthority
+from .bridge import (
+    DEFAULT_MODEL,
+    _admit_response,
+    _authorization_refusal,
+    _cached_admission,
+    _conduit_failure,
+    _conduit_request,
+    _default_client,
+)
+from .cache import ConduitResponseCache
+from .receipts import ProvenanceReceipt
+from .refusal import RefusalArtifact
+
+# Status codes and SDK error classes worth retrying: timeouts, conflicts,
+# rate limits and server-side failures.
+TRANSIENT_STATUS_CODES = frozenset({408, 409, 429})
+TRANSIENT_ERROR_NAMES = frozenset(
+    {"APITimeoutError", "APIConnectionError", "RateLimitError", "InternalServerError"}
+)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return True for conduit errors that a retry may clear."""
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int) and (status in TRANSIENT_STATUS_CODES or status >= 500):
+        return True
+    return type(exc).__name__ in TRANSIENT_ERROR_NAMES
+
+
+# Extra time a synchronous call gets beyond its own timeout before the
+# conduit stops waiting for it.
+_TIMEOUT_GRACE = 1.0
+
+
+class _ConduitStillRunning(Exception):
+    """A synchronous conduit call outlived its timeout and is still running."""
+
+
+async def _create(client: Any, request: dict[str, Any], executor: Executor, timeout: float) -> Any:
+    create = client.responses.create
+    if inspect.iscoroutinefunction(create):
+        # Cancelling the coroutine abandons the request, so a retry is safe.
+        return await asyncio.wait_for(create(**request, timeout=timeout), timeout)
+    # Synchronous SDK clients are thread-safe and pool their connections.  The
+    # SDK enforces ``timeout`` inside the worker thread; a running executor
+    # future cannot be cancelled, so a call that ignores it is reported as
+    # still running and never retried alongside itself.
+    future = asyncio.get_running_loop().run_in_executor(
+        executor, partial(create, **request, timeout=timeout)
+    )
+    done, _ = await asyncio.wait({future}, timeout=timeout + _TIMEOUT_GRACE)
+    if not done:
+        raise _ConduitStillRunning(f"conduit request exceeded {timeout}s and is still running")
+    return future.result()
+
+
+async def _execute_one(
+    client: Any,
+    prompt: str,
+    human_api_key: HumanAPIKey,
+    scoped_authority: ScopedAuthority,
+    semaphore: asyncio.Semaphore,
+    executor: Executor,
+    *,
+    model: str,
+    timeout: float,
+    retries: int,
+    backoff: float,
+    cache: ConduitResponseCache | None,
+) -> ProvenanceReceipt | RefusalArtifact:
+    try:
+        prompt_hash, request = _conduit_request(prompt, model)
+        cached = _cached_admission(cache, prompt_hash, model, human_api_key, scoped_authority)
+        if cached is not None:
+            return cached
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    response = await _create(client, request, executor, timeout)
+                break
+            except Exception as exc:
+                if isinstance(exc, asyncio.TimeoutError):
+                    exc = TimeoutError(f"conduit request exceeded {timeout}s")
+                if attempt >= retries or not is_transient(exc):
+                    return _conduit_failure(exc, attempts=attempt + 1)
+                # Full jitter keeps retrying workers from synchronising.
+                await asyncio.sleep(random.uniform(0, backoff * 2**attempt))
+                attempt += 1
+        return _admit_response(response, prompt_hash, model, human_api_key, scoped_authority, cache)
+    except Exception as exc:
+        return RefusalArtifact(
+            reason="Unhandled runtime exception in TAS bridge",
+            details={"error": str(exc)},
+        )
+
+
+async def execute_many(
+    human_api_key: HumanAPIKey | None,
+    scoped_authority: ScopedAuthority | None,
+    prompts: Iterable[str],
+    *,
+    client: Any | None = None,
+    model: str = DEFAULT_MODEL,
+    concurrency: int = 16,
+    timeout: float = 60.0,
+    retries: int = 2,
+    backoff: float = 0.5,
+    cache: ConduitResponseCache | None = None,
+) -> list[ProvenanceReceipt | RefusalArtifact]:
+    """Execute *prompts* concurrently; results are returned in prompt order.
+
+    Authority is checked once for the batch; a refusal there is returned for
+    every prompt.  ``client`` may be a synchronous or ``async`` Responses
+    client and defaults to the process's pooled OpenAI client.  An optional
+    ``cache`` is consulted before each conduit call, as in
+    :func:`tas_openai_execute`.
+    """
+    prompts = list(prompts)
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    refusal = _authorization_refusal(human_api_key, scoped_authority)
+    if refusal is None:
+        execution_client = client if client is not None else _default_client()
+        if isinstance(execution_client, RefusalArtifact):
+            refusal = execution_client
+    if refusal is not None:
+        return [copy.deepcopy(refusal) for _ in prompts]
+
+    semaphore = asyncio.Semaphore(concurrency)
+    executor = ThreadPoolExecutor(concurrency, thread_name_prefix="tas-conduit")
+    try:
+        return list(
+            await asyncio.gather(
+                *(
+                    _execute_one(
+                        execution_client,
+                        prompt,
+                        human_api_key,
+                        scoped_authority,
+                        semaphore,
+                        executor,
+                        model=model,
+                        timeout=timeout,
+                        retries=retries,
+                        backoff=backoff,
+                        cache=cache,
+                    )
+                    for prompt in prompts
+                )
+            )
+        )
+    finally:
+        # Timed-out calls may still be running; do not block on them.
+        executor.shutdown(wait=False)
@@ -0,0 +1,209 @@
+"""Local fake of the OpenAI Responses endpoint for offline conduit runs.
+
+``FakeResponsesServer`` answers ``POST /v1/responses`` with a well-formed
+TAS candidate built from the conduit prompt's ``tas_paradata_requirements``,
+after an optional artificial latency, and can inject ``429`` rate-limit
+errors to exercise retries.  ``ResponsesHTTPClient`` is a minimal,
+keep-alive, thread-safe client exposing ``responses.create`` so the bridge
+can be benchmarked without the OpenAI SDK; the SDK itself also works against
+``FakeResponsesServer.url``.
+"""
+
+from __future__ import annotations
+
+import http.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import urlsplit
+
+
+def fake_candidate(conduit_input: str) -> dict[str, Any]:
+    """Return the admissible candidate the fake model emits for *conduit_input*."""
+    request = json.loads(conduit_input)
+    requirements = request.get("tas_paradata_requirements", {})
+    return {
+        "decision": "candidate",
+        "claim_type": "summary",
+        "confidence": 0.9,
+        "requires_web_verification": False,
+        "requires_human_authorization": True,
+        "proposed_output": f"candidate for: {request.get('prompt', '')}",
+        "known_limitations": ["offline fake conduit"],
+        "tas_paradata": {
+            "input_hash": requirements.get("input_hash", ""),
+            "model": requirements.get("model", "fake"),
+            "timestamp": requirements.get("timestamp", ""),
+            "tool_path": "openai.responses",
+            "receipt_required": True,
+        },
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.rstrip("/") != "/v1/responses":
+            self._reply(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+            return
+        number = next(self.server.counter)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.server.fail_every and number % self.server.fail_every == 0:
+            self._reply(429, {"error": {"message": "rate limited", "type": "rate_limit_error"}})
+            return
+        try:
+            request = json.loads(body)
+            text = json.dumps(fake_candidate(request["input"]))
+        except (KeyError, TypeError, ValueError) as exc:
+            self._reply(400, {"error": {"message": str(exc), "type": "invalid_request_error"}})
+            return
+        self._reply(
+            200,
+            {
+                "id": f"resp_fake_{number}",
+                "object": "response",
+                "created_at": int(time.time()),
+                "model": request.get("model", "fake"),
+                "status": "completed",
+                "output": [
+                    {
+                        "type": "message",
+                        "id": f"msg_fake_{number}",
+                        "status": "completed",
+                        "role": "assistant",
+                        "content": [{"type": "output_text", "text": text, "annotations": []}],
+                    }
+                ],
+                "parallel_tool_calls": False,
+                "tool_choice": "auto",
+                "tools": [],
+            },
+        )
+
+    def _reply(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload).encode()
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client timed out and hung up first; nothing left to answer.
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    latency: float
+    fail_every: int
+    counter: "itertools.count[int]"
+
+
+class FakeResponsesServer:
+    """Threaded fake Responses API; use as a context manager."""
+
+    def __init__(
+        self, *, latency: float = 0.0, fail_every: int = 0, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self._server = _Server((host, port), _Handler)
+        self._server.latency = latency
+        self._server.fail_every = fail_every
+        self._server.counter = itertools.count(1)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeResponsesServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeResponsesServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+class ResponsesHTTPError(Exception):
+    """Non-200 reply from a Responses endpoint."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(f"{status_code}: {message}")
+        self.status_code = status_code
+
+
+class _Responses:
+    def __init__(self, client: "ResponsesHTTPClient") -> None:
+        self._client = client
+
+    def create(self, *, timeout: float | None = None, **request: Any) -> SimpleNamespace:
+        return self._client._post("/responses", request, timeout)
+
+
+class ResponsesHTTPClient:
+    """Minimal Responses client keeping one keep-alive connection per thread."""
+
+    def __init__(self, base_url: str, *, api_key: str = "fake", timeout: float = 30.0) -> None:
+        parts = urlsplit(base_url)
+        self._host = parts.hostname or "127.0.0.1"
+        self._port = parts.port or 80
+        self._prefix = parts.path.rstrip("/")
+        self._headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        self._timeout = timeout
+        self._local = threading.local()
+        self.responses = _Responses(self)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+            self._local.connection = connection
+        return connection
+
+    def _post(
+        self, path: str, request: dict[str, Any], timeout: float | None = None
+    ) -> SimpleNamespace:
+        body = json.dumps(request).encode()
+        connection = self._connection()
+        # Like the OpenAI SDK, a per-request timeout overrides the client's.
+        connection.timeout = self._timeout if timeout is None else timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(connection.timeout)
+        try:
+            connection.request("POST", self._prefix + path, body, self._headers)
+            reply = connection.getresponse()
+            data = reply.read()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            self._local.connection = None
+            raise
+        payload = json.loads(data)
+        if reply.status != 200:
+            raise ResponsesHTTPError(reply.status, payload.get("error", {}).get("message", ""))
+        output_text = "".join(
+            part.get("text", "")
+            for item in payload.get("output", [])
+            for part in item.get("content", [])
+            if part.get("type") == "output_text"
+        )
+        return SimpleNamespace(model=payload.get("model"), output_text=output_text, raw=payload)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Iterable, Mapping
 
 from .schemas import TAS_CANDIDATE_RESPONSE_SCHEMA, CandidateResponse
 
@@ -18,87 +18,101 @@ class GateResult:
     candidate: CandidateResponse | None = None
 
 
-def _schema_keys() -> set[str]:
-    return set(TAS_CANDIDATE_RESPONSE_SCHEMA["properties"])
-
-
-def _check_schema(candidate_payload: dict) -> GateResult | None:
-    actual_keys = set(candidate_payload)
-    required_keys = set(TAS_CANDIDATE_RESPONSE_SCHEMA["required"])
-    missing = required_keys - actual_keys
-    if missing:
-        return GateResult(
-            False, "schema", f"Missing required fields: {sorted(missing)}"
-        )
-
-    unexpected = actual_keys - _schema_keys()
-    if unexpected:
-        return GateResult(
-            False, "schema", f"Unexpected fields: {sorted(unexpected)}"
-        )
-    return None
-
-
-def _check_safety_envelope(candidate: CandidateResponse) -> GateResult | None:
-    if candidate.decision != "candidate":
-        return GateResult(
-            False,
-            "P1",
-            f"Candidate decision is not admissible: {candidate.decision}",
-            candidate,
-        )
-
-    if (
-        candidate.claim_type
-        not in TAS_CANDIDATE_RESPONSE_SCHEMA["properties"]["claim_type"]["enum"]
-    ):
-        return GateResult(False, "P0", "Unknown claim type", candidate)
-
-    if not 0.0 <= candidate.confidence <= 1.0:
-        return GateResult(
-            False, "Rκ", "Confidence must be between 0.0 and 1.0", candidate
-        )
-
-    if not candidate.proposed_output.strip():
-        return GateResult(False, "Φ", "Proposed output is empty", candidate)
-
-    paradata = candidate.tas_paradata
-    if paradata.get("tool_path") != "openai.responses":
-        return GateResult(
-            False, "GENE_C01", "Missing OpenAI Responses tool path", candidate
-        )
-
-    if paradata.get("receipt_required") is not True:
-        return GateResult(
-            False, "GENE_C01", "Receipt is not required by paradata", candidate
-        )
-
-    return None
+def compile_candidate_validator(
+    schema: Mapping[str, Any] = TAS_CANDIDATE_RESPONSE_SCHEMA,
+) -> Callable[[Any], GateResult]:
+    """Specialise the admissibility gateway for *schema* once.
+
+    Key sets, the claim-type enum and the confidence bounds are read from the
+    schema up front, and the candidate is built once from the validated
+    payload with the same coercions as ``CandidateResponse.from_mapping``, so
+    every payload yields exactly the ``GateResult`` the original interpreted
+    gateway did, including its refusal messages and exception text.
+    """
+    properties = schema["properties"]
+    allowed_keys = frozenset(properties)
+    required_keys = frozenset(schema["required"])
+    if not {"decision", "claim_type", "confidence", "proposed_output", "tas_paradata"} <= required_keys:
+        raise ValueError("candidate schema must require the gated fields")
+    claim_types = frozenset(properties["claim_type"]["enum"])
+    minimum = properties["confidence"].get("minimum", 0.0)
+    maximum = properties["confidence"].get("maximum", 1.0)
+    confidence_reason = f"Confidence must be between {minimum} and {maximum}"
+    new_candidate = CandidateResponse
+
+    def validate(candidate_payload: Any) -> GateResult:
+        try:
+            if not isinstance(candidate_payload, dict):
+                return GateResult(False, "schema", "Candidate must be a JSON object")
+
+            actual_keys = set(candidate_payload)
+            if not required_keys <= actual_keys:
+                return GateResult(
+                    False, "schema", f"Missing required fields: {sorted(required_keys - actual_keys)}"
+                )
+            if not actual_keys <= allowed_keys:
+                return GateResult(
+                    False, "schema", f"Unexpected fields: {sorted(actual_keys - allowed_keys)}"
+                )
+
+            # Gated fields are required and present; the rest keep from_mapping's defaults.
+            get = candidate_payload.get
+            candidate = new_candidate(
+                str(candidate_payload["decision"]),
+                str(candidate_payload["claim_type"]),
+                float(candidate_payload["confidence"]),
+                bool(get("requires_web_verification")),
+                bool(get("requires_human_authorization")),
+                str(candidate_payload["proposed_output"]),
+                list(get("known_limitations", [])),
+                dict(candidate_payload["tas_paradata"]),
+            )
+
+            if candidate.decision != "candidate":
+                return GateResult(
+                    False,
+                    "P1",
+                    f"Candidate decision is not admissible: {candidate.decision}",
+                    candidate,
+                )
+            if candidate.claim_type not in claim_types:
+                return GateResult(False, "P0", "Unknown claim type", candidate)
+            if not minimum <= candidate.confidence <= maximum:
+                return GateResult(False, "Rκ", confidence_reason, candidate)
+            if not candidate.proposed_output.strip():
+                return GateResult(False, "Φ", "Proposed output is empty", candidate)
+            paradata = candidate.tas_paradata
+            if paradata.get("tool_path") != "openai.responses":
+                return GateResult(
+                    False, "GENE_C01", "Missing OpenAI Responses tool path", candidate
+                )
+            if paradata.get("receipt_required") is not True:
+                return GateResult(
+                    False, "GENE_C01", "Receipt is not required by paradata", candidate
+                )
+            return GateResult(
+                True, "TAS", "Candidate passed TAS admissibility gateway", candidate
+            )
+        except Exception as exc:
+            return GateResult(
+                False,
+                "EXCEPTION",
+                f"Unhandled exception in admissibility gateway: {str(exc)}",
+            )
+
+    return validate
+
+
+_compiled_gateway = compile_candidate_validator()
 
 
 def tas_admissibility_gateway(candidate_payload: Any) -> GateResult:
     """Evaluate a structured OpenAI candidate before it can become authoritative."""
-    try:
-        if not isinstance(candidate_payload, dict):
-            return GateResult(False, "schema", "Candidate must be a JSON object")
-
-        schema_error = _check_schema(candidate_payload)
-        if schema_error:
-            return schema_error
-
-        candidate = CandidateResponse.from_mapping(candidate_payload)
-
-        envelope_error = _check_safety_envelope(candidate)
-        if envelope_error:
-            return envelope_error
-
-        return GateResult(
-            True, "TAS", "Candidate passed TAS admissibility gateway", candidate
-        )
-    except Exception as exc:
-        return GateResult(
-            False,
-            "EXCEPTION",
-            f"Unhandled exception in admissibility gateway: {str(exc)}",
-        )
-# Nonce: 484
+    return _compiled_gateway(candidate_payload)
+
+
+def validate_many(candidate_payloads: Iterable[Any]) -> list[GateResult]:
+    """Gate a batch of candidates; results are in input order."""
+    gateway = _compiled_gateway
+    return [gateway(payload) for payload in candidate_payloads]
+# Nonce: 92437
@@ -1,25 +1,376 @@
-"""In-memory immutable ledger helper for bridge receipts and refusals."""
+"""Immutable ledgers for bridge receipts and refusals.
+
+``ImmutableTruthLedger`` keeps hash-linked entries in memory.
+``SegmentedTruthLedger`` writes the same entries to append-only segment files
+so receipts survive restart.  Both index entries by ``entry_hash`` and by the
+artifact's ``receipt_id``/``refusal_receipt_id``, and both verify the hash
+chain incrementally from a :class:`LedgerCheckpoint`.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any, Iterable, Iterator, Protocol
 
 from .receipts import canonical_hash
 
+GENESIS_HASH = "sha256:genesis"
+
+
+class ChainIntegrityError(ValueError):
+    """Raised when stored entries no longer form the recorded hash chain."""
+
+
+@dataclass(frozen=True)
+class LedgerCheckpoint:
+    """Verified prefix of a ledger: ``count`` entries ending at ``entry_hash``."""
+
+    count: int = 0
+    entry_hash: str = GENESIS_HASH
+
+
+class TruthLedger(Protocol):
+    """Append-only, hash-linked store of bridge artifacts."""
+
+    def append(self, artifact: Any) -> str:
+        """Append one artifact and return its entry hash."""
+
+    def append_many(self, artifacts: Iterable[Any]) -> list[str]:
+        """Append artifacts in order and return their entry hashes."""
+
+    def get(self, entry_hash: str) -> dict[str, Any] | None:
+        """Return the entry with *entry_hash*, if any."""
+
+    def find_receipt(self, receipt_id: str) -> dict[str, Any] | None:
+        """Return the entry whose payload carries *receipt_id*, if any."""
+
+    def verify_chain(self, since: LedgerCheckpoint | None = None) -> LedgerCheckpoint:
+        """Verify entries after *since* and return the new checkpoint."""
+
+
+def _artifact_payload(artifact: Any) -> dict[str, Any]:
+    return artifact.to_dict() if hasattr(artifact, "to_dict") else dict(artifact)
+
+
+def _receipt_id(payload: dict[str, Any]) -> str:
+    return payload.get("receipt_id") or payload.get("refusal_receipt_id") or ""
+
+
+def _link(payload: dict[str, Any], previous_hash: str) -> tuple[str, bytes]:
+    """Return ``(entry_hash, stored line)`` for a new entry.
+
+    The line is the canonical JSON of the entry including ``entry_hash``,
+    spliced from the bytes already hashed so each entry is encoded once.
+    """
+    encoded = json.dumps(
+        {"payload": payload, "previous_hash": previous_hash},
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode()
+    entry_hash = "sha256:" + hashlib.sha256(encoded).hexdigest()
+    return entry_hash, b'{"entry_hash":"' + entry_hash.encode() + b'",' + encoded[1:] + b"\n"
+
+
+def _verify_entries(
+    entries: Iterable[dict[str, Any]], since: LedgerCheckpoint
+) -> LedgerCheckpoint:
+    count, previous_hash = since.count, since.entry_hash
+    for entry in entries:
+        if entry.get("previous_hash") != previous_hash:
+            raise ChainIntegrityError(f"entry {count} does not link to {previous_hash}")
+        expected = canonical_hash({"payload": entry.get("payload"), "previous_hash": previous_hash})
+        if entry.get("entry_hash") != expected:
+            raise ChainIntegrityError(f"entry {count} hash mismatch")
+        count += 1
+        previous_hash = expected
+    return LedgerCheckpoint(count, previous_hash)
+
 
 @dataclass
 class ImmutableTruthLedger:
     """Append-only ledger that stores hash-linked bridge artifacts."""
 
     entries: list[dict[str, Any]] = field(default_factory=list)
+    _by_hash: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _by_receipt: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for position, entry in enumerate(self.entries):
+            self._index(position, entry)
 
     def append(self, artifact: Any) -> str:
-        payload = artifact.to_dict() if hasattr(artifact, "to_dict") else dict(artifact)
-        previous_hash = self.entries[-1]["entry_hash"] if self.entries else "sha256:genesis"
+        payload = _artifact_payload(artifact)
+        previous_hash = self.entries[-1]["entry_hash"] if self.entries else GENESIS_HASH
         entry = {"payload": payload, "previous_hash": previous_hash}
         entry_hash = canonical_hash(entry)
         entry["entry_hash"] = entry_hash
+        self._index(len(self.entries), entry)
         self.entries.append(entry)
         return entry_hash
-# Nonce: 183668
+
+    def append_many(self, artifacts: Iterable[Any]) -> list[str]:
+        return [self.append(artifact) for artifact in artifacts]
+
+    def get(self, entry_hash: str) -> dict[str, Any] | None:
+        position = self._by_hash.get(entry_hash)
+        return None if position is None else self.entries[position]
+
+    def find_receipt(self, receipt_id: str) -> dict[str, Any] | None:
+        position = self._by_receipt.get(receipt_id)
+        return None if position is None else self.entries[position]
+
+    def verify_chain(self, since: LedgerCheckpoint | None = None) -> LedgerCheckpoint:
+        since = since or LedgerCheckpoint()
+        _check_checkpoint(since, len(self.entries), lambda i: self.entries[i]["entry_hash"])
+        return _verify_entries(self.entries[since.count:], since)
+
+    def _index(self, position: int, entry: dict[str, Any]) -> None:
+        self._by_hash[entry["entry_hash"]] = position
+        receipt_id = _receipt_id(entry["payload"])
+        if receipt_id:
+            self._by_receipt.setdefault(receipt_id, position)
+
+
+def _check_checkpoint(since: LedgerCheckpoint, length: int, hash_at: Any) -> None:
+    if since.count > length:
+        raise ChainIntegrityError(f"checkpoint covers {since.count} entries, ledger has {length}")
+    expected = hash_at(since.count - 1) if since.count else GENESIS_HASH
+    if expected != since.entry_hash:
+        raise ChainIntegrityError(f"checkpoint hash does not match entry {since.count - 1}")
+
+
+class SegmentedTruthLedger:
+    """Durable ledger writing hash-linked entries to rolling segment files.
+
+    Entries are stored one canonical JSON line each in
+    ``segment-NNNNNN.jsonl``.  Once a segment exceeds ``segment_bytes`` it is
+    fsynced, sealed with a ``.idx`` sidecar listing each entry's hash,
+    receipt id and byte span, and a new segment is started; reopening loads
+    the sidecars and scans only the active segment, dropping a torn final
+    line.
+
+    With ``sync=True`` (the default) ``append`` and ``append_many`` return
+    only after their entries are fsynced.  Concurrent writers share fsyncs:
+    whichever thread syncs first covers every entry written before it, so a
+    burst of appends costs one fsync rather than one each.  One process
+    should write a directory at a time.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        segment_bytes: int = 64 << 20,
+        sync: bool = True,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.sync = sync
+        self._write_lock = threading.Lock()
+        self._sync_cond = threading.Condition()
+        self._syncing = False
+        # Entry locations by sequence: (segment number, offset, length).
+        self._spans: list[tuple[int, int, int]] = []
+        self._by_hash: dict[str, int] = {}
+        self._by_receipt: dict[str, int] = {}
+        self._hashes: list[str] = []
+        self._receipts: list[str] = []
+        self._readers: dict[int, int] = {}
+        self._load()
+        self._durable = len(self._spans)
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle                                                            #
+    # ------------------------------------------------------------------ #
+
+    def close(self) -> None:
+        with self._write_lock:
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+            for descriptor in self._readers.values():
+                os.close(descriptor)
+            self._readers.clear()
+
+    def __enter__(self) -> "SegmentedTruthLedger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return (self._read(position) for position in range(len(self._spans)))
+
+    @property
+    def head(self) -> str:
+        return self._hashes[-1] if self._hashes else GENESIS_HASH
+
+    # ------------------------------------------------------------------ #
+    # Appends                                                              #
+    # ------------------------------------------------------------------ #
+
+    def append(self, artifact: Any) -> str:
+        return self.append_many((artifact,))[0]
+
+    def append_many(self, artifacts: Iterable[Any]) -> list[str]:
+        """Append artifacts in order with a single write and fsync per segment."""
+        payloads = [_artifact_payload(artifact) for artifact in artifacts]
+        hashes: list[str] = []
+        with self._write_lock:
+            previous_hash = self.head
+            pending: list[tuple[str, str, bytes]] = []
+            size = self._size
+            for payload in payloads:
+                entry_hash, line = _link(payload, previous_hash)
+                pending.append((entry_hash, _receipt_id(payload), line))
+                hashes.append(entry_hash)
+                previous_hash = entry_hash
+                size += len(line)
+                if size >= self.segment_bytes:
+                    self._write(pending)
+                    self._roll()
+                    pending, size = [], 0
+            if pending:
+                self._write(pending)
+            written = len(self._spans)
+        self._sync_to(written)
+        return hashes
+
+    def _write(self, pending: list[tuple[str, str, bytes]]) -> None:
+        """Write entries to the active segment, then index them."""
+        os.write(self._fd, b"".join(line for _, _, line in pending))
+        offset = self._size
+        for entry_hash, receipt_id, line in pending:
+            self._remember(entry_hash, receipt_id, (self._segment, offset, len(line) - 1))
+            offset += len(line)
+        self._size = offset
+
+    def _sync_to(self, target: int) -> None:
+        """Group commit: return once entries below *target* are fsynced."""
+        if not self.sync:
+            return
+        with self._sync_cond:
+            while self._durable < target:
+                if self._syncing:
+                    self._sync_cond.wait()
+                    continue
+                self._syncing = True
+                with self._write_lock:
+                    goal, descriptor = len(self._spans), os.dup(self._fd)
+                self._sync_cond.release()
+                try:
+                    os.fsync(descriptor)
+                finally:
+                    os.close(descriptor)
+                    self._sync_cond.acquire()
+                    self._syncing = False
+                    self._sync_cond.notify_all()
+                self._durable = max(self._durable, goal)
+
+    def _roll(self) -> None:
+        """Seal the active segment and start the next one."""
+        os.fsync(self._fd)
+        os.close(self._fd)
+        sealed = self._segment
+        index = [
+            [self._hashes[position], self._receipts[position], offset, length]
+            for position, (segment, offset, length) in enumerate(self._spans)
+            if segment == sealed
+        ]
+        sidecar = self._path(sealed, ".idx")
+        temporary = sidecar.with_suffix(".idx.tmp")
+        with open(temporary, "w", encoding="utf-8") as stream:
+            json.dump(index, stream, separators=(",", ":"))
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temporary, sidecar)
+        self._open_segment(sealed + 1)
+
+    # ------------------------------------------------------------------ #
+    # Lookups and verification                                             #
+    # ------------------------------------------------------------------ #
+
+    def get(self, entry_hash: str) -> dict[str, Any] | None:
+        position = self._by_hash.get(entry_hash)
+        return None if position is None else self._read(position)
+
+    def find_receipt(self, receipt_id: str) -> dict[str, Any] | None:
+        position = self._by_receipt.get(receipt_id)
+        return None if position is None else self._read(position)
+
+    def verify_chain(self, since: LedgerCheckpoint | None = None) -> LedgerCheckpoint:
+        """Re-hash entries after *since* from disk; cost is O(new entries)."""
+        since = since or LedgerCheckpoint()
+        length = len(self._spans)
+        _check_checkpoint(since, length, self._hashes.__getitem__)
+        checkpoint = _verify_entries(
+            (self._read(position) for position in range(since.count, length)), since
+        )
+        if checkpoint.entry_hash != (self._hashes[length - 1] if length else GENESIS_HASH):
+            raise ChainIntegrityError("stored entries diverge from the ledger index")
+        return checkpoint
+
+    def _read(self, position: int) -> dict[str, Any]:
+        segment, offset, length = self._spans[position]
+        descriptor = self._readers.get(segment)
+        if descriptor is None:
+            descriptor = self._readers[segment] = os.open(self._path(segment), os.O_RDONLY)
+        return json.loads(os.pread(descriptor, length, offset))
+
+    # ------------------------------------------------------------------ #
+    # Indexing and recovery                                                #
+    # ------------------------------------------------------------------ #
+
+    def _path(self, segment: int, suffix: str = ".jsonl") -> Path:
+        return self.directory / f"segment-{segment:06d}{suffix}"
+
+    def _remember(self, entry_hash: str, receipt_id: str, span: tuple[int, int, int]) -> None:
+        position = len(self._spans)
+        self._spans.append(span)
+        self._hashes.append(entry_hash)
+        self._receipts.append(receipt_id)
+        self._by_hash[entry_hash] = position
+        if receipt_id:
+            self._by_receipt.setdefault(receipt_id, position)
+
+    def _load(self) -> None:
+        segments = sorted(int(path.stem.split("-")[1]) for path in self.directory.glob("segment-*.jsonl"))
+        for segment in segments[:-1]:
+            sidecar = self._path(segment, ".idx")
+            if sidecar.exists():
+                for entry_hash, receipt_id, offset, length in json.loads(sidecar.read_text("utf-8")):
+                    self._remember(entry_hash, receipt_id, (segment, offset, length))
+            else:
+                self._scan(segment)
+        self._open_segment(segments[-1] if segments else 0)
+        if segments:
+            self._size = self._scan(segments[-1])
+            os.ftruncate(self._fd, self._size)
+
+    def _scan(self, segment: int) -> int:
+        """Index a segment's complete lines and return their total size."""
+        data = self._path(segment).read_bytes()
+        offset = 0
+        while True:
+            end = data.find(b"\n", offset)
+            if end < 0:
+                # A torn final line was never acknowledged to a caller.
+                return offset
+            entry = json.loads(data[offset:end])
+            self._remember(entry["entry_hash"], _receipt_id(entry["payload"]), (segment, offset, end - offset))
+            offset = end + 1
+
+    def _open_segment(self, segment: int) -> None:
+        self._segment = segment
+        self._fd = os.open(self._path(segment), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self._size = os.fstat(self._fd).st_size
+# Nonce: 214487
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 from .authority import HumanAPIKey, ScopedAuthority
-from .bridge import tas_openai_execute
-from .ledger import ImmutableTruthLedger
+from .bridge import DEFAULT_MODEL, tas_openai_execute
+from .cache import ConduitResponseCache
+from .conduit import execute_many
+from .ledger import TruthLedger
 from .receipts import ProvenanceReceipt
 from .refusal import RefusalArtifact
 
@@ -24,12 +26,14 @@ class AlgorithmicPolymath:
         human_api_key: HumanAPIKey | None,
         scoped_authority: ScopedAuthority | None,
         lineage_anchor: str | None,
-        ledger: ImmutableTruthLedger,
+        ledger: TruthLedger,
+        cache: ConduitResponseCache | None = None,
     ):
         self.human_api_key = human_api_key
         self.scoped_authority = scoped_authority
         self.lineage_anchor = lineage_anchor
         self.ledger = ledger
+        self.cache = cache
 
     def execute(
         self, prompt: str, *, client: Any | None = None, model: str = "gpt-5.5"
@@ -51,6 +55,7 @@ class AlgorithmicPolymath:
                 prompt=prompt,
                 client=client,
                 model=model,
+                cache=self.cache,
             )
 
             try:
@@ -68,4 +73,60 @@ class AlgorithmicPolymath:
                 reason="Unhandled runtime exception escaped into Polymath",
                 details={"error": str(exc)},
             )
-# Nonce: 140535
+
+    async def execute_many(
+        self,
+        prompts: Iterable[str],
+        *,
+        client: Any | None = None,
+        model: str = DEFAULT_MODEL,
+        concurrency: int = 16,
+        timeout: float = 60.0,
+        retries: int = 2,
+    ) -> list[ProvenanceReceipt | RefusalArtifact]:
+        """Execute prompts concurrently and record their results with one ledger batch."""
+        prompts = list(prompts)
+        try:
+            if not self.human_api_key or not self.human_api_key.validate():
+                return [RefusalArtifact(reason="Missing or invalid HumanAPI Key") for _ in prompts]
+
+            if not self.scoped_authority or not self.scoped_authority.active:
+                return [RefusalArtifact(reason="Missing or inactive scoped authority") for _ in prompts]
+
+            if not self.lineage_anchor or not self.lineage_anchor.strip():
+                return [RefusalArtifact(reason="Missing lineage anchor") for _ in prompts]
+
+            results = await execute_many(
+                self.human_api_key,
+                self.scoped_authority,
+                prompts,
+                client=client,
+                model=model,
+                concurrency=concurrency,
+                timeout=timeout,
+                retries=retries,
+                cache=self.cache,
+            )
+
+            try:
+                self.ledger.append_many(results)
+            except Exception as exc:
+                return [
+                    RefusalArtifact(
+                        reason="Receipt-path failure",
+                        details={"stage": "ledger.append_many", "error": str(exc)},
+                    )
+                    for _ in prompts
+                ]
+
+            return results
+
+        except Exception as exc:
+            return [
+                RefusalArtifact(
+                    reason="Unhandled runtime exception escaped into Polymath",
+                    details={"error": str(exc)},
+                )
+                for _ in prompts
+            ]
+# Nonce: 28532
@@ -33,6 +33,10 @@ class ProvenanceReceipt:
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
     receipt_id: str = ""
+    # Set only when a conduit cache was enabled: whether the candidate came
+    # from it.  Omitted from the payload otherwise, so receipt ids issued
+    # without a cache are unchanged.
+    cache_hit: bool | None = None
 
     @classmethod
     def from_response(
@@ -41,6 +45,7 @@ class ProvenanceReceipt:
         human_api_key: Any,
         scoped_authority: Any,
         gate_result: Any,
+        cache_hit: bool | None = None,
     ) -> "ProvenanceReceipt":
         candidate = gate_result.candidate
         candidate_dict = candidate.to_dict()
@@ -57,11 +62,12 @@ class ProvenanceReceipt:
             model=model,
             gate=gate_result.gate,
             admissible=True,
+            cache_hit=cache_hit,
         )
         return receipt.with_receipt_id()
 
     def _payload_without_receipt_id(self) -> dict[str, Any]:
-        return {
+        payload: dict[str, Any] = {
             "receipt_type": self.receipt_type,
             "schema_version": self.schema_version,
             "human_authority": self.human_authority,
@@ -74,6 +80,9 @@ class ProvenanceReceipt:
             "admissible": self.admissible,
             "timestamp": self.timestamp,
         }
+        if self.cache_hit is not None:
+            payload["cache_hit"] = self.cache_hit
+        return payload
 
     def with_receipt_id(self) -> "ProvenanceReceipt":
         payload = self._payload_without_receipt_id()
@@ -83,4 +92,4 @@ class ProvenanceReceipt:
         payload = self._payload_without_receipt_id()
         payload["receipt_id"] = self.receipt_id
         return payload
-# Nonce: 66050
+# Nonce: 168644
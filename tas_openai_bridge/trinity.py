@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+import heapq
+import os
 import re
+from typing import Callable, Iterable, Sequence
 
 
 TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
@@ -25,6 +29,19 @@ def _jaccard_distance(left: tuple[str, ...], right: tuple[str, ...]) -> float:
     return 1.0 - similarity
 
 
+def _jaccard_distances(
+    pairs: Sequence[tuple[tuple[str, ...], tuple[str, ...]]],
+) -> list[float]:
+    """Batch form of ``_jaccard_distance`` over (left, right) focus vectors."""
+    distances = []
+    append = distances.append
+    for left, right in pairs:
+        left_set = set(left)
+        union = left_set.union(right)
+        append(1.0 - len(left_set.intersection(right)) / len(union) if union else 0.0)
+    return distances
+
+
 @dataclass(frozen=True)
 class ArchetypeAnalysis:
     archetype: str
@@ -58,10 +75,12 @@ class OctopusArchetype:
     """Deep-pattern archetype focused on stable, recurring structure."""
 
     def analyze(self, query: str) -> ArchetypeAnalysis:
-        tokens = _tokenize(query)
-        counts = Counter(tokens)
-        ranked = [token for token, _ in counts.most_common(6)]
-        focus = tuple(ranked[:3])
+        return self.analyze_counts(Counter(_tokenize(query)))
+
+    def analyze_counts(self, counts: Counter[str]) -> ArchetypeAnalysis:
+        """Analyze pre-tokenized counts; ``analyze`` tokenizes and delegates here."""
+        # most_common(n) is a prefix of most_common(6); only the top 3 are used.
+        focus = tuple(token for token, _ in counts.most_common(3))
         if not focus:
             focus = ("signal",)
         summary = "Pattern map: " + ", ".join(focus)
@@ -77,10 +96,13 @@ class RaccoonArchetype:
     """Exploratory archetype focused on edge hypotheses and curiosity paths."""
 
     def analyze(self, query: str) -> ArchetypeAnalysis:
-        tokens = _tokenize(query)
-        counts = Counter(tokens)
-        ascending = sorted(counts.items(), key=lambda item: (item[1], item[0]))
-        focus = tuple(token for token, _ in ascending[:3])
+        return self.analyze_counts(Counter(_tokenize(query)))
+
+    def analyze_counts(self, counts: Counter[str]) -> ArchetypeAnalysis:
+        """Analyze pre-tokenized counts; ``analyze`` tokenizes and delegates here."""
+        # nsmallest(3, ...) equals sorted(...)[:3] without sorting every token.
+        ascending = heapq.nsmallest(3, counts.items(), key=lambda item: (item[1], item[0]))
+        focus = tuple(token for token, _ in ascending)
         if not focus:
             focus = ("hypothesis",)
         summary = "Curiosity probes: " + ", ".join(focus)
@@ -106,6 +128,36 @@ class SemanticRouter:
     def route(self, query: str) -> tuple[ArchetypeAnalysis, ArchetypeAnalysis]:
         return self.octopus.analyze(query), self.raccoon.analyze(query)
 
+    def route_many(
+        self, queries: Iterable[str]
+    ) -> list[tuple[ArchetypeAnalysis, ArchetypeAnalysis]]:
+        """Route queries, tokenizing each once and sharing its counts.
+
+        An archetype that overrides ``analyze`` is called with the raw query
+        instead, so batch routing always matches ``route``.
+        """
+        octopus = _counts_analyzer(self.octopus, OctopusArchetype)
+        raccoon = _counts_analyzer(self.raccoon, RaccoonArchetype)
+        routed = []
+        for query in queries:
+            counts = Counter(_tokenize(query)) if octopus or raccoon else None
+            routed.append(
+                (
+                    octopus(counts) if octopus else self.octopus.analyze(query),
+                    raccoon(counts) if raccoon else self.raccoon.analyze(query),
+                )
+            )
+        return routed
+
+
+def _counts_analyzer(
+    archetype: object, base: type
+) -> Callable[[Counter[str]], ArchetypeAnalysis] | None:
+    """Return ``analyze_counts`` when *archetype* keeps the stock ``analyze``."""
+    if isinstance(archetype, base) and type(archetype).analyze is base.analyze:
+        return archetype.analyze_counts
+    return None
+
 
 class TrinityEngine:
     """Sovereign n+1 reasoning layer with π-staple safety reconciliation."""
@@ -122,17 +174,64 @@ class TrinityEngine:
         octopus, raccoon = self.router.route(query)
         return self.reconcile(octopus, raccoon)
 
+    def execute_many(
+        self,
+        queries: Iterable[str],
+        *,
+        jobs: int = 1,
+        chunk_size: int = 2048,
+    ) -> list[TrinityResult]:
+        """Batch ``execute``: results equal ``[execute(q) for q in queries]``.
+
+        Each query is tokenized once for both archetypes and the batch's
+        divergences are computed together.  With ``jobs > 1`` (``0`` for one
+        per CPU) chunks of ``chunk_size`` queries run in worker processes;
+        the engine must then be picklable.
+        """
+        queries = list(queries)
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1 or len(queries) <= chunk_size:
+            return self._execute_chunk(queries)
+        chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+        with ProcessPoolExecutor(jobs) as pool:
+            return [
+                result
+                for chunk_results in pool.map(self._execute_chunk, chunks)
+                for result in chunk_results
+            ]
+
+    def _execute_chunk(self, queries: Sequence[str]) -> list[TrinityResult]:
+        return self.reconcile_many(self.router.route_many(queries))
+
     def reconcile(
         self,
         octopus: ArchetypeAnalysis,
         raccoon: ArchetypeAnalysis,
     ) -> TrinityResult:
-        if octopus.archetype != "octopus":
-            raise ValueError("Expected octopus analysis for first perspective")
-        if raccoon.archetype != "raccoon":
-            raise ValueError("Expected raccoon analysis for second perspective")
-
+        _check_archetypes(octopus, raccoon)
         divergence = _jaccard_distance(octopus.focus_vector, raccoon.focus_vector)
+        return self._reconcile(octopus, raccoon, divergence)
+
+    def reconcile_many(
+        self, pairs: Sequence[tuple[ArchetypeAnalysis, ArchetypeAnalysis]]
+    ) -> list[TrinityResult]:
+        """Reconcile many analysis pairs with one batch divergence pass."""
+        for octopus, raccoon in pairs:
+            _check_archetypes(octopus, raccoon)
+        divergences = _jaccard_distances(
+            [(octopus.focus_vector, raccoon.focus_vector) for octopus, raccoon in pairs]
+        )
+        return [
+            self._reconcile(octopus, raccoon, divergence)
+            for (octopus, raccoon), divergence in zip(pairs, divergences)
+        ]
+
+    def _reconcile(
+        self,
+        octopus: ArchetypeAnalysis,
+        raccoon: ArchetypeAnalysis,
+        divergence: float,
+    ) -> TrinityResult:
         triggered = divergence > self.safety_envelope.pi_staple_max_divergence
         if triggered:
             reason = (
@@ -163,4 +262,11 @@ class TrinityEngine:
             singularity=event,
             balanced_response=balance,
         )
-# Nonce: 47171
+
+
+def _check_archetypes(octopus: ArchetypeAnalysis, raccoon: ArchetypeAnalysis) -> None:
+    if octopus.archetype != "octopus":
+        raise ValueError("Expected octopus analysis for first perspective")
+    if raccoon.archetype != "raccoon":
+        raise ValueError("Expected raccoon analysis for second perspective")
+# Nonce: 35520
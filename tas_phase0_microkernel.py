@@ -15,10 +15,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from hashlib import sha256
-import hmac
 import json
 from typing import Any, Dict, Tuple
 
+from tas_keyed_mac import KeyedMAC
+
 PHASE = "PHASE_0_MICRO_KERNEL_BOOT"
 MINIMUM_COHERENCE = 1.0
 BOOT_STATUS = "BOOTSTRAP_LOCKED"
@@ -124,13 +125,24 @@ def digest_payload(payload: Dict[str, Any]) -> str:
     return sha256(canonical_json_bytes(payload)).hexdigest()
 
 
-def sign_payload(payload: Dict[str, Any], signing_key: str) -> str:
+def sign_payload(payload: Dict[str, Any], signing_key: str | KeyedMAC) -> str:
     """Reference HMAC signature.
 
     Prototype note: replace this with a secure element, HSM, TPM-backed key, or
     verifier-held asymmetric key before claiming hardware-backed signatures.
     """
-    return hmac.new(signing_key.encode("utf-8"), canonical_json_bytes(payload), sha256).hexdigest()
+    return payload_mac(signing_key).hexdigest(canonical_json_bytes(payload))
+
+
+def payload_mac(signing_key: str | KeyedMAC) -> KeyedMAC:
+    """Return the HMAC context for *signing_key*.
+
+    Whoever owns a signing key should hold this context and pass it wherever
+    a key is accepted, so the key is set up once rather than per message.
+    """
+    if isinstance(signing_key, KeyedMAC):
+        return signing_key
+    return KeyedMAC(signing_key.encode("utf-8"))
 
 
 def boot_microkernel(manifest: Phase0Manifest) -> Dict[str, Any]:
@@ -159,7 +171,7 @@ def boot_microkernel(manifest: Phase0Manifest) -> Dict[str, Any]:
 def verify_action(
     proposal: ActionProposal,
     policy: VerificationPolicy,
-    signing_key: str,
+    signing_key: str | KeyedMAC,
     token_ttl_seconds: int = 30,
 ) -> Dict[str, Any]:
     """Issue a signed one-shot token or a signed refusal receipt.
@@ -180,6 +192,7 @@ def verify_action(
         "snapshot_id": proposal.snapshot_id,
     }
     proposal_digest = digest_payload(proposal_payload)
+    mac = payload_mac(signing_key)
 
     refusal_reason = None
     if proposal.action not in policy.allowed_actions:
@@ -211,7 +224,7 @@ def verify_action(
             "actuation_token": None,
         }
         receipt["receipt_hash"] = digest_payload(receipt)
-        receipt["signature"] = sign_payload(receipt, signing_key)
+        receipt["signature"] = mac.hexdigest(canonical_json_bytes(receipt))
         return receipt
 
     token = {
@@ -224,7 +237,7 @@ def verify_action(
         "one_shot": True,
     }
     token["token_hash"] = digest_payload(token)
-    token["signature"] = sign_payload(token, signing_key)
+    token["signature"] = mac.hexdigest(canonical_json_bytes(token))
 
     receipt = {
         **base_receipt,
@@ -232,11 +245,13 @@ def verify_action(
         "actuation_token": token,
     }
     receipt["receipt_hash"] = digest_payload(receipt)
-    receipt["signature"] = sign_payload(receipt, signing_key)
+    receipt["signature"] = mac.hexdigest(canonical_json_bytes(receipt))
     return receipt
 
 
-def guard_accepts_token(token: Dict[str, Any] | None, signing_key: str, used_counters: set[int]) -> bool:
+def guard_accepts_token(
+    token: Dict[str, Any] | None, signing_key: str | KeyedMAC, used_counters: set[int]
+) -> bool:
     """Reference external guard check for signed one-shot tokens."""
     if not token:
         return False
@@ -259,7 +274,7 @@ def guard_accepts_token(token: Dict[str, Any] | None, signing_key: str, used_cou
     # Optimization: Using .copy() is significantly faster than dict() for shallow dictionary copies.
     unsigned = token.copy()
     unsigned.pop("signature", None)
-    if signature != sign_payload(unsigned, signing_key):
+    if not payload_mac(signing_key).verify(signature, canonical_json_bytes(unsigned)):
         return False
 
     used_counters.add(counter)
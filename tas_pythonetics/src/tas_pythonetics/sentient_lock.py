@@ -8,6 +8,11 @@ import uuid
 import json
 import math
 
+try:
+    from tas_keyed_mac import KeyedMAC
+except ImportError:  # standalone tas_pythonetics install
+    KeyedMAC = None
+
 @dataclass
 class RefusalArtifact:
     reason: str
@@ -76,13 +81,31 @@ class StructuralIntegrityError(Exception):
     pass
 
 class DilithiumSigner:
-    """Mock implementation for PQC CRYSTALS-Dilithium signature scheme."""
-    @staticmethod
-    def sign(key: bytes, message: bytes) -> str:
+    """Mock implementation for PQC CRYSTALS-Dilithium signature scheme.
+
+    An instance keys its MAC context once; the owner of the key holds it.
+    """
+
+    __slots__ = ("_mac", "_prototype")
+
+    def __init__(self, key: bytes):
+        if KeyedMAC is not None:
+            self._mac, self._prototype = KeyedMAC(key), None
+        else:
+            self._mac, self._prototype = None, hmac.new(key, digestmod=hashlib.sha256)
+
+    def sign_message(self, message: bytes) -> str:
         # In a real implementation this would use FIPS 204 Dilithium.
         # Here we mock it by appending '-dilithium' to an HMAC.
-        base_hmac = hmac.new(key, message, hashlib.sha256).hexdigest()
-        return f"{base_hmac}-dilithium"
+        if self._mac is not None:
+            return f"{self._mac.hexdigest(message)}-dilithium"
+        mac = self._prototype.copy()
+        mac.update(message)
+        return f"{mac.hexdigest()}-dilithium"
+
+    @staticmethod
+    def sign(key: bytes, message: bytes) -> str:
+        return DilithiumSigner(key).sign_message(message)
 
 class SentientLock:
     # Golden Ratio Minimum Threshold for Coherence Curve Tracking
@@ -97,6 +120,7 @@ class SentientLock:
         """
         self.genesis_root = genesis_root
         self.human_sig = human_sig
+        self._lineage_signer: Tuple[str, DilithiumSigner] | None = None
         self.refusal_ledger: list[RefusalArtifact] = []
 
     def verify_triple(self, node: Dict[str, Any], parent_lineage_hash: str) -> bool:
@@ -148,9 +172,7 @@ class SentientLock:
             # Anchor current node and parent lineage back to the Genesis Root (K_0)
             # using PQC Dilithium instead of standard HMAC-SHA256
             lineage_payload = f"{node['hash']}:{parent_lineage_hash}"
-            hmac_key = self.genesis_root.encode('utf-8')
-
-            calculated_lineage = DilithiumSigner.sign(hmac_key, lineage_payload.encode('utf-8'))
+            calculated_lineage = self._signer().sign_message(lineage_payload.encode('utf-8'))
 
             if calculated_lineage != node.get("lineage_hash"):
                 raise StructuralIntegrityError(
@@ -166,6 +188,14 @@ class SentientLock:
             self._engage_scorch_semantics(node, str(error))
             return False
 
+    def _signer(self) -> DilithiumSigner:
+        # Keyed once per genesis root; rebuilt if the root is reassigned.
+        cached = self._lineage_signer
+        if cached is None or cached[0] != self.genesis_root:
+            cached = (self.genesis_root, DilithiumSigner(self.genesis_root.encode('utf-8')))
+            self._lineage_signer = cached
+        return cached[1]
+
     def _engage_scorch_semantics(self, faulty_node: Dict[str, Any], error_message: str):
         """
         The Interception Mechanism: Phoenix Rollup Protocol & Scorch Semantics.
@@ -256,4 +286,4 @@ def verify_kinematic_identity(data: str, signature: str = TAS_HUMAN_SIG) -> bool
 
     logger.info("Kinematic Identity Verified: Mathematical Resonance Confirmed.")
     return True
-# Nonce: 156236
+# Nonce: 14633
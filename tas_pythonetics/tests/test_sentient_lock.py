@@ -35,6 +35,20 @@ class TestSentientLock(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(len(self.lock.refusal_ledger), 0)
 
+    def test_lineage_signer_is_keyed_once_per_genesis_root(self):
+        key = self.genesis_root.encode('utf-8')
+        expected = hmac.new(key, b"payload", hashlib.sha256).hexdigest() + "-dilithium"
+        self.assertEqual(DilithiumSigner(key).sign_message(b"payload"), expected)
+
+        self.assertTrue(self.lock.verify_triple(self.valid_node.copy(), self.parent_hash))
+        signer = self.lock._signer()
+        self.assertTrue(self.lock.verify_triple(self.valid_node.copy(), self.parent_hash))
+        self.assertIs(self.lock._signer(), signer)
+
+        self.lock.genesis_root = "ROTATED_ROOT"
+        self.assertIsNot(self.lock._signer(), signer)
+        self.assertFalse(self.lock.verify_triple(self.valid_node.copy(), self.parent_hash))
+
     def test_verify_triple_fail_form(self):
         faulty_node = self.valid_node.copy()
         faulty_node["hash"] = "invalid_hash"
@@ -118,4 +132,4 @@ class TestSentientLock(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
-# Nonce: 147028
+# Nonce: 80064
@@ -5,6 +5,7 @@ import logging
 from datetime import datetime, timezone
 import uuid
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Logging configuration
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -12,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 TAS_META_EXT = ".tasmeta.json"
 TAS_HUMAN_SIG = "Russell Nordland" # Default seed if none provided
+IGNORED_DIRS = {".git", "__pycache__", ".venv", ".idea", ".vscode", "tas_tools"}
 
 def calculate_sha256(filepath):
     """
@@ -30,34 +32,28 @@ def calculate_sha256(filepath):
         logger.error(f"Error reading file {filepath}: {e}")
         return None
 
-def sequence_artifact(filepath, h_seed=TAS_HUMAN_SIG, genome_id="TAS_GENOME_V1"):
+def _read_previous_lineage(meta_path):
     """
-    Perform the Sequencing Ceremony on a file.
-    Generates a .tasmeta.json file.
+    Return the lineage_id recorded in an existing sidecar, if any.
     """
-    if not os.path.exists(filepath):
-        logger.error(f"File not found: {filepath}")
-        return False
-
-    form_id = calculate_sha256(filepath)
-    if not form_id:
-        return False
-
-    # Check for previous lineage
-    meta_path = filepath + TAS_META_EXT
-    previous_lineage = None
-    if os.path.exists(meta_path):
-        try:
-            with open(meta_path, 'r') as f:
-                old_meta = json.load(f)
-                previous_lineage = old_meta.get("lineage_id")
-                # If we are re-sequencing, we might want to grab the *current* lineage ID
-                # to be the *parent* of the new one.
-                # In this simple model, we just hash it into the new one.
-                logger.info(f"Found previous lineage: {previous_lineage}")
-        except:
-            pass
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, 'r') as f:
+            old_meta = json.load(f)
+            previous_lineage = old_meta.get("lineage_id")
+            # If we are re-sequencing, we might want to grab the *current* lineage ID
+            # to be the *parent* of the new one.
+            # In this simple model, we just hash it into the new one.
+            logger.info(f"Found previous lineage: {previous_lineage}")
+            return previous_lineage
+    except:
+        return None
 
+def _build_metadata(form_id, previous_lineage, h_seed, genome_id):
+    """
+    Build the sidecar metadata for one sequencing of an artifact.
+    """
     # Generate Lineage ID
     # Lineage = H(Form + PrevLineage + Seed + Timestamp)
     timestamp = datetime.now(timezone.utc).isoformat()
@@ -67,7 +63,7 @@ def sequence_artifact(filepath, h_seed=TAS_HUMAN_SIG, genome_id="TAS_GENOME_V1")
     # Generate Cert ID (UUID for this specific issuance)
     cert_id = str(uuid.uuid4())
 
-    meta = {
+    return {
         "id": lineage_id, # Lineage ID serves as the version ID
         "type": "TasArtifact",
         "form_id": form_id,
@@ -86,18 +82,139 @@ def sequence_artifact(filepath, h_seed=TAS_HUMAN_SIG, genome_id="TAS_GENOME_V1")
         ]
     }
 
+def sequence_artifact(filepath, h_seed=TAS_HUMAN_SIG, genome_id="TAS_GENOME_V1"):
+    """
+    Perform the Sequencing Ceremony on a file.
+    Generates a .tasmeta.json file.
+    """
+    if not os.path.exists(filepath):
+        logger.error(f"File not found: {filepath}")
+        return False
+
+    form_id = calculate_sha256(filepath)
+    if not form_id:
+        return False
+
+    # Check for previous lineage
+    meta_path = filepath + TAS_META_EXT
+    previous_lineage = _read_previous_lineage(meta_path)
+    meta = _build_metadata(form_id, previous_lineage, h_seed, genome_id)
+
     try:
         with open(meta_path, 'w') as f:
             json.dump(meta, f, indent=2)
         print(f"Sequencing complete for {filepath}")
         print(f"  Form ID: {form_id}")
-        print(f"  Lineage ID: {lineage_id}")
-        print(f"  Cert ID: {cert_id}")
+        print(f"  Lineage ID: {meta['lineage_id']}")
+        print(f"  Cert ID: {meta['cert_id']}")
         return True
     except Exception as e:
         logger.error(f"Failed to write metadata: {e}")
         return False
 
+def _iter_artifact_paths(root_dir):
+    # Mirrors the shadow scan walk so a sequenced tree scans clean
+    for root, dirs, files in os.walk(root_dir):
+        dirs[:] = sorted(d for d in dirs if d not in IGNORED_DIRS)
+        for filename in sorted(files):
+            if filename.endswith(TAS_META_EXT) or filename.startswith("."):
+                continue
+            yield os.path.join(root, filename)
+
+def _prepare_artifact(filepath, h_seed, genome_id):
+    form_id = calculate_sha256(filepath)
+    if not form_id:
+        return None
+    previous_lineage = _read_previous_lineage(filepath + TAS_META_EXT)
+    return previous_lineage, _build_metadata(form_id, previous_lineage, h_seed, genome_id)
+
+def _write_sidecar_batch(batch):
+    """
+    Atomically write a batch of (filepath, meta) sidecars.
+
+    Every sidecar is written and fsynced to a temporary file before any of
+    them is renamed into place, so a crash never leaves a truncated sidecar.
+    Returns the list of (filepath, error) failures.
+    """
+    staged = []
+    failures = []
+    for filepath, meta in batch:
+        meta_path = filepath + TAS_META_EXT
+        tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(meta, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            staged.append((filepath, tmp_path, meta_path))
+        except Exception as e:
+            failures.append((filepath, str(e)))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    for filepath, tmp_path, meta_path in staged:
+        try:
+            os.replace(tmp_path, meta_path)
+        except Exception as e:
+            failures.append((filepath, str(e)))
+    return failures
+
+def sequence_tree(root_dir, h_seed=TAS_HUMAN_SIG, genome_id="TAS_GENOME_V1", jobs=1, batch_size=256, manifest_path=None):
+    """
+    Perform the Sequencing Ceremony on every artifact under root_dir.
+
+    Files are hashed on a pool of ``jobs`` threads and each sidecar's
+    lineage is derived exactly as in sequence_artifact, chaining from the
+    previous sidecar if present. Sidecars are written atomically in batches
+    of ``batch_size``. Returns a summary manifest, also written to
+    ``manifest_path`` when given.
+    """
+    manifest = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "root": root_dir,
+        "h_seed": h_seed,
+        "genome_id": genome_id,
+        "artifacts": [],
+        "errors": []
+    }
+
+    paths = list(_iter_artifact_paths(root_dir))
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        prepared = pool.map(lambda path: _prepare_artifact(path, h_seed, genome_id), paths)
+
+        batch = []
+        for filepath, result in zip(paths, prepared):
+            if result is None:
+                manifest["errors"].append({"path": filepath, "error": "Could not hash file"})
+                continue
+            previous_lineage, meta = result
+            batch.append((filepath, meta))
+            manifest["artifacts"].append({
+                "path": filepath,
+                "form_id": meta["form_id"],
+                "lineage_id": meta["lineage_id"],
+                "previous_lineage": previous_lineage,
+                "cert_id": meta["cert_id"]
+            })
+            if len(batch) >= batch_size:
+                failures = _write_sidecar_batch(batch)
+                manifest["errors"].extend({"path": path, "error": error} for path, error in failures)
+                batch = []
+        if batch:
+            failures = _write_sidecar_batch(batch)
+            manifest["errors"].extend({"path": path, "error": error} for path, error in failures)
+
+    if manifest["errors"]:
+        failed = {error["path"] for error in manifest["errors"]}
+        manifest["artifacts"] = [
+            item for item in manifest["artifacts"] if item["path"] not in failed
+        ]
+
+    if manifest_path:
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    return manifest
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python tas_sequencer.py <filepath> [h_seed] [genome_id]")
@@ -108,4 +225,4 @@ if __name__ == "__main__":
     genome_id = sys.argv[3] if len(sys.argv) > 3 else "TAS_GENOME_V1"
 
     sequence_artifact(filepath, h_seed, genome_id)
-# Nonce: 20970
+# Nonce: 132573
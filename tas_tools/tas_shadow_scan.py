@@ -2,6 +2,9 @@ import os
 import hashlib
 import json
 import logging
+import mmap
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 
 # Logging configuration
@@ -11,13 +14,30 @@ logger = logging.getLogger(__name__)
 TAS_META_EXT = ".tasmeta.json"
 IGNORED_DIRS = {".git", "__pycache__", ".venv", ".idea", ".vscode", "tas_tools"} # Basic ignores
 
+# Incremental scan cache: (path, inode, size, mtime_ns) -> form_id, plus the
+# sidecar's (inode, size, mtime_ns) and the classification it produced
+SCAN_CACHE_FILENAME = ".tas_scan_cache.json"
+SCAN_CACHE_VERSION = 2
+
+# Hashing futures allowed in flight per worker before the walk waits on one
+IN_FLIGHT_PER_JOB = 4
+
+# Files at or above this size are hashed through mmap in a single update call
+MMAP_THRESHOLD = 1 << 20
+
 def calculate_sha256(filepath):
     """
     Compute SHA-256 hash of file content.
+    Large files are mapped into memory so hashlib can digest them in one
+    GIL-free call.
     """
     sha256 = hashlib.sha256()
     try:
         with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    sha256.update(mapped)
+                return sha256.hexdigest()
             while True:
                 data = f.read(65536)
                 if not data:
@@ -28,17 +48,82 @@ def calculate_sha256(filepath):
         logger.error(f"Error reading file {filepath}: {e}")
         return None
 
-def scan_repository(root_dir):
+class ScanCache:
     """
-    Walk the repository and classify artifacts.
+    Persistent form_id cache for incremental shadow scans.
+
+    Entries are keyed by the path relative to the scan root and are only
+    trusted while the file's (inode, size, mtime_ns) fingerprint is unchanged.
+    The classification is additionally tied to the sidecar's fingerprint, so
+    an unchanged file/sidecar pair is reported without re-reading the sidecar.
+    Entries not seen during the current scan are dropped on save.
     """
-    report = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "living_braid": [],
-        "noise": [],
-        "errors": []
-    }
 
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self._previous = {}
+        self._current = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") == SCAN_CACHE_VERSION and isinstance(data.get("entries"), dict):
+                self._previous = data["entries"]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable scan cache {self.cache_path}: {e}")
+
+    def lookup(self, key, fingerprint):
+        entry = self._previous.get(key)
+        if entry is not None and entry[:3] == fingerprint:
+            return entry[3]
+        return None
+
+    def lookup_verdict(self, key, fingerprint, meta_fingerprint):
+        """
+        Return the cached (bucket, details) for an unchanged file/sidecar
+        pair, or None. ``meta_fingerprint`` is None for a missing sidecar.
+        """
+        entry = self._previous.get(key)
+        if entry is not None and len(entry) == 7 and entry[:3] == fingerprint and entry[4] == meta_fingerprint:
+            return entry[5], entry[6]
+        return None
+
+    def store(self, key, fingerprint, form_id, meta_fingerprint=None, verdict=None):
+        if verdict is None:
+            self._current[key] = [*fingerprint, form_id]
+        else:
+            self._current[key] = [*fingerprint, form_id, meta_fingerprint, *verdict]
+
+    def save(self, started_ns):
+        """
+        Atomically persist the entries observed in this scan.
+
+        Files modified at or after ``started_ns`` are not cached: a write in the
+        same mtime tick as the hash would otherwise go unnoticed next run. The
+        same applies to a sidecar, whose verdict alone is dropped.
+        """
+        entries = {}
+        for key, entry in self._current.items():
+            if entry[2] >= started_ns:
+                continue
+            if len(entry) > 4 and entry[4] is not None and entry[4][2] >= started_ns:
+                entry = entry[:4]
+            entries[key] = entry
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({"version": SCAN_CACHE_VERSION, "entries": entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.error(f"Failed to write scan cache {self.cache_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+def _iter_artifact_paths(root_dir):
     for root, dirs, files in os.walk(root_dir):
         # Filter ignored directories
         dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
@@ -51,38 +136,141 @@ def scan_repository(root_dir):
             if filename.startswith("."):
                 continue
 
-            filepath = os.path.join(root, filename)
-            meta_path = filepath + TAS_META_EXT
+            yield os.path.join(root, filename)
 
-            form_id = calculate_sha256(filepath)
-            if not form_id:
-                # If we can't read/hash it, skip
-                continue
+def _sidecar_fingerprint(filepath):
+    """(inode, size, mtime_ns) of the artifact's sidecar, or None if missing."""
+    try:
+        st = os.stat(filepath + TAS_META_EXT)
+    except OSError:
+        return None
+    return [st.st_ino, st.st_size, st.st_mtime_ns]
+
+def _classify(filepath, form_id):
+    """
+    Compare a hashed artifact against its sidecar.
+    Returns the report bucket name and the artifact entry.
+    """
+    meta_path = filepath + TAS_META_EXT
+    artifact_info = {
+        "path": filepath,
+        "form_id": form_id
+    }
 
-            artifact_info = {
-                "path": filepath,
-                "form_id": form_id
-            }
+    if os.path.exists(meta_path):
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
 
-            if os.path.exists(meta_path):
+            # Basic validation: check if form_id matches
+            if meta.get("form_id") == form_id:
+                artifact_info["meta"] = meta
+                return "living_braid", artifact_info
+            artifact_info["error"] = "Form ID mismatch (file changed since sequencing)"
+            return "noise", artifact_info
+
+        except Exception as e:
+            artifact_info["error"] = f"Invalid metadata: {e}"
+            return "noise", artifact_info
+
+    artifact_info["error"] = "Missing metadata"
+    return "noise", artifact_info
+
+def _classify_cached(filepath, form_id, cache, key, fingerprint):
+    """
+    _classify, reusing the cached verdict while neither the artifact nor its
+    sidecar has changed.
+    """
+    if cache is None:
+        return _classify(filepath, form_id)
+    meta_fingerprint = _sidecar_fingerprint(filepath)
+    verdict = cache.lookup_verdict(key, fingerprint, meta_fingerprint)
+    if verdict is not None:
+        bucket, details = verdict
+        artifact_info = {"path": filepath, "form_id": form_id, **details}
+    else:
+        bucket, artifact_info = _classify(filepath, form_id)
+        details = {k: artifact_info[k] for k in ("meta", "error") if k in artifact_info}
+    cache.store(key, fingerprint, form_id, meta_fingerprint, [bucket, details])
+    return bucket, artifact_info
+
+def iter_scan(root_dir, jobs=1, cache=None):
+    """
+    Classify artifacts under root_dir, yielding results as they complete.
+
+    Yields (index, bucket, artifact_info) tuples, where index is the file's
+    position in walk order. Files whose fingerprint matches ``cache`` are
+    yielded immediately; the rest are hashed on a pool of ``jobs`` threads,
+    with at most IN_FLIGHT_PER_JOB * jobs hashes outstanding while walking.
+    """
+    workers = max(1, jobs)
+    max_in_flight = IN_FLIGHT_PER_JOB * workers
+    pending = {}
+
+    def finish(future):
+        index, filepath, key, fingerprint = pending.pop(future)
+        form_id = future.result()
+        if not form_id:
+            # If we can't read/hash it, skip
+            return None
+        return (index, *_classify_cached(filepath, form_id, cache, key, fingerprint))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index, filepath in enumerate(_iter_artifact_paths(root_dir)):
+            key = os.path.relpath(filepath, root_dir)
+            fingerprint = None
+            if cache is not None:
                 try:
-                    with open(meta_path, 'r') as f:
-                        meta = json.load(f)
-
-                    # Basic validation: check if form_id matches
-                    if meta.get("form_id") == form_id:
-                        artifact_info["meta"] = meta
-                        report["living_braid"].append(artifact_info)
-                    else:
-                        artifact_info["error"] = "Form ID mismatch (file changed since sequencing)"
-                        report["noise"].append(artifact_info)
-
-                except Exception as e:
-                    artifact_info["error"] = f"Invalid metadata: {e}"
-                    report["noise"].append(artifact_info)
-            else:
-                artifact_info["error"] = "Missing metadata"
-                report["noise"].append(artifact_info)
+                    st = os.stat(filepath)
+                except OSError as e:
+                    logger.error(f"Error reading file {filepath}: {e}")
+                    continue
+                fingerprint = [st.st_ino, st.st_size, st.st_mtime_ns]
+                form_id = cache.lookup(key, fingerprint)
+                if form_id is not None:
+                    yield (index, *_classify_cached(filepath, form_id, cache, key, fingerprint))
+                    continue
+            pending[pool.submit(calculate_sha256, filepath)] = (index, filepath, key, fingerprint)
+
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = finish(future)
+                    if result is not None:
+                        yield result
+
+        for future in as_completed(list(pending)):
+            result = finish(future)
+            if result is not None:
+                yield result
+
+def scan_repository(root_dir, incremental=False, jobs=1, cache_path=None):
+    """
+    Walk the repository and classify artifacts.
+
+    With ``incremental`` set, form_ids are reused from the scan cache
+    (default: ``<root_dir>/.tas_scan_cache.json``) for files whose inode,
+    size and mtime are unchanged. The report is identical either way.
+    """
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "living_braid": [],
+        "noise": [],
+        "errors": []
+    }
+
+    cache = None
+    started_ns = time.time_ns()
+    if incremental:
+        cache = ScanCache(cache_path or os.path.join(root_dir, SCAN_CACHE_FILENAME))
+
+    # Restore walk order so output does not depend on completion order
+    results = sorted(iter_scan(root_dir, jobs=jobs, cache=cache), key=lambda result: result[0])
+    for _, bucket, artifact_info in results:
+        report[bucket].append(artifact_info)
+
+    if cache is not None:
+        cache.save(started_ns)
 
     return report
 
@@ -110,4 +298,4 @@ if __name__ == "__main__":
     target_dir = sys.argv[1] if len(sys.argv) > 1 else "."
     scan_result = scan_repository(target_dir)
     print_report(scan_result)
-# Nonce: 5354
+# Nonce: 14039
@@ -71,6 +71,37 @@ class TestShadowScanIntegration(unittest.TestCase):
         self.assertIn(f"✓ {self.file1}", result_scan2.stdout)
         self.assertIn(f"✗ {self.file2}", result_scan2.stdout)
 
+    def test_incremental_parallel_scan_matches_default_output(self):
+        baseline = subprocess.run(
+            [sys.executable, self.cli_path, "shadow-scan", self.test_dir],
+            capture_output=True, text=True
+        )
+        for _ in range(2):
+            incremental = subprocess.run(
+                [sys.executable, self.cli_path, "shadow-scan", self.test_dir, "--incremental", "--jobs", "2"],
+                capture_output=True, text=True
+            )
+            self.assertEqual(incremental.returncode, baseline.returncode)
+            self.assertEqual(
+                incremental.stdout.splitlines()[4:],
+                baseline.stdout.splitlines()[4:],
+            )
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, ".tas_scan_cache.json")))
+
+    def test_recursive_sequence_clears_noise(self):
+        result_seq = subprocess.run(
+            [sys.executable, self.cli_path, "sequence", self.test_dir, "--recursive", "--jobs", "2"],
+            check=True, capture_output=True, text=True
+        )
+        self.assertIn("Sequencing complete for 2 artifacts", result_seq.stdout)
+
+        result_scan = subprocess.run(
+            [sys.executable, self.cli_path, "shadow-scan", self.test_dir],
+            capture_output=True, text=True
+        )
+        self.assertEqual(result_scan.returncode, 0)
+        self.assertIn("[Living Braid] - Verified Artifacts: 2", result_scan.stdout)
+
 if __name__ == '__main__':
     unittest.main()
-# Nonce: 19439
+# Nonce: 725
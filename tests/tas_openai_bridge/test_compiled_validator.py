@@ -0,0 +1,199 @@
+import copy
+import math
+from typing import Any
+
+import pytest
+
+from tas_openai_bridge import validate_many
+from tas_openai_bridge.gates import (
+    GateResult,
+    compile_candidate_validator,
+    tas_admissibility_gateway,
+)
+from tas_openai_bridge.schemas import TAS_CANDIDATE_RESPONSE_SCHEMA, CandidateResponse
+
+VALID = {
+    "decision": "candidate",
+    "claim_type": "summary",
+    "confidence": 0.9,
+    "requires_web_verification": False,
+    "requires_human_authorization": True,
+    "proposed_output": "candidate text",
+    "known_limitations": ["none"],
+    "tas_paradata": {
+        "input_hash": "sha256:abc",
+        "model": "gpt-5.5",
+        "timestamp": "2026-05-15T00:00:00+00:00",
+        "tool_path": "openai.responses",
+        "receipt_required": True,
+    },
+}
+
+
+def _variant(**changes):
+    payload = copy.deepcopy(VALID)
+    for key, value in changes.items():
+        if value is _DROP:
+            payload.pop(key)
+        else:
+            payload[key] = value
+    return payload
+
+
+def _paradata(**changes):
+    paradata = dict(VALID["tas_paradata"])
+    for key, value in changes.items():
+        if value is _DROP:
+            paradata.pop(key)
+        else:
+            paradata[key] = value
+    return paradata
+
+
+_DROP = object()
+
+CASES = [
+    VALID,
+    None,
+    [],
+    "candidate",
+    {},
+    _variant(decision=_DROP),
+    _variant(decision=_DROP, tas_paradata=_DROP),
+    _variant(extra=1),
+    _variant(extra=1, another=2),
+    _variant(decision="refuse"),
+    _variant(decision="needs_more_context"),
+    _variant(decision=7),
+    _variant(claim_type="poem"),
+    _variant(claim_type="external_fact"),
+    _variant(confidence=1.5),
+    _variant(confidence=-0.1),
+    _variant(confidence=math.nan),
+    _variant(confidence="0.5"),
+    _variant(confidence="high"),
+    _variant(confidence=None),
+    _variant(confidence=True),
+    _variant(proposed_output="   "),
+    _variant(proposed_output=None),
+    _variant(known_limitations=5),
+    _variant(known_limitations="ab"),
+    _variant(tas_paradata=[]),
+    _variant(tas_paradata=[("tool_path", "openai.responses")]),
+    _variant(tas_paradata=_paradata(tool_path="other")),
+    _variant(tas_paradata=_paradata(receipt_required=1)),
+    _variant(tas_paradata=_paradata(receipt_required=_DROP)),
+    _variant(tas_paradata={}),
+    _variant(requires_web_verification="yes"),
+]
+
+
+def _schema_keys() -> set[str]:
+    return set(TAS_CANDIDATE_RESPONSE_SCHEMA["properties"])
+
+
+def _check_schema(candidate_payload: dict) -> GateResult | None:
+    actual_keys = set(candidate_payload)
+    required_keys = set(TAS_CANDIDATE_RESPONSE_SCHEMA["required"])
+    missing = required_keys - actual_keys
+    if missing:
+        return GateResult(
+            False, "schema", f"Missing required fields: {sorted(missing)}"
+        )
+
+    unexpected = actual_keys - _schema_keys()
+    if unexpected:
+        return GateResult(
+            False, "schema", f"Unexpected fields: {sorted(unexpected)}"
+        )
+    return None
+
+
+def _check_safety_envelope(candidate: CandidateResponse) -> GateResult | None:
+    if candidate.decision != "candidate":
+        return GateResult(
+            False,
+            "P1",
+            f"Candidate decision is not admissible: {candidate.decision}",
+            candidate,
+        )
+
+    if (
+        candidate.claim_type
+        not in TAS_CANDIDATE_RESPONSE_SCHEMA["properties"]["claim_type"]["enum"]
+    ):
+        return GateResult(False, "P0", "Unknown claim type", candidate)
+
+    if not 0.0 <= candidate.confidence <= 1.0:
+        return GateResult(
+            False, "Rκ", "Confidence must be between 0.0 and 1.0", candidate
+        )
+
+    if not candidate.proposed_output.strip():
+        return GateResult(False, "Φ", "Proposed output is empty", candidate)
+
+    paradata = candidate.tas_paradata
+    if paradata.get("tool_path") != "openai.responses":
+        return GateResult(
+            False, "GENE_C01", "Missing OpenAI Responses tool path", candidate
+        )
+
+    if paradata.get("receipt_required") is not True:
+        return GateResult(
+            False, "GENE_C01", "Receipt is not required by paradata", candidate
+        )
+
+    return None
+
+
+def _reference_gateway(candidate_payload: Any) -> GateResult:
+    """The original interpreted gateway, kept as the compiled validator's oracle."""
+    try:
+        if not isinstance(candidate_payload, dict):
+            return GateResult(False, "schema", "Candidate must be a JSON object")
+
+        schema_error = _check_schema(candidate_payload)
+        if schema_error:
+            return schema_error
+
+        candidate = CandidateResponse.from_mapping(candidate_payload)
+
+        envelope_error = _check_safety_envelope(candidate)
+        if envelope_error:
+            return envelope_error
+
+        return GateResult(
+            True, "TAS", "Candidate passed TAS admissibility gateway", candidate
+        )
+    except Exception as exc:
+        return GateResult(
+            False,
+            "EXCEPTION",
+            f"Unhandled exception in admissibility gateway: {str(exc)}",
+        )
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_compiled_gateway_matches_reference(case):
+    assert tas_admissibility_gateway(copy.deepcopy(case)) == _reference_gateway(copy.deepcopy(case))
+
+
+def test_validate_many_preserves_order():
+    assert validate_many(CASES) == [_reference_gateway(payload) for payload in CASES]
+
+
+def test_compiler_reads_bounds_and_enums_from_schema():
+    schema = copy.deepcopy(TAS_CANDIDATE_RESPONSE_SCHEMA)
+    schema["properties"]["confidence"]["maximum"] = 0.5
+    schema["properties"]["claim_type"]["enum"] = ["code"]
+    validate = compile_candidate_validator(schema)
+    assert validate(VALID).gate == "P0"
+    assert validate(_variant(claim_type="code")).reason == "Confidence must be between 0.0 and 0.5"
+    assert validate(_variant(confidence=0.2, claim_type="code")).admissible
+
+
+def test_compiler_rejects_schema_without_gated_fields():
+    schema = copy.deepcopy(TAS_CANDIDATE_RESPONSE_SCHEMA)
+    schema["required"].remove("decision")
+    with pytest.raises(ValueError):
+        compile_candidate_validator(schema)
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from tas_openai_bridge import (
+    AlgorithmicPolymath,
+    HumanAPIKey,
+    ProvenanceReceipt,
+    RefusalArtifact,
+    ScopedAuthority,
+    execute_many,
+    tas_openai_execute,
+)
+from tas_openai_bridge.conduit import is_transient
+from tas_openai_bridge.fake_server import (
+    FakeResponsesServer,
+    ResponsesHTTPClient,
+    ResponsesHTTPError,
+    fake_candidate,
+)
+from tas_openai_bridge.ledger import ImmutableTruthLedger
+
+KEY = HumanAPIKey("HumanAPIKey001")
+AUTHORITY = ScopedAuthority(authority="HumanAPIKey001")
+
+
+def _run(prompts, client, **options):
+    return asyncio.run(execute_many(KEY, AUTHORITY, prompts, client=client, backoff=0.01, **options))
+
+
+def test_execute_many_returns_receipts_in_prompt_order():
+    prompts = [f"prompt {i}" for i in range(12)]
+    with FakeResponsesServer(latency=0.01) as server:
+        client = ResponsesHTTPClient(server.url)
+        results = _run(prompts, client, concurrency=4)
+        serial = tas_openai_execute(KEY, AUTHORITY, prompts[3], client=client)
+    assert all(isinstance(result, ProvenanceReceipt) for result in results)
+    assert results[3].input_hash == serial.input_hash
+    assert [r.input_hash for r in results] == [
+        tas_openai_execute(KEY, AUTHORITY, p, client=_StaticClient()).input_hash for p in prompts
+    ]
+
+
+def test_execute_many_retries_transient_errors():
+    with FakeResponsesServer(fail_every=2) as server:
+        results = _run(["a", "b", "c", "d"], ResponsesHTTPClient(server.url), concurrency=1, retries=3)
+    assert all(isinstance(result, ProvenanceReceipt) for result in results)
+
+
+def test_execute_many_refuses_after_retries_are_exhausted():
+    with FakeResponsesServer(fail_every=1) as server:
+        (result,) = _run(["a"], ResponsesHTTPClient(server.url), retries=2)
+    assert isinstance(result, RefusalArtifact)
+    assert result.reason == "OpenAI conduit execution failed"
+    assert result.details["attempts"] == 3
+    assert result.details["error"].startswith("429")
+
+
+def test_execute_many_does_not_retry_permanent_errors():
+    calls = []
+
+    class BadRequestClient:
+        class responses:
+            @staticmethod
+            def create(**request):
+                calls.append(request)
+                raise ResponsesHTTPError(400, "bad request")
+
+    (result,) = _run(["a"], BadRequestClient(), retries=5)
+    assert isinstance(result, RefusalArtifact)
+    assert len(calls) == 1
+
+
+def test_execute_many_times_out_each_request():
+    release = threading.Event()
+    calls = []
+
+    class HangingClient:
+        class responses:
+            @staticmethod
+            def create(**request):
+                calls.append(request["timeout"])
+                release.wait(5)
+
+    started = time.perf_counter()
+    (result,) = _run(["a"], HangingClient(), timeout=0.05, retries=3)
+    release.set()
+    assert time.perf_counter() - started < 2
+    assert isinstance(result, RefusalArtifact)
+    assert "exceeded" in result.details["error"]
+    # The first call never returned, so it is not sent a second time.
+    assert calls == [0.05]
+
+
+def test_execute_many_retries_requests_the_sdk_timed_out():
+    with FakeResponsesServer(latency=0.5) as server:
+        (result,) = _run(["a"], ResponsesHTTPClient(server.url), timeout=0.05, retries=1)
+    assert isinstance(result, RefusalArtifact)
+    assert result.details["attempts"] == 2
+
+
+def test_execute_many_accepts_async_clients():
+    class AsyncClient:
+        class responses:
+            @staticmethod
+            async def create(**request):
+                await asyncio.sleep(0)
+                return _StaticClient().responses.create(**request)
+
+    results = _run(["a", "b"], AsyncClient())
+    assert all(isinstance(result, ProvenanceReceipt) for result in results)
+
+
+def test_execute_many_refuses_every_prompt_without_authority():
+    results = asyncio.run(execute_many(None, AUTHORITY, ["a", "b"], client=_StaticClient()))
+    assert [r.reason for r in results] == ["Missing authority anchor"] * 2
+    assert results[0] is not results[1]
+
+
+def test_polymath_execute_many_refuses_each_prompt_separately():
+    polymath = AlgorithmicPolymath(None, AUTHORITY, "anchor", ImmutableTruthLedger())
+    results = asyncio.run(polymath.execute_many(["a", "b"], client=_StaticClient()))
+    assert [r.reason for r in results] == ["Missing or invalid HumanAPI Key"] * 2
+    assert results[0] is not results[1]
+
+
+def test_polymath_execute_many_records_one_ledger_batch():
+    ledger = ImmutableTruthLedger()
+    polymath = AlgorithmicPolymath(KEY, AUTHORITY, "anchor", ledger)
+    results = asyncio.run(polymath.execute_many(["a", "b", "c"], client=_StaticClient()))
+    assert [entry["payload"]["receipt_id"] for entry in ledger.entries] == [r.receipt_id for r in results]
+
+
+def test_is_transient_classification():
+    assert is_transient(TimeoutError())
+    assert is_transient(ResponsesHTTPError(503, "unavailable"))
+    assert not is_transient(ResponsesHTTPError(401, "unauthorized"))
+    assert not is_transient(ValueError())
+
+
+class _StaticClient:
+    class responses:
+        @staticmethod
+        def create(**request):
+            return SimpleNamespace(model=request["model"], output_text=json.dumps(fake_candidate(request["input"])))
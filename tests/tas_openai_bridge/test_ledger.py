@@ -0,0 +1,128 @@
+import json
+import threading
+
+import pytest
+
+from tas_openai_bridge import ProvenanceReceipt, RefusalArtifact
+from tas_openai_bridge.ledger import (
+    ChainIntegrityError,
+    ImmutableTruthLedger,
+    LedgerCheckpoint,
+    SegmentedTruthLedger,
+)
+
+
+def _receipt(index):
+    return ProvenanceReceipt(
+        receipt_type="TAS_OPENAI_PROVENANCE_RECEIPT",
+        schema_version="1.0",
+        human_authority="steward",
+        conduit="openai",
+        action="ADMIT",
+        input_hash=f"sha256:{index:064x}",
+        output_hash="sha256:output",
+        model="gpt-5.5",
+        gate="tas_admissibility_gateway",
+        admissible=True,
+        timestamp="2026-05-15T00:00:00+00:00",
+    ).with_receipt_id()
+
+
+def _artifacts(count):
+    artifacts = [_receipt(i) for i in range(count)]
+    artifacts.append(
+        RefusalArtifact.for_reason("blocked", code="TAS_GATE_REFUSAL", parent_context="gate")
+    )
+    return artifacts
+
+
+def test_segmented_ledger_matches_in_memory_hashes(tmp_path):
+    artifacts = _artifacts(20)
+    in_memory = ImmutableTruthLedger()
+    expected = [in_memory.append(artifact) for artifact in artifacts]
+    with SegmentedTruthLedger(tmp_path, segment_bytes=2048) as ledger:
+        assert ledger.append_many(artifacts[:5]) + [ledger.append(a) for a in artifacts[5:]] == expected
+        assert list(ledger) == in_memory.entries
+    assert len(list(tmp_path.glob("segment-*.jsonl"))) > 1
+    assert list(tmp_path.glob("segment-*.idx"))
+
+
+def test_lookups_by_entry_hash_and_receipt_id(tmp_path):
+    artifacts = _artifacts(3)
+    in_memory = ImmutableTruthLedger()
+    with SegmentedTruthLedger(tmp_path) as durable:
+        for ledger in (in_memory, durable):
+            hashes = ledger.append_many(artifacts)
+            assert ledger.get(hashes[1])["payload"]["receipt_id"] == artifacts[1].receipt_id
+            refusal = ledger.find_receipt(artifacts[-1].refusal_receipt_id)
+            assert refusal["entry_hash"] == hashes[-1]
+            assert ledger.find_receipt(artifacts[0].receipt_id)["entry_hash"] == hashes[0]
+            assert ledger.get("sha256:missing") is None
+            assert ledger.find_receipt("sha256:missing") is None
+
+
+def test_reopen_restores_indexes_and_chain_head(tmp_path):
+    artifacts = _artifacts(40)
+    with SegmentedTruthLedger(tmp_path, segment_bytes=4096) as ledger:
+        hashes = ledger.append_many(artifacts[:30])
+    with SegmentedTruthLedger(tmp_path, segment_bytes=4096) as reopened:
+        assert len(reopened) == 30
+        assert reopened.head == hashes[-1]
+        assert reopened.find_receipt(artifacts[3].receipt_id)["entry_hash"] == hashes[3]
+        hashes += reopened.append_many(artifacts[30:])
+        assert reopened.verify_chain() == LedgerCheckpoint(len(artifacts), hashes[-1])
+
+
+def test_reopen_drops_torn_final_line(tmp_path):
+    with SegmentedTruthLedger(tmp_path) as ledger:
+        head = ledger.append_many(_artifacts(2))[-1]
+    segment = tmp_path / "segment-000000.jsonl"
+    with open(segment, "ab") as stream:
+        stream.write(b'{"entry_hash":"sha256:torn"')
+    with SegmentedTruthLedger(tmp_path) as reopened:
+        assert len(reopened) == 3
+        assert reopened.head == head
+        assert reopened.verify_chain().count == 3
+    assert segment.read_bytes().endswith(b"\n")
+
+
+def test_verify_chain_resumes_from_checkpoint(tmp_path):
+    artifacts = _artifacts(10)
+    with SegmentedTruthLedger(tmp_path) as ledger:
+        ledger.append_many(artifacts[:5])
+        checkpoint = ledger.verify_chain()
+        assert checkpoint.count == 5
+        ledger.append_many(artifacts[5:])
+        resumed = ledger.verify_chain(checkpoint)
+        assert resumed == ledger.verify_chain()
+        with pytest.raises(ChainIntegrityError):
+            ledger.verify_chain(LedgerCheckpoint(5, "sha256:forged"))
+
+
+def test_verify_chain_detects_tampering(tmp_path):
+    with SegmentedTruthLedger(tmp_path) as ledger:
+        ledger.append_many(_artifacts(3))
+    segment = tmp_path / "segment-000000.jsonl"
+    lines = segment.read_bytes().splitlines()
+    entry = json.loads(lines[1])
+    entry["payload"]["model"] = "gpt-tampered"
+    lines[1] = json.dumps(entry, sort_keys=True, separators=(",", ":")).encode()
+    segment.write_bytes(b"\n".join(lines) + b"\n")
+    with SegmentedTruthLedger(tmp_path) as reopened:
+        with pytest.raises(ChainIntegrityError):
+            reopened.verify_chain()
+        # Entries before the tampered one still verify.
+        assert ImmutableTruthLedger(list(reopened)[:1]).verify_chain().count == 1
+
+
+def test_concurrent_appends_stay_linked(tmp_path):
+    with SegmentedTruthLedger(tmp_path, segment_bytes=8192) as ledger:
+        threads = [
+            threading.Thread(target=lambda: [ledger.append(a) for a in _artifacts(25)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert ledger.verify_chain().count == 4 * 26
@@ -0,0 +1,137 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from tas_openai_bridge import (
+    HumanAPIKey,
+    ProvenanceReceipt,
+    RefusalArtifact,
+    ScopedAuthority,
+    execute_many,
+    tas_openai_execute,
+)
+from tas_openai_bridge.cache import SCHEMA_VERSION, ConduitResponseCache, cache_key
+from tas_openai_bridge.fake_server import fake_candidate
+
+KEY = HumanAPIKey("HumanAPIKey001")
+AUTHORITY = ScopedAuthority(authority="HumanAPIKey001")
+
+
+class CountingClient:
+    def __init__(self, decision="candidate"):
+        self.calls = 0
+        self.decision = decision
+        self.responses = self
+
+    def create(self, **request):
+        self.calls += 1
+        candidate = fake_candidate(request["input"])
+        candidate["decision"] = self.decision
+        self.returned = json.loads(json.dumps(candidate))
+        return SimpleNamespace(model=request["model"], output_text=json.dumps(candidate))
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hit_skips_conduit_but_issues_fresh_gated_receipt(tmp_path):
+    client = CountingClient()
+    with ConduitResponseCache(tmp_path) as cache:
+        first = tas_openai_execute(KEY, AUTHORITY, "same prompt", client=client, cache=cache)
+        second = tas_openai_execute(KEY, AUTHORITY, "same prompt", client=client, cache=cache)
+    assert client.calls == 1
+    assert isinstance(first, ProvenanceReceipt) and isinstance(second, ProvenanceReceipt)
+    assert first.input_hash == second.input_hash
+    # The same candidate is gated both times; only the receipt records the source.
+    assert first.output_hash == second.output_hash
+    assert (first.cache_hit, second.cache_hit) == (False, True)
+    assert first.to_dict()["cache_hit"] is False and second.to_dict()["cache_hit"] is True
+    assert first.receipt_id != second.receipt_id
+
+
+def test_cache_hit_is_only_on_receipts_issued_with_a_cache(tmp_path):
+    with ConduitResponseCache(tmp_path) as cache:
+        assert tas_openai_execute(KEY, AUTHORITY, "p", client=CountingClient(), cache=cache).cache_hit is False
+    uncached = tas_openai_execute(KEY, AUTHORITY, "p", client=CountingClient())
+    assert uncached.cache_hit is None
+    assert "cache_hit" not in uncached.to_dict()
+
+
+def test_stores_the_returned_candidate_not_the_gated_one(tmp_path):
+    client = CountingClient()
+    with ConduitResponseCache(tmp_path) as cache:
+        receipt = tas_openai_execute(KEY, AUTHORITY, "p", client=client, cache=cache)
+        assert cache.get(receipt.input_hash, receipt.model) == client.returned
+
+
+def test_refused_candidates_are_not_cached(tmp_path):
+    client = CountingClient(decision="refuse")
+    with ConduitResponseCache(tmp_path) as cache:
+        first = tas_openai_execute(KEY, AUTHORITY, "p", client=client, cache=cache)
+        second = tas_openai_execute(KEY, AUTHORITY, "p", client=client, cache=cache)
+        assert len(cache) == 0
+    assert client.calls == 2
+    assert isinstance(first, RefusalArtifact) and isinstance(second, RefusalArtifact)
+    assert second.details["gate"] == "P1"
+
+
+def test_cache_key_separates_models_and_schema_versions(tmp_path):
+    client = CountingClient()
+    with ConduitResponseCache(tmp_path) as cache:
+        tas_openai_execute(KEY, AUTHORITY, "p", client=client, cache=cache, model="m1")
+        tas_openai_execute(KEY, AUTHORITY, "p", client=client, cache=cache, model="m2")
+    assert client.calls == 2
+    assert cache_key("sha256:x", "m1") != cache_key("sha256:x", "m1", "other-schema")
+    assert cache_key("sha256:x", "m1") == cache_key("sha256:x", "m1", SCHEMA_VERSION)
+
+
+def test_ttl_expiry(tmp_path):
+    clock = Clock()
+    with ConduitResponseCache(tmp_path, ttl_seconds=60, clock=clock) as cache:
+        cache.put("sha256:a", "m", {"v": 1})
+        clock.now += 59
+        assert cache.get("sha256:a", "m") == {"v": 1}
+        clock.now += 2
+        assert cache.get("sha256:a", "m") is None
+        assert len(cache) == 0
+        assert not list(cache.objects.rglob("*.json"))
+
+
+def test_lru_eviction_and_shared_objects(tmp_path):
+    clock = Clock()
+    with ConduitResponseCache(tmp_path, max_entries=2, clock=clock) as cache:
+        cache.put("sha256:a", "m", {"v": 1})
+        clock.now += 1
+        cache.put("sha256:b", "m", {"v": 1})
+        assert len(list(cache.objects.rglob("*.json"))) == 1
+        clock.now += 1
+        assert cache.get("sha256:a", "m") == {"v": 1}
+        clock.now += 1
+        cache.put("sha256:c", "m", {"v": 2})
+        assert cache.get("sha256:b", "m") is None
+        assert cache.get("sha256:a", "m") == {"v": 1}
+        assert cache.get("sha256:c", "m") == {"v": 2}
+
+
+def test_corrupted_object_is_a_miss(tmp_path):
+    with ConduitResponseCache(tmp_path) as cache:
+        object_id = cache.put("sha256:a", "m", {"v": 1})
+        cache._object_path(object_id).write_text('{"v":2}')
+        assert cache.get("sha256:a", "m") is None
+
+
+def test_cache_persists_and_serves_execute_many(tmp_path):
+    client = CountingClient()
+    with ConduitResponseCache(tmp_path) as cache:
+        tas_openai_execute(KEY, AUTHORITY, "warm", client=client, cache=cache)
+    with ConduitResponseCache(tmp_path) as reopened:
+        results = asyncio.run(
+            execute_many(KEY, AUTHORITY, ["warm", "cold", "warm"], client=client, cache=reopened)
+        )
+    assert all(isinstance(result, ProvenanceReceipt) for result in results)
+    assert client.calls == 2
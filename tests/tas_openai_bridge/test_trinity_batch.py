@@ -0,0 +1,45 @@
+import random
+
+from tas_openai_bridge import (
+    ArchetypeAnalysis,
+    OctopusArchetype,
+    SafetyEnvelope,
+    SemanticRouter,
+    TrinityEngine,
+)
+
+WORDS = ["risk", "ledger", "lineage", "audit", "safeguard", "can't", "edge", "x1", "Map", "MAP"]
+
+
+def _queries(count, seed=7):
+    rng = random.Random(seed)
+    queries = ["", "   ", "!!!", "one", "risk risk ledger", "a b c d e f g h"]
+    queries += [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 12))) for _ in range(count)]
+    return queries
+
+
+def test_execute_many_matches_execute():
+    engine = TrinityEngine(safety_envelope=SafetyEnvelope(pi_staple_max_divergence=0.3))
+    queries = _queries(500)
+    assert engine.execute_many(queries) == [engine.execute(query) for query in queries]
+
+
+def test_execute_many_in_worker_processes_matches_execute():
+    engine = TrinityEngine()
+    queries = _queries(300)
+    assert engine.execute_many(queries, jobs=2, chunk_size=64) == [engine.execute(q) for q in queries]
+
+
+class LoudOctopus(OctopusArchetype):
+    def analyze(self, query):
+        return ArchetypeAnalysis("octopus", query.upper(), (query.upper(),))
+
+
+def test_route_many_respects_overridden_analyze():
+    engine = TrinityEngine(router=SemanticRouter(octopus=LoudOctopus()))
+    queries = _queries(50)
+    assert engine.execute_many(queries) == [engine.execute(query) for query in queries]
+
+
+def test_execute_many_empty_batch():
+    assert TrinityEngine().execute_many([]) == []
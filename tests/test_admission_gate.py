@@ -514,3 +514,46 @@ def test_file_ledger_rejects_tampered_receipt_after_restart(tmp_path):
     path.write_bytes(canonical_json({**receipt, "failure_code": "FORGED"}))
 
     assert FileDecisionLedger(tmp_path).get_receipt(receipt_hash) is None
+
+
+def test_nonce_store_refuses_replayed_authorization():
+    from tas_admissibility import InMemoryNonceStore
+
+    gate, authority, _, context, _ = _gate()
+    gate.nonce_store = InMemoryNonceStore()
+    candidate, envelope = _request(authority, context)
+    forged = parse_canonical_json(envelope)
+    forged["signature"] = base64.b64encode(b"not a signature").decode()
+
+    results = [
+        gate.evaluate(
+            raw_candidate=candidate,
+            raw_envelope=raw_envelope,
+            current_time="2029-01-01T00:00:00Z",
+        )
+        for raw_envelope in (canonical_json(forged), envelope, envelope)
+    ]
+
+    # An unauthenticated copy must not burn the nonce; the genuine replay is
+    # refused with a durable receipt.
+    assert [r["resulting_state"] for r in results] == ["REFUSED", "ADMITTED", "REFUSED"]
+    assert results[2]["receipt"]["failure_code"] == "NONCE_REPLAYED"
+    assert gate.nonce_store.nonces == {'["credential-1","nonce-1"]'}
+
+
+def test_nonce_store_failure_refuses_closed():
+    gate, authority, _, context, _ = _gate()
+
+    class BrokenNonceStore:
+        def consume(self, nonce):
+            raise OSError("offline")
+
+    gate.nonce_store = BrokenNonceStore()
+    candidate, envelope = _request(authority, context)
+    result = gate.evaluate(
+        raw_candidate=candidate,
+        raw_envelope=envelope,
+        current_time="2029-01-01T00:00:00Z",
+    )
+    assert result["resulting_state"] == "REFUSED"
+    assert result["receipt"]["failure_code"] == "NONCE_STORE_UNAVAILABLE"
@@ -0,0 +1,117 @@
+import json
+import multiprocessing
+import os
+import sys
+from dataclasses import replace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from admission_gate import AuthoritySnapshot
+from authority_store import (
+    IndexedAuthorityResolver,
+    RevocationSet,
+    authority_snapshot_record,
+    export_jsonl,
+)
+
+
+def _snapshot(n, epoch=7, valid_until="2030-01-01T00:00:00Z"):
+    return AuthoritySnapshot(
+        f"credential-{n}",
+        "Ed25519",
+        bytes([n % 256]) * 32,
+        epoch,
+        False,
+        "c" * 64,
+        f"{epoch:064x}",
+        valid_until,
+        "a" * 64,
+    )
+
+
+def test_snapshot_pre_parses_valid_until():
+    snapshot = _snapshot(1, valid_until="2030-01-01T01:00:00+01:00")
+    assert snapshot.valid_until_us == 1_893_456_000_000_000
+    assert _snapshot(1, valid_until="not a time").valid_until_us is None
+    assert _snapshot(1, valid_until="2030-01-01T00:00:00").valid_until_us is None
+    # The parsed value is derived state: recomputed by replace() and kept
+    # out of equality and repr.
+    moved = replace(snapshot, valid_until="2030-01-01T01:00:00Z")
+    assert moved.valid_until_us == snapshot.valid_until_us + 3_600_000_000
+    assert replace(moved, valid_until=snapshot.valid_until) == snapshot
+    assert "valid_until_us" not in repr(snapshot)
+
+
+def test_resolver_indexes_by_key_and_epoch(tmp_path):
+    snapshots = [_snapshot(n, epoch=5 + n % 3) for n in range(30)]
+    path = tmp_path / "authority.jsonl"
+    assert export_jsonl(snapshots, path) == 30
+    resolver = IndexedAuthorityResolver.from_jsonl(path)
+
+    assert len(resolver) == 30
+    assert resolver.resolve(credential_id="credential-4", checkpoint_hash=f"{6:064x}") == snapshots[4]
+    assert resolver.resolve(credential_id="credential-4", checkpoint_hash=f"{5:064x}") is None
+    assert resolver.epochs() == [5, 6, 7]
+    assert resolver.snapshots_for_epoch(6) == [s for s in snapshots if s.authority_epoch == 6]
+
+    # Shared fields are interned across snapshots.
+    first, second = resolver.snapshots_for_epoch(5)[:2]
+    assert first.scope_policy_hash is second.scope_policy_hash
+    assert first.valid_until is second.valid_until
+
+    assert resolver.add(snapshots[0]) is False
+    with pytest.raises(ValueError, match="conflicting"):
+        resolver.add(replace(snapshots[0], revoked=True))
+
+    assert resolver.retire_epochs_before(7) == 20
+    assert resolver.epochs() == [7]
+    assert resolver.resolve(credential_id="credential-4", checkpoint_hash=f"{6:064x}") is None
+
+
+def test_bulk_load_rejects_bad_records_with_line_numbers(tmp_path):
+    good = authority_snapshot_record(_snapshot(1))
+    for bad in (
+        {**good, "valid_until": "2030-01-01"},
+        {**good, "public_key": "%%%"},
+        {**good, "authority_epoch": True},
+        {key: value for key, value in good.items() if key != "revoked"},
+    ):
+        path = tmp_path / "bad.jsonl"
+        path.write_text(json.dumps(good) + "\n\n" + json.dumps(bad) + "\n")
+        with pytest.raises(ValueError, match=r"bad\.jsonl:3:"):
+            IndexedAuthorityResolver.from_jsonl(path)
+
+
+def _revoke(path, keys):
+    with RevocationSet(path) as revocations:
+        revocations.add_many(keys)
+
+
+def test_revocations_are_shared_across_processes_and_survive_growth(tmp_path):
+    path = tmp_path / "revocations"
+    snapshots = [_snapshot(n) for n in range(40)]
+    keys = [(s.credential_id, s.checkpoint_hash) for s in snapshots]
+    with RevocationSet(path, capacity=4) as revocations:
+        resolver = IndexedAuthorityResolver(snapshots, revocations=revocations)
+        assert revocations.add(*keys[0]) is True
+        assert revocations.add(*keys[0]) is False
+        assert resolver.resolve(credential_id=keys[0][0], checkpoint_hash=keys[0][1]).revoked
+
+        # Another process grows the table several times; this mapping follows.
+        process = multiprocessing.get_context("fork").Process(target=_revoke, args=(path, keys[1:30]))
+        process.start()
+        process.join()
+        assert process.exitcode == 0
+
+        assert len(revocations) == 30
+        assert all(key in revocations for key in keys[:30])
+        assert not any(key in revocations for key in keys[30:])
+        assert [resolver.resolve(credential_id=c, checkpoint_hash=h).revoked for c, h in keys[28:32]] == [
+            True, True, False, False,
+        ]
+        assert revocations.add(*keys[35]) is True
+    with RevocationSet(path) as reopened:
+        assert len(reopened) == 31 and keys[35] in reopened
+    assert sorted(os.listdir(tmp_path)) == ["revocations"]
@@ -85,3 +85,76 @@ def test_invalid_ttl_is_rejected(table_and_clock, ttl):
     table, _ = table_and_clock
     with pytest.raises(ValueError, match="ttl_seconds"):
         table.mint("steward", {"read"}, ttl_seconds=ttl)
+
+
+def test_sweep_purges_only_expired_grants_and_their_revocations(table_and_clock):
+    table, clock = table_and_clock
+    short = table.mint("steward", {"read"}, ttl_seconds=1)
+    table.revoke(short)
+    long = table.mint("steward", {"read"}, ttl_seconds=10)
+
+    assert table.sweep_expired() == 0
+    clock.now += 1
+    assert table.sweep_expired() == 1
+    assert table.validate_token("steward", short, "read") == (False, "TOKEN_UNKNOWN")
+    assert table.validate_token("steward", long, "read") == (True, None)
+
+
+def test_authenticated_payload_cache_is_bounded_and_honours_revocation():
+    clock = Clock()
+    table = CapabilityTable(b"k" * 32, clock=clock, auth_cache_size=2)
+    tokens = [table.mint("steward", {"read"}) for _ in range(3)]
+    for token in tokens:
+        assert table.validate_token("steward", token, "read") == (True, None)
+    assert list(table._auth_cache) == tokens[1:]
+
+    table.revoke(tokens[2])
+    assert table.validate_token("steward", tokens[2], "read") == (False, "TOKEN_REVOKED")
+    assert table.validate_token("steward", tokens[2] + "0", "read") == (
+        False,
+        "INVALID_SIGNATURE",
+    )
+
+
+def test_sqlite_store_is_shared_between_tables(tmp_path):
+    from core.authority.capability_store import SQLiteCapabilityStore
+
+    clock = Clock()
+    path = tmp_path / "capabilities.sqlite"
+    with SQLiteCapabilityStore(path) as first_store, SQLiteCapabilityStore(path) as second_store:
+        first = CapabilityTable(b"k" * 32, clock=clock, store=first_store)
+        second = CapabilityTable(b"k" * 32, clock=clock, store=second_store)
+
+        token = first.mint("steward", {"read", "write"}, ttl_seconds=5)
+        other = second.mint("steward", {"read"}, ttl_seconds=5)
+        assert token != other
+        assert second.validate_token("steward", token, "write") == (True, None)
+
+        second.revoke(token)
+        assert first.validate_token("steward", token, "read") == (False, "TOKEN_REVOKED")
+
+        clock.now += 5
+        assert first.sweep_expired() == 2
+        assert len(second_store) == 0
+
+    with SQLiteCapabilityStore(path) as reopened:
+        assert reopened.next_sequence() == 3
+
+
+def test_cached_validation_and_sqlite_store_are_safe_across_threads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from core.authority.capability_store import SQLiteCapabilityStore
+
+    with SQLiteCapabilityStore(tmp_path / "capabilities.sqlite") as store:
+        # A cache smaller than the working set evicts on nearly every call.
+        table = CapabilityTable(b"k" * 32, clock=Clock(), store=store, auth_cache_size=2)
+        tokens = [table.mint("steward", {"read"}) for _ in range(8)]
+
+        def validate(index):
+            return table.validate_token("steward", tokens[index % len(tokens)], "read")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(validate, range(2000)))
+
+    assert results == [(True, None)] * 2000
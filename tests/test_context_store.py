@@ -0,0 +1,135 @@
+import multiprocessing
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from context_snapshot import (
+    ContextSnapshot,
+    ContextValidationError,
+    canonical_json,
+    definition_id_for_mapping,
+    make_definition_record,
+    resolve_verified_context,
+)
+from context_store import SQLiteContextResolver, SQLiteDefinitionResolver
+
+
+def _definition(term="requested_operation"):
+    return make_definition_record(
+        namespace_id="tas:core",
+        term=term,
+        semantic_version="1",
+        definition=f"The {term} as defined for the core namespace.",
+    )
+
+
+def _context(definition_ids, *, sequence=0, parent=None):
+    return ContextSnapshot.build(
+        namespace_id="tas:core",
+        context_sequence=sequence,
+        definition_ids=definition_ids,
+        invariant_set_id="b" * 64,
+        authority_binding_hash="a" * 64,
+        parent_context_hash=parent,
+        effective_epoch=7,
+    )
+
+
+def _raw(context):
+    return canonical_json(context.mapping)
+
+
+def test_round_trips_exact_bytes_and_resolves_verified_context(tmp_path):
+    path = tmp_path / "context.sqlite"
+    definitions = [_definition("alpha"), _definition("beta")]
+    with SQLiteDefinitionResolver(path) as definition_resolver, SQLiteContextResolver(path) as context_resolver:
+        ids = definition_resolver.put_many([canonical_json(d) for d in definitions])
+        assert ids == [definition_id_for_mapping(d) for d in definitions]
+        context = _context(ids)
+        assert context_resolver.put(_raw(context)) == context.context_snapshot_hash
+        assert context_resolver.resolve(context_snapshot_hash=context.context_snapshot_hash) == _raw(context)
+        assert context_resolver.advance_head(context.context_snapshot_hash) == 1
+
+        resolved = resolve_verified_context(
+            context_snapshot_hash=context.context_snapshot_hash,
+            context_resolver=context_resolver,
+            definition_resolver=definition_resolver,
+        )
+        assert resolved == context
+        assert definition_resolver.resolve_many([ids[1], "f" * 64, "not-a-hash", ids[0]]) == {
+            ids[0]: canonical_json(definitions[0]),
+            ids[1]: canonical_json(definitions[1]),
+        }
+
+
+def test_rejects_non_canonical_or_invalid_objects(tmp_path):
+    with SQLiteDefinitionResolver(tmp_path / "c.sqlite") as definitions, SQLiteContextResolver(
+        tmp_path / "c.sqlite"
+    ) as contexts:
+        with pytest.raises(ContextValidationError):
+            definitions.put(b'{"term": "x"}')
+        raw = _raw(_context([definition_id_for_mapping(_definition())]))
+        with pytest.raises(ContextValidationError):
+            contexts.put(raw.replace(b",", b", ", 1))
+        assert contexts.resolve_many([]) == {}
+        assert contexts.resolve(context_snapshot_hash="A" * 64) is None
+
+
+def test_heads_advance_only_along_the_context_chain(tmp_path):
+    definition_id = definition_id_for_mapping(_definition())
+    genesis = _context([definition_id])
+    child = _context([definition_id], sequence=1, parent=genesis.context_snapshot_hash)
+    sibling = _context([definition_id], sequence=1, parent="c" * 64)
+    with SQLiteContextResolver(tmp_path / "c.sqlite") as resolver:
+        resolver.put_many([_raw(genesis), _raw(child), _raw(sibling)])
+        assert resolver.expected_head(namespace_id="tas:core") is None
+        assert resolver.head_version() == 0
+
+        with pytest.raises(ContextValidationError, match="does not extend"):
+            resolver.advance_head(child.context_snapshot_hash)
+        assert resolver.advance_head(genesis.context_snapshot_hash) == 1
+        assert resolver.advance_head(child.context_snapshot_hash) == 2
+        for stale in (genesis, sibling):
+            with pytest.raises(ContextValidationError, match="does not extend"):
+                resolver.advance_head(stale.context_snapshot_hash)
+        with pytest.raises(ContextValidationError, match="unavailable"):
+            resolver.advance_head("d" * 64)
+
+        assert resolver.head("tas:core") == (child.context_snapshot_hash, 2)
+        assert resolver.head_version() == 2
+
+
+def _advance(path, context_snapshot_hash, results):
+    with SQLiteContextResolver(path) as resolver:
+        try:
+            results.put(resolver.advance_head(context_snapshot_hash))
+        except ContextValidationError:
+            results.put(None)
+
+
+def test_heads_and_version_are_shared_between_processes(tmp_path):
+    path = tmp_path / "c.sqlite"
+    definition_id = definition_id_for_mapping(_definition())
+    genesis = _context([definition_id])
+    with SQLiteContextResolver(path) as resolver:
+        resolver.put(_raw(genesis))
+        seen = resolver.head_version()
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        racers = [
+            context.Process(target=_advance, args=(path, genesis.context_snapshot_hash, results))
+            for _ in range(4)
+        ]
+        for racer in racers:
+            racer.start()
+        outcomes = sorted((results.get() for _ in racers), key=lambda v: (v is None, v))
+        for racer in racers:
+            racer.join()
+
+        assert outcomes == [1, None, None, None]
+        assert resolver.head_version() == seen + 1
+        assert resolver.expected_head(namespace_id="tas:core") == genesis.context_snapshot_hash
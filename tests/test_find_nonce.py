@@ -0,0 +1,34 @@
+import hashlib
+
+import find_nonce
+
+
+def _stamped(path):
+    content = path.read_text()
+    return hashlib.sha256(f"{content}{find_nonce.TAS_HUMAN_SIG}".encode()).hexdigest()
+
+
+def test_parallel_search_returns_the_serial_nonce(tmp_path):
+    serial = tmp_path / "serial.py"
+    parallel = tmp_path / "parallel.py"
+    for path in (serial, parallel):
+        path.write_text("print('sequenced')\n")
+
+    expected = find_nonce.find_nonce(str(serial))
+
+    assert find_nonce.find_nonce_parallel(str(parallel), jobs=3) == expected
+    assert parallel.read_text() == serial.read_text()
+    assert _stamped(parallel).startswith(find_nonce.PREFIX)
+
+
+def test_batch_mode_matches_per_file_search(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text(f"VALUE = {index}\n# Nonce: 7\n")
+        paths.append(str(path))
+    expected = {path: find_nonce.search_nonce(f"VALUE = {index}\n") for index, path in enumerate(paths)}
+
+    assert find_nonce.find_nonces(paths, jobs=2) == expected
+    for path in paths:
+        assert tmp_path.joinpath(path).read_text().endswith(f"# Nonce: {expected[path]}\n")
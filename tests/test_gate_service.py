@@ -0,0 +1,167 @@
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from admission_gate import FileDecisionLedger
+from tas_admissibility import SQLiteNonceStore
+from tas_bench.corpus import admission_gatekeeper, mint
+from tas_gate_service import GateClient, GateService, GateServiceError, RemoteError, admission_methods
+from tas_gate_service.protocol import FrameError, decode_body, encode_frame, read_frame, split_frame
+
+
+def test_frame_round_trip_and_rejection():
+    parts = [b"evaluate", b"", b"\x00" * 5, "é".encode()]
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(encode_frame(parts) + encode_frame([b"next"]))
+        assert read_frame(right) == parts
+        assert read_frame(right) == [b"next"]
+
+        left.sendall(encode_frame([b"x" * 64]))
+        with pytest.raises(FrameError):
+            read_frame(right, max_bytes=32)
+
+    frame = encode_frame([b"abc"])
+    assert split_frame(frame[:-1]) is None
+    assert split_frame(frame + b"more") == ([b"abc"], len(frame))
+    with pytest.raises(FrameError):
+        decode_body(frame[6:] + b"!", 1)
+    with pytest.raises(FrameError):
+        decode_body(frame[6:-1], 1)
+
+
+@pytest.fixture
+def corpus():
+    return mint("admission_gate", 8, seed=11, adversarial=0.0)
+
+
+@pytest.fixture
+def service(tmp_path, corpus):
+    state = tmp_path / "state"
+    state.mkdir()
+
+    def factory():
+        gatekeeper = admission_gatekeeper(
+            corpus,
+            ledger=FileDecisionLedger(state / "ledger"),
+            nonce_store=SQLiteNonceStore(str(state / "nonces.sqlite")),
+        )
+        return {**admission_methods(gatekeeper), "pid": os.getpid}
+
+    gate = GateService(tmp_path / "gate.sock", factory, workers=2, shutdown_timeout=5.0)
+    gate.start()
+    yield gate, state
+    gate.stop()
+
+
+def _request(corpus, index):
+    import base64
+
+    record = corpus.records[index]
+    return base64.b64decode(record["candidate"]), base64.b64decode(record["envelope"])
+
+
+def test_workers_share_ledger_and_nonce_store(service, corpus):
+    gate, state = service
+    with GateClient(gate.socket_path) as first, GateClient(gate.socket_path) as second:
+        admitted = first.evaluate(*_request(corpus, 0))
+        replayed = second.evaluate(*_request(corpus, 0))
+        other = second.evaluate(*_request(corpus, 1))
+
+    assert admitted["resulting_state"] == "ADMITTED"
+    assert replayed["resulting_state"] == "REFUSED"
+    assert replayed["receipt"]["failure_code"] == "NONCE_REPLAYED"
+    assert other["resulting_state"] == "ADMITTED"
+    ledger = FileDecisionLedger(state / "ledger")
+    assert ledger.get_receipt(admitted["receipt_hash"]) == admitted["receipt"]
+    assert ledger.get_receipt(replayed["receipt_hash"]) == replayed["receipt"]
+
+
+def test_unknown_method_is_a_remote_error(service):
+    gate, _ = service
+    with GateClient(gate.socket_path) as client:
+        with pytest.raises(RemoteError, match="unknown method"):
+            client.call("drop_ledger")
+        with pytest.raises(RemoteError, match="TypeError"):
+            client.call("evaluate", b"only-one-argument")
+        assert client.call("pid") > 0
+
+
+def test_graceful_reload_replaces_workers_without_dropping_clients(service, corpus):
+    gate, _ = service
+    with GateClient(gate.socket_path) as client:
+        before = client.call("pid")
+        gate.reload()
+        deadline = time.monotonic() + 10
+        while client.call("pid") == before:
+            assert time.monotonic() < deadline, "workers were not replaced"
+            time.sleep(0.05)
+        assert client.evaluate(*_request(corpus, 2))["resulting_state"] == "ADMITTED"
+
+
+def test_a_stalled_client_does_not_block_its_worker(tmp_path):
+    path = tmp_path / "gate.sock"
+    with GateService(path, lambda: {"ping": lambda: "pong"}, workers=1, frame_timeout=30.0):
+        stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with stalled, GateClient(path, timeout=5.0) as client:
+            stalled.connect(str(path))
+            stalled.sendall(encode_frame([b"ping"])[:3])  # half a header
+            started = time.monotonic()
+            assert client.call("ping") == "pong"
+            assert time.monotonic() - started < 2.0
+            stalled.sendall(encode_frame([b"ping"])[3:])
+            stalled.settimeout(5.0)
+            assert read_frame(stalled) == [b"ok", b'"pong"']
+
+
+def test_client_does_not_resend_a_request_that_was_received(tmp_path):
+    path = str(tmp_path / "dying.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen()
+    received = []
+
+    def serve():
+        # Read the request completely, then die without answering.
+        connection, _ = listener.accept()
+        with connection:
+            received.append(read_frame(connection))
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    with listener, GateClient(path, timeout=5.0) as client:
+        with pytest.raises(GateServiceError, match="may have been evaluated"):
+            client.call("evaluate", b"candidate", b"envelope")
+        thread.join(timeout=5.0)
+        # A resend would have reconnected to the still-listening socket.
+        listener.settimeout(0.2)
+        with pytest.raises(TimeoutError):
+            listener.accept()
+    assert received == [[b"evaluate", b"candidate", b"envelope"]]
+
+
+def test_stop_removes_the_socket(tmp_path):
+    path = tmp_path / "gate.sock"
+    with GateService(path, lambda: {"ping": lambda: "pong"}, workers=1) as gate:
+        with GateClient(path) as client:
+            assert client.call("ping") == "pong"
+        with pytest.raises(OSError):
+            GateService(path, dict, workers=1)._bind()
+    assert gate.pid is None
+    assert not path.exists()
+
+
+def test_logos_gatekeeper_is_served(tmp_path):
+    from tas_bench import fixtures
+    from tas_gate_service import logos_methods
+
+    gatekeeper, resolver = fixtures.logos_gatekeeper()
+    payload = fixtures.logos_payload(gatekeeper, resolver, 0)
+    expected = gatekeeper.process_payload(payload)
+
+    with GateService(tmp_path / "logos.sock", lambda: logos_methods(gatekeeper), workers=1):
+        with GateClient(tmp_path / "logos.sock") as client:
+            assert client.process_payload(payload) == expected
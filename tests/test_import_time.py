@@ -0,0 +1,105 @@
+"""Import-time budgets for the lazy ``core`` / ``tas_openai_bridge`` facades and the CLI.
+
+The laziness checks always run, as do machine-independent budgets: a cap on
+the modules a facade import adds over ``python -c pass``, and a cap on its
+cost relative to that bare interpreter start, both measured in the same test.
+Absolute wall-clock budgets depend on the machine, so they are opt-in: set
+``TAS_IMPORT_BUDGET=1`` to enforce them.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+IMPORT_BUDGET_US = {
+    "core": 40_000,
+    "tas_openai_bridge": 40_000,
+}
+
+# Modules a facade import may add on top of a bare interpreter start
+IMPORT_BUDGET_MODULES = {
+    "core": 5,
+    "tas_openai_bridge": 5,
+}
+
+# Facade import cost as a fraction of the bare interpreter's own imports
+IMPORT_BUDGET_RATIO = 0.5
+
+
+def _importtime(*args, self_time=False):
+    """Return {module: cumulative (or self) microseconds} from ``python -X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line.split("|")
+        modules[name.strip()] = int(own.split(":")[1]) if self_time else int(cumulative)
+    return modules
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TAS_IMPORT_BUDGET"),
+    reason="wall-clock import budgets are opt-in; set TAS_IMPORT_BUDGET=1",
+)
+@pytest.mark.parametrize("package", sorted(IMPORT_BUDGET_US))
+def test_package_import_within_budget(package):
+    best = min(_importtime("-c", f"import {package}")[package] for _ in range(3))
+    assert best <= IMPORT_BUDGET_US[package], f"import {package} took {best}us"
+
+
+@pytest.mark.parametrize("package", sorted(IMPORT_BUDGET_MODULES))
+def test_package_import_adds_few_modules(package):
+    bare = _importtime("-c", "pass")
+    added = sorted(set(_importtime("-c", f"import {package}")) - set(bare))
+    assert len(added) <= IMPORT_BUDGET_MODULES[package], f"import {package} added {added}"
+
+
+@pytest.mark.parametrize("package", sorted(IMPORT_BUDGET_MODULES))
+def test_package_import_within_startup_ratio(package):
+    ratios = []
+    for _ in range(3):
+        bare = _importtime("-c", "pass", self_time=True)
+        modules = _importtime("-c", f"import {package}", self_time=True)
+        added = sum(us for name, us in modules.items() if name not in bare)
+        ratios.append(added / sum(bare.values()))
+    best = min(ratios)
+    assert best <= IMPORT_BUDGET_RATIO, f"import {package} cost {best:.2f}x a bare interpreter start"
+
+
+@pytest.mark.parametrize("package", ["core", "tas_openai_bridge"])
+def test_package_import_is_lazy(package):
+    modules = _importtime("-c", f"import {package}")
+
+    loaded = sorted(name for name in modules if name.startswith(f"{package}."))
+    assert loaded == []
+    assert "cryptography" not in modules
+
+
+def test_cli_help_skips_subcommand_imports():
+    modules = _importtime("tas_cli.py", "--help")
+
+    heavy = sorted(
+        name
+        for name in modules
+        if name.split(".")[0] in {"core", "tas_tools", "tas_pythonetics", "cryptography"}
+    )
+    assert heavy == []
+
+
+def test_cli_defaults_mirror_sequencer_constants():
+    import tas_cli
+    from tas_tools import tas_sequencer
+
+    assert tas_cli.TAS_HUMAN_SIG == tas_sequencer.TAS_HUMAN_SIG
+    assert tas_cli.TAS_META_EXT == tas_sequencer.TAS_META_EXT
@@ -0,0 +1,97 @@
+import hashlib
+import hmac
+
+import pytest
+
+from tas_keyed_mac import KeyedMAC
+from tas_logos_gatekeeper import RECEIPT_DOMAIN, HMACReceiptSigner
+from tas_phase0_microkernel import (
+    ActionProposal,
+    VerificationPolicy,
+    canonical_json_bytes,
+    guard_accepts_token,
+    payload_mac,
+    verify_action,
+)
+
+
+@pytest.mark.parametrize("key", [b"", b"k" * 32, b"x" * 64, bytes(range(200))])
+def test_keyed_mac_matches_hmac_new(key):
+    mac = KeyedMAC(key)
+    for message in (b"", b"receipt", b"m" * 1000):
+        expected = hmac.new(key, message, hashlib.sha256)
+        assert mac.hexdigest(message) == expected.hexdigest()
+        assert mac.digest(message) == expected.digest()
+
+
+def test_prefix_and_parts_are_streamed_into_the_mac():
+    key = b"k" * 32
+    mac = KeyedMAC(key, prefix=b"DOMAIN\x00")
+
+    expected = hmac.new(key, b"DOMAIN\x00header.body", hashlib.sha256).hexdigest()
+    assert mac.hexdigest(b"header", b".", b"body") == expected
+    assert mac.verify(expected, b"header.body")
+
+
+def test_batch_sign_and_verify():
+    mac = KeyedMAC(b"s" * 32)
+    messages = [f"receipt-{i}".encode() for i in range(50)]
+
+    signatures = mac.sign_many(messages)
+
+    assert signatures == [mac.hexdigest(m) for m in messages]
+    tampered = list(signatures)
+    tampered[3] = "0" * 64
+    tampered[7] = None
+    tampered[9] = "é" * 64
+    results = mac.verify_many(messages, tampered)
+    assert [i for i, ok in enumerate(results) if not ok] == [3, 7, 9]
+    with pytest.raises(ValueError):
+        mac.verify_many(messages, signatures[:-1])
+
+
+def test_receipt_signer_batch_matches_single_calls():
+    key = b"r" * 32
+    signer = HMACReceiptSigner("gate-key", key)
+    receipts = [f'{{"n":{i}}}'.encode() for i in range(10)]
+
+    signatures = signer.sign_many(receipts)
+
+    assert signatures == [signer.sign(r) for r in receipts]
+    domain_bound = RECEIPT_DOMAIN.encode("ascii") + b"\x00" + receipts[0]
+    assert signatures[0]["value"] == hmac.new(key, domain_bound, hashlib.sha256).hexdigest()
+    wrong_key = dict(signatures[1], key_id="other")
+    assert signer.verify_many(receipts[:2], [signatures[0], wrong_key]) == [True, False]
+
+
+def test_phase0_signatures_match_hmac_new_with_string_or_held_keys():
+    key = "verifier-key"
+    policy = VerificationPolicy(
+        allowed_actions=("READ",),
+        expected_attestation_digest="attest",
+        expected_policy_hash="policy",
+    )
+    proposal = ActionProposal(
+        proposal_id="proposal-1",
+        action="READ",
+        nonce="nonce-1",
+        counter=1,
+        attestation_digest="attest",
+        policy_hash="policy",
+        previous_receipt_hash="prev",
+        snapshot_id="snap",
+    )
+
+    receipt = verify_action(proposal, policy, key)
+
+    for signed in (receipt, receipt["actuation_token"]):
+        unsigned = {k: v for k, v in signed.items() if k != "signature"}
+        expected = hmac.new(key.encode(), canonical_json_bytes(unsigned), hashlib.sha256)
+        assert signed["signature"] == expected.hexdigest()
+    assert guard_accepts_token(receipt["actuation_token"], key, set())
+    assert not guard_accepts_token(receipt["actuation_token"], "other-key", set())
+
+    held = payload_mac(key)
+    assert payload_mac(held) is held
+    assert verify_action(proposal, policy, held) == receipt
+    assert guard_accepts_token(receipt["actuation_token"], held, set())
@@ -0,0 +1,116 @@
+"""Tests for the persistent, chain-prefetching SDF lineage store."""
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from lineage_store import SQLiteLineageStore
+from sdf_evidence_envelope import SDFEvidenceEnvelope, build_envelope, verify_evidence
+
+GENESIS = "a" * 64
+
+
+def _envelope(key, sequence: int, parent: SDFEvidenceEnvelope | None, tag: str = "") -> SDFEvidenceEnvelope:
+    return build_envelope(
+        evidence_id=f"evidence-{tag}{sequence}",
+        claim={"op": "write", "n": sequence},
+        issuer_authority_id="authority",
+        issuer_private_key=key,
+        context="context",
+        genesis_hash=GENESIS,
+        parent_hash=None if parent is None else parent.canonical_hash,
+        sequence=sequence,
+        issued_at="2026-08-17T00:00:00Z",
+        nonce=f"nonce-{tag}{sequence}",
+    )
+
+
+def _chain(key, length: int) -> list[SDFEvidenceEnvelope]:
+    chain: list[SDFEvidenceEnvelope] = []
+    for sequence in range(length):
+        chain.append(_envelope(key, sequence, chain[-1] if chain else None))
+    return chain
+
+
+class CountingStore(SQLiteLineageStore):
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.calls: list[str] = []
+
+    def resolve(self, canonical_hash: str) -> SDFEvidenceEnvelope | None:
+        self.calls.append("resolve")
+        return super().resolve(canonical_hash)
+
+    def resolve_chain(self, canonical_hash: str, max_depth: int) -> list[SDFEvidenceEnvelope]:
+        self.calls.append("resolve_chain")
+        return super().resolve_chain(canonical_hash, max_depth)
+
+
+def _verify(envelope: SDFEvidenceEnvelope, resolver: Any) -> bool:
+    return verify_evidence(
+        envelope,
+        authority_scope=frozenset({"authority"}),
+        current_context="context",
+        seen_nonces=set(),
+        invariant_pass=True,
+        trusted_authority_keys={"authority": envelope.issuer.public_key_b64},
+        lineage_resolver=resolver,
+        trusted_genesis_hashes=frozenset({GENESIS}),
+    ).lineage_intact
+
+
+def test_resolve_chain_follows_parent_links_through_forks(tmp_path: Path) -> None:
+    key = ec.generate_private_key(ec.SECP256K1())
+    trunk = _chain(key, 6)
+    # A fork at sequence 3 starts its own lane beside the trunk's.
+    sibling = _envelope(key, 3, trunk[2], tag="fork-")
+    with SQLiteLineageStore(tmp_path / "lineage.sqlite") as store:
+        assert store.put_many(trunk) == 6
+        assert store.put_many([sibling, trunk[0]]) == 1
+        assert len(store) == 7
+
+        assert store.resolve(trunk[4].canonical_hash) == trunk[4]
+        assert store.resolve("f" * 64) is None
+        assert store.resolve_chain(trunk[5].canonical_hash, 10) == trunk[::-1]
+        assert store.resolve_chain(trunk[5].canonical_hash, 2) == [trunk[5], trunk[4]]
+        assert store.resolve_chain(sibling.canonical_hash, 10) == [sibling, *trunk[2::-1]]
+        assert store.resolve_chain("f" * 64, 10) == []
+
+
+def test_resolve_chain_crosses_lanes_stored_out_of_order(tmp_path: Path) -> None:
+    key = ec.generate_private_key(ec.SECP256K1())
+    chain = _chain(key, 6)
+    with SQLiteLineageStore(tmp_path / "lineage.sqlite") as store:
+        # Children stored before their parents cannot join the parent's lane.
+        store.put_many(chain[3:])
+        store.put_many(chain[:3])
+        assert store.resolve_chain(chain[5].canonical_hash, 10) == chain[::-1]
+        assert store.resolve_chain(chain[5].canonical_hash, 4) == chain[:1:-1]
+
+
+def test_check_lineage_uses_one_bulk_read(tmp_path: Path) -> None:
+    key = ec.generate_private_key(ec.SECP256K1())
+    chain = _chain(key, 8)
+    with CountingStore(tmp_path / "lineage.sqlite") as store:
+        store.put_many(chain[:-1])
+        assert _verify(chain[-1], store)
+        assert store.calls == ["resolve_chain"]
+
+        # A missing ancestor still fails closed.
+        with SQLiteLineageStore(tmp_path / "gap.sqlite") as gapped:
+            gapped.put_many(chain[:3] + chain[4:-1])
+            assert not _verify(chain[-1], gapped)
+
+
+def test_rejects_envelopes_whose_hash_does_not_commit_to_the_body(tmp_path: Path) -> None:
+    key = ec.generate_private_key(ec.SECP256K1())
+    genesis = _chain(key, 1)[0]
+    with SQLiteLineageStore(tmp_path / "lineage.sqlite") as store:
+        with pytest.raises(ValueError, match="canonical_hash"):
+            store.put(replace(genesis, claim={"op": "delete"}))
+        with pytest.raises(ValueError, match="lineage"):
+            store.put(replace(genesis, lineage=replace(genesis.lineage, sequence=-1)))
+        assert len(store) == 0
@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core import merkle
+from core.merkle import MerkleTree, canonical_json, leaf_hash, verify_many, verify_proof
+
+VECTORS_PATH = Path(__file__).resolve().parents[1] / "conformance-tests" / "merkle" / "vectors_v1_sha256.json"
+VECTORS = json.loads(VECTORS_PATH.read_text(encoding="utf-8"))
+
+
+def _tree(vector):
+    tree = MerkleTree()
+    for leaf in vector["leaves"]:
+        canonical = canonical_json(leaf["input"])
+        assert canonical.hex() == leaf["expected_canonical_hex"]
+        tree.append(canonical)
+    return tree
+
+
+@pytest.mark.parametrize(
+    "vector", [v for v in VECTORS if v["expected_result"] == "ACCEPT"], ids=lambda v: v["vector_id"]
+)
+def test_accept_vectors_reproduce_levels_and_root(vector):
+    tree = _tree(vector)
+    header = merkle.EMPTY_HEADER if not vector["leaves"] else merkle.LEAF_HEADER
+    assert header.hex() in {
+        value for key, value in vector["domain"].items() if key.endswith("header_hex")
+    }
+    assert [leaf_hash(canonical_json(leaf["input"])).hex() for leaf in vector["leaves"]] == [
+        leaf["expected_leaf_hash"] for leaf in vector["leaves"]
+    ]
+    assert tree.levels() == vector["expected_levels"]
+    assert tree.root_hex() == vector["expected_root_hash"]
+
+    proofs = tree.proofs()
+    assert proofs == [tree.proof(index) for index in range(len(tree))]
+    leaves = [bytes.fromhex(leaf["expected_leaf_hash"]) for leaf in vector["leaves"]]
+    assert verify_many(list(zip(leaves, proofs)), vector["expected_root_hash"]) == [True] * len(leaves)
+
+
+@pytest.mark.parametrize(
+    "vector", [v for v in VECTORS if v["expected_result"] == "REJECT"], ids=lambda v: v["vector_id"]
+)
+def test_reject_vectors_produce_a_root_mismatch(vector):
+    tree = MerkleTree(bytes.fromhex(leaf["expected_leaf_hash"]) for leaf in vector["leaves"])
+    assert tree.root_hex() == vector["actual_root_hash"]
+    assert tree.root_hex() != vector["provided_root_hash"]
+
+
+def test_incremental_roots_match_rebuilt_trees_and_proofs_reject_tampering():
+    leaves = [leaf_hash(str(index).encode()) for index in range(37)]
+    tree = MerkleTree()
+    for count, leaf in enumerate(leaves, start=1):
+        tree.append_leaf_hash(leaf)
+        assert tree.root == MerkleTree(leaves[:count]).root
+
+    for index, proof in enumerate(tree.proofs()):
+        assert verify_proof(leaves[index], proof, tree.root)
+        assert not verify_proof(leaves[(index + 1) % len(leaves)], proof, tree.root)
+    assert verify_many([(leaves[0], [{"up": "00"}]), (leaves[0], tree.proof(0))], tree.root) == [False, True]
+    with pytest.raises(IndexError):
+        tree.proof(len(leaves))
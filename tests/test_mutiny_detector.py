@@ -1,7 +1,11 @@
 import math
+import random
+
+import pytest
 
 from core.physics.tasw_hamiltonian import EnergyState
-from core.sensing.mutiny_detector import MutinyDetector
+from core.sensing import mutiny_detector
+from core.sensing.mutiny_detector import MutinyBank, MutinyDetector
 
 
 def test_nominal_and_friction_progression():
@@ -62,4 +66,77 @@ def test_cooldown_enforces_blocking_after_trip():
     recovered = detector.assess_state(EnergyState(total=0.5))
     assert recovered.severity == "NOMINAL"
     assert recovered.is_mutiny is False
-# Nonce: 16153
+
+
+def _random_batches(streams, batches, per_batch, seed=7):
+    rng = random.Random(seed)
+    clock = [0.0] * streams
+    levels = [math.nan, -1.0, 0.5, 8.5, 9.5, 12.0, 18.5, 19.5, 25.0]
+    for _ in range(batches):
+        batch = []
+        for _ in range(per_batch):
+            stream = rng.randrange(streams)
+            clock[stream] += rng.choice([0.5, 2.0, 6.0])
+            batch.append((stream, clock[stream], rng.choice(levels)))
+        yield batch
+
+
+def _reference_transitions(batches, monkeypatch, **config):
+    detectors = {}
+    now = [0.0]
+    monkeypatch.setattr(mutiny_detector.time, "monotonic", lambda: now[0])
+    transitions = []
+    for batch in batches:
+        for stream, timestamp, total in batch:
+            detector = detectors.setdefault(stream, MutinyDetector(**config))
+            before = detector._state
+            now[0] = timestamp
+            event = detector.assess_state(EnergyState(total=total))
+            if event.severity != before:
+                transitions.append((stream, timestamp, before, event.severity, event.trigger_code))
+    monkeypatch.undo()
+    return transitions, {stream: d._state for stream, d in detectors.items()}
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_mutiny_bank_matches_per_stream_detectors(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    config = dict(friction_threshold=10.0, mutiny_threshold=20.0, hysteresis=0.1, cooldown_seconds=5.0)
+    batches = list(_random_batches(streams=64, batches=3, per_batch=4000))
+    expected, final_states = _reference_transitions(batches, monkeypatch, **config)
+    if not use_numpy:
+        monkeypatch.setattr(mutiny_detector, "np", None)
+
+    bank = MutinyBank(**config)
+    actual = []
+    for batch in batches:
+        for t in bank.process(batch):
+            actual.append((t.stream_id, t.timestamp, t.previous, t.event.severity, t.event.trigger_code))
+
+    assert actual == expected
+    assert {stream: bank.state(stream) for stream in final_states} == final_states
+
+
+def test_mutiny_bank_reports_only_transitions():
+    bank = MutinyBank(friction_threshold=1.0, mutiny_threshold=2.0, cooldown_seconds=5.0)
+
+    transitions = bank.process([(3, 0.0, 0.5), (3, 1.0, 0.5), (3, 2.0, 10.0), (3, 3.0, 0.1), (3, 9.0, 0.1)])
+
+    assert [(t.timestamp, t.previous, t.event.severity) for t in transitions] == [
+        (2.0, "NOMINAL", "MUTINY"),
+        (9.0, "MUTINY", "NOMINAL"),
+    ]
+    assert transitions[0].event.trigger_code == "HAMILTONIAN_LIMIT_EXCEEDED"
+    assert bank.state(3) == "NOMINAL"
+    assert bank.state(99) == "NOMINAL"
+
+
+def test_mutiny_bank_rejects_bad_stream_ids():
+    bank = MutinyBank()
+    with pytest.raises(ValueError):
+        bank.process([(-1, 0.0, 1.0)])
+    with pytest.raises(ValueError):
+        bank.process([(1.5, 0.0, 1.0)])
+    assert bank.process([]) == []
+# Nonce: 4448
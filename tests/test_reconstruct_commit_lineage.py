@@ -74,3 +74,57 @@ def test_cli_writes_json_lines(tmp_path):
     )
     assert json.loads(output.read_text().splitlines()[0])["commit_identity"]["sha"] == first
     assert "sha256:" in completed.stderr
+
+
+def branching_repository(tmp_path: Path) -> Path:
+    repo, _, _ = repository(tmp_path)
+    run(repo, "git", "checkout", "-qb", "side")
+    (repo / "data.bin").write_bytes(b"\0binary")
+    run(repo, "git", "add", ".")
+    run(repo, "git", "commit", "-qm", "add a binary fixture")
+    run(repo, "git", "tag", "-a", "v1", "-m", "annotated")
+    run(repo, "git", "checkout", "-q", "-")
+    run(repo, "git", "mv", "README.md", "docs.md")
+    run(repo, "git", "commit", "-qm", "rename the readme")
+    run(repo, "git", "merge", "-q", "--no-edit", "side")
+    run(repo, "git", "checkout", "-qb", "ignored", "HEAD~1")
+    (repo / "scratch.txt").write_text("scratch\n")
+    run(repo, "git", "add", ".")
+    run(repo, "git", "commit", "-qm", "branch merged with the ours strategy")
+    run(repo, "git", "checkout", "-q", "-")
+    run(repo, "git", "merge", "-q", "-s", "ours", "--no-edit", "ignored")
+    run(repo, "git", "commit", "-q", "--allow-empty", "-m", "empty\n\nwith a body\n")
+    run(repo, "git", "tag", "lightweight", "HEAD~1")
+    return repo
+
+
+def test_streaming_export_matches_per_commit_export(tmp_path):
+    repo = branching_repository(tmp_path)
+    expected = module.records(repo, "--all", {})
+    streamed = list(module.iter_records(repo, "--all", {}))
+
+    assert streamed == expected
+    merge = expected[-2]["git_evidence"]
+    assert [delta["changed_files"] for delta in merge["parent_deltas"]][0] == []
+    renamed = [item for item in expected if item["git_evidence"]["commit_message"] == "rename the readme"]
+    assert renamed[0]["git_evidence"]["changed_files"][0]["path"] == "README.md => docs.md"
+    default_branch = run(repo, "git", "symbolic-ref", "HEAD").stdout.strip()
+    assert expected[0]["commit_identity"]["containing_refs"] == sorted(
+        [default_branch, "refs/heads/ignored", "refs/heads/side", "refs/tags/lightweight", "refs/tags/v1"]
+    )
+
+
+def test_cli_fast_output_is_byte_identical(tmp_path):
+    (tmp_path / "repo").mkdir()
+    repo = branching_repository(tmp_path / "repo")
+    outputs = []
+    for flags in ([], ["--fast"]):
+        output = tmp_path / f"lineage{len(outputs)}.jsonl"
+        completed = subprocess.run(
+            [sys.executable, str(SCRIPT), "--repo", str(repo), "--output", str(output), *flags],
+            text=True,
+            capture_output=True,
+            check=True,
+        )
+        outputs.append((output.read_bytes(), completed.stderr.split(" to ")[0]))
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,116 @@
+"""Indexed registry ledgers behind SDFRegistryAPI."""
+
+import os
+import types
+
+import pytest
+
+import sdf_tas_interface
+from sdf_tas_interface import (
+    EpistemicCapsule,
+    FileRegistryLedger,
+    InMemoryRegistryLedger,
+    SDFRegistryAPI,
+)
+
+WITNESS_KEY = "witness-key"
+
+
+@pytest.fixture(autouse=True)
+def fixed_clock(monkeypatch):
+    monkeypatch.setattr(sdf_tas_interface, "_utc_timestamp", lambda: "2026-01-01T00:00:00+00:00")
+
+
+def _capsule(owner):
+    return EpistemicCapsule(
+        owner_id=owner,
+        claims=("claim",),
+        sources=("source",),
+        attestations=("attestation",),
+        consent_scope="scope",
+        revocation_policy="policy",
+    )
+
+
+def _populate(registry):
+    first = registry.notarize_capsule(_capsule("did:tas:alice"))
+    second = registry.notarize_capsule(_capsule("did:tas:bob"))
+    registry.append_execution_record(first["record_id"], "trace-1", "prev-1", "EXECUTED")
+    registry.append_execution_record(second["record_id"], "trace-2", "prev-2", "REFUSED")
+    registry.append_execution_record(first["record_id"], "trace-3", "prev-3", "EXECUTED")
+    return first, second
+
+
+def test_query_record_is_a_lazy_indexed_iterator():
+    registry = SDFRegistryAPI(WITNESS_KEY)
+    first, _ = _populate(registry)
+    timeline = registry.query_record(first["record_id"])
+    assert isinstance(timeline, types.GeneratorType)
+    assert [entry["ledger_tx"] for entry in timeline] == ["tx-000001", "tx-000003", "tx-000005"]
+    assert list(registry.query_record("record-999999")) == []
+    assert [entry["owner_id"] for entry in registry.query_owner("did:tas:bob")] == ["did:tas:bob"]
+    assert registry.get_transaction("tx-000004")["status"] == "REFUSED"
+    assert registry.get_transaction("tx-999999") is None
+
+
+def test_file_ledger_matches_in_memory_entries_and_signatures(tmp_path):
+    in_memory = SDFRegistryAPI(WITNESS_KEY)
+    with FileRegistryLedger(tmp_path) as ledger:
+        durable = SDFRegistryAPI(WITNESS_KEY, ledger=ledger)
+        _populate(in_memory)
+        _populate(durable)
+        assert list(durable.ledger) == list(in_memory.ledger)
+        for record_id in ("record-000001", "record-000002"):
+            assert list(durable.query_record(record_id)) == list(in_memory.query_record(record_id))
+        assert durable.get_transaction("tx-000002") == in_memory.get_transaction("tx-000002")
+
+
+def test_file_ledger_resumes_sequence_without_replay(tmp_path):
+    with FileRegistryLedger(tmp_path) as ledger:
+        first, _ = _populate(SDFRegistryAPI(WITNESS_KEY, ledger=ledger))
+
+    with FileRegistryLedger(tmp_path) as reopened:
+        registry = SDFRegistryAPI(WITNESS_KEY, ledger=reopened)
+        assert len(reopened) == 5
+        receipt = registry.notarize_capsule(_capsule("did:tas:carol"))
+        assert receipt["record_id"] == "record-000006"
+        assert [entry["ledger_tx"] for entry in registry.query_record(first["record_id"])] == [
+            "tx-000001",
+            "tx-000003",
+            "tx-000005",
+        ]
+
+
+def test_file_ledger_indexes_unindexed_tail_and_drops_torn_line(tmp_path):
+    with FileRegistryLedger(tmp_path) as ledger:
+        registry = SDFRegistryAPI(WITNESS_KEY, ledger=ledger)
+        registry.notarize_capsule(_capsule("did:tas:alice"))
+
+    # Simulate a crash after the log write but before the index insert, then a torn write.
+    log_path = tmp_path / FileRegistryLedger.LOG_NAME
+    in_memory = SDFRegistryAPI(WITNESS_KEY)
+    in_memory.notarize_capsule(_capsule("did:tas:alice"))
+    lost = in_memory.notarize_capsule(_capsule("did:tas:bob"))
+    with open(log_path, "ab") as stream:
+        stream.write(sdf_tas_interface.canonical_json_bytes(lost) + b"\n")
+        stream.write(b'{"record_id":"record-0000')
+    size_before = os.path.getsize(log_path)
+
+    with FileRegistryLedger(tmp_path) as recovered:
+        assert len(recovered) == 2
+        assert list(recovered.query_owner("did:tas:bob")) == [lost]
+        assert os.path.getsize(log_path) < size_before
+        registry = SDFRegistryAPI(WITNESS_KEY, ledger=recovered)
+        assert registry.notarize_capsule(_capsule("did:tas:carol"))["ledger_tx"] == "tx-000003"
+
+
+def test_file_ledger_refuses_log_shorter_than_index(tmp_path):
+    with FileRegistryLedger(tmp_path) as ledger:
+        _populate(SDFRegistryAPI(WITNESS_KEY, ledger=ledger))
+    os.truncate(tmp_path / FileRegistryLedger.LOG_NAME, 10)
+    with pytest.raises(ValueError):
+        FileRegistryLedger(tmp_path)
+
+
+def test_in_memory_ledger_is_default():
+    assert isinstance(SDFRegistryAPI(WITNESS_KEY).ledger, InMemoryRegistryLedger)
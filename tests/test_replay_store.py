@@ -0,0 +1,156 @@
+"""Replay stores behind ExternalActuatorGuard."""
+
+import multiprocessing
+
+import pytest
+
+from sdf_tas_interface import (
+    ExternalActuatorGuard,
+    InMemoryReplayStore,
+    WindowedReplayStore,
+)
+from tas_phase0_microkernel import ActionProposal, VerificationPolicy, verify_action
+
+KEY = "verifier-key"
+POLICY = VerificationPolicy(
+    allowed_actions=("READ",),
+    expected_attestation_digest="attest",
+    expected_policy_hash="policy",
+)
+
+
+def _gateway_receipt(counter):
+    proposal = ActionProposal(
+        proposal_id=f"proposal-{counter}",
+        action="READ",
+        nonce=f"nonce-{counter}",
+        counter=counter,
+        attestation_digest="attest",
+        policy_hash="policy",
+        previous_receipt_hash="prev",
+        snapshot_id="snap",
+    )
+    receipt = verify_action(proposal, POLICY, KEY)
+    return {
+        "intent_id": f"intent-{counter}",
+        "record_hash": "record",
+        "anchor_hash": "anchor",
+        "verification_receipt": receipt,
+    }
+
+
+def test_in_memory_store_keeps_prototype_eviction():
+    store = InMemoryReplayStore(max_size=2)
+    assert store.consume(1) and store.consume(2) and store.consume(3)
+    assert 1 not in store
+    assert not store.consume(3)
+
+
+def test_windowed_store_refuses_counters_below_the_window(tmp_path):
+    with WindowedReplayStore(tmp_path / "replay.bin", window=64) as store:
+        assert store.consume(5)
+        assert not store.consume(5)
+        assert store.consume(3)
+        assert store.consume(100)
+        assert store.high_watermark == 100
+        # 3 and 36 are outside the window (36 < 100 - 64 + 1) and stay refused.
+        assert 36 in store and not store.consume(36)
+        assert 37 not in store and store.consume(37)
+        assert 99 not in store and store.consume(99)
+
+
+def test_windowed_store_clears_slots_when_the_window_advances(tmp_path):
+    with WindowedReplayStore(tmp_path / "replay.bin", window=16) as store:
+        assert all(store.consume(counter) for counter in range(0, 16))
+        assert store.consume(21)
+        # Slots of 16..20 were recycled from 0..4 and must read as unused,
+        # while 0..5 have fallen below the window and stay consumed.
+        assert [counter in store for counter in range(16, 22)] == [False] * 5 + [True]
+        assert all(counter in store for counter in range(0, 16))
+        assert store.consume(10_000)
+        assert not any(counter in store for counter in range(9_990, 10_000))
+
+
+def test_windowed_store_persists_and_keeps_its_window(tmp_path):
+    path = tmp_path / "replay.bin"
+    with WindowedReplayStore(path, window=64) as store:
+        assert store.consume(7)
+    with WindowedReplayStore(path, window=1024) as reopened:
+        assert reopened.window == 64
+        assert not reopened.consume(7)
+        assert reopened.high_watermark == 7
+
+
+@pytest.mark.parametrize("counter", [-1, "7", 1.0, True, None])
+def test_windowed_store_fails_closed_on_non_counters(tmp_path, counter):
+    with WindowedReplayStore(tmp_path / "replay.bin", window=64) as store:
+        assert not store.consume(counter)
+
+
+def test_windowed_store_refuses_counters_beyond_the_watermark_field(tmp_path):
+    with WindowedReplayStore(tmp_path / "replay.bin", window=64) as store:
+        assert store.consume(100)
+        assert not store.consume(2**63)
+        assert 2**63 not in store
+        # The oversized counter must not have cleared the window.
+        assert not store.consume(100)
+        assert store.high_watermark == 100
+        assert store.consume(2**63 - 1)
+
+
+def test_windowed_store_rejects_foreign_files(tmp_path):
+    path = tmp_path / "replay.bin"
+    path.write_bytes(b"not a replay store" * 4)
+    with pytest.raises(ValueError):
+        WindowedReplayStore(path)
+
+
+def _consume_all(path, counters, results):
+    with WindowedReplayStore(path, window=4096) as store:
+        results.extend([counter for counter in counters if store.consume(counter)])
+
+
+def test_windowed_store_accepts_each_counter_once_across_processes(tmp_path):
+    path = tmp_path / "replay.bin"
+    WindowedReplayStore(path, window=4096).close()
+    with multiprocessing.Manager() as manager:
+        results = manager.list()
+        workers = [
+            multiprocessing.Process(target=_consume_all, args=(path, range(1, 2001), results))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert sorted(results) == list(range(1, 2001))
+
+
+def test_guard_shares_replay_state_through_the_store(tmp_path):
+    path = tmp_path / "replay.bin"
+    with WindowedReplayStore(path) as first, WindowedReplayStore(path) as second:
+        guard_a = ExternalActuatorGuard(KEY, replay_store=first)
+        guard_b = ExternalActuatorGuard(KEY, replay_store=second)
+        receipt = _gateway_receipt(1)
+        assert guard_a.execute(receipt)["status"] == "EXECUTED"
+        assert guard_b.execute(receipt)["status"] == "REFUSED"
+        assert guard_b.execute(_gateway_receipt(2))["status"] == "EXECUTED"
+
+
+def test_guard_does_not_consume_counters_for_forged_tokens(tmp_path):
+    with WindowedReplayStore(tmp_path / "replay.bin") as store:
+        guard = ExternalActuatorGuard(KEY, replay_store=store)
+        forged = _gateway_receipt(3)
+        forged["verification_receipt"]["actuation_token"]["signature"] = "0" * 64
+        assert guard.execute(forged)["status"] == "REFUSED"
+        assert 3 not in store
+        assert guard.execute(_gateway_receipt(3))["status"] == "EXECUTED"
+
+
+def test_default_guard_warns_and_uses_the_in_memory_store():
+    with pytest.warns(RuntimeWarning):
+        guard = ExternalActuatorGuard(KEY, max_replay_cache_size=8)
+    assert isinstance(guard.replay_store, InMemoryReplayStore)
+    receipt = _gateway_receipt(1)
+    assert guard.execute(receipt)["status"] == "EXECUTED"
+    assert guard.execute(receipt)["status"] == "REFUSED"
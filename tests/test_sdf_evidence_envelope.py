@@ -881,6 +881,21 @@ class TestReceiptDeterminism:
         )
         assert v_scope_fail.receipt_hash != v_context_fail.receipt_hash
 
+    def test_from_dict_round_trips_a_verifiable_envelope(self) -> None:
+        key = _new_key()
+        env = _make_envelope(key=key, claim={"op": "write", "n": [1, 2.5, None]})
+
+        restored = SDFEvidenceEnvelope.from_dict(env.to_dict())
+
+        assert restored == env
+        assert verify_evidence(
+            restored,
+            authority_scope=_scope(),
+            current_context="ctx:system:v1",
+            seen_nonces=_nonces(),
+            invariant_pass=True,
+        ).admissible
+
 
 class TestReviewTrustBoundaryRegressions:
     def setup_method(self) -> None:
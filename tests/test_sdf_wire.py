@@ -0,0 +1,96 @@
+"""Tests for the binary SDF envelope wire frame."""
+
+import base64
+from dataclasses import replace
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from sdf_evidence_envelope import (
+    SDF_ENVELOPE_DOMAIN,
+    SDFEvidenceEnvelope,
+    _canonical_json,
+    build_envelope,
+)
+from sdf_wire import WIRE_VERSION, decode, encode
+
+
+def _envelope(key, **overrides) -> SDFEvidenceEnvelope:
+    fields = dict(
+        evidence_id="evidence-1",
+        claim={"op": "write", "value": 1.5, "tags": ["a", "b"], "note": None},
+        issuer_authority_id="authority",
+        issuer_private_key=key,
+        context="context",
+        genesis_hash="a" * 64,
+        parent_hash="b" * 64,
+        sequence=7,
+        issued_at="2026-08-17T00:00:00Z",
+        nonce="nonce-1",
+    )
+    fields.update(overrides)
+    return build_envelope(**fields)
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"parent_hash": None, "sequence": 0},
+    {"evidence_id": 'quote " back\\slash \n tab\t é漢 \U0001f600',
+     "claim": {"kéy": ["\x00", " ", 2**70, -0.0]}},
+])
+def test_round_trip_preserves_signed_bytes_hash_and_signature(overrides) -> None:
+    key = ec.generate_private_key(ec.SECP256K1())
+    envelope = _envelope(key, **overrides)
+    frame = encode(envelope)
+    wire = decode(bytearray(frame))
+
+    signed = SDF_ENVELOPE_DOMAIN + _canonical_json(envelope.body_dict())
+    assert wire.signed_message() == signed
+    assert wire.hash_matches()
+    assert wire.canonical_hash == envelope.canonical_hash
+    assert wire.parent_hash == envelope.lineage.parent_hash
+    assert bytes(wire.claim_json) == _canonical_json(envelope.claim)
+    key.public_key().verify(bytes(wire.signature), wire.signed_message(), ec.ECDSA(hashes.SHA256()))
+
+    rebuilt = wire.to_envelope()
+    assert rebuilt.signature == envelope.signature
+    assert rebuilt.body_dict() == envelope.body_dict()
+    assert encode(rebuilt) == frame
+    assert len(frame) < len(_canonical_json(envelope.to_dict()))
+
+
+def test_fields_are_views_into_the_callers_buffer() -> None:
+    key = ec.generate_private_key(ec.SECP256K1())
+    frame = bytearray(encode(_envelope(key)))
+    wire = decode(frame)
+    assert wire.public_key.obj is frame
+    assert wire.nbytes == len(frame)
+    assert wire.evidence_id == "evidence-1"
+
+    # Tampering with the framed body breaks the hash commitment.
+    start = frame.index(b"nonce-1")
+    frame[start] = ord("N")
+    assert not decode(frame).hash_matches()
+
+
+def test_rejects_malformed_frames_and_unframeable_envelopes() -> None:
+    key = ec.generate_private_key(ec.SECP256K1())
+    envelope = _envelope(key)
+    frame = encode(envelope)
+    with pytest.raises(ValueError, match="truncated"):
+        decode(frame[:10])
+    with pytest.raises(ValueError, match="length"):
+        decode(frame + b"\x00")
+    with pytest.raises(ValueError, match="not an SDF"):
+        decode(b"XXXX" + frame[4:])
+    with pytest.raises(ValueError, match="version"):
+        decode(frame[:4] + bytes([WIRE_VERSION + 1]) + frame[5:])
+
+    with pytest.raises(ValueError, match="hex"):
+        encode(replace(envelope, canonical_hash="A" * 64))
+    unpadded = base64.b64encode(b"\x04" * 65).decode().rstrip("=") + "\n"
+    with pytest.raises(ValueError, match="base64"):
+        encode(replace(envelope, issuer=replace(envelope.issuer, public_key_b64=unpadded)))
+    with pytest.raises(ValueError, match="sequence"):
+        encode(replace(envelope, lineage=replace(envelope.lineage, sequence=-1)))
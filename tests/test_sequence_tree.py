@@ -0,0 +1,62 @@
+import hashlib
+import json
+
+from tas_tools.tas_sequencer import TAS_META_EXT, sequence_artifact, sequence_tree
+from tas_tools.tas_shadow_scan import scan_repository
+
+
+def _expected_lineage(meta, previous_lineage):
+    content = (
+        f"{meta['form_id']}{previous_lineage or ''}{meta['h_seed']}"
+        f"{meta['timestamp']}{meta['genome_id']}"
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _load_meta(path):
+    with open(str(path) + TAS_META_EXT) as f:
+        return json.load(f)
+
+
+def _write_tree(root):
+    (root / "nested").mkdir()
+    (root / "a.py").write_text("A = 1\n")
+    (root / "nested" / "b.py").write_text("B = 2\n")
+    (root / ".hidden").write_text("skipped\n")
+
+
+def test_sequence_tree_produces_a_clean_shadow_scan(tmp_path):
+    _write_tree(tmp_path)
+    manifest_path = tmp_path.parent / f"{tmp_path.name}-manifest.json"
+
+    manifest = sequence_tree(str(tmp_path), jobs=4, manifest_path=str(manifest_path))
+
+    assert [item["path"] for item in manifest["artifacts"]] == [
+        str(tmp_path / "a.py"),
+        str(tmp_path / "nested" / "b.py"),
+    ]
+    assert manifest["errors"] == []
+    with open(manifest_path) as f:
+        assert json.load(f) == manifest
+
+    report = scan_repository(str(tmp_path))
+    assert len(report["living_braid"]) == 2
+    assert report["noise"] == []
+
+
+def test_sequence_tree_lineage_matches_per_file_ceremony(tmp_path):
+    _write_tree(tmp_path)
+    target = tmp_path / "a.py"
+    assert sequence_artifact(str(target))
+    first = _load_meta(target)
+    assert first["lineage_id"] == _expected_lineage(first, None)
+
+    manifest = sequence_tree(str(tmp_path), batch_size=1)
+
+    second = _load_meta(target)
+    assert second["lineage_id"] == _expected_lineage(second, first["lineage_id"])
+    assert set(second) == set(first)
+    entry = next(item for item in manifest["artifacts"] if item["path"] == str(target))
+    assert entry["previous_lineage"] == first["lineage_id"]
+    assert entry["lineage_id"] == second["lineage_id"] == second["id"]
+    assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,121 @@
+import json
+import os
+
+from tas_tools import tas_shadow_scan
+from tas_tools.tas_shadow_scan import SCAN_CACHE_FILENAME, scan_repository
+
+
+def _strip_timestamp(report):
+    return {key: value for key, value in report.items() if key != "timestamp"}
+
+
+def _write_tree(root):
+    (root / "pkg").mkdir()
+    for index in range(12):
+        (root / "pkg" / f"module_{index}.py").write_text(f"VALUE = {index}\n")
+    (root / "large.bin").write_bytes(os.urandom(tas_shadow_scan.MMAP_THRESHOLD + 17))
+    sequenced = root / "pkg" / "module_0.py"
+    form_id = tas_shadow_scan.calculate_sha256(str(sequenced))
+    (root / "pkg" / "module_0.py.tasmeta.json").write_text(json.dumps({"form_id": form_id}))
+
+
+def test_parallel_incremental_report_matches_serial_scan(tmp_path):
+    _write_tree(tmp_path)
+
+    serial = scan_repository(str(tmp_path))
+    parallel = scan_repository(str(tmp_path), incremental=True, jobs=4)
+
+    assert _strip_timestamp(parallel) == _strip_timestamp(serial)
+    assert len(serial["living_braid"]) == 1
+    assert (tmp_path / SCAN_CACHE_FILENAME).exists()
+
+
+def test_incremental_scan_only_rehashes_changed_files(tmp_path, monkeypatch):
+    _write_tree(tmp_path)
+    scan_repository(str(tmp_path), incremental=True)
+    # Age every file so the racy-mtime guard lets them into the cache.
+    for path in tmp_path.rglob("*"):
+        if path.is_file() and path.name != SCAN_CACHE_FILENAME:
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    scan_repository(str(tmp_path), incremental=True)
+
+    changed = tmp_path / "pkg" / "module_0.py"
+    changed.write_text("VALUE = 'drifted'\n")
+
+    hashed = []
+    original = tas_shadow_scan.calculate_sha256
+
+    def recording_sha256(filepath):
+        hashed.append(filepath)
+        return original(filepath)
+
+    monkeypatch.setattr(tas_shadow_scan, "calculate_sha256", recording_sha256)
+    report = scan_repository(str(tmp_path), incremental=True, jobs=2)
+
+    assert hashed == [str(changed)]
+    assert report["living_braid"] == []
+    drifted = [item for item in report["noise"] if item["path"] == str(changed)]
+    assert drifted[0]["error"] == "Form ID mismatch (file changed since sequencing)"
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    _write_tree(tmp_path)
+    (tmp_path / SCAN_CACHE_FILENAME).write_text("{not json")
+
+    report = scan_repository(str(tmp_path), incremental=True)
+
+    assert len(report["living_braid"]) == 1
+    with open(tmp_path / SCAN_CACHE_FILENAME) as f:
+        assert json.load(f)["version"] == tas_shadow_scan.SCAN_CACHE_VERSION
+
+
+def test_unchanged_sidecars_are_not_reparsed(tmp_path, monkeypatch):
+    _write_tree(tmp_path)
+    scan_repository(str(tmp_path), incremental=True)
+    for path in tmp_path.rglob("*"):
+        if path.is_file() and path.name != SCAN_CACHE_FILENAME:
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    expected = scan_repository(str(tmp_path), incremental=True)
+
+    parsed = []
+    original = json.load
+
+    def recording_load(f, *args, **kwargs):
+        parsed.append(getattr(f, "name", None))
+        return original(f, *args, **kwargs)
+
+    monkeypatch.setattr(tas_shadow_scan.json, "load", recording_load)
+    report = scan_repository(str(tmp_path), incremental=True)
+
+    assert parsed == [str(tmp_path / SCAN_CACHE_FILENAME)]
+    assert _strip_timestamp(report) == _strip_timestamp(expected)
+
+    sidecar = tmp_path / "pkg" / "module_0.py.tasmeta.json"
+    sidecar.write_text(json.dumps({"form_id": "0" * 64}))
+    parsed.clear()
+    report = scan_repository(str(tmp_path), incremental=True)
+
+    assert parsed == [str(tmp_path / SCAN_CACHE_FILENAME), str(sidecar)]
+    assert report["living_braid"] == []
+
+
+def test_in_flight_hashes_are_bounded_while_walking(tmp_path, monkeypatch):
+    _write_tree(tmp_path)
+    jobs = 2
+    limit = tas_shadow_scan.IN_FLIGHT_PER_JOB * jobs
+    total = sum(1 for _ in tas_shadow_scan._iter_artifact_paths(str(tmp_path)))
+    walked = []
+    original_walk = tas_shadow_scan._iter_artifact_paths
+
+    def recording_walk(root_dir):
+        for filepath in original_walk(root_dir):
+            walked.append(filepath)
+            yield filepath
+
+    monkeypatch.setattr(tas_shadow_scan, "_iter_artifact_paths", recording_walk)
+    walked_at_yield = [len(walked) for _ in tas_shadow_scan.iter_scan(str(tmp_path), jobs=jobs)]
+
+    assert total > limit
+    assert len(walked_at_yield) == total
+    assert walked_at_yield[0] < total
+    assert all(seen - done <= limit for done, seen in enumerate(walked_at_yield))
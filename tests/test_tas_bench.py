@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from tas_bench import CASES, compare, run_case, select
+from tas_bench.__main__ import DEFAULT_BASELINE, main
+from tas_bench.harness import percentile
+
+
+def _report(**p50):
+    return {"results": {name: {"p50_us": value} for name, value in p50.items()}}
+
+
+def test_percentile_is_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 0.50) == 50
+    assert percentile(samples, 0.95) == 95
+    assert percentile(samples, 0.99) == 99
+    assert percentile([7], 0.99) == 7
+    with pytest.raises(ValueError):
+        percentile([], 0.5)
+
+
+def test_compare_classifies_each_case():
+    baseline = _report(same=100.0, slower=100.0, faster=100.0, dropped=100.0)
+    current = _report(same=110.0, slower=130.0, faster=70.0, added=5.0)
+
+    statuses = {item.name: item.status for item in compare(baseline, current, threshold=0.25)}
+
+    assert statuses == {
+        "added": "new",
+        "dropped": "missing",
+        "faster": "improvement",
+        "same": "ok",
+        "slower": "regression",
+    }
+
+
+def test_compare_command_exits_nonzero_on_regression(tmp_path, capsys):
+    old, new = tmp_path / "old.json", tmp_path / "new.json"
+    old.write_text(json.dumps(_report(case=100.0)))
+    new.write_text(json.dumps(_report(case=200.0)))
+
+    assert main(["compare", str(old), str(old)]) == 0
+    assert main(["compare", str(old), str(new)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_every_case_runs(name):
+    result = run_case(CASES[name], warmup=1, repeat=2, number=2)
+
+    assert result.operations == 4
+    assert 0 < result.p50_us <= result.p95_us <= result.p99_us
+    assert result.ops_per_sec > 0
+
+
+def test_baseline_covers_every_case():
+    baseline = json.loads(Path(DEFAULT_BASELINE).read_text())
+
+    assert set(baseline["results"]) == set(CASES)
+    assert {case.name for case in select(["ledger.*"])} <= set(baseline["results"])
+
+
+def test_latency_histogram_percentiles_and_merge():
+    from tas_bench.loadgen import LatencyHistogram
+
+    low, high = LatencyHistogram(), LatencyHistogram()
+    for latency in range(1_000, 101_000, 1_000):
+        (low if latency <= 50_000 else high).record(latency)
+    low.merge(high)
+
+    assert low.count == 100 and low.min_ns == 1_000 and low.max_ns == 100_000
+    for fraction, exact in ((0.50, 50_000), (0.99, 99_000)):
+        assert exact <= low.percentile(fraction) <= exact * 2 ** (1 / LatencyHistogram.SUB_BUCKETS)
+    assert sum(count for _, count in low.to_dict()["buckets"]) == 100
+
+
+@pytest.mark.parametrize(
+    "target, algorithm",
+    [("admission_gate", "ed25519"), ("admission_gate", "secp256k1"), ("sdf", "ed25519")],
+)
+def test_minted_corpus_round_trips_and_produces_expected_codes(tmp_path, target, algorithm):
+    from tas_bench.corpus import TARGETS, Corpus, build_target, mint
+    from tas_bench.loadgen import run_closed_loop
+
+    corpus = mint(target, 120, seed=7, adversarial=0.6, algorithm=algorithm)
+    path = tmp_path / "corpus.jsonl"
+    corpus.save(path)
+    loaded = Corpus.load(path)
+    assert loaded.header == corpus.header and loaded.records == corpus.records
+    assert set(loaded.kinds()) == set(TARGETS[target])
+
+    # One worker: with several, a replay may overtake its original.
+    result = run_closed_loop(build_target(loaded), workers=1)
+
+    assert result.requests == 120
+    assert result.mismatches == {}
+    assert sum(h.count for h in result.histograms.values()) == 120
+    assert set(result.histograms) == set(TARGETS[target].values())
+
+
+def test_open_loop_reports_every_request(tmp_path, capsys):
+    from tas_bench.corpus import build_target, mint
+    from tas_bench.loadgen import run_open_loop
+
+    corpus = mint("sdf", 40, seed=1)
+    result = run_open_loop(build_target(corpus), rate=2_000, workers=2, limit=30)
+
+    assert result.mode == "open" and result.requests == 30
+    assert result.total().count == 30
+    assert result.mismatches == {}
+
+    path = tmp_path / "sdf.jsonl"
+    corpus.save(path)
+    report = tmp_path / "report.json"
+    assert main(["load", str(path), "--limit", "10", "--output", str(report)]) == 0
+    assert json.loads(report.read_text())["latency"]["count"] == 10
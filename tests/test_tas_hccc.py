@@ -78,4 +78,50 @@ def test_cce_requires_anchors():
     with pytest.raises(ValueError, match="TAS-SES requires"):
         CursiveCoherenceEngine("anchor1", anchors)
 
-# Nonce: 4698
+def test_merkle_batch_commits_verifiable_cells(tmp_path):
+    from tas_hccc import MerkleBatch, verify_cell, verify_cells
+
+    batch = MerkleBatch(batch_size=3, out_dir=str(tmp_path))
+    for index in range(3):
+        batch.add_cell(Cell(f"2026-01-01T00:00:0{index}+00:00", {"idx": index}))
+
+    assert batch.cells == []
+    (batch_file,) = tmp_path.glob("*.jsonl")
+    root = batch_file.stem
+    lines = batch_file.read_text(encoding="utf-8").splitlines()
+
+    assert all(verify_cell(line, root) for line in lines)
+    assert verify_cells(lines, root) == [True, True, True]
+
+    tampered = json.loads(lines[0])
+    tampered["payload"]["idx"] = 99
+    assert not verify_cell(json.dumps(tampered), root)
+    assert verify_cells([json.dumps(tampered), lines[1]], root) == [False, True]
+
+def test_verify_cell_accepts_pre_tas_v1_batches_with_legacy():
+    import hashlib
+    from dataclasses import asdict
+    from tas_hccc import verify_cell, verify_cells
+
+    # Written the way merkletools built batches: SHA-256 leaves, sha256(l || r) nodes.
+    cells = [Cell(f"2026-01-01T00:00:0{index}+00:00", {"idx": index}) for index in range(3)]
+    leaves = [hashlib.sha256(cell._blob_for_sig()).digest() for cell in cells]
+    pair = hashlib.sha256(leaves[0] + leaves[1]).digest()
+    root = hashlib.sha256(pair + leaves[2]).hexdigest()
+    proofs = [
+        [{"right": leaves[1].hex()}, {"right": leaves[2].hex()}],
+        [{"left": leaves[0].hex()}, {"right": leaves[2].hex()}],
+        [{"left": pair.hex()}],
+    ]
+    lines = [
+        json.dumps(asdict(cell) | {"proof": proof}) for cell, proof in zip(cells, proofs)
+    ]
+
+    assert all(verify_cell(line, root, legacy=True) for line in lines)
+    assert verify_cells(lines, root, legacy=True) == [True, True, True]
+    assert not any(verify_cell(line, root) for line in lines)
+    tampered = json.loads(lines[2])
+    tampered["payload"]["idx"] = 99
+    assert not verify_cell(json.dumps(tampered), root, legacy=True)
+
+# Nonce: 152451
@@ -0,0 +1,101 @@
+import math
+import random
+
+import pytest
+
+from core.geometry import topology
+from core.geometry.topology import (
+    FAIL_F8_TOPOLOGY_BREACH,
+    PASS_P7_TOPOLOGICAL_CONSISTENCY,
+    WindingEngine,
+    update_winding,
+)
+
+
+def _circle(turns, steps_per_turn, radius=1.0, centre=(0.0, 0.0)):
+    # Starts just below the positive x-axis so the first crossing is visible.
+    return [
+        (
+            centre[0] + radius * math.cos(2 * math.pi * i / steps_per_turn - 0.1),
+            centre[1] + radius * math.sin(2 * math.pi * i / steps_per_turn - 0.1),
+        )
+        for i in range(turns * steps_per_turn + 1)
+    ]
+
+
+def test_update_winding_keeps_adjacent_quadrant_rule():
+    assert update_winding((1.0, -0.5), (1.0, 0.5), (0.0, 0.0)) == 1
+    assert update_winding((1.0, 0.5), (1.0, -0.5), (0.0, 0.0)) == -1
+    assert update_winding((1.0, 0.5), (-1.0, 0.5), (0.0, 0.0)) == 0
+    assert update_winding((-1.0, 0.5), (-1.0, -0.5), (0.0, 0.0)) == 0
+
+
+def test_update_winding_catches_multi_quadrant_jumps():
+    # Quadrant 3 -> 1 passing right of the anchor crosses the positive ray.
+    assert update_winding((-0.1, -2.0), (2.0, 0.1), (0.0, 0.0)) == 1
+    # Quadrant 3 -> 1 passing left of the anchor does not.
+    assert update_winding((-2.0, -0.1), (0.1, 2.0), (0.0, 0.0)) == 0
+    # Quadrant 2 -> 4 clockwise through Quadrant 1.
+    assert update_winding((-0.1, 2.0), (2.0, -0.1), (0.0, 0.0)) == -1
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_engine_matches_update_winding(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(topology, "np", None)
+    rng = random.Random(3)
+    anchors = {f"a{j}": (rng.uniform(-2, 2), rng.uniform(-2, 2)) for j in range(5)}
+    trajectory = [(rng.uniform(-3, 3), rng.uniform(-3, 3)) for _ in range(500)]
+    engine = WindingEngine(anchors, {a: range(-1000, 1001) for a in anchors}, chunk_size=64)
+
+    deltas = [[int(d) for d in row] for row in engine.winding_deltas(trajectory)]
+    expected = [
+        [update_winding(p, q, anchors[a]) for a in anchors]
+        for p, q in zip(trajectory, trajectory[1:])
+    ]
+    assert deltas == expected
+
+    verdict = engine.advance(trajectory)
+    assert verdict.status == PASS_P7_TOPOLOGICAL_CONSISTENCY
+    assert engine.windings() == {
+        a: sum(row[j] for row in expected) for j, a in enumerate(anchors)
+    }
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_engine_reports_first_breach_and_does_not_commit(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(topology, "np", None)
+    anchors = {"far": (50.0, 50.0), "origin": (0.0, 0.0)}
+    engine = WindingEngine(anchors, {"far": {0}, "origin": {0, 1}}, chunk_size=7)
+    trajectory = _circle(turns=3, steps_per_turn=16)
+
+    verdict = engine.advance(trajectory)
+
+    # The second counter-clockwise crossing of the origin's ray reaches W=2.
+    assert verdict.status == FAIL_F8_TOPOLOGY_BREACH
+    assert verdict.anchor_id == "origin"
+    assert verdict.winding == 2
+    assert verdict.breach_index == 17
+    assert not verdict.passed
+    assert engine.windings() == {"far": 0, "origin": 0}
+
+    assert engine.advance(trajectory[:17]).passed
+    assert engine.windings() == {"far": 0, "origin": 1}
+
+
+def test_engine_accepts_per_anchor_projections():
+    pytest.importorskip("numpy")
+    anchors = {"a": (0.0, 0.0), "b": (0.0, 0.0)}
+    circle = _circle(turns=1, steps_per_turn=8)
+    still = [(1.0, 1.0)] * len(circle)
+    engine = WindingEngine(anchors, {"a": {0, 1}, "b": {0}})
+
+    verdict = engine.advance([[p, q] for p, q in zip(circle, still)])
+
+    assert verdict.passed
+    assert engine.windings() == {"a": 1, "b": 0}
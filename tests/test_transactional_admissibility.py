@@ -1,5 +1,6 @@
 """Regression tests for authenticated ancestry and pre-effect nonce commits."""
 
+import hashlib
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
@@ -8,7 +9,13 @@ import pytest
 from cryptography.hazmat.primitives.asymmetric import ec
 
 from sdf_evidence_envelope import SDFEvidenceEnvelope, build_envelope, verify_evidence
-from tas_admissibility import AdmissionReceipt, SQLiteNonceStore, admit_or_refuse
+from tas_admissibility import (
+    AdmissionReceipt,
+    InMemoryNonceStore,
+    SQLiteNonceStore,
+    admit_many,
+    admit_or_refuse,
+)
 
 
 GENESIS = "a" * 64
@@ -102,3 +109,129 @@ def test_transition_state_root_is_validated(tmp_path: Path) -> None:
             nonce_store=SQLiteNonceStore(str(tmp_path / "nonces.sqlite3")),
             trusted_genesis_hashes=frozenset({GENESIS}),
         )
+
+
+def test_admit_many_matches_the_serial_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("tas_admissibility._VERIFY_CHUNK", 3)
+    key = ec.generate_private_key(ec.SECP256K1())
+    forger = ec.generate_private_key(ec.SECP256K1())
+    root = envelope(key, sequence=0, parent_hash=None, nonce="root")
+    child = envelope(key, sequence=1, parent_hash=root.canonical_hash, nonce="child")
+    orphan = envelope(key, sequence=1, parent_hash="f" * 64, nonce="orphan")
+    forged = envelope(forger, sequence=0, parent_hash=None, nonce="forged")
+    batch = [
+        ({"op": "write"}, root),
+        ({"op": "write"}, root),            # replayed nonce
+        ({"op": "write"}, child),
+        ({"op": "write"}, orphan),          # unresolvable parent
+        ({"op": "write"}, forged),          # untrusted key
+        ({"op": "delete"}, envelope(key, sequence=0, parent_hash=None, nonce="mismatch")),
+        ({"op": "write"}, envelope(key, sequence=0, parent_hash=None, nonce="blocked")),
+        ({"op": "write"}, envelope(key, sequence=0, parent_hash=None, nonce="last")),
+    ]
+
+    def run(admit: Any) -> tuple[list[Any], list[str]]:
+        states: list[str] = []
+
+        def invariant_check(proposal: Any, state: str) -> bool:
+            states.append(state)
+            return len(states) != 7  # state-dependent refusal for one item
+
+        def apply_transition(proposal: Any, state: str) -> str:
+            return hashlib.sha256(state.encode()).hexdigest()
+
+        options: dict[str, Any] = dict(
+            authority_scope=frozenset({"authority"}),
+            current_context="context",
+            seen_nonces=set(),
+            invariant_check=invariant_check,
+            apply_transition=apply_transition,
+            trusted_authority_keys={"authority": root.issuer.public_key_b64},
+            lineage_resolver=Resolver(root),
+            trusted_genesis_hashes=frozenset({GENESIS}),
+        )
+        return admit(options), states
+
+    def serial(options: dict[str, Any]) -> list[Any]:
+        outcomes, state = [], STATE
+        for proposal, item in batch:
+            outcome = admit_or_refuse(proposal=proposal, envelope=item, state_root=state, **options)
+            state = outcome.state_root_after if outcome.admitted else state
+            outcomes.append(outcome)
+        return outcomes
+
+    expected, expected_states = run(serial)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outcomes, states = run(lambda options: admit_many(batch, STATE, executor=pool, **options))
+
+    assert outcomes == expected
+    assert states == expected_states
+    assert [outcome.admitted for outcome in outcomes] == [
+        True, False, True, False, False, False, False, True,
+    ]
+    assert [getattr(outcome, "failed_predicate", None) for outcome in outcomes] == [
+        None, "nonce_fresh", None, "lineage_intact", "authentic",
+        "claim_matches_proposal", "invariant_pass", None,
+    ]
+    assert run(lambda options: admit_many(iter(batch), STATE, **options))[0] == expected
+
+
+def test_admit_many_reverifies_only_the_envelope_whose_verification_raised(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("tas_admissibility._VERIFY_CHUNK", 2)
+    key = ec.generate_private_key(ec.SECP256K1())
+    root = envelope(key, sequence=0, parent_hash=None, nonce="root")
+    child = envelope(key, sequence=1, parent_hash=root.canonical_hash, nonce="child")
+    orphan = envelope(key, sequence=1, parent_hash="f" * 64, nonce="orphan")
+
+    class FlakyResolver(Resolver):
+        def __init__(self, *envelopes: SDFEvidenceEnvelope, failures: int) -> None:
+            super().__init__(*envelopes)
+            self.failures = failures
+
+        def resolve(self, canonical_hash: str) -> SDFEvidenceEnvelope | None:
+            if self.failures:
+                self.failures -= 1
+                raise OSError("lineage store unavailable")
+            return super().resolve(canonical_hash)
+
+    batch = [
+        ({"op": "write"}, envelope(key, sequence=0, parent_hash=None, nonce="first")),
+        ({"op": "write"}, child),
+        ({"op": "write"}, envelope(key, sequence=0, parent_hash=None, nonce="neighbour")),
+        ({"op": "write"}, orphan),
+        ({"op": "write"}, envelope(key, sequence=0, parent_hash=None, nonce="after")),
+    ]
+
+    def options(failures: int) -> dict[str, Any]:
+        return dict(
+            authority_scope=frozenset({"authority"}),
+            current_context="context",
+            seen_nonces=set(),
+            invariant_check=lambda proposal, state: True,
+            apply_transition=lambda proposal, state: hashlib.sha256(state.encode()).hexdigest(),
+            trusted_authority_keys={"authority": root.issuer.public_key_b64},
+            lineage_resolver=FlakyResolver(root, failures=failures),
+            trusted_genesis_hashes=frozenset({GENESIS}),
+        )
+
+    expected = admit_many(batch, STATE, **options(0))
+    # The first lookup (the child's parent) fails once during the batch-wide
+    # stage; only the child is verified again, and every receipt matches.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        outcomes = admit_many(batch, STATE, executor=pool, **options(1))
+    assert outcomes == expected
+    assert [outcome.admitted for outcome in outcomes] == [True, True, True, False, True]
+    assert outcomes[3].failed_predicate == "lineage_intact"
+
+    class BrokenResolver(Resolver):
+        def resolve(self, canonical_hash: str) -> SDFEvidenceEnvelope | None:
+            raise OSError("lineage store unavailable")
+
+    # A failure that persists surfaces exactly as admit_or_refuse raises it.
+    broken = dict(options(0), lineage_resolver=BrokenResolver(root))
+    with pytest.raises(OSError):
+        admit_or_refuse(proposal={"op": "write"}, envelope=child, state_root=STATE, **broken)
+    with pytest.raises(OSError):
+        admit_many(batch, STATE, **broken)